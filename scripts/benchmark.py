@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Benchmark the SDK's hot paths against the in-memory stand-in API.
+
+Measures sample (de)serialization, page parsing, Dataset.flattened, upload
+serialization, end-to-end pagination throughput, Dataset.save/load, import time
+and peak memory, at each requested dataset size. No network access is needed: requests go to
+lightningrod.testing.FakeLightningRodServer through an httpx transport.
+
+Results are written as JSON so runs can be compared over time:
+
+    python scripts/benchmark.py --output bench.json
+    python scripts/benchmark.py --sizes 10000 --compare bench.json
+
+With --compare, the script exits with status 1 if any benchmark got slower (or
+used more memory) than the baseline by more than --threshold.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+SDK_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(SDK_ROOT / "src"))
+
+from lightningrod import __version__  # noqa: E402
+from lightningrod._generated.models import PaginatedSamplesResponse, QuestionPipeline, Sample  # noqa: E402
+from lightningrod._generated.models.mock_transform_config import MockTransformConfig  # noqa: E402
+from lightningrod._json import get_codec  # noqa: E402
+from lightningrod.datasets.dataset import Dataset  # noqa: E402
+from lightningrod.testing import FakeLightningRodServer, FakeServerConfig, synthetic_samples  # noqa: E402
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+PAGE_SIZE = 1000
+SEED_TEXT_BYTES = 200
+
+
+def _best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    """Fastest of `repeat` runs of `fn`, in seconds, with the garbage collector paused while timing."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def _peak_bytes(fn: Callable[[], Any]) -> int:
+    """Peak Python heap allocation while `fn` runs (the result is dropped afterwards)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def _result(name: str, size: int, seconds: float, **extra: Any) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "size": size,
+        "seconds": seconds,
+        "items_per_second": size / seconds if seconds > 0 else None,
+        "us_per_item": seconds / size * 1e6 if size else None,
+        **extra,
+    }
+
+
+def _memory_result(name: str, size: int, peak_bytes: int) -> Dict[str, Any]:
+    return {"name": name, "size": size, "peak_bytes": peak_bytes, "bytes_per_item": peak_bytes / size if size else None}
+
+
+def _dataset(server: FakeLightningRodServer) -> Dataset:
+    """Output dataset of a completed job on `server`."""
+    config = QuestionPipeline(seed_generator=MockTransformConfig(), question_generator=MockTransformConfig())
+    return server.client().transforms.run(config, progress=None)
+
+
+def bench_serialization(size: int, repeat: int) -> List[Dict[str, Any]]:
+    payloads = synthetic_samples(size, SEED_TEXT_BYTES)
+    samples = [Sample.from_dict(p) for p in payloads]
+    pages = [
+        {"samples": payloads[i:i + PAGE_SIZE], "has_more": True, "total": size, "next_cursor": str(i + PAGE_SIZE)}
+        for i in range(0, size, PAGE_SIZE)
+    ]
+    codec = get_codec()
+    encoded = [codec.dumps(page) for page in pages]
+    return [
+        _result("sample_from_dict", size, _best_of(repeat, lambda: [Sample.from_dict(p) for p in payloads])),
+        _result("sample_to_dict", size, _best_of(repeat, lambda: [s.to_dict() for s in samples])),
+        _result(
+            "paginated_response_parse",
+            size,
+            _best_of(repeat, lambda: [PaginatedSamplesResponse.from_dict(codec.loads(b)) for b in encoded]),
+            page_size=PAGE_SIZE,
+            json_codec=codec.name,
+        ),
+    ]
+
+
+def bench_client(size: int, repeat: int) -> List[Dict[str, Any]]:
+    server = FakeLightningRodServer(FakeServerConfig(rows_per_job=size, seed_text_bytes=SEED_TEXT_BYTES))
+    dataset = _dataset(server)
+    results = []
+
+    pages_before = server.requests["GET /datasets/{dataset_id}/samples"]
+    seconds = _best_of(repeat, dataset.download)
+    pages = (server.requests["GET /datasets/{dataset_id}/samples"] - pages_before) // repeat
+    results.append(_result("pagination_download", size, seconds, requests=pages))
+    results.append(_result("pagination_download_lazy", size, _best_of(repeat, lambda: dataset.download(lazy=True))))
+
+    results.append(_result("dataset_flattened", size, _best_of(repeat, dataset.flattened)))
+
+    samples = dataset.samples()
+    lr = server.client()
+    results.append(_result(
+        "create_from_samples",
+        size,
+        _best_of(repeat, lambda: lr.datasets.create_from_samples(samples)),
+    ))
+
+    results.append(_memory_result("download_peak_memory", size, _peak_bytes(lambda: lr.datasets.get(dataset.id).download())))
+    results.append(_memory_result("flattened_peak_memory", size, _peak_bytes(dataset.flattened)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "dataset.arrow"
+        results.append(_result("dataset_save", size, _best_of(repeat, lambda: dataset.save(path))))
+        results.append(_result("dataset_load", size, _best_of(repeat, lambda: Dataset.load(path)), file_bytes=path.stat().st_size))
+        loaded = Dataset.load(path).samples()
+        results.append(_result("dataset_load_iterate", size, _best_of(repeat, lambda: [s.question for s in loaded])))
+    return results
+
+
+def bench_import_time(repeat: int) -> List[Dict[str, Any]]:
+    env = dict(os.environ, PYTHONPATH=str(SDK_ROOT / "src"))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    results = []
+    for name, statement in (
+        ("import_lightningrod", "import lightningrod"),
+        ("import_client", "from lightningrod import LightningRod"),
+        ("import_client_and_models", "from lightningrod import LightningRod, QuestionPipeline, Sample"),
+    ):
+        code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+        times = []
+        # The extra first run writes bytecode, so compilation is not measured
+        for _ in range(repeat + 1):
+            out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+            times.append(float(out.stdout))
+        results.append(_result(name, 1, min(times[1:])))
+    return results
+
+
+def run(sizes: Sequence[int], repeat: int) -> Dict[str, Any]:
+    results = bench_import_time(repeat)
+    for size in sizes:
+        print(f"Benchmarking {size:,} samples...", file=sys.stderr)
+        results += bench_serialization(size, repeat)
+        results += bench_client(size, repeat)
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "lightningrod_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "json_codec": get_codec().name,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def _metric(result: Dict[str, Any]) -> float:
+    return result["peak_bytes"] if "peak_bytes" in result else result["seconds"]
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Describe every benchmark that is more than `threshold` times worse than in `baseline`."""
+    previous = {(r["name"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        before = previous.get((result["name"], result["size"]))
+        if before is None or _metric(before) <= 0:
+            continue
+        ratio = _metric(result) / _metric(before)
+        if ratio > threshold:
+            regressions.append(f"{result['name']} @ {result['size']:,}: {ratio:.2f}x baseline")
+    return regressions
+
+
+def _print_summary(report: Dict[str, Any]) -> None:
+    for r in report["results"]:
+        if "peak_bytes" in r:
+            value = f"{r['peak_bytes'] / 1e6:10.1f} MB peak"
+        elif r["name"].startswith("import_"):
+            value = f"{r['seconds'] * 1e3:10.1f} ms"
+        else:
+            value = f"{r['seconds']:10.3f} s  ({r['us_per_item']:.2f} µs/item)"
+        print(f"{r['name']:<28} {r['size']:>10,}  {value}", file=sys.stderr)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(v) for v in value.split(",")],
+        default=list(DEFAULT_SIZES),
+        help="Comma-separated dataset sizes (default: 10000,100000,1000000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the fastest is reported")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here instead of stdout")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.repeat)
+    _print_summary(report)
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare is not None:
+        regressions = compare(report, json.loads(args.compare.read_text()), args.threshold)
+        for line in regressions:
+            print(f"✗ Regression: {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("✓ No regressions", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,12 +6,18 @@ This script:
 1. Fetches the latest openapi.json from the running FastAPI server
 2. Saves it to sdk/python/openapi.json
 3. Generates typed Python client code using openapi-python-client
+4. Post-processes the generated code to route JSON through lightningrod._json,
+   to time response parsing for lightningrod._instrumentation, to load
+   model modules lazily on first attribute access and to take per-call imports
+   and dateutil parsing out of model (de)serialization
 """
 import json
+import re
 import shutil
 import subprocess
 import sys
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 from urllib.request import urlopen
 from urllib.error import URLError
 
@@ -98,6 +104,213 @@ def generate_client() -> None:
         sys.exit(1)
 
 
+CODEC_IMPORT = "from lightningrod._json import JsonCodec, default_codec\n"
+CODEC_FIELD = "    json_codec: JsonCodec = field(factory=default_codec, kw_only=True)\n"
+CODEC_DOC = "        json_codec: JSON codec used to encode request bodies and decode responses\n"
+
+
+def _patch_client_module(source: str) -> str:
+    """Give Client and AuthenticatedClient a `json_codec` attribute."""
+    if CODEC_IMPORT in source:
+        return source
+    source = source.replace(
+        "from attrs import define, evolve, field\n",
+        "from attrs import define, evolve, field\n\n" + CODEC_IMPORT,
+    )
+    source = source.replace(
+        "            argument to the constructor.\n",
+        "            argument to the constructor.\n" + CODEC_DOC,
+    )
+    return source.replace(
+        "    raise_on_unexpected_status: bool = field(default=False, kw_only=True)\n",
+        "    raise_on_unexpected_status: bool = field(default=False, kw_only=True)\n" + CODEC_FIELD,
+    )
+
+
+PARSE_IMPORT = "from lightningrod._instrumentation import timed_parse\n"
+
+
+def _patch_endpoint_module(source: str) -> str:
+    """
+    Encode request bodies and decode responses with the client's JSON codec, and
+    time response parsing for instrumented clients.
+    """
+    source = source.replace("response.json()", "client.json_codec.loads(response.content)")
+    source = re.sub(
+        r"(\.request\(\s*)\*\*kwargs",
+        r"\1**client.json_codec.encode(kwargs)",
+        source,
+    )
+    if "parsed=_parse_response(client=client, response=response)" in source:
+        source = source.replace(
+            "parsed=_parse_response(client=client, response=response)",
+            "parsed=timed_parse(_parse_response, client=client, response=response)",
+        )
+        source = source.replace("\nfrom ... import errors\n", "\n" + PARSE_IMPORT + "\nfrom ... import errors\n", 1)
+    return source
+
+
+LAZY_MODELS_MARKER = "_MODEL_MODULES = {\n"
+_MODEL_IMPORT = re.compile(r"^from (\.\w+) import (\w+)\n", re.MULTILINE)
+
+
+def _patch_models_init(source: str) -> str:
+    """
+    Replace the eager `from .x import Y` lines in models/__init__.py with a
+    PEP 562 `__getattr__`, so each model module is imported on first use.
+    """
+    if LAZY_MODELS_MARKER in source:
+        return source
+    imports = _MODEL_IMPORT.findall(source)
+    first = _MODEL_IMPORT.search(source)
+    last = list(_MODEL_IMPORT.finditer(source))[-1]
+    type_checking = "".join(f"    from {module} import {name}\n" for module, name in imports)
+    modules = "".join(f'    "{name}": "{module}",\n' for module, name in imports)
+    lazy = (
+        "from importlib import import_module\n"
+        "from typing import TYPE_CHECKING, Any, List\n"
+        "\n"
+        "if TYPE_CHECKING:\n"
+        f"{type_checking}"
+        "\n"
+        f"{LAZY_MODELS_MARKER}"
+        f"{modules}"
+        "}\n"
+        "\n"
+        "\n"
+        "def __getattr__(name: str) -> Any:\n"
+        "    try:\n"
+        "        module = _MODEL_MODULES[name]\n"
+        "    except KeyError:\n"
+        '        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None\n'
+        "    value = getattr(import_module(module, __name__), name)\n"
+        "    globals()[name] = value\n"
+        "    return value\n"
+        "\n"
+        "\n"
+        "def __dir__() -> List[str]:\n"
+        "    return sorted(set(globals()) | set(__all__))\n"
+        "\n"
+    )
+    return source[: first.start()] + lazy + source[last.end() :]
+
+
+DATETIME_IMPORT = "from lightningrod._datetime import parse_datetime\n"
+_LOCAL_MODEL_IMPORT = re.compile(r"^ {8}(from \.\.models\.\w+ import \w+\n)", re.MULTILINE)
+_LOCAL_MODEL_IMPORTS = re.compile(r"(?:^ {8}from \.\.models\.\w+ import \w+\n)+\n?", re.MULTILINE)
+_TYPE_CHECKING_BLOCK = re.compile(r"^if TYPE_CHECKING:\n((?:    .*\n)+)", re.MULTILINE)
+# A model whose from_dict rejects any other value of a const field, e.g. question_type
+_DISCRIMINATOR = re.compile(
+    r'^class (\w+):\n.*?^ {8}if (\w+) != "(\w+)" and not isinstance\(\2, Unset\):\n {12}raise ValueError',
+    re.MULTILINE | re.DOTALL,
+)
+# One member of a generated union decoder: try the model, fall through to the next on failure
+_UNION_MEMBER = re.compile(
+    r"^(?P<indent> +)try:\n"
+    r"(?P=indent)    if not isinstance\(data, dict\):\n"
+    r"(?P=indent)        raise TypeError\(\)\n"
+    r"(?P=indent)    (?P<var>\w+) = (?P<model>\w+)\.from_dict\(data\)\n"
+    r"\n"
+    r"(?P=indent)    return (?P=var)\n"
+    r"(?P=indent)except \(TypeError, ValueError, AttributeError, KeyError\):\n"
+    r"(?P=indent)    pass\n",
+    re.MULTILINE,
+)
+
+
+def _model_discriminators(models_dir: Path) -> Dict[str, Tuple[str, str]]:
+    """Map each model class with a const discriminator field to (field, value)."""
+    discriminators: Dict[str, Tuple[str, str]] = {}
+    for path in sorted(models_dir.glob("*.py")):
+        for model, field, value in _DISCRIMINATOR.findall(path.read_text()):
+            discriminators[model] = (field, value)
+    return discriminators
+
+
+def _dispatch_union_member(match: "re.Match[str]", discriminators: Dict[str, Tuple[str, str]]) -> str:
+    discriminator = discriminators.get(match["model"])
+    if discriminator is None:
+        return match.group(0)
+    field, value = discriminator
+    indent, var, model = match["indent"], match["var"], match["model"]
+    return (
+        f'{indent}if isinstance(data, dict) and data.get("{field}", "{value}") == "{value}":\n'
+        f"{indent}    try:\n"
+        f"{indent}        {var} = {model}.from_dict(data)\n"
+        f"\n"
+        f"{indent}        return {var}\n"
+        f"{indent}    except (TypeError, ValueError, AttributeError, KeyError):\n"
+        f"{indent}        pass\n"
+    )
+
+
+def _patch_model_module(source: str, discriminators: Optional[Dict[str, Tuple[str, str]]] = None) -> str:
+    """
+    Speed up a model's to_dict/from_dict, which run once per object:
+
+    - Hoist the `from ..models.x import Y` statements the generator repeats
+      inside every method call up to module level (the model import graph is
+      acyclic, so this cannot create an import cycle).
+    - Parse timestamps with `parse_datetime` instead of dateutil's `isoparse`.
+    - Dispatch unions of discriminated models (`question_type`, `context_type`)
+      on the discriminator: a member is only tried when the payload's value
+      matches its const, since its from_dict would raise otherwise. Unions
+      that previously raised and caught an exception per failed member now
+      go straight to the matching one; results are unchanged.
+    """
+    hoisted = sorted(set(_LOCAL_MODEL_IMPORT.findall(source)))
+    if hoisted:
+        source = _LOCAL_MODEL_IMPORTS.sub("", source)
+        block = _TYPE_CHECKING_BLOCK.search(source)
+        if block is not None:
+            remaining = [line + "\n" for line in block.group(1).splitlines() if line.strip() + "\n" not in hoisted]
+            replacement = "".join(hoisted)
+            if remaining:
+                replacement += "\nif TYPE_CHECKING:\n" + "".join(remaining)
+            source = source[: block.start()] + replacement + source[block.end() :]
+        else:
+            marker = source.index("\n\nT = TypeVar(")
+            source = source[:marker] + "\n" + "".join(hoisted) + source[marker:]
+    if "isoparse(" in source:
+        source = source.replace("from dateutil.parser import isoparse\n", DATETIME_IMPORT)
+        source = source.replace("isoparse(", "parse_datetime(")
+    if discriminators is None:
+        discriminators = _model_discriminators(GENERATED_DIR / "models")
+    source = _UNION_MEMBER.sub(lambda match: _dispatch_union_member(match, discriminators), source)
+    return source
+
+
+def postprocess_generated(generated_dir: Path = GENERATED_DIR) -> None:
+    """
+    Apply SDK-specific changes to freshly generated code.
+
+    Safe to run repeatedly; already-patched files are left unchanged.
+    """
+    print("\nPost-processing generated code...")
+    client_file = generated_dir / "client.py"
+    client_file.write_text(_patch_client_module(client_file.read_text()))
+    for path in sorted((generated_dir / "api").rglob("*.py")):
+        source = path.read_text()
+        patched = _patch_endpoint_module(source)
+        if patched != source:
+            path.write_text(patched)
+    models_init = generated_dir / "models" / "__init__.py"
+    models_init.write_text(_patch_models_init(models_init.read_text()))
+    discriminators = _model_discriminators(generated_dir / "models")
+    for path in sorted((generated_dir / "models").glob("*.py")):
+        if path == models_init:
+            continue
+        source = path.read_text()
+        patched = _patch_model_module(source, discriminators)
+        if patched != source:
+            path.write_text(patched)
+    print("✓ Routed request and response bodies through the configurable JSON codec")
+    print("✓ Wrapped response parsing with instrumentation timing")
+    print("✓ Made model imports lazy")
+    print("✓ Hoisted per-call model imports and switched to fast timestamp parsing")
+    print("✓ Dispatched discriminated unions on their type field")
+
+
 def main() -> None:
     """Main execution flow."""
     print("=" * 60)
@@ -108,6 +321,7 @@ def main() -> None:
     spec = fetch_openapi_spec()
     save_openapi_spec(spec)
     generate_client()
+    postprocess_generated()
     
     print()
     print("=" * 60)
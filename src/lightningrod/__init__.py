@@ -4,42 +4,145 @@ Lightning Rod Python SDK
 AI-powered forecasting dataset generation platform.
 """
 
-from lightningrod.client import LightningRod
-from lightningrod.datasets.dataset import Dataset
-from lightningrod._generated.models import (
-    AnswerType,
-    AnswerTypeEnum,
-    TransformJob,
-    TransformJobStatus,
-    NewsSeedGenerator,
-    GdeltSeedGenerator,
-    NewsContextGenerator,
-    QuestionGenerator,
-    QuestionAndLabelGenerator,
-    ForwardLookingQuestionGenerator,
-    QuestionPipeline,
-    QuestionRenderer,
-    WebSearchLabeler,
-    FilterCriteria,
-    Sample,
-    SampleMeta,
-    Seed,
-    # TODO(filesets): Enable when filesets are publicly supported
-    # FileSetSeedGenerator,
-    # FileSetQuerySeedGenerator,
-    # CreateFileSetRequest,
-    # CreateFileSetFileRequest,
-    # CreateFileUploadResponse,
-    # FileSetFile,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from lightningrod._errors import APIError
+    from lightningrod._http import HttpConfig
+    from lightningrod._httpcache import HttpCache, HttpCacheStats
+    from lightningrod._instrumentation import EndpointStats, InMemoryExporter, Instrumentation, LoggingExporter, Span, SpanExporter, span_context
+    from lightningrod._ratelimit import RateLimit, RateLimiter, RateLimitStats
+    from lightningrod._retry import RetryPolicy
+    from lightningrod.client import AsyncLightningRod, LightningRod
+    from lightningrod.datasets.dataset import AsyncDataset, Dataset
+    from lightningrod.datasets.lazy import LazySample
+    from lightningrod.transforms.cache import RunCache
+    from lightningrod.transforms.handle import AsyncJobHandle, JobHandle
+    from lightningrod.transforms.metrics import JobThroughput, MetricsHistory, StepThroughput
+    from lightningrod.transforms.polling import PollSchedule
+    from lightningrod.transforms.recorder import MetricsRecorder
+    from lightningrod.transforms.progress import (
+        CostEvent,
+        JobMessageEvent,
+        JobStatusEvent,
+        LoggingProgressReporter,
+        ProgressEvent,
+        ProgressReporter,
+        RichProgressReporter,
+        StepMetricsEvent,
+    )
+    from lightningrod._generated.models import (
+        AnswerType,
+        AnswerTypeEnum,
+        TransformJob,
+        TransformJobStatus,
+        NewsSeedGenerator,
+        GdeltSeedGenerator,
+        NewsContextGenerator,
+        QuestionGenerator,
+        QuestionAndLabelGenerator,
+        ForwardLookingQuestionGenerator,
+        QuestionPipeline,
+        QuestionRenderer,
+        WebSearchLabeler,
+        FilterCriteria,
+        Sample,
+        SampleMeta,
+        Seed,
+        # TODO(filesets): Enable when filesets are publicly supported
+        # FileSetSeedGenerator,
+        # FileSetQuerySeedGenerator,
+        # CreateFileSetRequest,
+        # CreateFileSetFileRequest,
+        # CreateFileUploadResponse,
+        # FileSetFile,
+    )
+
+# Public names are resolved on first access (PEP 562) so that `import lightningrod`
+# does not pay for httpx, rich and the generated models until they are used.
+_LAZY_IMPORTS = {
+    "APIError": "lightningrod._errors",
+    "HttpConfig": "lightningrod._http",
+    "HttpCache": "lightningrod._httpcache",
+    "HttpCacheStats": "lightningrod._httpcache",
+    "EndpointStats": "lightningrod._instrumentation",
+    "InMemoryExporter": "lightningrod._instrumentation",
+    "Instrumentation": "lightningrod._instrumentation",
+    "LoggingExporter": "lightningrod._instrumentation",
+    "Span": "lightningrod._instrumentation",
+    "SpanExporter": "lightningrod._instrumentation",
+    "span_context": "lightningrod._instrumentation",
+    "RateLimit": "lightningrod._ratelimit",
+    "RateLimiter": "lightningrod._ratelimit",
+    "RateLimitStats": "lightningrod._ratelimit",
+    "RetryPolicy": "lightningrod._retry",
+    "AsyncLightningRod": "lightningrod.client",
+    "LightningRod": "lightningrod.client",
+    "AsyncDataset": "lightningrod.datasets.dataset",
+    "Dataset": "lightningrod.datasets.dataset",
+    "LazySample": "lightningrod.datasets.lazy",
+    "RunCache": "lightningrod.transforms.cache",
+    "AsyncJobHandle": "lightningrod.transforms.handle",
+    "JobHandle": "lightningrod.transforms.handle",
+    "JobThroughput": "lightningrod.transforms.metrics",
+    "MetricsHistory": "lightningrod.transforms.metrics",
+    "StepThroughput": "lightningrod.transforms.metrics",
+    "PollSchedule": "lightningrod.transforms.polling",
+    "MetricsRecorder": "lightningrod.transforms.recorder",
+    "CostEvent": "lightningrod.transforms.progress",
+    "JobMessageEvent": "lightningrod.transforms.progress",
+    "JobStatusEvent": "lightningrod.transforms.progress",
+    "LoggingProgressReporter": "lightningrod.transforms.progress",
+    "ProgressEvent": "lightningrod.transforms.progress",
+    "ProgressReporter": "lightningrod.transforms.progress",
+    "RichProgressReporter": "lightningrod.transforms.progress",
+    "StepMetricsEvent": "lightningrod.transforms.progress",
+    "AnswerType": "lightningrod._generated.models",
+    "AnswerTypeEnum": "lightningrod._generated.models",
+    "TransformJob": "lightningrod._generated.models",
+    "TransformJobStatus": "lightningrod._generated.models",
+    "NewsSeedGenerator": "lightningrod._generated.models",
+    "GdeltSeedGenerator": "lightningrod._generated.models",
+    "NewsContextGenerator": "lightningrod._generated.models",
+    "QuestionGenerator": "lightningrod._generated.models",
+    "QuestionAndLabelGenerator": "lightningrod._generated.models",
+    "ForwardLookingQuestionGenerator": "lightningrod._generated.models",
+    "QuestionPipeline": "lightningrod._generated.models",
+    "QuestionRenderer": "lightningrod._generated.models",
+    "WebSearchLabeler": "lightningrod._generated.models",
+    "FilterCriteria": "lightningrod._generated.models",
+    "Sample": "lightningrod._generated.models",
+    "SampleMeta": "lightningrod._generated.models",
+    "Seed": "lightningrod._generated.models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __version__ = "0.1.6"
 __all__ = [
+    "APIError",
     "AnswerType",
     "AnswerTypeEnum",
-    "AnswerTypes",
     "AsyncDataset",
+    "AsyncJobHandle",
+    "AsyncLightningRod",
+    "CostEvent",
     "Dataset",
+    "EndpointStats",
     # TODO(filesets): Enable when filesets are publicly supported
     # "FileSetSeedGenerator",
     # "FileSetQuerySeedGenerator",
@@ -50,15 +153,43 @@ __all__ = [
     "FilterCriteria",
     "ForwardLookingQuestionGenerator",
     "GdeltSeedGenerator",
+    "HttpCache",
+    "HttpCacheStats",
+    "HttpConfig",
+    "InMemoryExporter",
+    "Instrumentation",
+    "JobHandle",
+    "JobMessageEvent",
+    "JobStatusEvent",
+    "JobThroughput",
+    "LazySample",
+    "LoggingExporter",
+    "LoggingProgressReporter",
+    "MetricsHistory",
+    "MetricsRecorder",
     "NewsContextGenerator",
     "NewsSeedGenerator",
+    "PollSchedule",
+    "ProgressEvent",
+    "ProgressReporter",
     "QuestionAndLabelGenerator",
     "QuestionGenerator",
     "QuestionPipeline",
     "QuestionRenderer",
+    "RateLimit",
+    "RateLimitStats",
+    "RateLimiter",
+    "RetryPolicy",
+    "RichProgressReporter",
+    "RunCache",
     "Sample",
     "SampleMeta",
     "Seed",
+    "Span",
+    "SpanExporter",
+    "span_context",
+    "StepMetricsEvent",
+    "StepThroughput",
     "TransformJob",
     "TransformJobStatus",
     "WebSearchLabeler",
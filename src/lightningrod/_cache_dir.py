@@ -0,0 +1,7 @@
+import os
+from pathlib import Path
+
+
+def default_cache_dir() -> Path:
+    """Root directory for the SDK's on-disk caches: $XDG_CACHE_HOME/lightningrod, or ~/.cache/lightningrod."""
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "lightningrod"
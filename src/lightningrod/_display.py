@@ -50,9 +50,26 @@ def _build_cost_lines(job: Any) -> list[RenderableType]:
     return lines
 
 
+def _build_throughput_lines(throughput: Any) -> list[RenderableType]:
+    """Build ETA and projected cost lines from a JobThroughput. Returns empty list if no data."""
+    lines: list[RenderableType] = []
+    if throughput.eta_seconds is not None:
+        lines.append(_safe_markup(f"  [bold]ETA:[/bold]        {_format_duration(throughput.eta_seconds)}"))
+    if throughput.projected_cost_dollars is not None:
+        lines.append(_safe_markup(f"  [bold]Projected:[/bold]  ${throughput.projected_cost_dollars:.2f}"))
+    return lines
+
+
+def _format_rate(rows_per_second: Optional[float]) -> str:
+    if rows_per_second is None:
+        return "-"
+    return f"{rows_per_second:.1f}"
+
+
 def build_live_display(
     metrics: Any = None,
     job: Any = None,
+    throughput: Any = None,
 ) -> RenderableType:
     """Build the live display renderable for the polling loop."""
     renderables: list[RenderableType] = []
@@ -60,12 +77,15 @@ def build_live_display(
     renderables.append(_safe_markup("[bold bright_blue]>> Pipeline Running[/bold bright_blue]"))
     renderables.append(Text(""))
 
-    # Cost summary from job.usage
+    # Cost summary from job.usage, plus ETA and projected cost from the metrics history
+    summary_lines: list[RenderableType] = []
     if job is not None:
-        cost_lines = _build_cost_lines(job)
-        if cost_lines:
-            renderables.extend(cost_lines)
-            renderables.append(Text(""))
+        summary_lines.extend(_build_cost_lines(job))
+    if throughput is not None:
+        summary_lines.extend(_build_throughput_lines(throughput))
+    if summary_lines:
+        renderables.extend(summary_lines)
+        renderables.append(Text(""))
 
     if metrics is None:
         renderables.append(Text("Waiting for metrics...", style="dim italic"))
@@ -84,6 +104,10 @@ def build_live_display(
     table.add_column("Rejected", justify="right")
     table.add_column("Errors", justify="right")
     table.add_column("Duration", justify="right")
+    if throughput is not None:
+        table.add_column("Rows/s", justify="right")
+        table.add_column("ETA", justify="right")
+    step_throughput = {step.step_index: step for step in throughput.steps} if throughput is not None else {}
 
     for step in sorted(metrics.steps, key=lambda s: s.step_index):
         if step.progress >= 1.0:
@@ -96,7 +120,7 @@ def build_live_display(
         rejected_style = "bright_red" if step.rejected_count > 0 else "dim"
         error_style = "bold bright_red" if step.error_count > 0 else "dim"
 
-        table.add_row(
+        row: list[RenderableType] = [
             step.transform_name,
             status,
             str(step.input_rows),
@@ -104,7 +128,13 @@ def build_live_display(
             Text(str(step.rejected_count), style=rejected_style),
             Text(str(step.error_count), style=error_style),
             _format_duration(step.duration_seconds),
-        )
+        ]
+        if throughput is not None:
+            rates = step_throughput.get(step.step_index)
+            eta = rates.eta_seconds if rates is not None else None
+            row.append(_format_rate(rates.rows_per_second if rates is not None else None))
+            row.append(_format_duration(eta) if eta is not None else "-")
+        table.add_row(*row)
 
     renderables.append(table)
 
@@ -125,49 +155,44 @@ def _is_notebook() -> bool:
         return False
 
 
-def run_live_display(
-    poll_callback: Any,
-    poll_interval: float = 15,
-    warning_message: Optional[str] = None,
-) -> None:
-    """Run a live-updating display that polls for metrics.
-
-    Args:
-        poll_callback: A callable that returns (metrics, job, is_running) each cycle.
-            - metrics: PipelineMetricsResponse or None
-            - job: TransformJob with current status/usage
-            - is_running: bool, False to stop the loop
-        poll_interval: Seconds between polls.
-        warning_message: Optional warning to persist above the live display.
+class LiveDisplay:
+    """Context manager that renders pipeline progress, in place, while a job is polled.
+
+    Uses rich.Live in terminals and re-prints the panel in Jupyter notebooks.
     """
-    import time
-    console = Console()
 
-    if _is_notebook():
+    def __init__(self, warning_message: Optional[str] = None):
+        self._warning_message: Optional[str] = warning_message
+        self._console = Console()
+        self._notebook: bool = _is_notebook()
+        self._live: Any = None
+
+    def __enter__(self) -> "LiveDisplay":
+        if not self._notebook:
+            from rich.live import Live
+            self._live = Live(
+                build_live_display(metrics=None, job=None),
+                console=self._console,
+                refresh_per_second=1,
+                transient=True,
+            )
+            self._live.__enter__()
+        return self
+
+    def update(self, metrics: Any, job: Any, throughput: Any = None) -> None:
+        if self._live is not None:
+            self._live.update(build_live_display(metrics=metrics, job=job, throughput=throughput))
+            return
         from IPython.display import clear_output
-        metrics, job, is_running = poll_callback()
-        while is_running:
-            clear_output(wait=True)
-            if warning_message:
-                display_warning(warning_message)
-            console.print(build_live_display(metrics=metrics, job=job))
-            time.sleep(poll_interval)
-            metrics, job, is_running = poll_callback()
-    else:
-        from rich.live import Live
-        with Live(
-            build_live_display(metrics=None, job=None),
-            console=console,
-            refresh_per_second=1,
-            transient=True,
-        ) as live:
-            metrics, job, is_running = poll_callback()
-            while is_running:
-                live.update(build_live_display(metrics=metrics, job=job))
-                time.sleep(poll_interval)
-                metrics, job, is_running = poll_callback()
-            # Final update
-            live.update(build_live_display(metrics=metrics, job=job))
+        clear_output(wait=True)
+        if self._warning_message:
+            display_warning(self._warning_message)
+        self._console.print(build_live_display(metrics=metrics, job=job, throughput=throughput))
+
+    def __exit__(self, *args: Any) -> None:
+        if self._live is not None:
+            self._live.__exit__(*args)
+            self._live = None
 
 
 def display_error(message: str, title: str = "Error", job: Any = None) -> None:
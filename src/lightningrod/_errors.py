@@ -1,14 +1,32 @@
 import json
 from http import HTTPStatus
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
+
+import httpx
 
-from lightningrod._display import display_error
 from lightningrod._generated.models import HTTPValidationError
 from lightningrod._generated.types import Response
 
 T = TypeVar("T")
 
 
+class APIError(Exception):
+    """Raised by `handle_response_error` for an unsuccessful API response."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code: Optional[int] = status_code
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Return True if a failed request may succeed when repeated: network errors, 429 and 5xx responses."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, APIError) and error.status_code is not None:
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
 def extract_error_message(response: Response[Any], operation: str) -> str:
     """
     Extract a detailed error message from a Response object.
@@ -57,11 +75,9 @@ def handle_response_error(response: Response[T], operation: str) -> T:
         The parsed response object
         
     Raises:
-        Exception: If the response indicates an error (parsed is None or HTTPValidationError)
+        APIError: If the response indicates an error (parsed is None or HTTPValidationError)
     """
     if response.parsed is None or isinstance(response.parsed, HTTPValidationError):
-        error_msg = extract_error_message(response, operation)
-        display_error(error_msg, title=f"API Error: {operation}")
-        raise Exception(error_msg)
+        raise APIError(extract_error_message(response, operation), int(response.status_code))
 
     return response.parsed
@@ -3,6 +3,8 @@ from typing import Any
 
 import httpx
 
+from lightningrod._instrumentation import timed_parse
+
 from ... import errors
 from ...client import AuthenticatedClient, Client
 from ...models.create_dataset_response import CreateDatasetResponse
@@ -20,7 +22,7 @@ def _get_kwargs() -> dict[str, Any]:
 
 def _parse_response(*, client: AuthenticatedClient | Client, response: httpx.Response) -> CreateDatasetResponse | None:
     if response.status_code == 201:
-        response_201 = CreateDatasetResponse.from_dict(response.json())
+        response_201 = CreateDatasetResponse.from_dict(client.json_codec.loads(response.content))
 
         return response_201
 
@@ -37,7 +39,7 @@ def _build_response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
+        parsed=timed_parse(_parse_response, client=client, response=response),
     )
 
 
@@ -60,7 +62,7 @@ def sync_detailed(
     kwargs = _get_kwargs()
 
     response = client.get_httpx_client().request(
-        **kwargs,
+        **client.json_codec.encode(kwargs),
     )
 
     return _build_response(client=client, response=response)
@@ -105,7 +107,7 @@ async def asyncio_detailed(
 
     kwargs = _get_kwargs()
 
-    response = await client.get_async_httpx_client().request(**kwargs)
+    response = await client.get_async_httpx_client().request(**client.json_codec.encode(kwargs))
 
     return _build_response(client=client, response=response)
 
@@ -4,6 +4,8 @@ from urllib.parse import quote
 
 import httpx
 
+from lightningrod._instrumentation import timed_parse
+
 from ... import errors
 from ...client import AuthenticatedClient, Client
 from ...models.dataset_metadata import DatasetMetadata
@@ -28,12 +30,12 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> DatasetMetadata | HTTPValidationError | None:
     if response.status_code == 200:
-        response_200 = DatasetMetadata.from_dict(response.json())
+        response_200 = DatasetMetadata.from_dict(client.json_codec.loads(response.content))
 
         return response_200
 
     if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+        response_422 = HTTPValidationError.from_dict(client.json_codec.loads(response.content))
 
         return response_422
 
@@ -50,7 +52,7 @@ def _build_response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
+        parsed=timed_parse(_parse_response, client=client, response=response),
     )
 
 
@@ -79,7 +81,7 @@ def sync_detailed(
     )
 
     response = client.get_httpx_client().request(
-        **kwargs,
+        **client.json_codec.encode(kwargs),
     )
 
     return _build_response(client=client, response=response)
@@ -135,7 +137,7 @@ async def asyncio_detailed(
         dataset_id=dataset_id,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
+    response = await client.get_async_httpx_client().request(**client.json_codec.encode(kwargs))
 
     return _build_response(client=client, response=response)
 
@@ -4,6 +4,8 @@ from urllib.parse import quote
 
 import httpx
 
+from lightningrod._instrumentation import timed_parse
+
 from ... import errors
 from ...client import AuthenticatedClient, Client
 from ...models.create_file_set_file_request import CreateFileSetFileRequest
@@ -38,12 +40,12 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> FileSetFile | HTTPValidationError | None:
     if response.status_code == 201:
-        response_201 = FileSetFile.from_dict(response.json())
+        response_201 = FileSetFile.from_dict(client.json_codec.loads(response.content))
 
         return response_201
 
     if response.status_code == 422:
-        response_422 = HTTPValidationError.from_dict(response.json())
+        response_422 = HTTPValidationError.from_dict(client.json_codec.loads(response.content))
 
         return response_422
 
@@ -60,7 +62,7 @@ def _build_response(
         status_code=HTTPStatus(response.status_code),
         content=response.content,
         headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
+        parsed=timed_parse(_parse_response, client=client, response=response),
     )
 
 
@@ -92,7 +94,7 @@ def sync_detailed(
     )
 
     response = client.get_httpx_client().request(
-        **kwargs,
+        **client.json_codec.encode(kwargs),
     )
 
     return _build_response(client=client, response=response)
@@ -154,7 +156,7 @@ async def asyncio_detailed(
         body=body,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
+    response = await client.get_async_httpx_client().request(**client.json_codec.encode(kwargs))
 
     return _build_response(client=client, response=response)
 
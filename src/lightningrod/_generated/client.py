@@ -4,6 +4,8 @@ from typing import Any
 import httpx
 from attrs import define, evolve, field
 
+from lightningrod._json import JsonCodec, default_codec
+
 
 @define
 class Client:
@@ -32,9 +34,11 @@ class Client:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        json_codec: JSON codec used to encode request bodies and decode responses
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    json_codec: JsonCodec = field(factory=default_codec, kw_only=True)
     _base_url: str = field(alias="base_url")
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
@@ -159,12 +163,14 @@ class AuthenticatedClient:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        json_codec: JSON codec used to encode request bodies and decode responses
         token: The token to use for authentication
         prefix: The prefix to use for the Authorization header
         auth_header_name: The name of the Authorization header
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    json_codec: JsonCodec = field(factory=default_codec, kw_only=True)
     _base_url: str = field(alias="base_url")
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
@@ -1,76 +1,169 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .answer_type import AnswerType
-from .answer_type_enum import AnswerTypeEnum
-from .balance_response import BalanceResponse
-from .chat_completion_request import ChatCompletionRequest
-from .chat_completion_response import ChatCompletionResponse
-from .chat_message import ChatMessage
-from .choice import Choice
-from .create_dataset_response import CreateDatasetResponse
-from .create_file_set_file_request import CreateFileSetFileRequest
-from .create_file_set_file_request_metadata_type_0 import CreateFileSetFileRequestMetadataType0
-from .create_file_set_request import CreateFileSetRequest
-from .create_file_upload_request import CreateFileUploadRequest
-from .create_file_upload_response import CreateFileUploadResponse
-from .create_file_upload_response_metadata_type_0 import CreateFileUploadResponseMetadataType0
-from .create_transform_job_request import CreateTransformJobRequest
-from .dataset_metadata import DatasetMetadata
-from .estimate_cost_request import EstimateCostRequest
-from .estimate_cost_response import EstimateCostResponse
-from .event_usage_summary import EventUsageSummary
-from .file_set import FileSet
-from .file_set_file import FileSetFile
-from .file_set_file_metadata_type_0 import FileSetFileMetadataType0
-from .file_set_query_seed_generator import FileSetQuerySeedGenerator
-from .file_set_seed_generator import FileSetSeedGenerator
-from .filter_criteria import FilterCriteria
-from .forward_looking_question import ForwardLookingQuestion
-from .forward_looking_question_generator import ForwardLookingQuestionGenerator
-from .gdelt_seed_generator import GdeltSeedGenerator
-from .http_validation_error import HTTPValidationError
-from .job_usage import JobUsage
-from .job_usage_by_step_type_0 import JobUsageByStepType0
-from .label import Label
-from .list_file_set_files_response import ListFileSetFilesResponse
-from .list_file_sets_response import ListFileSetsResponse
-from .llm_model_usage_summary import LLMModelUsageSummary
-from .mock_transform_config import MockTransformConfig
-from .mock_transform_config_metadata_additions import MockTransformConfigMetadataAdditions
-from .model_config import ModelConfig
-from .model_source_type import ModelSourceType
-from .news_context import NewsContext
-from .news_context_generator import NewsContextGenerator
-from .news_seed_generator import NewsSeedGenerator
-from .paginated_samples_response import PaginatedSamplesResponse
-from .pipeline_metrics_response import PipelineMetricsResponse
-from .question import Question
-from .question_and_label_generator import QuestionAndLabelGenerator
-from .question_generator import QuestionGenerator
-from .question_pipeline import QuestionPipeline
-from .question_renderer import QuestionRenderer
-from .rag_context import RAGContext
-from .response_message import ResponseMessage
-from .rollout import Rollout
-from .rollout_generator import RolloutGenerator
-from .rollout_parsed_output_type_0 import RolloutParsedOutputType0
-from .sample import Sample
-from .sample_meta import SampleMeta
-from .seed import Seed
-from .step_cost_breakdown import StepCostBreakdown
-from .transform_job import TransformJob
-from .transform_job_status import TransformJobStatus
-from .transform_step_metrics_response import TransformStepMetricsResponse
-from .transform_type import TransformType
-from .upload_samples_request import UploadSamplesRequest
-from .upload_samples_response import UploadSamplesResponse
-from .usage import Usage
-from .usage_summary import UsageSummary
-from .usage_summary_events import UsageSummaryEvents
-from .usage_summary_llm_by_model import UsageSummaryLlmByModel
-from .validate_sample_response import ValidateSampleResponse
-from .validation_error import ValidationError
-from .web_search_labeler import WebSearchLabeler
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .answer_type import AnswerType
+    from .answer_type_enum import AnswerTypeEnum
+    from .balance_response import BalanceResponse
+    from .chat_completion_request import ChatCompletionRequest
+    from .chat_completion_response import ChatCompletionResponse
+    from .chat_message import ChatMessage
+    from .choice import Choice
+    from .create_dataset_response import CreateDatasetResponse
+    from .create_file_set_file_request import CreateFileSetFileRequest
+    from .create_file_set_file_request_metadata_type_0 import CreateFileSetFileRequestMetadataType0
+    from .create_file_set_request import CreateFileSetRequest
+    from .create_file_upload_request import CreateFileUploadRequest
+    from .create_file_upload_response import CreateFileUploadResponse
+    from .create_file_upload_response_metadata_type_0 import CreateFileUploadResponseMetadataType0
+    from .create_transform_job_request import CreateTransformJobRequest
+    from .dataset_metadata import DatasetMetadata
+    from .estimate_cost_request import EstimateCostRequest
+    from .estimate_cost_response import EstimateCostResponse
+    from .event_usage_summary import EventUsageSummary
+    from .file_set import FileSet
+    from .file_set_file import FileSetFile
+    from .file_set_file_metadata_type_0 import FileSetFileMetadataType0
+    from .file_set_query_seed_generator import FileSetQuerySeedGenerator
+    from .file_set_seed_generator import FileSetSeedGenerator
+    from .filter_criteria import FilterCriteria
+    from .forward_looking_question import ForwardLookingQuestion
+    from .forward_looking_question_generator import ForwardLookingQuestionGenerator
+    from .gdelt_seed_generator import GdeltSeedGenerator
+    from .http_validation_error import HTTPValidationError
+    from .job_usage import JobUsage
+    from .job_usage_by_step_type_0 import JobUsageByStepType0
+    from .label import Label
+    from .list_file_set_files_response import ListFileSetFilesResponse
+    from .list_file_sets_response import ListFileSetsResponse
+    from .llm_model_usage_summary import LLMModelUsageSummary
+    from .mock_transform_config import MockTransformConfig
+    from .mock_transform_config_metadata_additions import MockTransformConfigMetadataAdditions
+    from .model_config import ModelConfig
+    from .model_source_type import ModelSourceType
+    from .news_context import NewsContext
+    from .news_context_generator import NewsContextGenerator
+    from .news_seed_generator import NewsSeedGenerator
+    from .paginated_samples_response import PaginatedSamplesResponse
+    from .pipeline_metrics_response import PipelineMetricsResponse
+    from .question import Question
+    from .question_and_label_generator import QuestionAndLabelGenerator
+    from .question_generator import QuestionGenerator
+    from .question_pipeline import QuestionPipeline
+    from .question_renderer import QuestionRenderer
+    from .rag_context import RAGContext
+    from .response_message import ResponseMessage
+    from .rollout import Rollout
+    from .rollout_generator import RolloutGenerator
+    from .rollout_parsed_output_type_0 import RolloutParsedOutputType0
+    from .sample import Sample
+    from .sample_meta import SampleMeta
+    from .seed import Seed
+    from .step_cost_breakdown import StepCostBreakdown
+    from .transform_job import TransformJob
+    from .transform_job_status import TransformJobStatus
+    from .transform_step_metrics_response import TransformStepMetricsResponse
+    from .transform_type import TransformType
+    from .upload_samples_request import UploadSamplesRequest
+    from .upload_samples_response import UploadSamplesResponse
+    from .usage import Usage
+    from .usage_summary import UsageSummary
+    from .usage_summary_events import UsageSummaryEvents
+    from .usage_summary_llm_by_model import UsageSummaryLlmByModel
+    from .validate_sample_response import ValidateSampleResponse
+    from .validation_error import ValidationError
+    from .web_search_labeler import WebSearchLabeler
+
+_MODEL_MODULES = {
+    "AnswerType": ".answer_type",
+    "AnswerTypeEnum": ".answer_type_enum",
+    "BalanceResponse": ".balance_response",
+    "ChatCompletionRequest": ".chat_completion_request",
+    "ChatCompletionResponse": ".chat_completion_response",
+    "ChatMessage": ".chat_message",
+    "Choice": ".choice",
+    "CreateDatasetResponse": ".create_dataset_response",
+    "CreateFileSetFileRequest": ".create_file_set_file_request",
+    "CreateFileSetFileRequestMetadataType0": ".create_file_set_file_request_metadata_type_0",
+    "CreateFileSetRequest": ".create_file_set_request",
+    "CreateFileUploadRequest": ".create_file_upload_request",
+    "CreateFileUploadResponse": ".create_file_upload_response",
+    "CreateFileUploadResponseMetadataType0": ".create_file_upload_response_metadata_type_0",
+    "CreateTransformJobRequest": ".create_transform_job_request",
+    "DatasetMetadata": ".dataset_metadata",
+    "EstimateCostRequest": ".estimate_cost_request",
+    "EstimateCostResponse": ".estimate_cost_response",
+    "EventUsageSummary": ".event_usage_summary",
+    "FileSet": ".file_set",
+    "FileSetFile": ".file_set_file",
+    "FileSetFileMetadataType0": ".file_set_file_metadata_type_0",
+    "FileSetQuerySeedGenerator": ".file_set_query_seed_generator",
+    "FileSetSeedGenerator": ".file_set_seed_generator",
+    "FilterCriteria": ".filter_criteria",
+    "ForwardLookingQuestion": ".forward_looking_question",
+    "ForwardLookingQuestionGenerator": ".forward_looking_question_generator",
+    "GdeltSeedGenerator": ".gdelt_seed_generator",
+    "HTTPValidationError": ".http_validation_error",
+    "JobUsage": ".job_usage",
+    "JobUsageByStepType0": ".job_usage_by_step_type_0",
+    "Label": ".label",
+    "ListFileSetFilesResponse": ".list_file_set_files_response",
+    "ListFileSetsResponse": ".list_file_sets_response",
+    "LLMModelUsageSummary": ".llm_model_usage_summary",
+    "MockTransformConfig": ".mock_transform_config",
+    "MockTransformConfigMetadataAdditions": ".mock_transform_config_metadata_additions",
+    "ModelConfig": ".model_config",
+    "ModelSourceType": ".model_source_type",
+    "NewsContext": ".news_context",
+    "NewsContextGenerator": ".news_context_generator",
+    "NewsSeedGenerator": ".news_seed_generator",
+    "PaginatedSamplesResponse": ".paginated_samples_response",
+    "PipelineMetricsResponse": ".pipeline_metrics_response",
+    "Question": ".question",
+    "QuestionAndLabelGenerator": ".question_and_label_generator",
+    "QuestionGenerator": ".question_generator",
+    "QuestionPipeline": ".question_pipeline",
+    "QuestionRenderer": ".question_renderer",
+    "RAGContext": ".rag_context",
+    "ResponseMessage": ".response_message",
+    "Rollout": ".rollout",
+    "RolloutGenerator": ".rollout_generator",
+    "RolloutParsedOutputType0": ".rollout_parsed_output_type_0",
+    "Sample": ".sample",
+    "SampleMeta": ".sample_meta",
+    "Seed": ".seed",
+    "StepCostBreakdown": ".step_cost_breakdown",
+    "TransformJob": ".transform_job",
+    "TransformJobStatus": ".transform_job_status",
+    "TransformStepMetricsResponse": ".transform_step_metrics_response",
+    "TransformType": ".transform_type",
+    "UploadSamplesRequest": ".upload_samples_request",
+    "UploadSamplesResponse": ".upload_samples_response",
+    "Usage": ".usage",
+    "UsageSummary": ".usage_summary",
+    "UsageSummaryEvents": ".usage_summary_events",
+    "UsageSummaryLlmByModel": ".usage_summary_llm_by_model",
+    "ValidateSampleResponse": ".validate_sample_response",
+    "ValidationError": ".validation_error",
+    "WebSearchLabeler": ".web_search_labeler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODEL_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = (
     "AnswerType",
@@ -8,8 +8,7 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.chat_message import ChatMessage
+from ..models.chat_message import ChatMessage
 
 
 T = TypeVar("T", bound="ChatCompletionRequest")
@@ -111,8 +110,6 @@ class ChatCompletionRequest:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.chat_message import ChatMessage
-
         d = dict(src_dict)
         model = d.pop("model")
 
@@ -8,9 +8,8 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.choice import Choice
-    from ..models.usage import Usage
+from ..models.choice import Choice
+from ..models.usage import Usage
 
 
 T = TypeVar("T", bound="ChatCompletionResponse")
@@ -37,8 +36,6 @@ class ChatCompletionResponse:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.usage import Usage
-
         id = self.id
 
         created = self.created
@@ -79,9 +76,6 @@ class ChatCompletionResponse:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.choice import Choice
-        from ..models.usage import Usage
-
         d = dict(src_dict)
         id = d.pop("id")
 
@@ -8,8 +8,7 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.response_message import ResponseMessage
+from ..models.response_message import ResponseMessage
 
 
 T = TypeVar("T", bound="Choice")
@@ -55,8 +54,6 @@ class Choice:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.response_message import ResponseMessage
-
         d = dict(src_dict)
         index = d.pop("index")
 
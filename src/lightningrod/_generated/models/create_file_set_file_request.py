@@ -8,8 +8,7 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.create_file_set_file_request_metadata_type_0 import CreateFileSetFileRequestMetadataType0
+from ..models.create_file_set_file_request_metadata_type_0 import CreateFileSetFileRequestMetadataType0
 
 
 T = TypeVar("T", bound="CreateFileSetFileRequest")
@@ -28,8 +27,6 @@ class CreateFileSetFileRequest:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.create_file_set_file_request_metadata_type_0 import CreateFileSetFileRequestMetadataType0
-
         file_id = self.file_id
 
         metadata: dict[str, Any] | None | Unset
@@ -54,8 +51,6 @@ class CreateFileSetFileRequest:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.create_file_set_file_request_metadata_type_0 import CreateFileSetFileRequestMetadataType0
-
         d = dict(src_dict)
         file_id = d.pop("file_id")
 
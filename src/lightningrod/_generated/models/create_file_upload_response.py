@@ -6,12 +6,11 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
+from lightningrod._datetime import parse_datetime
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.create_file_upload_response_metadata_type_0 import CreateFileUploadResponseMetadataType0
+from ..models.create_file_upload_response_metadata_type_0 import CreateFileUploadResponseMetadataType0
 
 
 T = TypeVar("T", bound="CreateFileUploadResponse")
@@ -44,8 +43,6 @@ class CreateFileUploadResponse:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.create_file_upload_response_metadata_type_0 import CreateFileUploadResponseMetadataType0
-
         id = self.id
 
         original_file_name = self.original_file_name
@@ -92,8 +89,6 @@ class CreateFileUploadResponse:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.create_file_upload_response_metadata_type_0 import CreateFileUploadResponseMetadataType0
-
         d = dict(src_dict)
         id = d.pop("id")
 
@@ -112,9 +107,9 @@ class CreateFileUploadResponse:
 
         size_bytes = d.pop("size_bytes")
 
-        created_at = isoparse(d.pop("created_at"))
+        created_at = parse_datetime(d.pop("created_at"))
 
-        expires_at = isoparse(d.pop("expires_at"))
+        expires_at = parse_datetime(d.pop("expires_at"))
 
         def _parse_metadata(data: object) -> CreateFileUploadResponseMetadataType0 | None | Unset:
             if data is None:
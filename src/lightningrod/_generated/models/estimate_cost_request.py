@@ -8,17 +8,16 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.file_set_query_seed_generator import FileSetQuerySeedGenerator
-    from ..models.file_set_seed_generator import FileSetSeedGenerator
-    from ..models.forward_looking_question_generator import ForwardLookingQuestionGenerator
-    from ..models.gdelt_seed_generator import GdeltSeedGenerator
-    from ..models.news_seed_generator import NewsSeedGenerator
-    from ..models.question_and_label_generator import QuestionAndLabelGenerator
-    from ..models.question_generator import QuestionGenerator
-    from ..models.question_pipeline import QuestionPipeline
-    from ..models.question_renderer import QuestionRenderer
-    from ..models.web_search_labeler import WebSearchLabeler
+from ..models.file_set_query_seed_generator import FileSetQuerySeedGenerator
+from ..models.file_set_seed_generator import FileSetSeedGenerator
+from ..models.forward_looking_question_generator import ForwardLookingQuestionGenerator
+from ..models.gdelt_seed_generator import GdeltSeedGenerator
+from ..models.news_seed_generator import NewsSeedGenerator
+from ..models.question_and_label_generator import QuestionAndLabelGenerator
+from ..models.question_generator import QuestionGenerator
+from ..models.question_pipeline import QuestionPipeline
+from ..models.question_renderer import QuestionRenderer
+from ..models.web_search_labeler import WebSearchLabeler
 
 
 T = TypeVar("T", bound="EstimateCostRequest")
@@ -50,16 +49,6 @@ class EstimateCostRequest:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.file_set_query_seed_generator import FileSetQuerySeedGenerator
-        from ..models.file_set_seed_generator import FileSetSeedGenerator
-        from ..models.forward_looking_question_generator import ForwardLookingQuestionGenerator
-        from ..models.gdelt_seed_generator import GdeltSeedGenerator
-        from ..models.news_seed_generator import NewsSeedGenerator
-        from ..models.question_and_label_generator import QuestionAndLabelGenerator
-        from ..models.question_generator import QuestionGenerator
-        from ..models.question_pipeline import QuestionPipeline
-        from ..models.question_renderer import QuestionRenderer
-
         config: dict[str, Any]
         if isinstance(self.config, ForwardLookingQuestionGenerator):
             config = self.config.to_dict()
@@ -102,17 +91,6 @@ class EstimateCostRequest:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.file_set_query_seed_generator import FileSetQuerySeedGenerator
-        from ..models.file_set_seed_generator import FileSetSeedGenerator
-        from ..models.forward_looking_question_generator import ForwardLookingQuestionGenerator
-        from ..models.gdelt_seed_generator import GdeltSeedGenerator
-        from ..models.news_seed_generator import NewsSeedGenerator
-        from ..models.question_and_label_generator import QuestionAndLabelGenerator
-        from ..models.question_generator import QuestionGenerator
-        from ..models.question_pipeline import QuestionPipeline
-        from ..models.question_renderer import QuestionRenderer
-        from ..models.web_search_labeler import WebSearchLabeler
-
         d = dict(src_dict)
 
         def _parse_config(
@@ -129,78 +107,69 @@ class EstimateCostRequest:
             | QuestionRenderer
             | WebSearchLabeler
         ):
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                componentsschemas_create_transform_config_type_0 = ForwardLookingQuestionGenerator.from_dict(data)
-
-                return componentsschemas_create_transform_config_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                componentsschemas_create_transform_config_type_1 = FileSetQuerySeedGenerator.from_dict(data)
-
-                return componentsschemas_create_transform_config_type_1
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                componentsschemas_create_transform_config_type_2 = FileSetSeedGenerator.from_dict(data)
-
-                return componentsschemas_create_transform_config_type_2
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                componentsschemas_create_transform_config_type_3 = GdeltSeedGenerator.from_dict(data)
-
-                return componentsschemas_create_transform_config_type_3
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                componentsschemas_create_transform_config_type_4 = NewsSeedGenerator.from_dict(data)
-
-                return componentsschemas_create_transform_config_type_4
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                componentsschemas_create_transform_config_type_5 = QuestionAndLabelGenerator.from_dict(data)
-
-                return componentsschemas_create_transform_config_type_5
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                componentsschemas_create_transform_config_type_6 = QuestionGenerator.from_dict(data)
-
-                return componentsschemas_create_transform_config_type_6
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                componentsschemas_create_transform_config_type_7 = QuestionPipeline.from_dict(data)
-
-                return componentsschemas_create_transform_config_type_7
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                componentsschemas_create_transform_config_type_8 = QuestionRenderer.from_dict(data)
-
-                return componentsschemas_create_transform_config_type_8
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
+            if isinstance(data, dict) and data.get("config_type", "FORWARD_LOOKING_QUESTION_GENERATOR") == "FORWARD_LOOKING_QUESTION_GENERATOR":
+                try:
+                    componentsschemas_create_transform_config_type_0 = ForwardLookingQuestionGenerator.from_dict(data)
+
+                    return componentsschemas_create_transform_config_type_0
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "FILESET_QUERY_SEED_GENERATOR") == "FILESET_QUERY_SEED_GENERATOR":
+                try:
+                    componentsschemas_create_transform_config_type_1 = FileSetQuerySeedGenerator.from_dict(data)
+
+                    return componentsschemas_create_transform_config_type_1
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "FILESET_SEED_GENERATOR") == "FILESET_SEED_GENERATOR":
+                try:
+                    componentsschemas_create_transform_config_type_2 = FileSetSeedGenerator.from_dict(data)
+
+                    return componentsschemas_create_transform_config_type_2
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "GDELT_SEED_GENERATOR") == "GDELT_SEED_GENERATOR":
+                try:
+                    componentsschemas_create_transform_config_type_3 = GdeltSeedGenerator.from_dict(data)
+
+                    return componentsschemas_create_transform_config_type_3
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "NEWS_SEED_GENERATOR") == "NEWS_SEED_GENERATOR":
+                try:
+                    componentsschemas_create_transform_config_type_4 = NewsSeedGenerator.from_dict(data)
+
+                    return componentsschemas_create_transform_config_type_4
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "QUESTION_AND_LABEL_GENERATOR") == "QUESTION_AND_LABEL_GENERATOR":
+                try:
+                    componentsschemas_create_transform_config_type_5 = QuestionAndLabelGenerator.from_dict(data)
+
+                    return componentsschemas_create_transform_config_type_5
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "QUESTION_GENERATOR") == "QUESTION_GENERATOR":
+                try:
+                    componentsschemas_create_transform_config_type_6 = QuestionGenerator.from_dict(data)
+
+                    return componentsschemas_create_transform_config_type_6
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "QUESTION_PIPELINE") == "QUESTION_PIPELINE":
+                try:
+                    componentsschemas_create_transform_config_type_7 = QuestionPipeline.from_dict(data)
+
+                    return componentsschemas_create_transform_config_type_7
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "QUESTION_RENDERER") == "QUESTION_RENDERER":
+                try:
+                    componentsschemas_create_transform_config_type_8 = QuestionRenderer.from_dict(data)
+
+                    return componentsschemas_create_transform_config_type_8
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
             if not isinstance(data, dict):
                 raise TypeError()
             componentsschemas_create_transform_config_type_9 = WebSearchLabeler.from_dict(data)
@@ -6,9 +6,8 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-if TYPE_CHECKING:
-    from ..models.step_cost_breakdown import StepCostBreakdown
-    from ..models.usage_summary import UsageSummary
+from ..models.step_cost_breakdown import StepCostBreakdown
+from ..models.usage_summary import UsageSummary
 
 
 T = TypeVar("T", bound="EstimateCostResponse")
@@ -67,9 +66,6 @@ class EstimateCostResponse:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.step_cost_breakdown import StepCostBreakdown
-        from ..models.usage_summary import UsageSummary
-
         d = dict(src_dict)
         total_cost_dollars = d.pop("total_cost_dollars")
 
@@ -6,7 +6,7 @@ from typing import Any, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
+from lightningrod._datetime import parse_datetime
 
 from ..types import UNSET, Unset
 
@@ -91,9 +91,9 @@ class FileSet:
 
         indexed_file_count = d.pop("indexed_file_count")
 
-        created_at = isoparse(d.pop("created_at"))
+        created_at = parse_datetime(d.pop("created_at"))
 
-        updated_at = isoparse(d.pop("updated_at"))
+        updated_at = parse_datetime(d.pop("updated_at"))
 
         is_public = d.pop("is_public", UNSET)
 
@@ -6,10 +6,9 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
+from lightningrod._datetime import parse_datetime
 
-if TYPE_CHECKING:
-    from ..models.file_set_file_metadata_type_0 import FileSetFileMetadataType0
+from ..models.file_set_file_metadata_type_0 import FileSetFileMetadataType0
 
 
 T = TypeVar("T", bound="FileSetFile")
@@ -46,8 +45,6 @@ class FileSetFile:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.file_set_file_metadata_type_0 import FileSetFileMetadataType0
-
         id = self.id
 
         original_file_name = self.original_file_name
@@ -103,8 +100,6 @@ class FileSetFile:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.file_set_file_metadata_type_0 import FileSetFileMetadataType0
-
         d = dict(src_dict)
         id = d.pop("id")
 
@@ -156,7 +151,7 @@ class FileSetFile:
             try:
                 if not isinstance(data, str):
                     raise TypeError()
-                file_created_date_type_0 = isoparse(data)
+                file_created_date_type_0 = parse_datetime(data)
 
                 return file_created_date_type_0
             except (TypeError, ValueError, AttributeError, KeyError):
@@ -165,9 +160,9 @@ class FileSetFile:
 
         file_created_date = _parse_file_created_date(d.pop("file_created_date"))
 
-        created_at = isoparse(d.pop("created_at"))
+        created_at = parse_datetime(d.pop("created_at"))
 
-        updated_at = isoparse(d.pop("updated_at"))
+        updated_at = parse_datetime(d.pop("updated_at"))
 
         file_set_file = cls(
             id=id,
@@ -8,9 +8,8 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.job_usage_by_step_type_0 import JobUsageByStepType0
-    from ..models.usage_summary import UsageSummary
+from ..models.job_usage_by_step_type_0 import JobUsageByStepType0
+from ..models.usage_summary import UsageSummary
 
 
 T = TypeVar("T", bound="JobUsage")
@@ -36,9 +35,6 @@ class JobUsage:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.job_usage_by_step_type_0 import JobUsageByStepType0
-        from ..models.usage_summary import UsageSummary
-
         total: dict[str, Any] | None | Unset
         if isinstance(self.total, Unset):
             total = UNSET
@@ -91,9 +87,6 @@ class JobUsage:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.job_usage_by_step_type_0 import JobUsageByStepType0
-        from ..models.usage_summary import UsageSummary
-
         d = dict(src_dict)
 
         def _parse_total(data: object) -> None | Unset | UsageSummary:
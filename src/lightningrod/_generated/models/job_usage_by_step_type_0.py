@@ -6,8 +6,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-if TYPE_CHECKING:
-    from ..models.usage_summary import UsageSummary
+from ..models.usage_summary import UsageSummary
 
 
 T = TypeVar("T", bound="JobUsageByStepType0")
@@ -28,8 +27,6 @@ class JobUsageByStepType0:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.usage_summary import UsageSummary
-
         d = dict(src_dict)
         job_usage_by_step_type_0 = cls()
 
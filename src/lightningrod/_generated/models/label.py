@@ -6,7 +6,7 @@ from typing import Any, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
+from lightningrod._datetime import parse_datetime
 
 from ..types import UNSET, Unset
 
@@ -88,7 +88,7 @@ class Label:
             try:
                 if not isinstance(data, str):
                     raise TypeError()
-                resolution_date_type_0 = isoparse(data)
+                resolution_date_type_0 = parse_datetime(data)
 
                 return resolution_date_type_0
             except (TypeError, ValueError, AttributeError, KeyError):
@@ -8,8 +8,7 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.file_set_file import FileSetFile
+from ..models.file_set_file import FileSetFile
 
 
 T = TypeVar("T", bound="ListFileSetFilesResponse")
@@ -63,8 +62,6 @@ class ListFileSetFilesResponse:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.file_set_file import FileSetFile
-
         d = dict(src_dict)
         files = []
         _files = d.pop("files")
@@ -6,8 +6,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-if TYPE_CHECKING:
-    from ..models.file_set import FileSet
+from ..models.file_set import FileSet
 
 
 T = TypeVar("T", bound="ListFileSetsResponse")
@@ -41,8 +40,6 @@ class ListFileSetsResponse:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.file_set import FileSet
-
         d = dict(src_dict)
         file_sets = []
         _file_sets = d.pop("file_sets")
@@ -8,8 +8,7 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.mock_transform_config_metadata_additions import MockTransformConfigMetadataAdditions
+from ..models.mock_transform_config_metadata_additions import MockTransformConfigMetadataAdditions
 
 
 T = TypeVar("T", bound="MockTransformConfig")
@@ -145,8 +144,6 @@ class MockTransformConfig:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.mock_transform_config_metadata_additions import MockTransformConfigMetadataAdditions
-
         d = dict(src_dict)
         config_type = cast(Literal["MOCK"] | Unset, d.pop("config_type", UNSET))
         if config_type != "MOCK" and not isinstance(config_type, Unset):
@@ -6,12 +6,11 @@ from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
+from lightningrod._datetime import parse_datetime
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.filter_criteria import FilterCriteria
+from ..models.filter_criteria import FilterCriteria
 
 
 T = TypeVar("T", bound="NewsSeedGenerator")
@@ -48,8 +47,6 @@ class NewsSeedGenerator:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.filter_criteria import FilterCriteria
-
         start_date = self.start_date.isoformat()
 
         end_date = self.end_date.isoformat()
@@ -114,12 +111,10 @@ class NewsSeedGenerator:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.filter_criteria import FilterCriteria
-
         d = dict(src_dict)
-        start_date = isoparse(d.pop("start_date"))
+        start_date = parse_datetime(d.pop("start_date"))
 
-        end_date = isoparse(d.pop("end_date"))
+        end_date = parse_datetime(d.pop("end_date"))
 
         def _parse_search_query(data: object) -> list[str] | str:
             try:
@@ -8,8 +8,7 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.sample import Sample
+from ..models.sample import Sample
 
 
 T = TypeVar("T", bound="PaginatedSamplesResponse")
@@ -63,8 +62,6 @@ class PaginatedSamplesResponse:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.sample import Sample
-
         d = dict(src_dict)
         samples = []
         _samples = d.pop("samples")
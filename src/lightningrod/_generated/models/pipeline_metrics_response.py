@@ -6,8 +6,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-if TYPE_CHECKING:
-    from ..models.transform_step_metrics_response import TransformStepMetricsResponse
+from ..models.transform_step_metrics_response import TransformStepMetricsResponse
 
 
 T = TypeVar("T", bound="PipelineMetricsResponse")
@@ -56,8 +55,6 @@ class PipelineMetricsResponse:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.transform_step_metrics_response import TransformStepMetricsResponse
-
         d = dict(src_dict)
         total_input_rows = d.pop("total_input_rows")
 
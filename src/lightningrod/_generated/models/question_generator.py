@@ -8,9 +8,8 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.answer_type import AnswerType
-    from ..models.filter_criteria import FilterCriteria
+from ..models.answer_type import AnswerType
+from ..models.filter_criteria import FilterCriteria
 
 
 T = TypeVar("T", bound="QuestionGenerator")
@@ -45,9 +44,6 @@ class QuestionGenerator:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.answer_type import AnswerType
-        from ..models.filter_criteria import FilterCriteria
-
         config_type = self.config_type
 
         instructions: None | str | Unset
@@ -114,9 +110,6 @@ class QuestionGenerator:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.answer_type import AnswerType
-        from ..models.filter_criteria import FilterCriteria
-
         d = dict(src_dict)
         config_type = cast(Literal["QUESTION_GENERATOR"] | Unset, d.pop("config_type", UNSET))
         if config_type != "QUESTION_GENERATOR" and not isinstance(config_type, Unset):
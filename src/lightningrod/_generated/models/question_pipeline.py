@@ -8,19 +8,18 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.file_set_query_seed_generator import FileSetQuerySeedGenerator
-    from ..models.file_set_seed_generator import FileSetSeedGenerator
-    from ..models.forward_looking_question_generator import ForwardLookingQuestionGenerator
-    from ..models.gdelt_seed_generator import GdeltSeedGenerator
-    from ..models.mock_transform_config import MockTransformConfig
-    from ..models.news_context_generator import NewsContextGenerator
-    from ..models.news_seed_generator import NewsSeedGenerator
-    from ..models.question_and_label_generator import QuestionAndLabelGenerator
-    from ..models.question_generator import QuestionGenerator
-    from ..models.question_renderer import QuestionRenderer
-    from ..models.rollout_generator import RolloutGenerator
-    from ..models.web_search_labeler import WebSearchLabeler
+from ..models.file_set_query_seed_generator import FileSetQuerySeedGenerator
+from ..models.file_set_seed_generator import FileSetSeedGenerator
+from ..models.forward_looking_question_generator import ForwardLookingQuestionGenerator
+from ..models.gdelt_seed_generator import GdeltSeedGenerator
+from ..models.mock_transform_config import MockTransformConfig
+from ..models.news_context_generator import NewsContextGenerator
+from ..models.news_seed_generator import NewsSeedGenerator
+from ..models.question_and_label_generator import QuestionAndLabelGenerator
+from ..models.question_generator import QuestionGenerator
+from ..models.question_renderer import QuestionRenderer
+from ..models.rollout_generator import RolloutGenerator
+from ..models.web_search_labeler import WebSearchLabeler
 
 
 T = TypeVar("T", bound="QuestionPipeline")
@@ -60,19 +59,6 @@ class QuestionPipeline:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.file_set_query_seed_generator import FileSetQuerySeedGenerator
-        from ..models.file_set_seed_generator import FileSetSeedGenerator
-        from ..models.forward_looking_question_generator import ForwardLookingQuestionGenerator
-        from ..models.gdelt_seed_generator import GdeltSeedGenerator
-        from ..models.mock_transform_config import MockTransformConfig
-        from ..models.news_context_generator import NewsContextGenerator
-        from ..models.news_seed_generator import NewsSeedGenerator
-        from ..models.question_and_label_generator import QuestionAndLabelGenerator
-        from ..models.question_generator import QuestionGenerator
-        from ..models.question_renderer import QuestionRenderer
-        from ..models.rollout_generator import RolloutGenerator
-        from ..models.web_search_labeler import WebSearchLabeler
-
         seed_generator: dict[str, Any]
         if isinstance(self.seed_generator, NewsSeedGenerator):
             seed_generator = self.seed_generator.to_dict()
@@ -167,19 +153,6 @@ class QuestionPipeline:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.file_set_query_seed_generator import FileSetQuerySeedGenerator
-        from ..models.file_set_seed_generator import FileSetSeedGenerator
-        from ..models.forward_looking_question_generator import ForwardLookingQuestionGenerator
-        from ..models.gdelt_seed_generator import GdeltSeedGenerator
-        from ..models.mock_transform_config import MockTransformConfig
-        from ..models.news_context_generator import NewsContextGenerator
-        from ..models.news_seed_generator import NewsSeedGenerator
-        from ..models.question_and_label_generator import QuestionAndLabelGenerator
-        from ..models.question_generator import QuestionGenerator
-        from ..models.question_renderer import QuestionRenderer
-        from ..models.rollout_generator import RolloutGenerator
-        from ..models.web_search_labeler import WebSearchLabeler
-
         d = dict(src_dict)
 
         def _parse_seed_generator(
@@ -191,38 +164,34 @@ class QuestionPipeline:
             | MockTransformConfig
             | NewsSeedGenerator
         ):
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                seed_generator_type_0 = NewsSeedGenerator.from_dict(data)
-
-                return seed_generator_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                seed_generator_type_1 = GdeltSeedGenerator.from_dict(data)
-
-                return seed_generator_type_1
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                seed_generator_type_2 = FileSetSeedGenerator.from_dict(data)
-
-                return seed_generator_type_2
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                seed_generator_type_3 = FileSetQuerySeedGenerator.from_dict(data)
-
-                return seed_generator_type_3
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
+            if isinstance(data, dict) and data.get("config_type", "NEWS_SEED_GENERATOR") == "NEWS_SEED_GENERATOR":
+                try:
+                    seed_generator_type_0 = NewsSeedGenerator.from_dict(data)
+
+                    return seed_generator_type_0
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "GDELT_SEED_GENERATOR") == "GDELT_SEED_GENERATOR":
+                try:
+                    seed_generator_type_1 = GdeltSeedGenerator.from_dict(data)
+
+                    return seed_generator_type_1
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "FILESET_SEED_GENERATOR") == "FILESET_SEED_GENERATOR":
+                try:
+                    seed_generator_type_2 = FileSetSeedGenerator.from_dict(data)
+
+                    return seed_generator_type_2
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "FILESET_QUERY_SEED_GENERATOR") == "FILESET_QUERY_SEED_GENERATOR":
+                try:
+                    seed_generator_type_3 = FileSetQuerySeedGenerator.from_dict(data)
+
+                    return seed_generator_type_3
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
             if not isinstance(data, dict):
                 raise TypeError()
             seed_generator_type_4 = MockTransformConfig.from_dict(data)
@@ -234,30 +203,27 @@ class QuestionPipeline:
         def _parse_question_generator(
             data: object,
         ) -> ForwardLookingQuestionGenerator | MockTransformConfig | QuestionAndLabelGenerator | QuestionGenerator:
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                question_generator_type_0 = QuestionGenerator.from_dict(data)
-
-                return question_generator_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                question_generator_type_1 = ForwardLookingQuestionGenerator.from_dict(data)
-
-                return question_generator_type_1
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                question_generator_type_2 = QuestionAndLabelGenerator.from_dict(data)
-
-                return question_generator_type_2
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
+            if isinstance(data, dict) and data.get("config_type", "QUESTION_GENERATOR") == "QUESTION_GENERATOR":
+                try:
+                    question_generator_type_0 = QuestionGenerator.from_dict(data)
+
+                    return question_generator_type_0
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "FORWARD_LOOKING_QUESTION_GENERATOR") == "FORWARD_LOOKING_QUESTION_GENERATOR":
+                try:
+                    question_generator_type_1 = ForwardLookingQuestionGenerator.from_dict(data)
+
+                    return question_generator_type_1
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "QUESTION_AND_LABEL_GENERATOR") == "QUESTION_AND_LABEL_GENERATOR":
+                try:
+                    question_generator_type_2 = QuestionAndLabelGenerator.from_dict(data)
+
+                    return question_generator_type_2
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
             if not isinstance(data, dict):
                 raise TypeError()
             question_generator_type_3 = MockTransformConfig.from_dict(data)
@@ -275,22 +241,20 @@ class QuestionPipeline:
                 return data
             if isinstance(data, Unset):
                 return data
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                labeler_type_0_type_0 = WebSearchLabeler.from_dict(data)
-
-                return labeler_type_0_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                labeler_type_0_type_1 = MockTransformConfig.from_dict(data)
-
-                return labeler_type_0_type_1
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
+            if isinstance(data, dict) and data.get("config_type", "WEB_SEARCH_LABELER") == "WEB_SEARCH_LABELER":
+                try:
+                    labeler_type_0_type_0 = WebSearchLabeler.from_dict(data)
+
+                    return labeler_type_0_type_0
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "MOCK") == "MOCK":
+                try:
+                    labeler_type_0_type_1 = MockTransformConfig.from_dict(data)
+
+                    return labeler_type_0_type_1
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
             return cast(MockTransformConfig | None | Unset | WebSearchLabeler, data)
 
         labeler = _parse_labeler(d.pop("labeler", UNSET))
@@ -310,14 +274,13 @@ class QuestionPipeline:
                     def _parse_context_generators_type_0_item(
                         data: object,
                     ) -> MockTransformConfig | NewsContextGenerator:
-                        try:
-                            if not isinstance(data, dict):
-                                raise TypeError()
-                            context_generators_type_0_item_type_0 = NewsContextGenerator.from_dict(data)
-
-                            return context_generators_type_0_item_type_0
-                        except (TypeError, ValueError, AttributeError, KeyError):
-                            pass
+                        if isinstance(data, dict) and data.get("config_type", "NEWS_CONTEXT_GENERATOR") == "NEWS_CONTEXT_GENERATOR":
+                            try:
+                                context_generators_type_0_item_type_0 = NewsContextGenerator.from_dict(data)
+
+                                return context_generators_type_0_item_type_0
+                            except (TypeError, ValueError, AttributeError, KeyError):
+                                pass
                         if not isinstance(data, dict):
                             raise TypeError()
                         context_generators_type_0_item_type_1 = MockTransformConfig.from_dict(data)
@@ -342,22 +305,20 @@ class QuestionPipeline:
                 return data
             if isinstance(data, Unset):
                 return data
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                renderer_type_0_type_0 = QuestionRenderer.from_dict(data)
-
-                return renderer_type_0_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                renderer_type_0_type_1 = MockTransformConfig.from_dict(data)
-
-                return renderer_type_0_type_1
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
+            if isinstance(data, dict) and data.get("config_type", "QUESTION_RENDERER") == "QUESTION_RENDERER":
+                try:
+                    renderer_type_0_type_0 = QuestionRenderer.from_dict(data)
+
+                    return renderer_type_0_type_0
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "MOCK") == "MOCK":
+                try:
+                    renderer_type_0_type_1 = MockTransformConfig.from_dict(data)
+
+                    return renderer_type_0_type_1
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
             return cast(MockTransformConfig | None | QuestionRenderer | Unset, data)
 
         renderer = _parse_renderer(d.pop("renderer", UNSET))
@@ -367,22 +328,20 @@ class QuestionPipeline:
                 return data
             if isinstance(data, Unset):
                 return data
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                rollout_generator_type_0_type_0 = RolloutGenerator.from_dict(data)
-
-                return rollout_generator_type_0_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                rollout_generator_type_0_type_1 = MockTransformConfig.from_dict(data)
-
-                return rollout_generator_type_0_type_1
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
+            if isinstance(data, dict) and data.get("config_type", "ROLLOUT_GENERATOR") == "ROLLOUT_GENERATOR":
+                try:
+                    rollout_generator_type_0_type_0 = RolloutGenerator.from_dict(data)
+
+                    return rollout_generator_type_0_type_0
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("config_type", "MOCK") == "MOCK":
+                try:
+                    rollout_generator_type_0_type_1 = MockTransformConfig.from_dict(data)
+
+                    return rollout_generator_type_0_type_1
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
             return cast(MockTransformConfig | None | RolloutGenerator | Unset, data)
 
         rollout_generator = _parse_rollout_generator(d.pop("rollout_generator", UNSET))
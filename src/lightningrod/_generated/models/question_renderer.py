@@ -8,8 +8,7 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.answer_type import AnswerType
+from ..models.answer_type import AnswerType
 
 
 T = TypeVar("T", bound="QuestionRenderer")
@@ -32,8 +31,6 @@ class QuestionRenderer:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.answer_type import AnswerType
-
         config_type = self.config_type
 
         template: None | str | Unset
@@ -64,8 +61,6 @@ class QuestionRenderer:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.answer_type import AnswerType
-
         d = dict(src_dict)
         config_type = cast(Literal["QUESTION_RENDERER"] | Unset, d.pop("config_type", UNSET))
         if config_type != "QUESTION_RENDERER" and not isinstance(config_type, Unset):
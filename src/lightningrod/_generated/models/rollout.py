@@ -8,8 +8,7 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.rollout_parsed_output_type_0 import RolloutParsedOutputType0
+from ..models.rollout_parsed_output_type_0 import RolloutParsedOutputType0
 
 
 T = TypeVar("T", bound="Rollout")
@@ -33,8 +32,6 @@ class Rollout:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.rollout_parsed_output_type_0 import RolloutParsedOutputType0
-
         model_name = self.model_name
 
         content = self.content
@@ -70,8 +67,6 @@ class Rollout:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.rollout_parsed_output_type_0 import RolloutParsedOutputType0
-
         d = dict(src_dict)
         model_name = d.pop("model_name")
 
@@ -8,8 +8,7 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.model_config import ModelConfig
+from ..models.model_config import ModelConfig
 
 
 T = TypeVar("T", bound="RolloutGenerator")
@@ -77,8 +76,6 @@ class RolloutGenerator:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.model_config import ModelConfig
-
         d = dict(src_dict)
         models = []
         _models = d.pop("models")
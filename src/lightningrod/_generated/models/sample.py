@@ -8,15 +8,14 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.forward_looking_question import ForwardLookingQuestion
-    from ..models.label import Label
-    from ..models.news_context import NewsContext
-    from ..models.question import Question
-    from ..models.rag_context import RAGContext
-    from ..models.rollout import Rollout
-    from ..models.sample_meta import SampleMeta
-    from ..models.seed import Seed
+from ..models.forward_looking_question import ForwardLookingQuestion
+from ..models.label import Label
+from ..models.news_context import NewsContext
+from ..models.question import Question
+from ..models.rag_context import RAGContext
+from ..models.rollout import Rollout
+from ..models.sample_meta import SampleMeta
+from ..models.seed import Seed
 
 
 T = TypeVar("T", bound="Sample")
@@ -47,12 +46,6 @@ class Sample:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.forward_looking_question import ForwardLookingQuestion
-        from ..models.label import Label
-        from ..models.news_context import NewsContext
-        from ..models.question import Question
-        from ..models.seed import Seed
-
         seed: dict[str, Any] | None | Unset
         if isinstance(self.seed, Unset):
             seed = UNSET
@@ -144,15 +137,6 @@ class Sample:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.forward_looking_question import ForwardLookingQuestion
-        from ..models.label import Label
-        from ..models.news_context import NewsContext
-        from ..models.question import Question
-        from ..models.rag_context import RAGContext
-        from ..models.rollout import Rollout
-        from ..models.sample_meta import SampleMeta
-        from ..models.seed import Seed
-
         d = dict(src_dict)
 
         def _parse_seed(data: object) -> None | Seed | Unset:
@@ -177,22 +161,20 @@ class Sample:
                 return data
             if isinstance(data, Unset):
                 return data
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                question_type_0_type_0 = ForwardLookingQuestion.from_dict(data)
-
-                return question_type_0_type_0
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                question_type_0_type_1 = Question.from_dict(data)
-
-                return question_type_0_type_1
-            except (TypeError, ValueError, AttributeError, KeyError):
-                pass
+            if isinstance(data, dict) and data.get("question_type", "FORWARD_LOOKING_QUESTION") == "FORWARD_LOOKING_QUESTION":
+                try:
+                    question_type_0_type_0 = ForwardLookingQuestion.from_dict(data)
+
+                    return question_type_0_type_0
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
+            if isinstance(data, dict) and data.get("question_type", "QUESTION") == "QUESTION":
+                try:
+                    question_type_0_type_1 = Question.from_dict(data)
+
+                    return question_type_0_type_1
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    pass
             return cast(ForwardLookingQuestion | None | Question | Unset, data)
 
         question = _parse_question(d.pop("question", UNSET))
@@ -236,14 +218,13 @@ class Sample:
                 for context_type_0_item_data in _context_type_0:
 
                     def _parse_context_type_0_item(data: object) -> NewsContext | RAGContext:
-                        try:
-                            if not isinstance(data, dict):
-                                raise TypeError()
-                            context_type_0_item_type_0 = NewsContext.from_dict(data)
-
-                            return context_type_0_item_type_0
-                        except (TypeError, ValueError, AttributeError, KeyError):
-                            pass
+                        if isinstance(data, dict) and data.get("context_type", "NEWS_CONTEXT") == "NEWS_CONTEXT":
+                            try:
+                                context_type_0_item_type_0 = NewsContext.from_dict(data)
+
+                                return context_type_0_item_type_0
+                            except (TypeError, ValueError, AttributeError, KeyError):
+                                pass
                         if not isinstance(data, dict):
                             raise TypeError()
                         context_type_0_item_type_1 = RAGContext.from_dict(data)
@@ -8,8 +8,7 @@ from attrs import field as _attrs_field
 
 from ..models.transform_type import TransformType
 
-if TYPE_CHECKING:
-    from ..models.usage_summary import UsageSummary
+from ..models.usage_summary import UsageSummary
 
 
 T = TypeVar("T", bound="StepCostBreakdown")
@@ -65,8 +64,6 @@ class StepCostBreakdown:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.usage_summary import UsageSummary
-
         d = dict(src_dict)
         step_name = d.pop("step_name")
 
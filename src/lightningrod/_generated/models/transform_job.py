@@ -6,13 +6,12 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
+from lightningrod._datetime import parse_datetime
 
 from ..models.transform_job_status import TransformJobStatus
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.job_usage import JobUsage
+from ..models.job_usage import JobUsage
 
 
 T = TypeVar("T", bound="TransformJob")
@@ -57,8 +56,6 @@ class TransformJob:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.job_usage import JobUsage
-
         id = self.id
 
         organization_id = self.organization_id
@@ -144,8 +141,6 @@ class TransformJob:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.job_usage import JobUsage
-
         d = dict(src_dict)
         id = d.pop("id")
 
@@ -173,9 +168,9 @@ class TransformJob:
 
         output_dataset_id = _parse_output_dataset_id(d.pop("output_dataset_id"))
 
-        created_at = isoparse(d.pop("created_at"))
+        created_at = parse_datetime(d.pop("created_at"))
 
-        updated_at = isoparse(d.pop("updated_at"))
+        updated_at = parse_datetime(d.pop("updated_at"))
 
         def _parse_configuration_id(data: object) -> None | str | Unset:
             if data is None:
@@ -6,8 +6,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-if TYPE_CHECKING:
-    from ..models.sample import Sample
+from ..models.sample import Sample
 
 
 T = TypeVar("T", bound="UploadSamplesRequest")
@@ -41,8 +40,6 @@ class UploadSamplesRequest:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.sample import Sample
-
         d = dict(src_dict)
         samples = []
         _samples = d.pop("samples")
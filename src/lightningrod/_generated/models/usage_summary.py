@@ -8,9 +8,8 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.usage_summary_events import UsageSummaryEvents
-    from ..models.usage_summary_llm_by_model import UsageSummaryLlmByModel
+from ..models.usage_summary_events import UsageSummaryEvents
+from ..models.usage_summary_llm_by_model import UsageSummaryLlmByModel
 
 
 T = TypeVar("T", bound="UsageSummary")
@@ -56,9 +55,6 @@ class UsageSummary:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.usage_summary_events import UsageSummaryEvents
-        from ..models.usage_summary_llm_by_model import UsageSummaryLlmByModel
-
         d = dict(src_dict)
         _events = d.pop("events", UNSET)
         events: UsageSummaryEvents | Unset
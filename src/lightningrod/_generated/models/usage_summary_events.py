@@ -6,8 +6,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-if TYPE_CHECKING:
-    from ..models.event_usage_summary import EventUsageSummary
+from ..models.event_usage_summary import EventUsageSummary
 
 
 T = TypeVar("T", bound="UsageSummaryEvents")
@@ -28,8 +27,6 @@ class UsageSummaryEvents:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.event_usage_summary import EventUsageSummary
-
         d = dict(src_dict)
         usage_summary_events = cls()
 
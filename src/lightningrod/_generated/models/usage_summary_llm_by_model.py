@@ -6,8 +6,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-if TYPE_CHECKING:
-    from ..models.llm_model_usage_summary import LLMModelUsageSummary
+from ..models.llm_model_usage_summary import LLMModelUsageSummary
 
 
 T = TypeVar("T", bound="UsageSummaryLlmByModel")
@@ -28,8 +27,6 @@ class UsageSummaryLlmByModel:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.llm_model_usage_summary import LLMModelUsageSummary
-
         d = dict(src_dict)
         usage_summary_llm_by_model = cls()
 
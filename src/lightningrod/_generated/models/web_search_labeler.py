@@ -8,8 +8,7 @@ from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.answer_type import AnswerType
+from ..models.answer_type import AnswerType
 
 
 T = TypeVar("T", bound="WebSearchLabeler")
@@ -33,8 +32,6 @@ class WebSearchLabeler:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.answer_type import AnswerType
-
         config_type = self.config_type
 
         confidence_threshold = self.confidence_threshold
@@ -65,8 +62,6 @@ class WebSearchLabeler:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.answer_type import AnswerType
-
         d = dict(src_dict)
         config_type = cast(Literal["WEB_SEARCH_LABELER"] | Unset, d.pop("config_type", UNSET))
         if config_type != "WEB_SEARCH_LABELER" and not isinstance(config_type, Unset):
@@ -0,0 +1,257 @@
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import httpx
+
+from lightningrod._generated.client import AuthenticatedClient
+from lightningrod._httpcache import AsyncCacheTransport, CacheTransport, HttpCache
+from lightningrod._instrumentation import AsyncInstrumentedTransport, Instrumentation, InstrumentedTransport
+from lightningrod._json import get_codec
+from lightningrod._ratelimit import AsyncRateLimitTransport, RateLimiter, RateLimitTransport
+from lightningrod._retry import AsyncRetryTransport, RetryPolicy, RetryTransport
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_TIMEOUT_SECONDS = 1800.0
+
+
+@dataclass
+class HttpConfig:
+    """
+    Connection pool settings shared by every request a client makes.
+
+    All sub-clients (transforms, datasets, organization, files) and signed-URL
+    uploads go through one pool, so bulk operations reuse warm connections instead
+    of paying a TCP and TLS handshake per request.
+
+    Attributes:
+        max_connections: Maximum number of concurrent connections
+        max_keepalive_connections: Maximum number of idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection is kept before it is closed
+        http2: Negotiate HTTP/2 (requires `pip install lightningrod-ai[http2]`)
+        timeout: Per-request timeout in seconds for API calls (no timeout if None)
+        warm_up: Open a connection to the API when the client is created
+        json_codec: JSON codec for request and response bodies: "orjson", "msgspec" or "json"
+            (defaults to the fastest installed; `pip install lightningrod-ai[fast-json]` adds orjson)
+
+    Example:
+        >>> lr = LightningRod(api_key="your-api-key", http=HttpConfig(max_connections=200, http2=True))
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    timeout: Optional[float] = None
+    warm_up: bool = False
+    json_codec: Optional[str] = None
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release: "_Release"):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class _Release:
+    def __init__(self, semaphore: threading.BoundedSemaphore):
+        self._semaphore = semaphore
+        self._released = False
+
+    def __call__(self) -> None:
+        if not self._released:
+            self._released = True
+            self._semaphore.release()
+
+
+class _ConnectionSlotTransport(httpx.BaseTransport):
+    """
+    Caps in-flight requests at the pool's connection limit.
+
+    httpcore's sync pool can hand a queued request a connection that another thread is
+    closing when more threads than connections share it, failing the request with a
+    read error. Making surplus threads wait here means httpcore never has to queue them.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, slots: int):
+        self.transport: httpx.BaseTransport = transport
+        self._slots = threading.BoundedSemaphore(slots)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._slots.acquire()
+        release = _Release(self._slots)
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException:
+            release()
+            raise
+        # The connection goes back to the pool once the body has been read and closed
+        if response.is_closed:
+            release()
+        else:
+            response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class HttpPool:
+    """
+    Owns the shared transport behind a LightningRod client's API and upload requests.
+
+    API requests get the auth header from the AuthenticatedClient; uploads to signed
+    URLs use a separate httpx.Client without it, over the same connection pool.
+    The pool is safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        config: Optional[HttpConfig] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimiter] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        cache: Optional[HttpCache] = None,
+    ):
+        self.config: HttpConfig = config or HttpConfig()
+        self.base_transport: httpx.BaseTransport = transport or httpx.HTTPTransport(
+            limits=self.config.limits(),
+            http2=self.config.http2,
+        )
+        # Layers applied to every request, innermost first; each retry attempt takes its own rate-limit token
+        layered: httpx.BaseTransport = self.base_transport
+        if transport is None:
+            layered = _ConnectionSlotTransport(layered, self.config.max_connections)
+        if rate_limit is not None:
+            layered = RateLimitTransport(layered, rate_limit)
+        layered = RetryTransport(layered, retry or RetryPolicy())
+        if cache is not None:
+            # Cache hits skip rate limiting and retries, but are still instrumented
+            layered = CacheTransport(layered, cache)
+        if instrumentation is not None:
+            layered = InstrumentedTransport(layered, instrumentation)
+        self.transport: httpx.BaseTransport = layered
+        self.instrumentation: Optional[Instrumentation] = instrumentation
+        self._upload_client: Optional[httpx.Client] = None
+        self._upload_client_lock = threading.Lock()
+
+    def authenticated_client(self, base_url: str, api_key: str) -> AuthenticatedClient:
+        if self.instrumentation is not None:
+            self.instrumentation.bind(base_url)
+        client = AuthenticatedClient(
+            base_url=base_url,
+            token=api_key,
+            prefix="Bearer",
+            auth_header_name="Authorization",
+            timeout=httpx.Timeout(self.config.timeout),
+            json_codec=get_codec(self.config.json_codec),
+            httpx_args={"transport": self.transport},
+        )
+        # AuthenticatedClient builds its httpx client lazily without a lock; build it now,
+        # before the client is shared, so concurrent first requests can't each create one
+        client.get_httpx_client()
+        return client
+
+    def upload_client(self) -> httpx.Client:
+        """Unauthenticated client for signed-URL uploads, sharing the API connection pool."""
+        with self._upload_client_lock:
+            if self._upload_client is None:
+                self._upload_client = httpx.Client(transport=self.transport, timeout=UPLOAD_TIMEOUT_SECONDS)
+            return self._upload_client
+
+    def warm_up(self, client: AuthenticatedClient) -> None:
+        """Open a connection to the API host so the first real request skips connection setup."""
+        try:
+            client.get_httpx_client().head("/")
+        except httpx.HTTPError:
+            logger.debug("Connection warm-up failed", exc_info=True)
+
+    def close(self) -> None:
+        # The API and upload clients both send through this transport
+        self.transport.close()
+
+
+class AsyncHttpPool:
+    """Async counterpart of HttpPool, built on httpx.AsyncHTTPTransport."""
+
+    def __init__(
+        self,
+        config: Optional[HttpConfig] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimiter] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        cache: Optional[HttpCache] = None,
+    ):
+        self.config: HttpConfig = config or HttpConfig()
+        self.base_transport: httpx.AsyncBaseTransport = transport or httpx.AsyncHTTPTransport(
+            limits=self.config.limits(),
+            http2=self.config.http2,
+        )
+        # Layers applied to every request, innermost first; each retry attempt takes its own rate-limit token
+        layered: httpx.AsyncBaseTransport = self.base_transport
+        if rate_limit is not None:
+            layered = AsyncRateLimitTransport(layered, rate_limit)
+        layered = AsyncRetryTransport(layered, retry or RetryPolicy())
+        if cache is not None:
+            # Cache hits skip rate limiting and retries, but are still instrumented
+            layered = AsyncCacheTransport(layered, cache)
+        if instrumentation is not None:
+            layered = AsyncInstrumentedTransport(layered, instrumentation)
+        self.transport: httpx.AsyncBaseTransport = layered
+        self.instrumentation: Optional[Instrumentation] = instrumentation
+        self._upload_client: Optional[httpx.AsyncClient] = None
+        self._upload_client_lock = threading.Lock()
+
+    def authenticated_client(self, base_url: str, api_key: str) -> AuthenticatedClient:
+        if self.instrumentation is not None:
+            self.instrumentation.bind(base_url)
+        client = AuthenticatedClient(
+            base_url=base_url,
+            token=api_key,
+            prefix="Bearer",
+            auth_header_name="Authorization",
+            timeout=httpx.Timeout(self.config.timeout),
+            json_codec=get_codec(self.config.json_codec),
+            httpx_args={"transport": self.transport},
+        )
+        # AuthenticatedClient builds its httpx client lazily without a lock; build it now,
+        # before the client is shared, so concurrent first requests can't each create one
+        client.get_async_httpx_client()
+        return client
+
+    def upload_client(self) -> httpx.AsyncClient:
+        """Unauthenticated client for signed-URL uploads, sharing the API connection pool."""
+        with self._upload_client_lock:
+            if self._upload_client is None:
+                self._upload_client = httpx.AsyncClient(transport=self.transport, timeout=UPLOAD_TIMEOUT_SECONDS)
+            return self._upload_client
+
+    async def warm_up(self, client: AuthenticatedClient) -> None:
+        """Open a connection to the API host so the first real request skips connection setup."""
+        try:
+            await client.get_async_httpx_client().head("/")
+        except httpx.HTTPError:
+            logger.debug("Connection warm-up failed", exc_info=True)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
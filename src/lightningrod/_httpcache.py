@@ -0,0 +1,350 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from lightningrod._cache_dir import default_cache_dir
+
+CACHE_EXTENSION = "lightningrod.cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_TERMINAL_JOB_STATUSES = {"COMPLETED", "FAILED", "CANCELLED"}
+_JOB_PATH = re.compile(r"/transform-jobs/([^/]+)$")
+_JOB_METRICS_PATH = re.compile(r"/transform-jobs/([^/]+)/metrics$")
+_DATASET_PATH = re.compile(r"/datasets/([^/]+)(?:/samples)?$")
+# The cached body is stored decoded, so these no longer describe it
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+@dataclass(frozen=True)
+class HttpCacheStats:
+    """
+    Counters for an HttpCache since it was created.
+
+    Attributes:
+        hits: Responses served from disk without contacting the server
+        revalidated: Stored responses confirmed unchanged by a 304 Not Modified
+        misses: GETs fetched in full whose response was stored, or that replaced a stale stored entry
+        stores: Responses written to disk
+        evictions: Entries removed to stay under `max_bytes`
+        size_bytes: Current size of the stored entries
+    """
+
+    hits: int
+    revalidated: int
+    misses: int
+    stores: int
+    evictions: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    path: Path
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+    etag: Optional[str]
+    immutable: bool
+
+    def response(self, revalidated: bool = False) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            extensions={CACHE_EXTENSION: "revalidated" if revalidated else "hit"},
+        )
+
+
+class HttpCache:
+    """
+    Disk cache for API GET responses.
+
+    Responses that can no longer change are stored and served without a request:
+    transform jobs in a terminal state, and the metrics, metadata and sample pages
+    of datasets produced by a finished job. Other GET responses that carry an ETag
+    are stored and revalidated with If-None-Match, so an unchanged resource costs a
+    304 instead of a full download. When the cache grows past `max_bytes`, the least
+    recently used entries are removed. The cache is safe to share between threads
+    and clients, and its directory can be shared between processes.
+
+    Args:
+        directory: Where entries are stored (defaults to ~/.cache/lightningrod/http)
+        max_bytes: Size limit for stored responses (defaults to 512 MiB)
+
+    Example:
+        >>> cache = HttpCache()
+        >>> lr = LightningRod(api_key="your-api-key", http_cache=cache)
+        >>> lr.datasets.get(dataset_id).download()  # fetched from the API
+        >>> cache.stats().hits
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.directory: Path = Path(directory) if directory is not None else default_cache_dir() / "http"
+        self.max_bytes: int = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self._counts: Dict[str, int] = {"hits": 0, "revalidated": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def stats(self) -> HttpCacheStats:
+        with self._lock:
+            return HttpCacheStats(size_bytes=self._current_size(), **self._counts)
+
+    def clear(self) -> None:
+        """Remove every stored response."""
+        with self._lock:
+            for path in self._entry_paths():
+                path.unlink(missing_ok=True)
+            for path in (self.directory / "final").glob("*"):
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+    def lookup(self, request: httpx.Request) -> Optional[_Entry]:
+        """Return the stored response for a GET, refreshing its position in the LRU order."""
+        if request.method != "GET":
+            return None
+        path = self._entry_path(request)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                content = f.read()
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return _Entry(
+            path=path,
+            status_code=meta["status_code"],
+            headers=[tuple(h) for h in meta["headers"]],
+            content=content,
+            etag=meta["etag"],
+            immutable=meta["immutable"],
+        )
+
+    def store(self, request: httpx.Request, response: httpx.Response) -> bool:
+        """Write a fully read GET response to disk if it is immutable or has an ETag."""
+        if request.method != "GET" or response.status_code != 200:
+            return False
+        path = self._entry_path(request)
+        immutable = self._is_immutable(request.url.path, response)
+        etag = response.headers.get("ETag")
+        if "no-store" in response.headers.get("Cache-Control", "") or (not immutable and etag is None):
+            # Whatever was stored for this URL is now out of date
+            self._discard(path)
+            return False
+        meta = {
+            "url": str(request.url),
+            "status_code": response.status_code,
+            "headers": [[k, v] for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS],
+            "etag": etag,
+            "immutable": immutable,
+        }
+        data = json.dumps(meta).encode("utf-8") + b"\n" + response.content
+        with self._lock:
+            size = self._current_size()
+            try:
+                size -= path.stat().st_size
+            except OSError:
+                pass
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so concurrent readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".entry-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._size = size + len(data)
+            self._counts["stores"] += 1
+            if self._size > self.max_bytes:
+                self._evict()
+        return True
+
+    def candidate(self, request: httpx.Request, response: httpx.Response) -> bool:
+        """Whether a GET response might be stored, and so is worth reading in full."""
+        if response.status_code != 200:
+            return False
+        path = request.url.path
+        return "ETag" in response.headers or any(p.search(path) for p in (_JOB_PATH, _JOB_METRICS_PATH, _DATASET_PATH))
+
+    def _discard(self, path: Path) -> None:
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                return
+            if self._size is not None:
+                self._size -= size
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def _key(self, request: httpx.Request) -> str:
+        # Responses are only shared between clients using the same credentials
+        auth = request.headers.get("Authorization", "")
+        return hashlib.sha256(f"{auth}\n{request.method}\n{request.url}".encode("utf-8")).hexdigest()
+
+    def _entry_path(self, request: httpx.Request) -> Path:
+        return self.directory / f"{self._key(request)}.entry"
+
+    def _entry_paths(self) -> List[Path]:
+        return list(self.directory.glob("*.entry"))
+
+    def _current_size(self) -> int:
+        if self._size is None:
+            self._size = sum(p.stat().st_size for p in self._entry_paths())
+        return self._size
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits in `max_bytes`."""
+        entries = []
+        for path in self._entry_paths():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        # Recount from disk, since other processes may share the directory
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._size -= size
+            self._counts["evictions"] += 1
+
+    def _final_marker(self, kind: str, resource_id: str) -> Path:
+        digest = hashlib.sha256(resource_id.encode("utf-8")).hexdigest()
+        return self.directory / "final" / f"{kind}-{digest}"
+
+    def _mark_final(self, kind: str, resource_id: str) -> None:
+        marker = self._final_marker(kind, resource_id)
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+
+    def _is_final(self, kind: str, resource_id: str) -> bool:
+        return self._final_marker(kind, resource_id).exists()
+
+    def _is_immutable(self, path: str, response: httpx.Response) -> bool:
+        match = _JOB_PATH.search(path)
+        if match:
+            job = _json_object(response.content)
+            if job.get("status") not in _TERMINAL_JOB_STATUSES:
+                return False
+            # A finished job's metrics and output dataset are final too
+            self._mark_final("job", match.group(1))
+            if job.get("output_dataset_id"):
+                self._mark_final("dataset", job["output_dataset_id"])
+            return True
+        match = _JOB_METRICS_PATH.search(path)
+        if match:
+            return self._is_final("job", match.group(1))
+        match = _DATASET_PATH.search(path)
+        if match:
+            return self._is_final("dataset", match.group(1))
+        return False
+
+
+def _json_object(content: bytes) -> Dict[str, Any]:
+    try:
+        value = json.loads(content)
+    except ValueError:
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+def _conditional(request: httpx.Request, entry: _Entry) -> httpx.Request:
+    if entry.etag is not None and "If-None-Match" not in request.headers:
+        request.headers["If-None-Match"] = entry.etag
+    return request
+
+
+class CacheTransport(httpx.BaseTransport):
+    """Wraps a transport, answering GETs from an HttpCache and storing cacheable responses."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: HttpCache):
+        self.transport: httpx.BaseTransport = transport
+        self.cache: HttpCache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return self.transport.handle_request(request)
+        entry = self.cache.lookup(request)
+        if entry is not None and entry.immutable:
+            self.cache._count("hits")
+            return entry.response()
+        if entry is not None:
+            _conditional(request, entry)
+        response = self.transport.handle_request(request)
+        if entry is not None and response.status_code == 304:
+            response.close()
+            self.cache._count("revalidated")
+            return entry.response(revalidated=True)
+        if entry is None and not self.cache.candidate(request, response):
+            return response
+        stored = False
+        if response.status_code == 200:
+            response.read()
+            stored = self.cache.store(request, response)
+        # Responses that can't be stored (e.g. a running job's status) aren't lookups the cache could answer
+        if entry is not None or stored:
+            self.cache._count("misses")
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of CacheTransport; cache files are read and written in a worker thread."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: HttpCache):
+        self.transport: httpx.AsyncBaseTransport = transport
+        self.cache: HttpCache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self.transport.handle_async_request(request)
+        entry = await asyncio.to_thread(self.cache.lookup, request)
+        if entry is not None and entry.immutable:
+            self.cache._count("hits")
+            return entry.response()
+        if entry is not None:
+            _conditional(request, entry)
+        response = await self.transport.handle_async_request(request)
+        if entry is not None and response.status_code == 304:
+            await response.aclose()
+            self.cache._count("revalidated")
+            return entry.response(revalidated=True)
+        if entry is None and not self.cache.candidate(request, response):
+            return response
+        stored = False
+        if response.status_code == 200:
+            await response.aread()
+            stored = await asyncio.to_thread(self.cache.store, request, response)
+        # Responses that can't be stored (e.g. a running job's status) aren't lookups the cache could answer
+        if entry is not None or stored:
+            self.cache._count("misses")
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,417 @@
+import bisect
+import contextvars
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+ATTEMPTS_EXTENSION = "lightningrod.attempts"
+SPAN_EXTENSION = "lightningrod.span"
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Path segments that are followed by an id, and the span attribute the id is recorded as
+_ID_SEGMENTS = {"datasets": "dataset_id", "transform-jobs": "job_id", "filesets": "file_set_id"}
+_NAMED_SUBPATHS = {"cost-estimation"}
+
+_correlation: contextvars.ContextVar[Dict[str, str]] = contextvars.ContextVar("lightningrod_span_context", default={})
+_span_ids = itertools.count(1)
+
+
+@dataclass
+class Span:
+    """
+    One timed operation: an HTTP exchange ("http") or parsing its response body ("parse").
+
+    The two spans of one request share `request_id`. Spans are correlated with jobs and
+    datasets through `job_id` and `dataset_id`, taken from the request path or from an
+    enclosing `span_context()`.
+
+    Attributes:
+        name: "http" or "parse"
+        method: HTTP method
+        endpoint: Path template, e.g. "/datasets/{dataset_id}/samples"; "signed-upload" for storage uploads
+        request_id: Id shared by the spans of one request
+        start_time: Wall-clock start (seconds since the epoch)
+        duration_seconds: Time from sending the request until the response body was read (including
+            retries and rate-limit waits) for "http" spans, or time spent parsing for "parse" spans
+        status_code: Final response status, or None if the request failed
+        request_bytes: Size of the request body
+        response_bytes: Size of the response body
+        retries: Number of times the request was resent
+        error: Exception type name if the request failed
+        job_id: Transform job the request belongs to
+        dataset_id: Dataset the request belongs to
+    """
+
+    name: str
+    method: str
+    endpoint: str
+    request_id: int
+    start_time: float
+    duration_seconds: float = 0.0
+    status_code: Optional[int] = None
+    request_bytes: int = 0
+    response_bytes: int = 0
+    retries: int = 0
+    error: Optional[str] = None
+    job_id: Optional[str] = None
+    dataset_id: Optional[str] = None
+
+
+class SpanExporter:
+    """
+    Receives every finished span. Subclass and override `export`, or pass a plain callable.
+
+    The base class ignores every span, like the base ProgressReporter ignores events.
+    """
+
+    def export(self, span: Span) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemoryExporter(SpanExporter):
+    """Keeps finished spans in a list, for tests and interactive inspection."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class LoggingExporter(SpanExporter):
+    """Logs each span at DEBUG level on the `lightningrod` logger."""
+
+    def export(self, span: Span) -> None:
+        logger.debug(
+            "%s %s %s %.1fms status=%s bytes=%d/%d retries=%d job=%s dataset=%s",
+            span.name, span.method, span.endpoint, span.duration_seconds * 1000, span.status_code,
+            span.request_bytes, span.response_bytes, span.retries, span.job_id, span.dataset_id,
+        )
+
+
+ExporterOption = Union[SpanExporter, Callable[[Span], Any]]
+
+
+class Histogram:
+    """Fixed-bucket histogram of durations in seconds."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (inf if it is past the last bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated counters for one `METHOD endpoint` pair."""
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+    parse: Histogram = field(default_factory=Histogram)
+
+
+class Instrumentation:
+    """
+    Records latency, payload sizes, retries and parse time for every API request.
+
+    Each request produces an "http" span when its response body has been read and,
+    for API responses, a "parse" span once the SDK has decoded it. Spans go to the
+    exporters and are aggregated per endpoint in `stats()`.
+
+    Args:
+        exporters: SpanExporter instances or callables receiving each finished span
+        on_request: Hooks called with each outgoing httpx.Request
+        on_response: Hooks called with each (httpx.Request, httpx.Response) before the body is read
+        buckets: Latency histogram bucket bounds in seconds
+
+    Example:
+        >>> exporter = InMemoryExporter()
+        >>> lr = LightningRod(api_key="your-api-key", instrumentation=Instrumentation([exporter]))
+        >>> lr.datasets.get("dataset-id").download()
+        >>> stats = lr.instrumentation.stats()["GET /datasets/{dataset_id}/samples"]
+        >>> print(stats.latency.quantile(0.95), stats.response_bytes, stats.parse.sum)
+    """
+
+    def __init__(
+        self,
+        exporters: Optional[Sequence[ExporterOption]] = None,
+        on_request: Optional[Sequence[Callable[[httpx.Request], Any]]] = None,
+        on_response: Optional[Sequence[Callable[[httpx.Request, httpx.Response], Any]]] = None,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        self.exporters: List[ExporterOption] = list(exporters or [])
+        self.on_request: List[Callable[[httpx.Request], Any]] = list(on_request or [])
+        self.on_response: List[Callable[[httpx.Request, httpx.Response], Any]] = list(on_response or [])
+        self._buckets: Tuple[float, ...] = tuple(buckets)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, EndpointStats] = {}
+        self._api_host: Optional[str] = None
+        self._api_path: str = ""
+
+    def bind(self, base_url: str) -> None:
+        """Set the API base URL, so endpoints are reported relative to it."""
+        url = httpx.URL(base_url)
+        self._api_host = url.host
+        self._api_path = url.path.rstrip("/")
+
+    def stats(self) -> Dict[str, EndpointStats]:
+        """Counters and histograms keyed by "METHOD endpoint"."""
+        with self._lock:
+            return dict(self._stats)
+
+    def start(self, request: httpx.Request) -> Span:
+        endpoint, ids = self._endpoint(request.url)
+        ids = {**ids, **_correlation.get()}
+        span = Span(
+            name="http",
+            method=request.method,
+            endpoint=endpoint,
+            request_id=next(_span_ids),
+            start_time=time.time(),
+            request_bytes=int(request.headers.get("Content-Length") or 0),
+            job_id=ids.get("job_id"),
+            dataset_id=ids.get("dataset_id"),
+        )
+        for hook in self.on_request:
+            hook(request)
+        return span
+
+    def finish(self, span: Span) -> None:
+        with self._lock:
+            stats = self._endpoint_stats(span)
+            if span.name == "http":
+                stats.requests += 1
+                stats.errors += span.error is not None or (span.status_code or 0) >= 400
+                stats.retries += span.retries
+                stats.request_bytes += span.request_bytes
+                stats.response_bytes += span.response_bytes
+                stats.latency.observe(span.duration_seconds)
+            else:
+                stats.parse.observe(span.duration_seconds)
+        for exporter in self.exporters:
+            try:
+                if isinstance(exporter, SpanExporter):
+                    exporter.export(span)
+                else:
+                    exporter(span)
+            except Exception:
+                logger.warning("Span exporter failed", exc_info=True)
+
+    def _endpoint_stats(self, span: Span) -> EndpointStats:
+        key = f"{span.method} {span.endpoint}"
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = EndpointStats(latency=Histogram(self._buckets), parse=Histogram(self._buckets))
+        return stats
+
+    def _endpoint(self, url: httpx.URL) -> Tuple[str, Dict[str, str]]:
+        if self._api_host is not None and url.host != self._api_host:
+            return "signed-upload", {}
+        path = url.path
+        if self._api_path and path.startswith(self._api_path):
+            path = path[len(self._api_path):]
+        segments = path.strip("/").split("/")
+        ids: Dict[str, str] = {}
+        for i in range(1, len(segments)):
+            name = _ID_SEGMENTS.get(segments[i - 1])
+            if name and segments[i] not in _NAMED_SUBPATHS:
+                ids[name] = segments[i]
+                segments[i] = "{" + name + "}"
+        return "/" + "/".join(segments), ids
+
+
+@contextmanager
+def span_context(job_id: Optional[str] = None, dataset_id: Optional[str] = None) -> Iterator[None]:
+    """Attribute spans of requests made inside the block to a job and/or dataset."""
+    extra = {key: value for key, value in (("job_id", job_id), ("dataset_id", dataset_id)) if value}
+    token = _correlation.set({**_correlation.get(), **extra})
+    try:
+        yield
+    finally:
+        _correlation.reset(token)
+
+
+class _SpanState:
+    def __init__(self, instrumentation: Instrumentation, span: Span, request: httpx.Request, started: float):
+        self.instrumentation = instrumentation
+        self.span = span
+        self.request = request
+        self.started = started
+        self.finished = False
+
+    def complete(self, response: Optional[httpx.Response] = None, error: Optional[BaseException] = None) -> None:
+        if self.finished:
+            return
+        self.finished = True
+        self.span.duration_seconds = time.perf_counter() - self.started
+        self.span.retries = max(0, self.request.extensions.get(ATTEMPTS_EXTENSION, 1) - 1)
+        if response is not None:
+            self.span.status_code = response.status_code
+        if error is not None:
+            self.span.error = type(error).__name__
+        self.instrumentation.finish(self.span)
+
+
+class _CountingStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, state: _SpanState, response: httpx.Response):
+        self._stream = stream
+        self._state = state
+        self._response = response
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._state.span.response_bytes += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._state.complete(self._response)
+
+
+class _AsyncCountingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, state: _SpanState, response: httpx.Response):
+        self._stream = stream
+        self._state = state
+        self._response = response
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._state.span.response_bytes += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._state.complete(self._response)
+
+
+def _attach(state: _SpanState, response: httpx.Response) -> bool:
+    """Link the span to the response; returns False if the body was already read (e.g. by a mock transport)."""
+    response.extensions = {**response.extensions, SPAN_EXTENSION: state}
+    for hook in state.instrumentation.on_response:
+        hook(state.request, response)
+    if response.is_closed:
+        state.span.response_bytes = len(response.content)
+        state.complete(response)
+        return False
+    return True
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    """Wraps a transport, recording a span for every request it sends."""
+
+    def __init__(self, transport: httpx.BaseTransport, instrumentation: Instrumentation):
+        self.transport: httpx.BaseTransport = transport
+        self.instrumentation: Instrumentation = instrumentation
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        state = _SpanState(self.instrumentation, self.instrumentation.start(request), request, time.perf_counter())
+        try:
+            response = self.transport.handle_request(request)
+        except Exception as e:
+            state.complete(error=e)
+            raise
+        if _attach(state, response):
+            response.stream = _CountingStream(response.stream, state, response)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of InstrumentedTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, instrumentation: Instrumentation):
+        self.transport: httpx.AsyncBaseTransport = transport
+        self.instrumentation: Instrumentation = instrumentation
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        state = _SpanState(self.instrumentation, self.instrumentation.start(request), request, time.perf_counter())
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception as e:
+            state.complete(error=e)
+            raise
+        if _attach(state, response):
+            response.stream = _AsyncCountingStream(response.stream, state, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def timed_parse(parse: Callable[..., Any], *, client: Any, response: httpx.Response) -> Any:
+    """Run a generated `_parse_response`, recording a "parse" span if the request was instrumented."""
+    state: Optional[_SpanState] = response.extensions.get(SPAN_EXTENSION)
+    if state is None:
+        return parse(client=client, response=response)
+    start_time = time.time()
+    started = time.perf_counter()
+    try:
+        return parse(client=client, response=response)
+    finally:
+        http = state.span
+        state.instrumentation.finish(Span(
+            name="parse",
+            method=http.method,
+            endpoint=http.endpoint,
+            request_id=http.request_id,
+            start_time=start_time,
+            duration_seconds=time.perf_counter() - started,
+            status_code=http.status_code,
+            job_id=http.job_id,
+            dataset_id=http.dataset_id,
+        ))
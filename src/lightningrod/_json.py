@@ -0,0 +1,91 @@
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+CODEC_NAMES = ("orjson", "msgspec", "json")
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """
+    Encoder/decoder pair used for API request and response bodies.
+
+    The generated endpoints call `loads` on every response and `encode` on every
+    request, so swapping in a faster codec speeds up all of them.
+
+    Attributes:
+        name: Codec name ("orjson", "msgspec" or "json")
+        loads: Parses JSON bytes into Python objects
+        dumps: Serializes Python objects to compact UTF-8 JSON bytes
+    """
+
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], bytes]
+
+    def encode(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace an httpx `json=` argument with a body serialized by this codec."""
+        if "json" not in kwargs:
+            return kwargs
+        kwargs = dict(kwargs)
+        kwargs["content"] = self.dumps(kwargs.pop("json"))
+        headers = kwargs.setdefault("headers", {})
+        headers.setdefault("Content-Type", "application/json")
+        return kwargs
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # Same settings httpx uses for `json=`
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def _load(name: str) -> JsonCodec:
+    if name == "orjson":
+        import orjson
+
+        return JsonCodec(name="orjson", loads=orjson.loads, dumps=orjson.dumps)
+    if name == "msgspec":
+        import msgspec
+
+        return JsonCodec(name="msgspec", loads=msgspec.json.decode, dumps=msgspec.json.encode)
+    if name == "json":
+        return JsonCodec(name="json", loads=json.loads, dumps=_stdlib_dumps)
+    raise ValueError(f"Unknown JSON codec {name!r}; expected one of {', '.join(CODEC_NAMES)}")
+
+
+@lru_cache(maxsize=None)
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Return the named codec, or the fastest installed one if `name` is None.
+
+    orjson is preferred, then msgspec, then the standard library.
+
+    Raises:
+        ValueError: If `name` is not a known codec
+        ImportError: If the named codec is not installed
+    """
+    if name is not None:
+        return _load(name)
+    for candidate in ("orjson", "msgspec"):
+        try:
+            return _load(candidate)
+        except ImportError:
+            continue
+    return _load("json")
+
+
+def default_codec() -> JsonCodec:
+    return get_codec()
+
+
+def available_codecs() -> List[str]:
+    """Names of the codecs that can be loaded in this environment."""
+    available = []
+    for name in CODEC_NAMES:
+        try:
+            _load(name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
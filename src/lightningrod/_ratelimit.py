@@ -0,0 +1,217 @@
+import asyncio
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+import httpx
+
+from lightningrod._retry import _retry_after_seconds
+
+# Endpoint groups, matched against the request path in order. Anything else
+# (including signed-URL uploads to storage) falls into the "default" group.
+ENDPOINT_GROUPS: Tuple[Tuple[str, str], ...] = (
+    ("transform-jobs", r"/transform-jobs(/|$)"),
+    ("datasets", r"/datasets(/|$)"),
+    ("files", r"/(files|filesets)(/|$)"),
+    ("organizations", r"/organizations(/|$)"),
+)
+DEFAULT_GROUP = "default"
+
+
+@dataclass
+class RateLimit:
+    """
+    Token-bucket limit for one endpoint group.
+
+    Attributes:
+        rate: Sustained requests per second
+        burst: Requests allowed back-to-back before throttling starts (defaults to one second's worth)
+    """
+
+    rate: float
+    burst: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+    @property
+    def capacity(self) -> int:
+        return self.burst if self.burst is not None else max(1, math.ceil(self.rate))
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    """Wait-time counters for one endpoint group."""
+
+    requests: int
+    delayed: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.requests if self.requests else 0.0
+
+
+class _TokenBucket:
+    def __init__(self, limit: RateLimit, now: float):
+        self.rate: float = limit.rate
+        self.capacity: int = limit.capacity
+        self.tokens: float = float(limit.capacity)
+        self.updated: float = now
+        self.requests: int = 0
+        self.delayed: int = 0
+        self.total_wait: float = 0.0
+        self.max_wait: float = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        # Tokens may go negative: each caller reserves the next free slot, so
+        # waiters are released one by one at the configured rate, in arrival order.
+        self._refill(now)
+        self.tokens -= 1
+        wait = max(0.0, -self.tokens / self.rate)
+        self.requests += 1
+        if wait > 0:
+            self.delayed += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        return wait
+
+    def pause(self, seconds: float, now: float) -> None:
+        self._refill(now)
+        self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+
+class RateLimiter:
+    """
+    Client-side token-bucket rate limiter, with one bucket per endpoint group.
+
+    Requests over the limit are delayed until a token is free instead of being sent and
+    rejected with 429. One limiter can be shared by several clients, threads and asyncio
+    tasks; they all draw from the same budget. When the server still answers 429 with
+    `Retry-After`, the whole group is paused for that long.
+
+    Args:
+        limits: Limits keyed by endpoint group: "transform-jobs", "datasets", "files",
+            "organizations" or "default" (every other request)
+        default: Shorthand for `limits["default"]`
+
+    Example:
+        >>> limiter = RateLimiter({"datasets": RateLimit(rate=20, burst=40)}, default=RateLimit(rate=10))
+        >>> lr = LightningRod(api_key="your-api-key", rate_limit=limiter)
+        >>> limiter.stats()["datasets"].total_wait_seconds
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, RateLimit]] = None,
+        default: Optional[RateLimit] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        limits = dict(limits or {})
+        if default is not None:
+            limits[DEFAULT_GROUP] = default
+        known = {name for name, _ in ENDPOINT_GROUPS} | {DEFAULT_GROUP}
+        unknown = set(limits) - known
+        if unknown:
+            raise ValueError(f"Unknown endpoint groups {sorted(unknown)}; expected one of {sorted(known)}")
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        self._buckets: Dict[str, _TokenBucket] = {group: _TokenBucket(limit, now) for group, limit in limits.items()}
+        self._patterns = [(group, re.compile(pattern)) for group, pattern in ENDPOINT_GROUPS]
+
+    def group(self, request: httpx.Request) -> str:
+        for group, pattern in self._patterns:
+            if pattern.search(request.url.path):
+                return group
+        return DEFAULT_GROUP
+
+    def reserve(self, request: httpx.Request) -> float:
+        """Take a token for `request`; returns the seconds to wait before sending it."""
+        bucket = self._buckets.get(self.group(request))
+        if bucket is None:
+            return 0.0
+        with self._lock:
+            return bucket.reserve(self._clock())
+
+    def pause(self, request: httpx.Request, seconds: float) -> None:
+        """Hold back every request in `request`'s group for `seconds`."""
+        bucket = self._buckets.get(self.group(request))
+        if bucket is None:
+            return
+        with self._lock:
+            bucket.pause(seconds, self._clock())
+
+    def acquire(self, request: httpx.Request) -> None:
+        wait = self.reserve(request)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, request: httpx.Request) -> None:
+        wait = self.reserve(request)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """Request and wait-time counters per limited endpoint group."""
+        with self._lock:
+            return {
+                group: RateLimitStats(
+                    requests=bucket.requests,
+                    delayed=bucket.delayed,
+                    total_wait_seconds=bucket.total_wait,
+                    max_wait_seconds=bucket.max_wait,
+                )
+                for group, bucket in self._buckets.items()
+            }
+
+    def _observe(self, request: httpx.Request, response: httpx.Response) -> None:
+        if response.status_code == 429:
+            retry_after = _retry_after_seconds(response)
+            if retry_after:
+                self.pause(request, retry_after)
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Wraps a transport, delaying requests to stay within a RateLimiter's budget."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter):
+        self.transport: httpx.BaseTransport = transport
+        self.limiter: RateLimiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.limiter.acquire(request)
+        response = self.transport.handle_request(request)
+        self.limiter._observe(request, response)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of RateLimitTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter):
+        self.transport: httpx.AsyncBaseTransport = transport
+        self.limiter: RateLimiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self.limiter.acquire_async(request)
+        response = await self.transport.handle_async_request(request)
+        self.limiter._observe(request, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,210 @@
+import asyncio
+import contextvars
+import email.utils
+import logging
+import random
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional, Tuple
+
+import httpx
+
+from lightningrod._instrumentation import ATTEMPTS_EXTENSION
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+_idempotency_key: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("lightningrod_idempotency_key", default=None)
+
+# Errors raised before the request reached the server, so any request can be resent
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Errors that may happen after the server received the request
+_TRANSIENT_ERRORS = (httpx.ReadError, httpx.ReadTimeout, httpx.WriteError, httpx.WriteTimeout, httpx.RemoteProtocolError)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Controls how requests are retried after transient failures.
+
+    Connection failures, 429 responses and 503 responses with a `Retry-After` header are
+    retried for every request, since the server turned them away without processing them.
+    Other failures (5xx in `retry_statuses`, read errors and timeouts) may happen after the
+    server acted on the request, so they are only retried for idempotent requests: GET,
+    HEAD, OPTIONS, PUT and DELETE, and POSTs to endpoints matching `idempotent_post_paths`.
+    Waits grow exponentially with jitter, and a `Retry-After` header takes precedence.
+
+    Sample uploads send an `Idempotency-Key` header, but the public API does not document
+    deduplicating on it, so a keyed POST is only treated as idempotent when
+    `honor_idempotency_keys` is set (e.g. against a server known to honour the header).
+
+    Attributes:
+        max_attempts: Total attempts per request, including the first
+        backoff_base: Seconds to wait before the first retry
+        backoff_max: Upper bound on the wait between attempts
+        jitter: Fractional random jitter (+/-) applied to each wait
+        retry_after_max: Upper bound on waits requested by `Retry-After`
+        retry_statuses: Response statuses that are retried
+        idempotent_post_paths: Regexes of POST endpoint paths that are safe to repeat
+        honor_idempotency_keys: Treat POSTs carrying an Idempotency-Key header as idempotent
+
+    Example:
+        >>> lr = LightningRod(api_key="your-api-key", retry=RetryPolicy(max_attempts=8, backoff_max=60))
+    """
+
+    max_attempts: int = 5
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: float = 0.25
+    retry_after_max: float = 120.0
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    idempotent_post_paths: Tuple[str, ...] = (r"/transform-jobs/cost-estimation$",)
+    honor_idempotency_keys: bool = False
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """A policy that never retries."""
+        return cls(max_attempts=1)
+
+    def is_idempotent(self, request: httpx.Request) -> bool:
+        if request.method in ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"):
+            return True
+        if self.honor_idempotency_keys and IDEMPOTENCY_KEY_HEADER in request.headers:
+            return True
+        return request.method == "POST" and any(re.search(pattern, request.url.path) for pattern in self.idempotent_post_paths)
+
+    def backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait after failed attempt number `attempt` (starting at 1)."""
+        retry_after = _retry_after_seconds(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.retry_after_max)
+        delay = min(self.backoff_base * (2 ** min(attempt - 1, 32)), self.backoff_max)
+        if self.jitter > 0:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, delay)
+
+    def should_retry_response(self, request: httpx.Request, response: httpx.Response) -> bool:
+        if response.status_code not in self.retry_statuses:
+            return False
+        if response.status_code == 429 or (response.status_code == 503 and "Retry-After" in response.headers):
+            return True
+        return self.is_idempotent(request)
+
+    def should_retry_error(self, request: httpx.Request, error: Exception) -> bool:
+        if isinstance(error, _CONNECT_ERRORS):
+            return True
+        return isinstance(error, _TRANSIENT_ERRORS) and self.is_idempotent(request)
+
+
+@contextmanager
+def idempotency_scope(key: Optional[str]) -> Iterator[None]:
+    """
+    Attach an Idempotency-Key header to requests made inside the block.
+
+    The POSTs become retryable on 5xx and read errors only under a RetryPolicy with
+    `honor_idempotency_keys=True`.
+    """
+    if key is None:
+        yield
+        return
+    token = _idempotency_key.set(key)
+    try:
+        yield
+    finally:
+        _idempotency_key.reset(token)
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _replayable(request: httpx.Request) -> bool:
+    # Streamed bodies (e.g. file uploads) can only be sent once
+    return isinstance(request.stream, httpx.ByteStream)
+
+
+def _prepare(request: httpx.Request) -> None:
+    key = _idempotency_key.get()
+    if key is not None and IDEMPOTENCY_KEY_HEADER not in request.headers:
+        request.headers[IDEMPOTENCY_KEY_HEADER] = key
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Wraps a transport, resending failed requests according to a RetryPolicy."""
+
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy, sleep: Callable[[float], None] = time.sleep):
+        self.transport: httpx.BaseTransport = transport
+        self.policy: RetryPolicy = policy
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        _prepare(request)
+        attempt = 1
+        while True:
+            request.extensions[ATTEMPTS_EXTENSION] = attempt
+            can_retry = attempt < self.policy.max_attempts and _replayable(request)
+            try:
+                response = self.transport.handle_request(request)
+            except httpx.TransportError as e:
+                if not (can_retry and self.policy.should_retry_error(request, e)):
+                    raise
+                delay = self.policy.backoff(attempt)
+                logger.info("Retrying %s %s in %.1fs after %s", request.method, request.url.path, delay, type(e).__name__)
+            else:
+                if not (can_retry and self.policy.should_retry_response(request, response)):
+                    return response
+                delay = self.policy.backoff(attempt, response)
+                logger.info("Retrying %s %s in %.1fs after HTTP %d", request.method, request.url.path, delay, response.status_code)
+                response.close()
+            self._sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of RetryTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy):
+        self.transport: httpx.AsyncBaseTransport = transport
+        self.policy: RetryPolicy = policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        _prepare(request)
+        attempt = 1
+        while True:
+            request.extensions[ATTEMPTS_EXTENSION] = attempt
+            can_retry = attempt < self.policy.max_attempts and _replayable(request)
+            try:
+                response = await self.transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                if not (can_retry and self.policy.should_retry_error(request, e)):
+                    raise
+                delay = self.policy.backoff(attempt)
+                logger.info("Retrying %s %s in %.1fs after %s", request.method, request.url.path, delay, type(e).__name__)
+            else:
+                if not (can_retry and self.policy.should_retry_response(request, response)):
+                    return response
+                delay = self.policy.backoff(attempt, response)
+                logger.info("Retrying %s %s in %.1fs after HTTP %d", request.method, request.url.path, delay, response.status_code)
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
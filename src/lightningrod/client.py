@@ -1,13 +1,23 @@
-from typing import List
+import threading
+from typing import TYPE_CHECKING, Any, List, Optional
+
+import httpx
 
 from lightningrod._generated.client import AuthenticatedClient
+from lightningrod._httpcache import HttpCache
+from lightningrod._http import AsyncHttpPool, HttpConfig, HttpPool
+from lightningrod._instrumentation import Instrumentation
+from lightningrod._ratelimit import RateLimiter
+from lightningrod._retry import RetryPolicy
 from lightningrod._generated.models.sample import Sample
-from lightningrod.datasets.client import DatasetSamplesClient, DatasetsClient
+from lightningrod.datasets.client import AsyncDatasetSamplesClient, AsyncDatasetsClient, DatasetSamplesClient, DatasetsClient
 from lightningrod.datasets.dataset import Dataset
-from lightningrod.files.client import FilesClient
-from lightningrod.filesets.client import FileSetsClient
-from lightningrod.organization.client import OrganizationsClient
-from lightningrod.transforms.client import TransformsClient
+from lightningrod.organization.client import AsyncOrganizationsClient, OrganizationsClient
+
+if TYPE_CHECKING:
+    from lightningrod.files.client import AsyncFilesClient, FilesClient
+    from lightningrod.filesets.client import AsyncFileSetsClient, FileSetsClient
+    from lightningrod.transforms.client import AsyncTransformsClient, TransformsClient
 
 
 class LightningRod:
@@ -17,6 +27,17 @@ class LightningRod:
     Args:
         api_key: Your Lightning Rod API key
         base_url: Base URL for the API (defaults to production)
+        http: Optional HttpConfig for the connection pool shared by all requests
+            (pool size, keep-alive, HTTP/2, timeout, warm-up)
+        transport: Optional httpx transport to send requests through instead of the network
+        retry: Optional RetryPolicy for transient failures (retries idempotent requests by default;
+            use `RetryPolicy.disabled()` to turn retries off)
+        rate_limit: Optional RateLimiter that queues requests to stay under per-endpoint-group
+            rate limits; pass the same limiter to several clients to share one budget
+        instrumentation: Optional Instrumentation recording per-endpoint latency, payload sizes,
+            retries and parse time, and sending spans to its exporters
+        http_cache: Optional HttpCache storing finished jobs and datasets on disk and revalidating
+            other responses by ETag; pass the same cache to several clients to share it
     
     Example:
         >>> lr = LightningRod(api_key="your-api-key")
@@ -28,21 +49,138 @@ class LightningRod:
     def __init__(
         self,
         api_key: str,
-        base_url: str = "https://api.lightningrod.ai/api/public/v1"
+        base_url: str = "https://api.lightningrod.ai/api/public/v1",
+        http: Optional[HttpConfig] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimiter] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        http_cache: Optional[HttpCache] = None,
     ):
         self.api_key: str = api_key
         self.base_url: str = base_url.rstrip("/")
-        self._generated_client: AuthenticatedClient = AuthenticatedClient(
-            base_url=self.base_url,
-            token=api_key,
-            prefix="Bearer",
-            auth_header_name="Authorization",
-        )
+        self.rate_limiter: Optional[RateLimiter] = rate_limit
+        self.instrumentation: Optional[Instrumentation] = instrumentation
+        self.http_cache: Optional[HttpCache] = http_cache
+        self._http: HttpPool = HttpPool(http, transport, retry, rate_limit, instrumentation, http_cache)
+        self._generated_client: AuthenticatedClient = self._http.authenticated_client(self.base_url, api_key)
         
         self._dataset_samples: DatasetSamplesClient = DatasetSamplesClient(self._generated_client)
-        self.transforms: TransformsClient = TransformsClient(self._generated_client, self._dataset_samples)
+        self._transforms: Optional["TransformsClient"] = None
+        self._transforms_lock: threading.Lock = threading.Lock()
         self.datasets: DatasetsClient = DatasetsClient(self._generated_client, self._dataset_samples)
         self.organization: OrganizationsClient = OrganizationsClient(self._generated_client)
          # TODO(filesets): Enable when filesets are publicly supported
-        # self.files: FilesClient = FilesClient(self._generated_client)
-        # self.filesets: FileSetsClient = FileSetsClient(self._generated_client, self.files)
\ No newline at end of file
+        # self.files: FilesClient = FilesClient(self._generated_client, self._http)
+        # self.filesets: FileSetsClient = FileSetsClient(self._generated_client, self.files)
+
+        if self._http.config.warm_up:
+            self.warm_up()
+
+    @property
+    def transforms(self) -> "TransformsClient":
+        """Client for running and monitoring transform jobs, built on first use."""
+        if self._transforms is None:
+            with self._transforms_lock:
+                if self._transforms is None:
+                    from lightningrod.transforms.client import TransformsClient
+
+                    self._transforms = TransformsClient(self._generated_client, self._dataset_samples)
+        return self._transforms
+
+    def warm_up(self) -> None:
+        """Open a connection to the API ahead of the first request."""
+        self._http.warm_up(self._generated_client)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool and stop the job polling threads."""
+        if self._transforms is not None:
+            self._transforms.jobs.close()
+        self._http.close()
+
+    def __enter__(self) -> "LightningRod":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncLightningRod:
+    """
+    Asyncio Python SDK for the Lightning Rod API.
+    
+    Every request is made with `httpx.AsyncClient` directly on the running event loop,
+    so jobs can be polled and datasets paginated without blocking or thread hops.
+    
+    Args:
+        api_key: Your Lightning Rod API key
+        base_url: Base URL for the API (defaults to production)
+        http: Optional HttpConfig for the connection pool shared by all requests;
+            with `warm_up=True` the connection is opened on `async with`
+        transport: Optional httpx async transport to send requests through instead of the network
+        retry: Optional RetryPolicy for transient failures
+        rate_limit: Optional RateLimiter shared across tasks (and with sync clients)
+        instrumentation: Optional Instrumentation recording per-request spans
+        http_cache: Optional HttpCache shared with other clients and processes
+    
+    Example:
+        >>> async with AsyncLightningRod(api_key="your-api-key") as lr:
+        ...     dataset = await lr.transforms.run(config)
+        ...     async for sample in dataset:
+        ...         print(sample.seed.seed_text)
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.lightningrod.ai/api/public/v1",
+        http: Optional[HttpConfig] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimiter] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        http_cache: Optional[HttpCache] = None,
+    ):
+        self.api_key: str = api_key
+        self.base_url: str = base_url.rstrip("/")
+        self.rate_limiter: Optional[RateLimiter] = rate_limit
+        self.instrumentation: Optional[Instrumentation] = instrumentation
+        self.http_cache: Optional[HttpCache] = http_cache
+        self._http: AsyncHttpPool = AsyncHttpPool(http, transport, retry, rate_limit, instrumentation, http_cache)
+        self._generated_client: AuthenticatedClient = self._http.authenticated_client(self.base_url, api_key)
+        
+        self._dataset_samples: AsyncDatasetSamplesClient = AsyncDatasetSamplesClient(self._generated_client)
+        self._transforms: Optional["AsyncTransformsClient"] = None
+        self._transforms_lock: threading.Lock = threading.Lock()
+        self.datasets: AsyncDatasetsClient = AsyncDatasetsClient(self._generated_client, self._dataset_samples)
+        self.organization: AsyncOrganizationsClient = AsyncOrganizationsClient(self._generated_client)
+        # TODO(filesets): Enable when filesets are publicly supported
+        # self.files: AsyncFilesClient = AsyncFilesClient(self._generated_client, self._http)
+        # self.filesets: AsyncFileSetsClient = AsyncFileSetsClient(self._generated_client, self.files)
+
+    @property
+    def transforms(self) -> "AsyncTransformsClient":
+        """Client for running and monitoring transform jobs, built on first use."""
+        if self._transforms is None:
+            with self._transforms_lock:
+                if self._transforms is None:
+                    from lightningrod.transforms.client import AsyncTransformsClient
+
+                    self._transforms = AsyncTransformsClient(self._generated_client, self._dataset_samples)
+        return self._transforms
+
+    async def warm_up(self) -> None:
+        """Open a connection to the API ahead of the first request."""
+        await self._http.warm_up(self._generated_client)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncLightningRod":
+        if self._http.config.warm_up:
+            await self.warm_up()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
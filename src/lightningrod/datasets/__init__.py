@@ -1,4 +1,6 @@
-from lightningrod.datasets.client import DatasetsClient, DatasetSamplesClient
+from lightningrod.datasets.client import AsyncDatasetsClient, AsyncDatasetSamplesClient, DatasetsClient, DatasetSamplesClient
 from lightningrod.datasets.dataset import Dataset, AsyncDataset
+from lightningrod.datasets.lazy import LazySample
+from lightningrod.datasets.memory import InMemoryDatasetSamplesClient
 
-__all__ = ["DatasetsClient", "DatasetSamplesClient", "Dataset", "AsyncDataset"]
+__all__ = ["AsyncDatasetsClient", "AsyncDatasetSamplesClient", "DatasetsClient", "DatasetSamplesClient", "Dataset", "AsyncDataset", "InMemoryDatasetSamplesClient", "LazySample"]
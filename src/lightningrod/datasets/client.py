@@ -1,7 +1,13 @@
-from typing import List, Optional
+import threading
+from concurrent.futures import Future
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
 
 from lightningrod._generated.models import (
     HTTPValidationError,
+    PaginatedSamplesResponse,
     UploadSamplesRequest,
 )
 from lightningrod._generated.models.sample import Sample
@@ -11,29 +17,80 @@ from lightningrod._generated.api.datasets import (
     get_dataset_samples_datasets_dataset_id_samples_get,
     upload_samples_datasets_dataset_id_samples_post,
 )
-from lightningrod._generated.types import Unset
+from lightningrod._generated.types import Response, Unset
 from lightningrod._generated.client import AuthenticatedClient
-from lightningrod.datasets.dataset import Dataset
+from lightningrod.datasets.dataset import AsyncDataset, Dataset
+from lightningrod.datasets.lazy import LazySample
 from lightningrod._errors import handle_response_error
+from lightningrod._instrumentation import timed_parse
+from lightningrod._retry import idempotency_scope
+
+
+def _parse_lazy_page(*, client: AuthenticatedClient, response: httpx.Response) -> Any:
+    """Like the generated `_parse_response`, but wraps each sample in a LazySample instead of decoding it."""
+    if response.status_code != 200:
+        return get_dataset_samples_datasets_dataset_id_samples_get._parse_response(client=client, response=response)
+    data = client.json_codec.loads(response.content)
+    samples = data.get("samples") if isinstance(data, dict) else None
+    if not isinstance(samples, list) or not all(isinstance(sample, dict) for sample in samples):
+        # Malformed page: let the generated model reject it exactly as the eager path does
+        return PaginatedSamplesResponse.from_dict(data)
+    page = PaginatedSamplesResponse.from_dict({**data, "samples": []})
+    page.samples = [LazySample.from_dict(sample) for sample in samples]
+    return page
+
+
+def _build_lazy_page_response(client: AuthenticatedClient, response: httpx.Response) -> Response[Any]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=timed_parse(_parse_lazy_page, client=client, response=response),
+    )
 
 
 class DatasetSamplesClient:
     def __init__(self, client: AuthenticatedClient):
         self._client: AuthenticatedClient = client
+        # In-flight downloads by dataset id, so concurrent callers share one download
+        self._downloads: Dict[Tuple[str, bool], "Future[List[Sample]]"] = {}
+        self._downloads_lock = threading.Lock()
     
-    def list(self, dataset_id: str) -> List[Sample]:
-        samples: List[Sample] = []
-        cursor: Optional[str] = None
-        
-        while True:
+    def fetch_page(
+        self,
+        dataset_id: str,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        lazy: bool = False,
+    ) -> PaginatedSamplesResponse:
+        """
+        Fetch a single page of samples starting at `cursor` (the first page if None).
+
+        With `lazy=True` the page holds LazySample objects, which decode each field
+        on first access instead of up front.
+        """
+        if not lazy:
             response = get_dataset_samples_datasets_dataset_id_samples_get.sync_detailed(
                 dataset_id=dataset_id,
                 client=self._client,
-                limit=100,
+                limit=limit,
                 cursor=cursor,
             )
-            
-            parsed = handle_response_error(response, "fetch samples")
+            return handle_response_error(response, "fetch samples")
+        kwargs = get_dataset_samples_datasets_dataset_id_samples_get._get_kwargs(
+            dataset_id=dataset_id,
+            limit=limit,
+            cursor=cursor,
+        )
+        http_response = self._client.get_httpx_client().request(**kwargs)
+        return handle_response_error(_build_lazy_page_response(self._client, http_response), "fetch samples")
+
+    def list(self, dataset_id: str, lazy: bool = False) -> List[Sample]:
+        samples: List[Sample] = []
+        cursor: Optional[str] = None
+        
+        while True:
+            parsed = self.fetch_page(dataset_id, cursor, lazy=lazy)
             
             samples.extend(parsed.samples)
             
@@ -45,10 +102,40 @@ class DatasetSamplesClient:
         
         return samples
     
+    def download(self, dataset_id: str, lazy: bool = False) -> List[Sample]:
+        """
+        Download every sample of a dataset, sharing the work between concurrent callers.
+
+        If another thread is already downloading the same dataset, this waits for and
+        returns its result instead of paginating through the dataset a second time.
+        With `lazy=True` the samples are LazySample objects.
+        """
+        key = (dataset_id, lazy)
+        with self._downloads_lock:
+            pending = self._downloads.get(key)
+            if pending is None:
+                future: "Future[List[Sample]]" = Future()
+                self._downloads[key] = future
+        if pending is not None:
+            return list(pending.result())
+
+        try:
+            samples = self.list(dataset_id, lazy=lazy)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(samples)
+            return samples
+        finally:
+            with self._downloads_lock:
+                del self._downloads[key]
+
     def upload(
         self,
         dataset_id: str,
         samples: List[Sample],
+        idempotency_key: Optional[str] = None,
     ) -> None:
         """
         Upload samples to an existing dataset.
@@ -56,6 +143,9 @@ class DatasetSamplesClient:
         Args:
             dataset_id: ID of the dataset to upload samples to
             samples: List of Sample objects to upload
+            idempotency_key: Optional key identifying this upload, sent as an Idempotency-Key
+                header. Retries after 5xx or read errors only happen when the client's
+                RetryPolicy has `honor_idempotency_keys=True`
             
         Example:
             >>> lr = LightningRod(api_key="your-api-key")
@@ -64,11 +154,12 @@ class DatasetSamplesClient:
         """
         request = UploadSamplesRequest(samples=samples)
         
-        response = upload_samples_datasets_dataset_id_samples_post.sync_detailed(
-            dataset_id=dataset_id,
-            client=self._client,
-            body=request,
-        )
+        with idempotency_scope(idempotency_key):
+            response = upload_samples_datasets_dataset_id_samples_post.sync_detailed(
+                dataset_id=dataset_id,
+                client=self._client,
+                body=request,
+            )
         
         handle_response_error(response, "upload samples")
 
@@ -136,7 +227,7 @@ class DatasetsClient:
         
         for i in range(0, len(samples), batch_size):
             batch = samples[i:i + batch_size]
-            self._dataset_samples_client.upload(dataset.id, batch)
+            self._dataset_samples_client.upload(dataset.id, batch, idempotency_key=f"{dataset.id}:{i}")
         
         dataset_response = get_dataset_datasets_dataset_id_get.sync_detailed(
             dataset_id=dataset.id,
@@ -172,3 +263,178 @@ class DatasetsClient:
             num_rows=dataset_result.num_rows,
             datasets_client=self._dataset_samples_client
         )
+
+
+
+class AsyncDatasetSamplesClient:
+    def __init__(self, client: AuthenticatedClient):
+        self._client: AuthenticatedClient = client
+
+    async def fetch_page(
+        self,
+        dataset_id: str,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        lazy: bool = False,
+    ) -> PaginatedSamplesResponse:
+        """
+        Fetch a single page of samples starting at `cursor` (the first page if None).
+
+        With `lazy=True` the page holds LazySample objects, which decode each field
+        on first access instead of up front.
+        """
+        if not lazy:
+            response = await get_dataset_samples_datasets_dataset_id_samples_get.asyncio_detailed(
+                dataset_id=dataset_id,
+                client=self._client,
+                limit=limit,
+                cursor=cursor,
+            )
+            return handle_response_error(response, "fetch samples")
+        kwargs = get_dataset_samples_datasets_dataset_id_samples_get._get_kwargs(
+            dataset_id=dataset_id,
+            limit=limit,
+            cursor=cursor,
+        )
+        http_response = await self._client.get_async_httpx_client().request(**kwargs)
+        return handle_response_error(_build_lazy_page_response(self._client, http_response), "fetch samples")
+
+    async def iter(self, dataset_id: str, lazy: bool = False) -> AsyncIterator[Sample]:
+        """
+        Stream samples from a dataset, fetching one page at a time.
+        
+        Args:
+            dataset_id: ID of the dataset to read
+            lazy: Yield LazySample objects, which decode each field on first access
+            
+        Example:
+            >>> dataset = await lr.datasets.get("dataset-id-here")
+            >>> async for sample in dataset:
+            ...     print(sample.seed.seed_text)
+        """
+        cursor: Optional[str] = None
+        
+        while True:
+            parsed = await self.fetch_page(dataset_id, cursor, lazy=lazy)
+            
+            for sample in parsed.samples:
+                yield sample
+            
+            if not parsed.has_more:
+                break
+            if isinstance(parsed.next_cursor, Unset) or parsed.next_cursor is None:
+                break
+            cursor = str(parsed.next_cursor)
+
+    async def list(self, dataset_id: str, lazy: bool = False) -> List[Sample]:
+        return [sample async for sample in self.iter(dataset_id, lazy=lazy)]
+
+    async def upload(
+        self,
+        dataset_id: str,
+        samples: List[Sample],
+        idempotency_key: Optional[str] = None,
+    ) -> None:
+        """
+        Upload samples to an existing dataset.
+        
+        Args:
+            dataset_id: ID of the dataset to upload samples to
+            samples: List of Sample objects to upload
+            idempotency_key: Optional key identifying this upload, sent as an Idempotency-Key
+                header. Retries after 5xx or read errors only happen when the client's
+                RetryPolicy has `honor_idempotency_keys=True`
+        """
+        request = UploadSamplesRequest(samples=samples)
+        
+        with idempotency_scope(idempotency_key):
+            response = await upload_samples_datasets_dataset_id_samples_post.asyncio_detailed(
+                dataset_id=dataset_id,
+                client=self._client,
+                body=request,
+            )
+        
+        handle_response_error(response, "upload samples")
+
+
+class AsyncDatasetsClient:
+    def __init__(self, client: AuthenticatedClient, dataset_samples_client: AsyncDatasetSamplesClient):
+        self._client: AuthenticatedClient = client
+        self._dataset_samples_client: AsyncDatasetSamplesClient = dataset_samples_client
+
+    async def create(self) -> AsyncDataset:
+        """
+        Create a new empty dataset.
+        
+        Returns:
+            AsyncDataset object representing the newly created dataset
+            
+        Example:
+            >>> lr = AsyncLightningRod(api_key="your-api-key")
+            >>> dataset = await lr.datasets.create()
+        """
+        response = await create_dataset_datasets_post.asyncio_detailed(
+            client=self._client,
+        )
+        
+        create_result = handle_response_error(response, "create dataset")
+        
+        return await self._get(create_result.id, "get dataset")
+
+    async def create_from_samples(
+        self,
+        samples: List[Sample],
+        batch_size: int = 1000,
+    ) -> AsyncDataset:
+        """
+        Create a new dataset and upload samples to it in batches.
+        
+        Args:
+            samples: List of Sample objects to upload
+            batch_size: Number of samples to upload per batch (default: 1000)
+            
+        Returns:
+            AsyncDataset object with all samples uploaded
+            
+        Example:
+            >>> lr = AsyncLightningRod(api_key="your-api-key")
+            >>> dataset = await lr.datasets.create_from_samples(samples)
+        """
+        dataset = await self.create()
+        
+        for i in range(0, len(samples), batch_size):
+            batch = samples[i:i + batch_size]
+            await self._dataset_samples_client.upload(dataset.id, batch, idempotency_key=f"{dataset.id}:{i}")
+        
+        refreshed = await self._get(dataset.id, "refresh dataset")
+        dataset.num_rows = refreshed.num_rows
+        return dataset
+
+    async def get(self, dataset_id: str) -> AsyncDataset:
+        """
+        Get a dataset by ID.
+        
+        Args:
+            dataset_id: ID of the dataset to retrieve
+            
+        Returns:
+            AsyncDataset object
+            
+        Example:
+            >>> lr = AsyncLightningRod(api_key="your-api-key")
+            >>> dataset = await lr.datasets.get("dataset-id-here")
+        """
+        return await self._get(dataset_id, "get dataset")
+
+    async def _get(self, dataset_id: str, operation: str) -> AsyncDataset:
+        dataset_response = await get_dataset_datasets_dataset_id_get.asyncio_detailed(
+            dataset_id=dataset_id,
+            client=self._client,
+        )
+        dataset_result = handle_response_error(dataset_response, operation)
+        
+        return AsyncDataset(
+            id=dataset_result.id,
+            num_rows=dataset_result.num_rows,
+            datasets_client=self._dataset_samples_client
+        )
@@ -1,5 +1,6 @@
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
-import asyncio
+import threading
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence, TYPE_CHECKING, Union
 
 from lightningrod._generated.models.sample import Sample
 from lightningrod._generated.models.forward_looking_question import ForwardLookingQuestion
@@ -11,7 +12,8 @@ from lightningrod._generated.types import UNSET, Unset
 
 # avoid circular import
 if TYPE_CHECKING:
-    from lightningrod.datasets.client import DatasetSamplesClient
+    from lightningrod.datasets.client import AsyncDatasetSamplesClient, DatasetSamplesClient
+
 
 class Dataset:
     """
@@ -39,19 +41,80 @@ class Dataset:
         self,
         id: str,
         num_rows: int,
-        datasets_client: "DatasetSamplesClient"
+        datasets_client: Optional["DatasetSamplesClient"]
     ):
         self.id: str = id
         self.num_rows: int = num_rows
-        self._datasets_client: "DatasetSamplesClient" = datasets_client
-        self._samples: Optional[List[Sample]] = None
+        # None for datasets opened with Dataset.load(), whose samples come from the file
+        self._datasets_client: Optional["DatasetSamplesClient"] = datasets_client
+        self._path: Optional[Path] = None
+        self._samples: Optional[Sequence[Sample]] = None
+        self._lock = threading.Lock()
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Save the samples to a local Arrow IPC (Feather v2) file.
+        Automatically downloads the samples if they haven't been downloaded yet.
+        
+        The file is uncompressed so `Dataset.load()` can memory-map it. Each row
+        holds one sample as JSON in a `sample` column.
+        
+        Args:
+            path: File to write; replaced atomically if it exists
+        
+        Example:
+            >>> dataset = lr.transforms.run(config)
+            >>> dataset.save("questions.arrow")
+            >>> dataset = Dataset.load("questions.arrow")  # later, or in another process
+        """
+        from lightningrod.datasets.storage import save_samples
+
+        save_samples(path, self.samples(), dataset_id=self.id)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Dataset":
+        """
+        Open a file written by `Dataset.save()` without reading it into memory.
+        
+        The file is memory-mapped, so opening takes the same time at any size and
+        processes loading the same file share its pages through the OS page cache.
+        `samples()` returns a read-only sequence (not a list) that decodes each row
+        into a `LazySample` when it is read. The dataset has no API client, so
+        `download()` reads the same file, decoding rows into `LazySample` or
+        `Sample` objects depending on `lazy`.
+        
+        Args:
+            path: File written by `Dataset.save()`
+        
+        Returns:
+            Dataset with the saved id and row count
+        
+        Raises:
+            ValueError: If the file is not a Lightning Rod dataset file
+        """
+        from lightningrod.datasets.storage import MappedSamples
+
+        samples = MappedSamples(path)
+        dataset = cls(id=samples.dataset_id or Path(path).stem, num_rows=len(samples), datasets_client=None)
+        dataset._path = samples.path
+        dataset._samples = samples
+        return dataset
     
-    def download(self) -> List[Sample]:
+    def download(self, lazy: bool = False) -> Sequence[Sample]:
         """
         Download all samples from the dataset via the paginated API.
         
+        Safe to call from several threads: concurrent downloads of the same dataset,
+        through this object or another one for the same id, share a single download.
+        
+        Args:
+            lazy: Return LazySample objects, which keep the raw payload and decode
+                each field (question, label, context, ...) on first access. Cheaper
+                when only a few fields are read.
+        
         Returns:
-            List of Sample objects
+            List of Sample objects, or for a dataset opened with `Dataset.load()`
+            a read-only memory-mapped sequence that decodes rows as they are read
         
         Example:
             >>> lr = LightningRod(api_key="your-api-key")
@@ -60,27 +123,36 @@ class Dataset:
             >>> for sample in samples:
             ...     print(sample.seed.seed_text)
         """
-        self._samples = self._datasets_client.list(self.id)
-        return self._samples
+        if self._path is not None:
+            from lightningrod.datasets.storage import MappedSamples
 
-    def samples(self) -> List[Sample]:
+            return MappedSamples(self._path, lazy=lazy)
+        samples = self._datasets_client.download(self.id, lazy=lazy)
+        with self._lock:
+            self._samples = samples
+        return samples
+
+    def samples(self) -> Sequence[Sample]:
         """
         Get all samples from the dataset. 
         Automatically downloads the samples if they haven't been downloaded yet.
         
         Returns:
-            List of Sample objects
+            List of Sample objects, or for a dataset opened with `Dataset.load()`
+            a read-only memory-mapped sequence of LazySample objects
         """
-        if not self._samples:
-            self.download()
+        if self._samples is None:
+            with self._lock:
+                if self._samples is None:
+                    self._samples = self._datasets_client.download(self.id)
         return self._samples
 
-    def to_samples(self) -> List[Sample]:
+    def to_samples(self) -> Sequence[Sample]:
         """
         Download all samples from the dataset via the paginated API.
         
         Returns:
-            List of Sample objects
+            List of Sample objects (a read-only sequence for datasets opened with `Dataset.load()`)
         
         Example:
             >>> lr = LightningRod(api_key="your-api-key")
@@ -115,76 +187,80 @@ class Dataset:
         return [self._sample_to_dict(sample) for sample in samples]
 
     def _sample_to_dict(self, sample: Sample) -> Dict[str, Any]:
-        row: Dict[str, Any] = {}
-        
-        if sample.question and not isinstance(sample.question, Unset):
-            if isinstance(sample.question, ForwardLookingQuestion):
-                row['question.question_text'] = sample.question.question_text
-                row['question.date_close'] = sample.question.date_close.isoformat()
-                row['question.event_date'] = sample.question.event_date.isoformat()
-                row['question.resolution_criteria'] = sample.question.resolution_criteria
-                if sample.question.prediction_date is not None and not isinstance(sample.question.prediction_date, Unset):
-                    row['question.prediction_date'] = sample.question.prediction_date.isoformat()
-            elif isinstance(sample.question, Question):
-                row['question.question_text'] = sample.question.question_text
-            else:
-                question_text = getattr(sample.question, 'question_text', None)
-                if question_text is not None:
-                    row['question.question_text'] = question_text
-        
-        if sample.label and not isinstance(sample.label, Unset):
-            row['label.label'] = sample.label.label
-            row['label.label_confidence'] = sample.label.label_confidence
-            if sample.label.resolution_date is not None and not isinstance(sample.label.resolution_date, Unset):
-                row['label.resolution_date'] = sample.label.resolution_date.isoformat()
-            if sample.label.reasoning is not None and not isinstance(sample.label.reasoning, Unset):
-                row['label.reasoning'] = sample.label.reasoning
-            if sample.label.answer_sources is not None and not isinstance(sample.label.answer_sources, Unset):
-                row['label.answer_sources'] = sample.label.answer_sources
-        
-        if sample.prompt and not isinstance(sample.prompt, Unset):
-            row['prompt'] = sample.prompt
-        
-        if sample.seed and not isinstance(sample.seed, Unset):
-            row['seed.seed_text'] = sample.seed.seed_text
-            if sample.seed.url is not None and not isinstance(sample.seed.url, Unset):
-                row['seed.url'] = sample.seed.url
-            if sample.seed.seed_creation_date is not None and not isinstance(sample.seed.seed_creation_date, Unset):
-                row['seed.seed_creation_date'] = sample.seed.seed_creation_date.isoformat()
-            if sample.seed.search_query is not None and not isinstance(sample.seed.search_query, Unset):
-                row['seed.search_query'] = sample.seed.search_query
-        
-        if sample.is_valid is not None and not isinstance(sample.is_valid, Unset):
-            row['is_valid'] = sample.is_valid
-        
-        if sample.context is not None and not isinstance(sample.context, Unset):
-            for idx, ctx in enumerate(sample.context):
-                if isinstance(ctx, NewsContext):
-                    row[f'context.{idx}.rendered_context'] = ctx.rendered_context
-                    row[f'context.{idx}.search_query'] = ctx.search_query
-                    row[f'context.{idx}.context_type'] = ctx.context_type
-                elif isinstance(ctx, RAGContext):
-                    row[f'context.{idx}.rendered_context'] = ctx.rendered_context
-                    row[f'context.{idx}.document_id'] = ctx.document_id
-                    row[f'context.{idx}.context_type'] = ctx.context_type
-        
-        if sample.meta is not None and not isinstance(sample.meta, Unset):
-            if isinstance(sample.meta, SampleMeta):
-                for key, value in sample.meta.additional_properties.items():
-                    row[f'meta.{key}'] = value
-        
-        if sample.additional_properties:
-            for key, value in sample.additional_properties.items():
-                row[f'additional_properties.{key}'] = value
-        
-        return row
+        return _sample_to_dict(sample)
+
+def _sample_to_dict(sample: Sample) -> Dict[str, Any]:
+    row: Dict[str, Any] = {}
+    
+    if sample.question and not isinstance(sample.question, Unset):
+        if isinstance(sample.question, ForwardLookingQuestion):
+            row['question.question_text'] = sample.question.question_text
+            row['question.date_close'] = sample.question.date_close.isoformat()
+            row['question.event_date'] = sample.question.event_date.isoformat()
+            row['question.resolution_criteria'] = sample.question.resolution_criteria
+            if sample.question.prediction_date is not None and not isinstance(sample.question.prediction_date, Unset):
+                row['question.prediction_date'] = sample.question.prediction_date.isoformat()
+        elif isinstance(sample.question, Question):
+            row['question.question_text'] = sample.question.question_text
+        else:
+            question_text = getattr(sample.question, 'question_text', None)
+            if question_text is not None:
+                row['question.question_text'] = question_text
+    
+    if sample.label and not isinstance(sample.label, Unset):
+        row['label.label'] = sample.label.label
+        row['label.label_confidence'] = sample.label.label_confidence
+        if sample.label.resolution_date is not None and not isinstance(sample.label.resolution_date, Unset):
+            row['label.resolution_date'] = sample.label.resolution_date.isoformat()
+        if sample.label.reasoning is not None and not isinstance(sample.label.reasoning, Unset):
+            row['label.reasoning'] = sample.label.reasoning
+        if sample.label.answer_sources is not None and not isinstance(sample.label.answer_sources, Unset):
+            row['label.answer_sources'] = sample.label.answer_sources
+    
+    if sample.prompt and not isinstance(sample.prompt, Unset):
+        row['prompt'] = sample.prompt
+    
+    if sample.seed and not isinstance(sample.seed, Unset):
+        row['seed.seed_text'] = sample.seed.seed_text
+        if sample.seed.url is not None and not isinstance(sample.seed.url, Unset):
+            row['seed.url'] = sample.seed.url
+        if sample.seed.seed_creation_date is not None and not isinstance(sample.seed.seed_creation_date, Unset):
+            row['seed.seed_creation_date'] = sample.seed.seed_creation_date.isoformat()
+        if sample.seed.search_query is not None and not isinstance(sample.seed.search_query, Unset):
+            row['seed.search_query'] = sample.seed.search_query
+    
+    if sample.is_valid is not None and not isinstance(sample.is_valid, Unset):
+        row['is_valid'] = sample.is_valid
+    
+    if sample.context is not None and not isinstance(sample.context, Unset):
+        for idx, ctx in enumerate(sample.context):
+            if isinstance(ctx, NewsContext):
+                row[f'context.{idx}.rendered_context'] = ctx.rendered_context
+                row[f'context.{idx}.search_query'] = ctx.search_query
+                row[f'context.{idx}.context_type'] = ctx.context_type
+            elif isinstance(ctx, RAGContext):
+                row[f'context.{idx}.rendered_context'] = ctx.rendered_context
+                row[f'context.{idx}.document_id'] = ctx.document_id
+                row[f'context.{idx}.context_type'] = ctx.context_type
+    
+    if sample.meta is not None and not isinstance(sample.meta, Unset):
+        if isinstance(sample.meta, SampleMeta):
+            for key, value in sample.meta.additional_properties.items():
+                row[f'meta.{key}'] = value
+    
+    if sample.additional_properties:
+        for key, value in sample.additional_properties.items():
+            row[f'additional_properties.{key}'] = value
+    
+    return row
+
 
 class AsyncDataset:
     """
-    Async wrapper for Dataset.
+    Async counterpart of Dataset.
     
-    This class provides an async interface to Dataset operations by running
-    the synchronous operations in a thread pool using asyncio.to_thread.
+    Samples are fetched with non-blocking HTTP requests on the event loop, and
+    can either be downloaded all at once or streamed page by page with `async for`.
     
     Note: AsyncDatasets should only be created through AsyncLightningRod methods,
     not instantiated directly.
@@ -201,23 +277,60 @@ class AsyncDataset:
         >>> print(f"Dataset has {len(samples)} samples")
     """
     
-    def __init__(self, sync_dataset: Dataset):
-        self._sync_dataset: Dataset = sync_dataset
-    
-    @property
-    def id(self) -> str:
-        return self._sync_dataset.id
-    
-    @property
-    def num_rows(self) -> int:
-        return self._sync_dataset.num_rows
+    def __init__(
+        self,
+        id: str,
+        num_rows: int,
+        datasets_client: "AsyncDatasetSamplesClient"
+    ):
+        self.id: str = id
+        self.num_rows: int = num_rows
+        self._datasets_client: "AsyncDatasetSamplesClient" = datasets_client
+        self._samples: Optional[List[Sample]] = None
+
+    def __aiter__(self) -> AsyncIterator[Sample]:
+        """
+        Stream samples page by page without holding the whole dataset in memory.
+        
+        Uses the cached samples if the dataset has already been downloaded.
+        
+        Example:
+            >>> async for sample in dataset:
+            ...     print(sample.seed.seed_text)
+        """
+        if self._samples is not None:
+            return _iter_cached(self._samples)
+        return self._datasets_client.iter(self.id)
+
+    async def download(self, lazy: bool = False) -> List[Sample]:
+        """
+        Download all samples from the dataset via the paginated API.
+        
+        Args:
+            lazy: Return LazySample objects, which decode each field on first access
+        
+        Returns:
+            List of Sample objects
+        """
+        self._samples = await self._datasets_client.list(self.id, lazy=lazy)
+        return self._samples
+
+    async def samples(self) -> List[Sample]:
+        """
+        Get all samples from the dataset. 
+        Automatically downloads the samples if they haven't been downloaded yet.
+        
+        Returns:
+            List of Sample objects
+        """
+        if self._samples is None:
+            await self.download()
+        return self._samples
     
     async def to_samples(self) -> List[Sample]:
         """
         Download all samples from the dataset via the paginated API.
         
-        All operations are run in a thread pool to avoid blocking the event loop.
-        
         Returns:
             List of Sample objects
         
@@ -229,15 +342,13 @@ class AsyncDataset:
             >>> for sample in samples:
             ...     print(sample.seed.seed_text)
         """
-        return await asyncio.to_thread(self._sync_dataset.to_samples)
+        return await self.samples()
 
     async def flattened(self) -> List[Dict[str, Any]]:
         """
         Convert all samples to a list of dictionaries.
         Automatically downloads the samples if they haven't been downloaded yet.
         
-        All operations are run in a thread pool to avoid blocking the event loop.
-        
         Handles different question types (Question, ForwardLookingQuestion) and
         extracts relevant fields from labels, seeds, and prompts.
         
@@ -252,4 +363,10 @@ class AsyncDataset:
             >>> import pandas as pd
             >>> df = pd.DataFrame(rows)
         """
-        return await asyncio.to_thread(self._sync_dataset.flattened)
\ No newline at end of file
+        samples = await self.samples()
+        return [_sample_to_dict(sample) for sample in samples]
+
+
+async def _iter_cached(samples: List[Sample]) -> AsyncIterator[Sample]:
+    for sample in samples:
+        yield sample
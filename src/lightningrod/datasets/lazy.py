@@ -0,0 +1,142 @@
+from typing import Any, Callable, Dict, Mapping, Tuple, Type
+
+from lightningrod._generated.models.forward_looking_question import ForwardLookingQuestion
+from lightningrod._generated.models.label import Label
+from lightningrod._generated.models.news_context import NewsContext
+from lightningrod._generated.models.question import Question
+from lightningrod._generated.models.rag_context import RAGContext
+from lightningrod._generated.models.rollout import Rollout
+from lightningrod._generated.models.sample import Sample
+from lightningrod._generated.models.sample_meta import SampleMeta
+from lightningrod._generated.models.seed import Seed
+from lightningrod._generated.types import UNSET, Unset
+
+# Exceptions the generated from_dict treats as "not this member of the union"
+_UNION_ERRORS = (TypeError, ValueError, AttributeError, KeyError)
+
+
+def _union(data: Any, types: Tuple[Type[Any], ...]) -> Any:
+    """Decode an optional model union the way Sample.from_dict does: first type that parses, else the raw value."""
+    if data is None or isinstance(data, Unset) or not isinstance(data, dict):
+        return data
+    for model in types:
+        try:
+            return model.from_dict(data)
+        except _UNION_ERRORS:
+            pass
+    return data
+
+
+def _context_item(data: Any) -> Any:
+    if not isinstance(data, dict):
+        raise TypeError()
+    try:
+        return NewsContext.from_dict(data)
+    except _UNION_ERRORS:
+        return RAGContext.from_dict(data)
+
+
+def _list(data: Any, decode_item: Callable[[Any], Any]) -> Any:
+    """Decode an optional list; any item failing to decode leaves the whole list raw, as in Sample.from_dict."""
+    if data is None or isinstance(data, Unset) or not isinstance(data, list):
+        return data
+    try:
+        return [decode_item(item) for item in data]
+    except _UNION_ERRORS:
+        return data
+
+
+def _meta(data: Any) -> Any:
+    return data if isinstance(data, Unset) else SampleMeta.from_dict(data)
+
+
+def _raw(data: Any) -> Any:
+    return data
+
+
+_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "seed": lambda data: _union(data, (Seed,)),
+    "question": lambda data: _union(data, (ForwardLookingQuestion, Question)),
+    "label": lambda data: _union(data, (Label,)),
+    "prompt": _raw,
+    "context": lambda data: _list(data, _context_item),
+    "rollouts": lambda data: _list(data, Rollout.from_dict),
+    "meta": _meta,
+    "is_valid": _raw,
+}
+
+
+def _lazy_field(name: str, decode: Callable[["LazySample"], Any]) -> property:
+    # Decoded values live in Sample's own slot for the field, so a decoded
+    # LazySample is only as large as a Sample plus the raw mapping
+    slot = Sample.__dict__[name]
+
+    def get(self: "LazySample") -> Any:
+        try:
+            return slot.__get__(self, LazySample)
+        except AttributeError:
+            value = decode(self)
+            slot.__set__(self, value)
+            return value
+
+    def set(self: "LazySample", value: Any) -> None:
+        slot.__set__(self, value)
+
+    return property(get, set, doc=f"`Sample.{name}`, decoded from the raw payload on first access.")
+
+
+def _field(name: str) -> property:
+    decode = _DECODERS[name]
+    return _lazy_field(name, lambda sample: decode(sample._raw.get(name, UNSET)))
+
+
+def _additional_properties(sample: "LazySample") -> Dict[str, Any]:
+    return {key: value for key, value in sample._raw.items() if key not in _DECODERS}
+
+
+class LazySample(Sample):
+    """
+    A `Sample` that keeps the raw API payload and decodes each field on first access.
+
+    Reading `sample.question` builds only the question (and caches it); `seed`,
+    `label`, `context`, `rollouts` and `meta` stay as plain dicts until they are
+    touched. It is a `Sample` subclass, so `isinstance` checks, `to_dict()` and
+    the flattening helpers work unchanged, and it compares equal to the eagerly
+    decoded `Sample` of the same payload.
+
+    Decoding follows `Sample.from_dict`, except that an invalid field raises on
+    first access instead of when the page is parsed.
+
+    Example:
+        >>> samples = dataset.download(lazy=True)
+        >>> labels = [s.label.label for s in samples]  # seeds and contexts are never built
+    """
+
+    __slots__ = ("_raw",)
+
+    seed = _field("seed")
+    question = _field("question")
+    label = _field("label")
+    prompt = _field("prompt")
+    context = _field("context")
+    rollouts = _field("rollouts")
+    meta = _field("meta")
+    is_valid = _field("is_valid")
+    additional_properties = _lazy_field("additional_properties", _additional_properties)
+
+    @classmethod
+    def from_dict(cls, src_dict: Mapping[str, Any]) -> "LazySample":
+        sample = object.__new__(cls)
+        sample._raw = dict(src_dict)
+        return sample
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sample):
+            return NotImplemented
+        return all(getattr(self, a.name) == getattr(other, a.name) for a in Sample.__attrs_attrs__)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None  # type: ignore[assignment]
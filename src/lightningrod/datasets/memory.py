@@ -0,0 +1,61 @@
+import threading
+import uuid
+from typing import Dict, List, Optional
+
+from lightningrod._generated.models import PaginatedSamplesResponse
+from lightningrod._generated.models.sample import Sample
+from lightningrod.datasets.client import DatasetSamplesClient
+from lightningrod.datasets.dataset import Dataset
+
+
+class InMemoryDatasetSamplesClient(DatasetSamplesClient):
+    """
+    DatasetSamplesClient that stores datasets in process memory instead of the API.
+
+    Pages are served with offset cursors exactly like the API, so `Dataset.download()`,
+    `flattened()` and output streaming exercise the same pagination code paths.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(client=None)
+        self._datasets: Dict[str, List[Sample]] = {}
+        self._lock = threading.Lock()
+
+    def create(self, samples: Optional[List[Sample]] = None) -> Dataset:
+        """Create a dataset, optionally holding `samples`, and return it."""
+        dataset_id = f"local-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self._datasets[dataset_id] = list(samples or [])
+        return Dataset(id=dataset_id, num_rows=len(self._datasets[dataset_id]), datasets_client=self)
+
+    def get(self, dataset_id: str) -> Dataset:
+        return Dataset(id=dataset_id, num_rows=len(self._samples(dataset_id)), datasets_client=self)
+
+    def fetch_page(
+        self,
+        dataset_id: str,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        lazy: bool = False,
+    ) -> PaginatedSamplesResponse:
+        # Samples are already decoded objects here, so `lazy` has nothing to defer
+        samples = self._samples(dataset_id)
+        start = int(cursor) if cursor else 0
+        end = min(start + limit, len(samples))
+        has_more = end < len(samples)
+        return PaginatedSamplesResponse(
+            samples=samples[start:end],
+            has_more=has_more,
+            total=len(samples),
+            next_cursor=str(end) if has_more else None,
+        )
+
+    def upload(self, dataset_id: str, samples: List[Sample], idempotency_key: Optional[str] = None) -> None:
+        with self._lock:
+            self._samples(dataset_id).extend(samples)
+
+    def _samples(self, dataset_id: str) -> List[Sample]:
+        try:
+            return self._datasets[dataset_id]
+        except KeyError:
+            raise Exception(f"Dataset {dataset_id} not found") from None
@@ -0,0 +1,132 @@
+import os
+import tempfile
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+import pyarrow as pa
+
+from lightningrod._generated.models.sample import Sample
+from lightningrod._json import get_codec
+from lightningrod.datasets.lazy import LazySample
+
+FORMAT = b"lightningrod-samples"
+FORMAT_VERSION = b"1"
+SAMPLE_COLUMN = "sample"
+# Rows per record batch: bounds memory while saving and the work to locate a row when reading
+BATCH_ROWS = 10_000
+
+_FORMAT_KEY = b"lightningrod.format"
+_VERSION_KEY = b"lightningrod.format_version"
+_DATASET_ID_KEY = b"lightningrod.dataset_id"
+
+
+def save_samples(path: Union[str, Path], samples: Iterable[Sample], dataset_id: Optional[str] = None) -> None:
+    """
+    Write samples to an uncompressed Arrow IPC file (Feather v2).
+
+    Each row holds one sample's `to_dict()` as JSON in a `sample` column. The
+    file is uncompressed so `MappedSamples` can memory-map it without copying.
+    It is written to a temp file and renamed, so readers never see a partial file.
+    """
+    path = Path(path)
+    metadata = {_FORMAT_KEY: FORMAT, _VERSION_KEY: FORMAT_VERSION}
+    if dataset_id is not None:
+        metadata[_DATASET_ID_KEY] = dataset_id.encode("utf-8")
+    schema = pa.schema([pa.field(SAMPLE_COLUMN, pa.large_binary())], metadata=metadata)
+    dumps = get_codec().dumps
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-", suffix=".tmp")
+    os.close(fd)
+    try:
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+            rows: List[bytes] = []
+            for sample in samples:
+                rows.append(dumps(sample.to_dict()))
+                if len(rows) == BATCH_ROWS:
+                    writer.write_batch(pa.record_batch([pa.array(rows, pa.large_binary())], schema=schema))
+                    rows = []
+            if rows:
+                writer.write_batch(pa.record_batch([pa.array(rows, pa.large_binary())], schema=schema))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class MappedSamples(Sequence[Sample]):
+    """
+    Read-only sequence of samples backed by a memory-mapped file written by `save_samples`.
+
+    Opening the file reads only its footer; rows are paged in by the OS when first
+    read, and processes mapping the same file share those pages. Indexing or
+    iterating decodes a row into a fresh `LazySample` (or `Sample` when `lazy` is
+    False), so nothing is kept in memory between reads.
+
+    Pickling re-opens the file by path rather than copying rows, so a
+    MappedSamples can be handed to worker processes (e.g. a DataLoader).
+
+    Args:
+        path: File written by `Dataset.save()`
+        lazy: Decode rows into LazySample objects rather than eagerly built Samples
+
+    Raises:
+        ValueError: If the file is not a Lightning Rod dataset file
+    """
+
+    def __init__(self, path: Union[str, Path], lazy: bool = True):
+        self.path: Path = Path(path)
+        self.lazy: bool = lazy
+        reader = pa.ipc.open_file(pa.memory_map(str(self.path), "r"))
+        metadata = reader.schema.metadata or {}
+        if metadata.get(_FORMAT_KEY) != FORMAT:
+            raise ValueError(f"{self.path} is not a Lightning Rod dataset file")
+        if metadata.get(_VERSION_KEY) != FORMAT_VERSION:
+            raise ValueError(f"{self.path} has unsupported format version {metadata.get(_VERSION_KEY)!r}")
+        dataset_id = metadata.get(_DATASET_ID_KEY)
+        self.dataset_id: Optional[str] = dataset_id.decode("utf-8") if dataset_id is not None else None
+
+        self._columns: List[Any] = []
+        self._starts: List[int] = []
+        total = 0
+        for i in range(reader.num_record_batches):
+            column = reader.get_batch(i).column(0)
+            self._columns.append(column)
+            self._starts.append(total)
+            total += len(column)
+        self._len = total
+        self._loads = get_codec().loads
+        self._from_dict = LazySample.from_dict if lazy else Sample.from_dict
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, index: int) -> Sample: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Sample]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Sample, List[Sample]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("sample index out of range")
+        batch = bisect_right(self._starts, index) - 1
+        value = self._columns[batch][index - self._starts[batch]].as_py()
+        return self._from_dict(self._loads(value))
+
+    def __iter__(self) -> Iterator[Sample]:
+        loads, from_dict = self._loads, self._from_dict
+        for column in self._columns:
+            for value in column.to_pylist():
+                yield from_dict(loads(value))
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str, bool]]:
+        return (MappedSamples, (str(self.path), self.lazy))
+
+    def __repr__(self) -> str:
+        return f"MappedSamples({str(self.path)!r}, rows={self._len}, lazy={self.lazy})"
@@ -1,6 +1,6 @@
+import asyncio
 from pathlib import Path
-
-import httpx
+from typing import AsyncIterator, Optional
 
 from lightningrod._generated.models import (
     HTTPValidationError,
@@ -13,10 +13,13 @@ from lightningrod._generated.api.files import (
 import mimetypes
 from lightningrod._generated.client import AuthenticatedClient
 from lightningrod._errors import handle_response_error
+from lightningrod._http import AsyncHttpPool, HttpPool
 
 class FilesClient:
-    def __init__(self, client: AuthenticatedClient):
+    def __init__(self, client: AuthenticatedClient, http_pool: Optional[HttpPool] = None):
         self._client: AuthenticatedClient = client
+        # Signed-URL uploads reuse one pooled connection instead of a new client per file
+        self._http_pool: HttpPool = http_pool or HttpPool()
     
     def upload(self, file_path: str | Path) -> CreateFileUploadResponse:
         path = Path(file_path)
@@ -45,14 +48,64 @@ class FilesClient:
         if parsed.mime_type:
             upload_headers["Content-Type"] = parsed.mime_type
         
-        with httpx.Client() as http_client:
-            with open(path, "rb") as f:
-                upload_response = http_client.put(
-                    parsed.upload_url,
-                    content=f,
-                    headers=upload_headers,
-                    timeout=1800.0
-                )
-                upload_response.raise_for_status()
+        with open(path, "rb") as f:
+            upload_response = self._http_pool.upload_client().put(
+                parsed.upload_url,
+                content=f,
+                headers=upload_headers,
+            )
+            upload_response.raise_for_status()
         
         return parsed
+
+
+class AsyncFilesClient:
+    def __init__(self, client: AuthenticatedClient, http_pool: Optional[AsyncHttpPool] = None):
+        self._client: AuthenticatedClient = client
+        self._http_pool: AsyncHttpPool = http_pool or AsyncHttpPool()
+    
+    async def upload(self, file_path: str | Path) -> CreateFileUploadResponse:
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        file_size: int = path.stat().st_size
+        mime_type, _ = mimetypes.guess_type(str(path))
+        
+        request_body = CreateFileUploadRequest(
+            filename=path.name,
+            size_bytes=file_size,
+            mime_type=mime_type
+        )
+        
+        response = await create_file_upload_files_post.asyncio_detailed(
+            client=self._client,
+            body=request_body
+        )
+        
+        parsed = handle_response_error(response, "get upload URL")
+        
+        upload_headers: dict[str, str] = {
+            "Content-Length": str(file_size)
+        }
+        if parsed.mime_type:
+            upload_headers["Content-Type"] = parsed.mime_type
+        
+        upload_response = await self._http_pool.upload_client().put(
+            parsed.upload_url,
+            content=_read_chunks(path),
+            headers=upload_headers,
+        )
+        upload_response.raise_for_status()
+        
+        return parsed
+
+
+async def _read_chunks(path: Path, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+    # Disk reads run in a worker thread so a slow disk doesn't stall the event loop
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
+    finally:
+        await asyncio.to_thread(f.close)
@@ -18,7 +18,7 @@ from lightningrod._generated.api.file_sets import (
     list_files_in_set_filesets_file_set_id_files_get,
 )
 from lightningrod._generated.client import AuthenticatedClient
-from lightningrod.files.client import FilesClient
+from lightningrod.files.client import AsyncFilesClient, FilesClient
 from lightningrod._errors import handle_response_error
 
 class FileSetFilesClient:
@@ -104,3 +104,88 @@ class FileSetsClient:
         
         parsed = handle_response_error(response, "list file sets")
         return parsed.file_sets
+
+
+class AsyncFileSetFilesClient:
+    def __init__(self, client: AuthenticatedClient, files_client: AsyncFilesClient):
+        self._client: AuthenticatedClient = client
+        self._files_client: AsyncFilesClient = files_client
+
+    async def upload(
+        self,
+        file_set_id: str,
+        file_path: str | Path,
+        metadata: Optional[dict[str, Any]] = None
+    ) -> FileSetFile:
+        file = await self._files_client.upload(file_path)
+        return await self.add(file_set_id, file.id, metadata)
+    
+    async def add(
+        self,
+        file_set_id: str,
+        file_id: str,
+        metadata: Optional[dict[str, Any]] = None
+    ) -> FileSetFile:
+        request = CreateFileSetFileRequest(
+            file_id=file_id,
+            metadata=CreateFileSetFileRequestMetadataType0.from_dict(metadata) if metadata else None
+        )
+        
+        response = await add_file_to_set_filesets_file_set_id_files_post.asyncio_detailed(
+            file_set_id=file_set_id,
+            client=self._client,
+            body=request
+        )
+        
+        return handle_response_error(response, "add file to set")
+    
+    async def list(
+        self,
+        file_set_id: str,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> ListFileSetFilesResponse:
+        response = await list_files_in_set_filesets_file_set_id_files_get.asyncio_detailed(
+            file_set_id=file_set_id,
+            client=self._client,
+            cursor=cursor if cursor else None,
+            limit=limit
+        )
+        
+        return handle_response_error(response, "list files in set")
+
+
+class AsyncFileSetsClient:
+    def __init__(self, client: AuthenticatedClient, files_client: AsyncFilesClient):
+        self._client = client
+        self.files = AsyncFileSetFilesClient(client, files_client)
+    
+    async def create(
+        self,
+        name: str,
+        description: Optional[str] = None
+    ) -> FileSet:
+        request = CreateFileSetRequest(name=name)
+        if description is not None:
+            request.description = description
+        
+        response = await create_file_set_filesets_post.asyncio_detailed(
+            client=self._client,
+            body=request
+        )
+        
+        return handle_response_error(response, "create file set")
+    
+    async def get(self, file_set_id: str) -> FileSet:
+        response = await get_file_set_filesets_file_set_id_get.asyncio_detailed(
+            file_set_id=file_set_id,
+            client=self._client
+        )
+        
+        return handle_response_error(response, "get file set")
+    
+    async def list(self) -> List[FileSet]:
+        response = await list_file_sets_filesets_get.asyncio_detailed(client=self._client)
+        
+        parsed = handle_response_error(response, "list file sets")
+        return parsed.file_sets
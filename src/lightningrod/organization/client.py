@@ -15,3 +15,16 @@ class OrganizationsClient:
         )
         parsed: BalanceResponse = handle_response_error(response, "get balance")
         return parsed.balance_dollars
+
+
+class AsyncOrganizationsClient:
+
+    def __init__(self, client: AuthenticatedClient):
+        self._client = client
+
+    async def get_balance(self) -> float:
+        response = await get_balance_organizations_balance_get.asyncio_detailed(
+            client=self._client,
+        )
+        parsed: BalanceResponse = handle_response_error(response, "get balance")
+        return parsed.balance_dollars
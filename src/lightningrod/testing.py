@@ -0,0 +1,565 @@
+"""
+Stand-in Lightning Rod API for offline tests and benchmarks.
+
+`FakeLightningRodServer` implements the public API described by
+`openapi/openapi.json` in memory: datasets and sample pagination, uploads,
+transform jobs and their metrics, cost estimates, files (including the signed
+upload URL) and filesets. Completed jobs produce synthetic datasets whose size,
+payload size and timing are set by `FakeServerConfig`.
+
+Use it in-process through an httpx transport:
+
+    >>> server = FakeLightningRodServer(FakeServerConfig(rows_per_job=10_000))
+    >>> lr = server.client()
+    >>> dataset = lr.transforms.run(config)
+
+or serve it over HTTP with any ASGI server; it has no dependencies of its own:
+
+    >>> import uvicorn
+    >>> uvicorn.run(FakeLightningRodServer(), port=8080)
+    >>> lr = LightningRod(api_key="fake", base_url="http://localhost:8080/api/public/v1")
+"""
+
+import asyncio
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from lightningrod.client import AsyncLightningRod, LightningRod
+
+API_PREFIX = "/api/public/v1"
+DEFAULT_BASE_URL = "http://lightningrod.test" + API_PREFIX
+STORAGE_HOST = "storage.lightningrod.test"
+
+_TOPICS = ("rates", "elections", "earnings", "weather", "launches", "tariffs", "mergers", "championships")
+
+
+@dataclass
+class FakeServerConfig:
+    """
+    Scale and timing of a FakeLightningRodServer.
+
+    Attributes:
+        rows_per_job: Samples in the output dataset of each completed job (capped by `max_questions`)
+        seed_text_bytes: Approximate length of each synthetic sample's seed text
+        latency_seconds: Delay added to every request
+        job_duration_seconds: How long a job reports RUNNING before it completes
+        failure_rate: Fraction of API requests answered with 503 and `Retry-After: 0`
+        cost_per_row_dollars: Cost reported per output row by estimates and job usage
+        balance_dollars: Organization balance
+        seed: Seed for synthetic data and injected failures, so runs are reproducible
+        replay_idempotency_keys: Answer a repeated sample upload with the same
+            `Idempotency-Key` from the first result instead of storing it again. Off by
+            default, like the real API, which does not deduplicate on the header
+    """
+
+    rows_per_job: int = 100
+    seed_text_bytes: int = 200
+    latency_seconds: float = 0.0
+    job_duration_seconds: float = 0.0
+    failure_rate: float = 0.0
+    cost_per_row_dollars: float = 0.01
+    balance_dollars: float = 100.0
+    seed: int = 0
+    replay_idempotency_keys: bool = False
+
+    def __post_init__(self) -> None:
+        if self.rows_per_job < 0:
+            raise ValueError("rows_per_job must be non-negative")
+        if not 0.0 <= self.failure_rate < 1.0:
+            raise ValueError("failure_rate must be in [0, 1)")
+
+
+@dataclass
+class _FakeJob:
+    id: str
+    config: Dict[str, Any]
+    input_dataset_id: Optional[str]
+    output_dataset_id: str
+    rows: int
+    created_at: datetime
+    started: float
+    status: str = "RUNNING"
+
+
+@dataclass
+class _FakeFileSet:
+    id: str
+    name: str
+    description: Optional[str]
+    created_at: datetime
+    files: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class _NotFound(Exception):
+    pass
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat()
+
+
+def _json(status_code: int, body: Any, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        content=json.dumps(body, separators=(",", ":")).encode("utf-8"),
+        headers={"Content-Type": "application/json", **(headers or {})},
+    )
+
+
+def _page(items: List[Any], cursor: Optional[str], limit: int) -> Tuple[List[Any], Optional[str], bool]:
+    start = int(cursor) if cursor else 0
+    end = start + limit
+    has_more = end < len(items)
+    return items[start:end], str(end) if has_more else None, has_more
+
+
+def synthetic_samples(count: int, seed_text_bytes: int = 200, seed: Any = 0) -> List[Dict[str, Any]]:
+    """
+    Build `count` realistic sample payloads (seed, forward-looking question, label, meta),
+    in the JSON form the API returns them. The same `seed` always gives the same samples.
+    """
+    rng = random.Random(seed)
+    filler = "lorem ipsum dolor sit amet consectetur adipiscing elit "
+    text = (filler * (seed_text_bytes // len(filler) + 1))[:seed_text_bytes]
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    samples = []
+    for i in range(count):
+        topic = rng.choice(_TOPICS)
+        created = base + timedelta(hours=i)
+        samples.append({
+            "seed": {
+                "seed_text": f"[{topic} #{i}] {text}",
+                "url": f"https://news.example/{topic}/{i}",
+                "seed_creation_date": _iso(created),
+                "search_query": topic,
+            },
+            "question": {
+                "question_type": "FORWARD_LOOKING_QUESTION",
+                "question_text": f"Will the {topic} story #{i} resolve positively?",
+                "date_close": _iso(created + timedelta(days=30)),
+                "event_date": _iso(created + timedelta(days=31)),
+                "resolution_criteria": f"Resolves YES if report #{i} on {topic} is confirmed.",
+            },
+            "label": {
+                "label": rng.choice(("Yes", "No")),
+                "label_confidence": round(rng.uniform(0.5, 1.0), 3),
+                "resolution_date": _iso(created + timedelta(days=31)),
+            },
+            "meta": {"sample_id": f"{seed}-{i}", "topic": topic},
+            "is_valid": True,
+        })
+    return samples
+
+
+class FakeLightningRodServer:
+    """
+    In-memory implementation of the Lightning Rod public API.
+
+    Requests are answered from state held on the instance, so a dataset uploaded
+    or a job created through one client is visible to every other client of the
+    same server. The server is safe to use from many threads and event loops.
+
+    Args:
+        config: Data scale, latency and failure injection (see FakeServerConfig)
+        base_url: URL that clients created with `client()` point at
+        clock: Monotonic clock used for job progress; override it to step jobs by hand
+
+    Attributes:
+        requests: Number of requests received per "METHOD /path/{template}"
+    """
+
+    def __init__(
+        self,
+        config: Optional[FakeServerConfig] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.config: FakeServerConfig = config or FakeServerConfig()
+        self.base_url: str = base_url.rstrip("/")
+        self.clock: Callable[[], float] = clock
+        self.requests: Counter = Counter()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._failures = random.Random(self.config.seed)
+        self._datasets: Dict[str, List[Dict[str, Any]]] = {}
+        self._jobs: Dict[str, _FakeJob] = {}
+        self._producers: Dict[str, _FakeJob] = {}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._uploaded: Dict[str, int] = {}
+        self._file_sets: Dict[str, _FakeFileSet] = {}
+        self._idempotent: Dict[str, Dict[str, Any]] = {}
+        self._routes: List[Tuple[str, "re.Pattern[str]", str, Callable[..., httpx.Response]]] = [
+            ("POST", re.compile(r"/datasets$"), "/datasets", self._create_dataset),
+            ("GET", re.compile(r"/datasets/([^/]+)$"), "/datasets/{dataset_id}", self._get_dataset),
+            ("GET", re.compile(r"/datasets/([^/]+)/samples$"), "/datasets/{dataset_id}/samples", self._list_samples),
+            ("POST", re.compile(r"/datasets/([^/]+)/samples$"), "/datasets/{dataset_id}/samples", self._upload_samples),
+            ("POST", re.compile(r"/samples/validate$"), "/samples/validate", self._validate_sample),
+            ("POST", re.compile(r"/transform-jobs/cost-estimation$"), "/transform-jobs/cost-estimation", self._estimate_cost),
+            ("POST", re.compile(r"/transform-jobs$"), "/transform-jobs", self._create_job),
+            ("GET", re.compile(r"/transform-jobs/([^/]+)$"), "/transform-jobs/{job_id}", self._get_job),
+            ("GET", re.compile(r"/transform-jobs/([^/]+)/metrics$"), "/transform-jobs/{job_id}/metrics", self._get_metrics),
+            ("GET", re.compile(r"/organizations/balance$"), "/organizations/balance", self._get_balance),
+            ("POST", re.compile(r"/files$"), "/files", self._create_file_upload),
+            ("POST", re.compile(r"/filesets/?$"), "/filesets", self._create_file_set),
+            ("GET", re.compile(r"/filesets/?$"), "/filesets", self._list_file_sets),
+            ("GET", re.compile(r"/filesets/([^/]+)$"), "/filesets/{file_set_id}", self._get_file_set),
+            ("POST", re.compile(r"/filesets/([^/]+)/files$"), "/filesets/{file_set_id}/files", self._add_file),
+            ("GET", re.compile(r"/filesets/([^/]+)/files$"), "/filesets/{file_set_id}/files", self._list_files),
+        ]
+
+    # Entry points
+
+    def client(self, api_key: str = "fake-key", **kwargs: Any) -> LightningRod:
+        """Create a LightningRod client connected to this server; `kwargs` are passed to LightningRod."""
+        return LightningRod(api_key=api_key, base_url=self.base_url, transport=self.transport(), **kwargs)
+
+    def async_client(self, api_key: str = "fake-key", **kwargs: Any) -> AsyncLightningRod:
+        """Create an AsyncLightningRod client connected to this server."""
+        return AsyncLightningRod(api_key=api_key, base_url=self.base_url, transport=self.async_transport(), **kwargs)
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for `httpx.Client`, or for LightningRod's `transport=` argument."""
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Transport for `httpx.AsyncClient`, or for AsyncLightningRod's `transport=` argument."""
+        return httpx.MockTransport(self.handle_async)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.config.latency_seconds:
+            time.sleep(self.config.latency_seconds)
+        return self._dispatch(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        if self.config.latency_seconds:
+            await asyncio.sleep(self.config.latency_seconds)
+        return self._dispatch(request)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        """ASGI entry point, so the server can be run by uvicorn, hypercorn or `httpx.ASGITransport`."""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        headers = [(k.decode("latin-1"), v.decode("latin-1")) for k, v in scope["headers"]]
+        host = dict(headers).get("host", "localhost")
+        url = f"{scope.get('scheme', 'http')}://{host}{scope['path']}"
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode("latin-1")
+        response = await self.handle_async(httpx.Request(scope["method"], url, headers=headers, content=body))
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [(k.encode("latin-1"), v.encode("latin-1")) for k, v in response.headers.items()],
+        })
+        await send({"type": "http.response.body", "body": response.content})
+
+    # Routing
+
+    def _dispatch(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == STORAGE_HOST:
+            return self._put_upload(request)
+        path = request.url.path
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX):]
+        for method, pattern, template, handler in self._routes:
+            match = pattern.match(path)
+            if match is None or method != request.method:
+                continue
+            with self._lock:
+                self.requests[f"{method} {template}"] += 1
+                failing = self.config.failure_rate and self._failures.random() < self.config.failure_rate
+            if failing:
+                return _json(503, {"detail": "Service temporarily unavailable"}, {"Retry-After": "0"})
+            try:
+                return handler(request, *match.groups())
+            except _NotFound as e:
+                return _json(404, {"detail": str(e)})
+        return _json(404, {"detail": "Not Found"})
+
+    def _body(self, request: httpx.Request) -> Dict[str, Any]:
+        return json.loads(request.content) if request.content else {}
+
+    def _new_id(self, prefix: str) -> str:
+        return f"{prefix}-{next(self._ids)}"
+
+    # Datasets
+
+    def _create_dataset(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            dataset_id = self._new_id("dataset")
+            self._datasets[dataset_id] = []
+        return _json(201, {"id": dataset_id})
+
+    def _rows(self, dataset_id: str) -> List[Dict[str, Any]]:
+        # Called with the lock held
+        producer = self._producers.get(dataset_id)
+        if producer is not None:
+            self._advance(producer)
+        if dataset_id not in self._datasets:
+            raise _NotFound(f"Dataset {dataset_id} not found")
+        return self._datasets[dataset_id]
+
+    def _get_dataset(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        with self._lock:
+            rows = self._rows(dataset_id)
+            return _json(200, {"id": dataset_id, "num_rows": len(rows)})
+
+    def _list_samples(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        limit = min(int(request.url.params.get("limit", 1000)), 5000)
+        with self._lock:
+            rows = self._rows(dataset_id)
+            samples, next_cursor, has_more = _page(rows, request.url.params.get("cursor"), limit)
+            total = len(rows)
+        return _json(200, {"samples": samples, "next_cursor": next_cursor, "has_more": has_more, "total": total})
+
+    def _upload_samples(self, request: httpx.Request, dataset_id: str) -> httpx.Response:
+        samples = self._body(request)["samples"]
+        key = request.headers.get("Idempotency-Key") if self.config.replay_idempotency_keys else None
+        with self._lock:
+            if key is not None and key in self._idempotent:
+                return _json(200, self._idempotent[key])
+            rows = self._rows(dataset_id)
+            rows.extend(samples)
+            result = {"count": len(samples), "total": len(rows)}
+            if key is not None:
+                self._idempotent[key] = result
+        return _json(200, result)
+
+    def _validate_sample(self, request: httpx.Request) -> httpx.Response:
+        sample = self._body(request)
+        if not sample.get("seed") and not sample.get("question"):
+            return _json(200, {"valid": False, "message": "Sample needs a seed or a question"})
+        return _json(200, {"valid": True, "message": "Sample is valid"})
+
+    # Transform jobs
+
+    def _estimated_rows(self, body: Dict[str, Any]) -> int:
+        max_questions = body.get("max_questions")
+        return self.config.rows_per_job if max_questions is None else min(self.config.rows_per_job, max_questions)
+
+    def _usage(self, cost: float) -> Dict[str, Any]:
+        return {"events": {}, "llm_by_model": {}, "total_cost": cost}
+
+    def _estimate_cost(self, request: httpx.Request) -> httpx.Response:
+        cost = self._estimated_rows(self._body(request)) * self.config.cost_per_row_dollars
+        return _json(200, {
+            "total_cost_dollars": cost,
+            "llm_cost_dollars": cost,
+            "web_search_cost_dollars": 0.0,
+            "url_download_cost_dollars": 0.0,
+            "usage": self._usage(cost),
+            "steps": [],
+        })
+
+    def _create_job(self, request: httpx.Request) -> httpx.Response:
+        body = self._body(request)
+        with self._lock:
+            input_dataset_id = body.get("input_dataset_id")
+            if input_dataset_id is not None:
+                self._rows(input_dataset_id)
+            job = _FakeJob(
+                id=self._new_id("job"),
+                config=body["config"],
+                input_dataset_id=input_dataset_id,
+                output_dataset_id=self._new_id("dataset"),
+                rows=self._estimated_rows(body),
+                created_at=datetime.now(timezone.utc),
+                started=self.clock(),
+            )
+            self._jobs[job.id] = job
+            self._producers[job.output_dataset_id] = job
+            self._advance(job)
+            return _json(201, self._job_payload(job))
+
+    def _job(self, job_id: str) -> _FakeJob:
+        # Called with the lock held
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise _NotFound(f"Transform job {job_id} not found")
+        self._advance(job)
+        return job
+
+    def _progress(self, job: _FakeJob) -> float:
+        if self.config.job_duration_seconds <= 0:
+            return 1.0
+        return min(1.0, (self.clock() - job.started) / self.config.job_duration_seconds)
+
+    def _advance(self, job: _FakeJob) -> None:
+        if job.status == "RUNNING" and self._progress(job) >= 1.0:
+            self._datasets[job.output_dataset_id] = synthetic_samples(
+                job.rows, self.config.seed_text_bytes, seed=f"{self.config.seed}:{job.output_dataset_id}"
+            )
+            job.status = "COMPLETED"
+
+    def _job_payload(self, job: _FakeJob) -> Dict[str, Any]:
+        cost = job.rows * self._progress(job) * self.config.cost_per_row_dollars
+        return {
+            "id": job.id,
+            "organization_id": "org-fake",
+            "status": job.status,
+            "modal_function_call_id": f"fc-{job.id}",
+            "modal_app_id": "app-fake",
+            "transform_config": json.dumps(job.config),
+            "input_dataset_id": job.input_dataset_id,
+            "output_dataset_id": job.output_dataset_id if job.status == "COMPLETED" else None,
+            "created_at": _iso(job.created_at),
+            "updated_at": _iso(datetime.now(timezone.utc)),
+            "usage": {"total": self._usage(cost), "current_cost_dollars": cost},
+            "estimated_cost_dollars": job.rows * self.config.cost_per_row_dollars,
+        }
+
+    def _get_job(self, request: httpx.Request, job_id: str) -> httpx.Response:
+        with self._lock:
+            return _json(200, self._job_payload(self._job(job_id)))
+
+    def _get_metrics(self, request: httpx.Request, job_id: str) -> httpx.Response:
+        with self._lock:
+            job = self._job(job_id)
+            progress = self._progress(job)
+        elapsed = progress * self.config.job_duration_seconds
+        output_rows = int(job.rows * progress)
+        return _json(200, {
+            "total_input_rows": job.rows,
+            "total_output_rows": output_rows,
+            "total_duration_seconds": elapsed,
+            "steps": [
+                {
+                    "step_index": 0,
+                    "transform_name": job.config.get("config_type", "transform").lower(),
+                    "input_rows": job.rows,
+                    "output_rows": output_rows,
+                    "rejected_count": 0,
+                    "error_count": 0,
+                    "duration_seconds": elapsed,
+                    "progress": progress,
+                    "summary": None,
+                }
+            ],
+        })
+
+    def _get_balance(self, request: httpx.Request) -> httpx.Response:
+        return _json(200, {"balance_dollars": self.config.balance_dollars})
+
+    # Files and filesets
+
+    def _create_file_upload(self, request: httpx.Request) -> httpx.Response:
+        body = self._body(request)
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            file_id = self._new_id("file")
+            record = {
+                "id": file_id,
+                "original_file_name": body["filename"],
+                "cloud_storage_path": f"uploads/{file_id}/{body['filename']}",
+                "upload_url": f"http://{STORAGE_HOST}/uploads/{file_id}?signature=fake",
+                "mime_type": body.get("mime_type"),
+                "size_bytes": body["size_bytes"],
+                "metadata": None,
+                "created_at": _iso(now),
+                "expires_at": _iso(now + timedelta(hours=1)),
+            }
+            self._files[file_id] = record
+        return _json(201, record)
+
+    def _put_upload(self, request: httpx.Request) -> httpx.Response:
+        match = re.match(r"/uploads/([^/]+)$", request.url.path)
+        if request.method != "PUT" or match is None:
+            return httpx.Response(404)
+        size = len(request.read())
+        with self._lock:
+            if match.group(1) not in self._files:
+                return httpx.Response(404)
+            self._uploaded[match.group(1)] = size
+        return httpx.Response(200)
+
+    def _file_set_payload(self, file_set: _FakeFileSet) -> Dict[str, Any]:
+        return {
+            "id": file_set.id,
+            "name": file_set.name,
+            "description": file_set.description,
+            "file_count": len(file_set.files),
+            "indexed_file_count": len(file_set.files),
+            "is_public": False,
+            "created_at": _iso(file_set.created_at),
+            "updated_at": _iso(file_set.created_at),
+        }
+
+    def _file_set(self, file_set_id: str) -> _FakeFileSet:
+        file_set = self._file_sets.get(file_set_id)
+        if file_set is None:
+            raise _NotFound(f"File set {file_set_id} not found")
+        return file_set
+
+    def _create_file_set(self, request: httpx.Request) -> httpx.Response:
+        body = self._body(request)
+        with self._lock:
+            file_set = _FakeFileSet(
+                id=self._new_id("fileset"),
+                name=body["name"],
+                description=body.get("description"),
+                created_at=datetime.now(timezone.utc),
+            )
+            self._file_sets[file_set.id] = file_set
+            return _json(201, self._file_set_payload(file_set))
+
+    def _list_file_sets(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            return _json(200, {"file_sets": [self._file_set_payload(f) for f in self._file_sets.values()]})
+
+    def _get_file_set(self, request: httpx.Request, file_set_id: str) -> httpx.Response:
+        with self._lock:
+            return _json(200, self._file_set_payload(self._file_set(file_set_id)))
+
+    def _add_file(self, request: httpx.Request, file_set_id: str) -> httpx.Response:
+        body = self._body(request)
+        with self._lock:
+            file_set = self._file_set(file_set_id)
+            upload = self._files.get(body["file_id"])
+            if upload is None:
+                raise _NotFound(f"File {body['file_id']} not found")
+            record = {
+                "id": upload["id"],
+                "original_file_name": upload["original_file_name"],
+                "cloud_storage_path": upload["cloud_storage_path"],
+                "mime_type": upload["mime_type"],
+                "size_bytes": self._uploaded.get(upload["id"], upload["size_bytes"]),
+                "character_count": None,
+                "metadata": body.get("metadata"),
+                "gemini_file_id": None,
+                "file_created_date": None,
+                "created_at": upload["created_at"],
+                "updated_at": upload["created_at"],
+            }
+            file_set.files.append(record)
+        return _json(201, record)
+
+    def _list_files(self, request: httpx.Request, file_set_id: str) -> httpx.Response:
+        limit = min(int(request.url.params.get("limit", 10)), 100)
+        with self._lock:
+            file_set = self._file_set(file_set_id)
+            files, next_cursor, has_more = _page(file_set.files, request.url.params.get("cursor"), limit)
+            total = len(file_set.files)
+        return _json(200, {"files": files, "next_cursor": next_cursor, "has_more": has_more, "total": total})
@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from lightningrod._cache_dir import default_cache_dir
+
+
+def config_fingerprint(config: Any, **params: Any) -> str:
+    """
+    Stable SHA-256 fingerprint of a transform config plus run parameters.
+
+    The config is canonicalized through `to_dict()` and serialized with sorted keys,
+    so two configs that would submit identical jobs produce the same fingerprint.
+    """
+    payload = {"config": config.to_dict(), **params}
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _BoundedMemo:
+    """Thread-safe in-memory LRU map holding at most `max_entries`, each expiring after `ttl_seconds`."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries: int = max_entries
+        self.ttl_seconds: float = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class RunCache:
+    """
+    Local cache mapping a transform run's fingerprint to the output dataset of a previous successful run.
+
+    Pass it to `lr.transforms.run(..., cache=cache)` to return the earlier output dataset
+    instantly when the same config is run again on the same input with the same limits.
+    Entries are stored in a small JSON file so they survive notebook and process restarts.
+
+    Args:
+        path: JSON file to store entries in (defaults to ~/.cache/lightningrod/runs.json)
+        ttl_seconds: Ignore entries older than this many seconds (never expire if None)
+
+    Example:
+        >>> cache = RunCache(ttl_seconds=7 * 24 * 3600)
+        >>> dataset = lr.transforms.run(config, cache=cache)  # runs the job
+        >>> dataset = lr.transforms.run(config, cache=cache)  # returns immediately
+        >>> cache.invalidate(config)
+    """
+
+    def __init__(self, path: Optional[str | Path] = None, ttl_seconds: Optional[float] = None):
+        self.path: Path = Path(path) if path is not None else default_cache_dir() / "runs.json"
+        self.ttl_seconds: Optional[float] = ttl_seconds
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        config: Any,
+        input_dataset_id: Optional[str] = None,
+        max_questions: Optional[int] = None,
+        max_cost_dollars: Optional[float] = None,
+    ) -> str:
+        return config_fingerprint(
+            config,
+            input_dataset_id=input_dataset_id,
+            max_questions=max_questions,
+            max_cost_dollars=max_cost_dollars,
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached output dataset ID for `key`, or None if missing or expired."""
+        with self._lock:
+            entry = self._load().get(key)
+        if entry is None:
+            return None
+        if self.ttl_seconds is not None and time.time() - entry["created_at"] > self.ttl_seconds:
+            return None
+        return entry["output_dataset_id"]
+
+    def put(self, key: str, output_dataset_id: str, job_id: Optional[str] = None) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[key] = {"output_dataset_id": output_dataset_id, "job_id": job_id, "created_at": time.time()}
+            self._save(entries)
+
+    def invalidate(
+        self,
+        config: Any,
+        input_dataset_id: Optional[str] = None,
+        max_questions: Optional[int] = None,
+        max_cost_dollars: Optional[float] = None,
+    ) -> bool:
+        """Remove the entry for a run; returns True if one existed."""
+        return self.invalidate_key(self.key(config, input_dataset_id, max_questions, max_cost_dollars))
+
+    def invalidate_key(self, key: str) -> bool:
+        with self._lock:
+            entries = self._load()
+            if entries.pop(key, None) is None:
+                return False
+            self._save(entries)
+            return True
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._save({})
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # A corrupt cache is treated as empty rather than failing the run
+            return {}
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".runs-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
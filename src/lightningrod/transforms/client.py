@@ -1,6 +1,7 @@
-from typing import Optional, Union
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
-from lightningrod._display import display_error, display_warning, run_live_display
 from lightningrod._generated.models import (
     FileSetQuerySeedGenerator,
     FileSetSeedGenerator,
@@ -29,17 +30,103 @@ from lightningrod._generated.api.transform_jobs import (
     cost_estimation_transform_jobs_cost_estimation_post,
 )
 from lightningrod._generated.models.pipeline_metrics_response import PipelineMetricsResponse
-from lightningrod.datasets.dataset import Dataset
+from lightningrod._generated.models.sample import Sample
+from lightningrod.datasets.dataset import AsyncDataset, Dataset
 from lightningrod._generated.client import AuthenticatedClient
-from lightningrod.datasets.client import DatasetSamplesClient
+from lightningrod.datasets.client import AsyncDatasetSamplesClient, DatasetSamplesClient, DatasetsClient
 from lightningrod._generated.types import Unset
 from lightningrod._errors import handle_response_error
+from lightningrod.transforms.cache import RunCache, _BoundedMemo, config_fingerprint
+from lightningrod.transforms.handle import AsyncJobHandle, JobHandle, JobPoller, _raise_for_job_status, wait_all, wait_all_async
+from lightningrod.transforms.polling import PollSchedule
+from lightningrod.transforms.sharding import shard_config, split_budget
+from lightningrod.transforms.progress import (
+    JobMessageEvent,
+    LoggingProgressReporter,
+    ProgressOption,
+    ProgressReporter,
+    reporting_api_errors,
+    resolve_progress,
+)
 
 TransformConfig = Union[FileSetQuerySeedGenerator, FileSetSeedGenerator, ForwardLookingQuestionGenerator, GdeltSeedGenerator, NewsSeedGenerator, QuestionAndLabelGenerator, QuestionGenerator, QuestionPipeline, QuestionRenderer, WebSearchLabeler]
 
+# Bounds for the estimates remembered by estimate_cost_many between sweeps
+ESTIMATE_MEMO_ENTRIES = 1024
+ESTIMATE_MEMO_TTL_SECONDS = 600.0
+
+# Threads fetching metrics for concurrent snapshot() calls (the poller plus any handles polled directly)
+SNAPSHOT_WORKERS = 4
+
+
+def _estimate_memo() -> _BoundedMemo:
+    return _BoundedMemo(ESTIMATE_MEMO_ENTRIES, ESTIMATE_MEMO_TTL_SECONDS)
+
+
+def _split_cached_estimates(
+    memo: _BoundedMemo, configs: Dict[str, TransformConfig],
+) -> Tuple[Dict[str, EstimateCostResponse], Dict[str, TransformConfig]]:
+    """Split configs keyed by fingerprint into remembered estimates and configs still to estimate."""
+    estimates: Dict[str, EstimateCostResponse] = {}
+    missing: Dict[str, TransformConfig] = {}
+    for key, config in configs.items():
+        cached = memo.get(key)
+        if cached is not None:
+            estimates[key] = cached
+        else:
+            missing[key] = config
+    return estimates, missing
+
+
+def _input_dataset_id(input_dataset: Optional[Union[AsyncDataset, Dataset, str]]) -> Optional[str]:
+    if isinstance(input_dataset, (AsyncDataset, Dataset)):
+        return input_dataset.id
+    return input_dataset
+
+
+def _cost_breakdown_rows(config_index: int, estimate: EstimateCostResponse) -> List[Dict[str, Any]]:
+    totals = {
+        "total_cost_dollars": estimate.total_cost_dollars,
+        "llm_cost_dollars": estimate.llm_cost_dollars,
+        "web_search_cost_dollars": estimate.web_search_cost_dollars,
+        "url_download_cost_dollars": estimate.url_download_cost_dollars,
+    }
+    if not estimate.steps:
+        # Keep a totals-only row so every config appears in the table
+        return [{
+            "config_index": config_index,
+            "step_name": None,
+            "step_type": None,
+            "output_count": None,
+            "cost_per_output": None,
+            "step_cost_dollars": None,
+            **totals,
+        }]
+    return [
+        {
+            "config_index": config_index,
+            "step_name": step.step_name,
+            "step_type": step.step_type.value,
+            "output_count": step.output_count,
+            "cost_per_output": step.cost_per_output,
+            "step_cost_dollars": step.total_cost_dollars,
+            **totals,
+        }
+        for step in estimate.steps
+    ]
+
+
+class JobSnapshot(NamedTuple):
+    """A transform job's status together with its pipeline metrics, fetched at the same time."""
+    job: TransformJob
+    metrics: Optional[PipelineMetricsResponse]
+
+
 class TransformJobsClient:
     def __init__(self, client: AuthenticatedClient):
         self._client = client
+        # Long-lived so polling doesn't start a thread per snapshot; threads are spawned on first use
+        self._executor = ThreadPoolExecutor(max_workers=SNAPSHOT_WORKERS, thread_name_prefix="lightningrod-jobs")
 
     def get(self, job_id: str) -> TransformJob:
         response = get_transform_job_transform_jobs_job_id_get.sync_detailed(
@@ -58,71 +145,244 @@ class TransformJobsClient:
             return response.parsed
         return None
 
+    def snapshot(self, job_id: str) -> JobSnapshot:
+        """
+        Fetch a job's status and pipeline metrics concurrently.
+
+        Both requests are issued at once over the client's shared connection pool,
+        so a snapshot costs roughly one round trip instead of two.
+
+        Args:
+            job_id: ID of the transform job
+
+        Returns:
+            JobSnapshot with the current TransformJob and its metrics (None if not yet available)
+
+        Example:
+            >>> lr = LightningRod(api_key="your-api-key")
+            >>> job, metrics = lr.transforms.jobs.snapshot(job_id)
+        """
+        # Metrics are fetched on the client's worker threads while the job is fetched on the caller's
+        metrics_future = self._executor.submit(self.get_metrics, job_id)
+        job = self.get(job_id)
+        return JobSnapshot(job=job, metrics=metrics_future.result())
+
+    def close(self) -> None:
+        """Stop the worker threads used by `snapshot`."""
+        self._executor.shutdown(wait=True)
+
 
 class TransformsClient:
     def __init__(self, client: AuthenticatedClient, dataset_samples_client: DatasetSamplesClient):
         self._client: AuthenticatedClient = client
         self._dataset_samples_client: DatasetSamplesClient = dataset_samples_client
         self.jobs = TransformJobsClient(client)
+        self._poller = JobPoller(self.jobs)
+        self._estimates: _BoundedMemo = _estimate_memo()
     
     def run(
         self,
         config: TransformConfig,
         input_dataset: Optional[Union[Dataset, str]] = None,
         max_questions: Optional[int] = None,
-        max_cost_dollars: Optional[float] = None
+        max_cost_dollars: Optional[float] = None,
+        poll_schedule: Optional[PollSchedule] = None,
+        progress: ProgressOption = "rich",
+        cache: Optional[RunCache] = None,
     ) -> Dataset:
-        job: TransformJob = self.submit(config, input_dataset, max_questions, max_cost_dollars)
-
-        # Save the warning message before polling overwrites the job object
-        warning_message = job.warning_message if (not isinstance(job.warning_message, Unset) and job.warning_message is not None) else None
-
-        def poll():
-            nonlocal job
-            job = self.jobs.get(job.id)
-            metrics = self.jobs.get_metrics(job.id)
-            return metrics, job, job.status == TransformJobStatus.RUNNING
-
-        run_live_display(poll, poll_interval=15, warning_message=warning_message)
-
-        if job.status == TransformJobStatus.FAILED:
-            error_msg = job.error_message if (not isinstance(job.error_message, Unset) and job.error_message) else "Unknown error"
-            display_error(error_msg, title="Job Failed", job=job)
-            raise Exception(f"Transform job {job.id} failed: {error_msg}")
-
-        if job.status == TransformJobStatus.COMPLETED:
-            if job.output_dataset_id is None:
-                raise Exception(f"Transform job {job.id} completed but has no output dataset")
-            
-            dataset_response = get_dataset_datasets_dataset_id_get.sync_detailed(
-                dataset_id=job.output_dataset_id,
-                client=self._client,
-            )
-            dataset_result = handle_response_error(dataset_response, "get dataset")
-            
-            return Dataset(
-                id=dataset_result.id,
-                num_rows=dataset_result.num_rows,
-                datasets_client=self._dataset_samples_client
-            )
-        
-        raise Exception(f"Unexpected job status: {job.status}")
+        """
+        Submit a transform job, wait for it to finish and return its output dataset.
+
+        Args:
+            config: Transform configuration to run
+            input_dataset: Optional input Dataset or dataset ID
+            max_questions: Optional cap on the number of generated questions
+            max_cost_dollars: Optional cost budget for the job
+            poll_schedule: Optional PollSchedule controlling the time between polls
+            progress: Where progress goes: "rich" (live panel, the default), "logging" or a
+                logging.Logger, a callable receiving each progress event, a ProgressReporter,
+                or None for a silent headless run
+            cache: Optional RunCache; if this exact run already succeeded, its output
+                dataset is returned without submitting a new job
+
+        Returns:
+            Dataset produced by the job
+
+        Example:
+            >>> lr = LightningRod(api_key="your-api-key")
+            >>> dataset = lr.transforms.run(config, progress=logging.getLogger("pipelines"))
+        """
+        cache_key: Optional[str] = None
+        if cache is not None:
+            cache_key = cache.key(config, _input_dataset_id(input_dataset), max_questions, max_cost_dollars)
+            cached_dataset_id = cache.get(cache_key)
+            if cached_dataset_id is not None:
+                return self._get_dataset(cached_dataset_id)
+
+        with resolve_progress(progress) as reporter, reporting_api_errors(reporter):
+            handle = JobHandle(self._create_job(config, input_dataset, max_questions, max_cost_dollars, reporter), self, reporter)
+            for event in handle.events(poll_schedule):
+                reporter(event)
+            _raise_for_job_status(handle.job, reporter)
+            dataset = handle.result()
+
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, dataset.id, job_id=handle.id)
+        return dataset
     
     def submit(
         self,
         config: TransformConfig,
         input_dataset: Optional[Union[Dataset, str]] = None,
         max_questions: Optional[int] = None,
-        max_cost_dollars: Optional[float] = None
+        max_cost_dollars: Optional[float] = None,
+        poll_schedule: Optional[PollSchedule] = None,
+        progress: ProgressOption = "logging",
+    ) -> JobHandle:
+        """
+        Submit a transform job without waiting for it to finish.
+
+        The returned handle is polled in the background by a single thread shared
+        across all submitted jobs, so many jobs can be in flight at once.
+
+        Args:
+            config: Transform configuration to run
+            input_dataset: Optional input Dataset or dataset ID
+            max_questions: Optional cap on the number of generated questions
+            max_cost_dollars: Optional cost budget for the job
+            poll_schedule: Optional PollSchedule for background status checks
+            progress: Where submission warnings and the failure from `result()` go; accepts
+                the same options as `run`. Defaults to "logging" so worker processes stay
+                headless; pass "rich" for panels
+
+        Returns:
+            JobHandle for waiting on the job and retrieving its output dataset
+
+        Example:
+            >>> lr = LightningRod(api_key="your-api-key")
+            >>> handle = lr.transforms.submit(config)
+            >>> handle.add_done_callback(lambda h: print(h.status))
+            >>> dataset = handle.result()
+        """
+        reporter = resolve_progress(progress)
+        with reporting_api_errors(reporter):
+            handle = JobHandle(self._create_job(config, input_dataset, max_questions, max_cost_dollars, reporter), self, reporter)
+        self._poller.watch(handle, poll_schedule)
+        return handle
+
+    def stream(
+        self,
+        config: TransformConfig,
+        input_dataset: Optional[Union[Dataset, str]] = None,
+        max_questions: Optional[int] = None,
+        max_cost_dollars: Optional[float] = None,
+        poll_schedule: Optional[PollSchedule] = None,
+    ) -> Iterator[Sample]:
+        """
+        Submit a transform job and yield its output samples as they are produced.
+
+        The iterator ends once the job completes and every output row has been yielded,
+        so downstream processing can start long before a large job finishes.
+
+        Example:
+            >>> lr = LightningRod(api_key="your-api-key")
+            >>> for sample in lr.transforms.stream(config):
+            ...     print(sample.question.question_text)
+        """
+        handle = self.submit(config, input_dataset, max_questions, max_cost_dollars, poll_schedule)
+        yield from handle.iter_output(poll_schedule)
+
+    def wait_all(self, handles: Iterable[JobHandle], timeout: Optional[float] = None) -> List[TransformJob]:
+        """
+        Wait for all submitted jobs to finish.
+
+        Failed jobs do not raise here; check each job's status or call `handle.result()`.
+
+        Args:
+            handles: JobHandles returned by `submit`
+            timeout: Maximum total seconds to wait (waits forever if None)
+
+        Returns:
+            The final TransformJob for each handle, in order
+
+        Raises:
+            TimeoutError: If any job is still running after `timeout` seconds
+
+        Example:
+            >>> lr = LightningRod(api_key="your-api-key")
+            >>> handles = [lr.transforms.submit(config) for config in configs]
+            >>> jobs = lr.transforms.wait_all(handles)
+        """
+        return wait_all(handles, timeout)
+
+    def run_sharded(
+        self,
+        config: TransformConfig,
+        shards: int,
+        input_dataset: Optional[Union[Dataset, str]] = None,
+        max_questions: Optional[int] = None,
+        max_cost_dollars: Optional[float] = None,
+        by: str = "auto",
+        poll_schedule: Optional[PollSchedule] = None,
+        timeout: Optional[float] = None,
+    ) -> Dataset:
+        """
+        Split a seed-generator pipeline into shards, run them in parallel and merge the outputs.
+
+        The NewsSeedGenerator or GdeltSeedGenerator date range is split into contiguous
+        ranges, or its search queries are spread across shards (see `by`). `max_questions`
+        and `max_cost_dollars` are divided evenly between shards, and at most
+        `max_questions` shards are used so none is submitted with a zero budget.
+
+        Args:
+            config: NewsSeedGenerator, GdeltSeedGenerator, or QuestionPipeline using one
+            shards: Number of jobs to split into; fewer are used if the work can't be split that far
+            input_dataset: Optional input Dataset or dataset ID, passed to every shard
+            max_questions: Optional cap on the total number of generated questions
+            max_cost_dollars: Optional total cost budget
+            by: "date", "query", or "auto" (queries when there are at least `shards` of them)
+            poll_schedule: Optional PollSchedule for background status checks
+            timeout: Maximum total seconds to wait for all shards
+
+        Returns:
+            A new Dataset containing the output of every shard
+
+        Raises:
+            Exception: If any shard fails; the other shards still run to completion
+
+        Example:
+            >>> lr = LightningRod(api_key="your-api-key")
+            >>> dataset = lr.transforms.run_sharded(pipeline, shards=6, max_questions=6000)
+        """
+        if max_questions is not None:
+            shards = max(1, min(shards, max_questions))
+        configs = shard_config(config, shards, by)
+        budgets = split_budget(max_questions, max_cost_dollars, len(configs))
+        handles = [
+            self.submit(shard, input_dataset, shard_questions, shard_cost, poll_schedule)
+            for shard, (shard_questions, shard_cost) in zip(configs, budgets)
+        ]
+        self.wait_all(handles, timeout)
+        outputs = [handle.result() for handle in handles]
+        if len(outputs) == 1:
+            return outputs[0]
+
+        samples: List[Sample] = []
+        for output in outputs:
+            samples.extend(output.download())
+        return DatasetsClient(self._client, self._dataset_samples_client).create_from_samples(samples)
+
+    def _create_job(
+        self,
+        config: TransformConfig,
+        input_dataset: Optional[Union[Dataset, str]],
+        max_questions: Optional[int],
+        max_cost_dollars: Optional[float],
+        reporter: Optional[ProgressReporter] = None,
     ) -> TransformJob:
-        dataset_id: Optional[str] = None
-        if isinstance(input_dataset, Dataset):
-            dataset_id = input_dataset.id
-        elif isinstance(input_dataset, str):
-            dataset_id = input_dataset
         request: CreateTransformJobRequest = CreateTransformJobRequest(
             config=config,
-            input_dataset_id=dataset_id,
+            input_dataset_id=_input_dataset_id(input_dataset),
             max_questions=max_questions,
             max_cost_dollars=max_cost_dollars,
         )
@@ -134,15 +394,38 @@ class TransformsClient:
 
         job: TransformJob = handle_response_error(response, "submit transform job")
 
+        reporter = reporter or LoggingProgressReporter()
         if not isinstance(job.error_message, Unset) and job.error_message is not None:
-            display_error(job.error_message, title="Error", job=job)
+            reporter(JobMessageEvent(job_id=job.id, level="error", title="Error", message=job.error_message, job=job))
             raise Exception(f"Transform job {job.id} error: {job.error_message}")
         if not isinstance(job.warning_message, Unset) and job.warning_message is not None:
-            display_warning(job.warning_message)
+            reporter(JobMessageEvent(job_id=job.id, level="warning", title="Warning", message=job.warning_message, job=job))
 
         return job
 
+    def _get_output_dataset(self, job: TransformJob) -> Dataset:
+        if job.output_dataset_id is None:
+            raise Exception(f"Transform job {job.id} completed but has no output dataset")
+        return self._get_dataset(job.output_dataset_id)
+
+    def _get_dataset(self, dataset_id: str) -> Dataset:
+        dataset_response = get_dataset_datasets_dataset_id_get.sync_detailed(
+            dataset_id=dataset_id,
+            client=self._client,
+        )
+        dataset_result = handle_response_error(dataset_response, "get dataset")
+        
+        return Dataset(
+            id=dataset_result.id,
+            num_rows=dataset_result.num_rows,
+            datasets_client=self._dataset_samples_client
+        )
+
     def estimate_cost(self, config: TransformConfig, max_questions: Optional[int] = None) -> float:
+        return self.estimate_cost_detailed(config, max_questions).total_cost_dollars
+
+    def estimate_cost_detailed(self, config: TransformConfig, max_questions: Optional[int] = None) -> EstimateCostResponse:
+        """Estimate the cost of a transform job, including the per-step breakdown."""
         response = cost_estimation_transform_jobs_cost_estimation_post.sync_detailed(
             client=self._client,
             body=EstimateCostRequest(
@@ -151,4 +434,286 @@ class TransformsClient:
             ),
         )
         parsed: EstimateCostResponse = handle_response_error(response, "estimate cost")
-        return parsed.total_cost_dollars
\ No newline at end of file
+        return parsed
+
+    def estimate_cost_many(
+        self,
+        configs: Iterable[TransformConfig],
+        max_questions: Optional[int] = None,
+        max_workers: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Estimate the cost of many configs concurrently and return a per-step cost table.
+
+        Identical configs are only estimated once, and estimates are remembered by config
+        fingerprint (up to ESTIMATE_MEMO_ENTRIES, for ESTIMATE_MEMO_TTL_SECONDS) so re-running
+        a sweep is instant. `estimate_cost()` always calls the API. Each row describes one
+        pipeline step of one config; `config_index` refers to the position in `configs`.
+        A config whose estimate has no steps gets a single row with only the totals.
+
+        Args:
+            configs: Transform configurations to estimate, e.g. a parameter sweep
+            max_questions: Optional cap on the number of generated questions, applied to every config
+            max_workers: Maximum number of estimate requests in flight at once
+
+        Returns:
+            List of dictionaries, one per (config, step), or one per config without steps
+
+        Example:
+            >>> lr = LightningRod(api_key="your-api-key")
+            >>> rows = lr.transforms.estimate_cost_many(sweep_configs, max_questions=1000)
+            >>> import pandas as pd
+            >>> df = pd.DataFrame(rows)
+            >>> df.groupby("config_index")["step_cost_dollars"].sum()
+        """
+        configs = list(configs)
+        unique: Dict[str, TransformConfig] = {}
+        keys = [config_fingerprint(config, max_questions=max_questions) for config in configs]
+        for key, config in zip(keys, configs):
+            unique.setdefault(key, config)
+
+        estimates, missing = _split_cached_estimates(self._estimates, unique)
+
+        if missing:
+            # Build the shared httpx client up front so all worker threads reuse the same pool
+            self._client.get_httpx_client()
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lightningrod-estimates") as executor:
+                futures = {key: executor.submit(self.estimate_cost_detailed, config, max_questions) for key, config in missing.items()}
+                for key, future in futures.items():
+                    estimates[key] = future.result()
+                    self._estimates.put(key, estimates[key])
+
+        rows: List[Dict[str, Any]] = []
+        for index, key in enumerate(keys):
+            rows.extend(_cost_breakdown_rows(index, estimates[key]))
+        return rows
+
+
+class AsyncTransformJobsClient:
+    def __init__(self, client: AuthenticatedClient):
+        self._client = client
+
+    async def get(self, job_id: str) -> TransformJob:
+        response = await get_transform_job_transform_jobs_job_id_get.asyncio_detailed(
+            job_id=job_id,
+            client=self._client,
+        )
+        return handle_response_error(response, "get transform job")
+
+    async def get_metrics(self, job_id: str) -> Optional[PipelineMetricsResponse]:
+        """Fetch pipeline metrics. Returns None if not yet available (404) or on error."""
+        response = await get_transform_job_metrics_transform_jobs_job_id_metrics_get.asyncio_detailed(
+            job_id=job_id,
+            client=self._client,
+        )
+        if isinstance(response.parsed, PipelineMetricsResponse):
+            return response.parsed
+        return None
+
+    async def snapshot(self, job_id: str) -> JobSnapshot:
+        """Fetch a job's status and pipeline metrics concurrently."""
+        job, metrics = await asyncio.gather(self.get(job_id), self.get_metrics(job_id))
+        return JobSnapshot(job=job, metrics=metrics)
+
+
+class AsyncTransformsClient:
+    def __init__(self, client: AuthenticatedClient, dataset_samples_client: AsyncDatasetSamplesClient):
+        self._client: AuthenticatedClient = client
+        self._dataset_samples_client: AsyncDatasetSamplesClient = dataset_samples_client
+        self.jobs = AsyncTransformJobsClient(client)
+        self._estimates: _BoundedMemo = _estimate_memo()
+
+    async def run(
+        self,
+        config: TransformConfig,
+        input_dataset: Optional[Union[AsyncDataset, Dataset, str]] = None,
+        max_questions: Optional[int] = None,
+        max_cost_dollars: Optional[float] = None,
+        poll_schedule: Optional[PollSchedule] = None,
+        progress: ProgressOption = "rich",
+        cache: Optional[RunCache] = None,
+    ) -> AsyncDataset:
+        """
+        Submit a transform job, wait for it to finish and return its output dataset.
+
+        See TransformsClient.run for the accepted `progress` and `cache` options.
+        """
+        cache_key: Optional[str] = None
+        if cache is not None:
+            cache_key = cache.key(config, _input_dataset_id(input_dataset), max_questions, max_cost_dollars)
+            cached_dataset_id = cache.get(cache_key)
+            if cached_dataset_id is not None:
+                return await self._get_dataset(cached_dataset_id)
+
+        with resolve_progress(progress) as reporter, reporting_api_errors(reporter):
+            handle = AsyncJobHandle(
+                await self._create_job(config, input_dataset, max_questions, max_cost_dollars, reporter),
+                self,
+                reporter=reporter,
+            )
+            async for event in handle.events(poll_schedule):
+                reporter(event)
+            _raise_for_job_status(handle.job, reporter)
+            dataset = await handle.result()
+
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, dataset.id, job_id=handle.id)
+        return dataset
+
+    async def submit(
+        self,
+        config: TransformConfig,
+        input_dataset: Optional[Union[AsyncDataset, Dataset, str]] = None,
+        max_questions: Optional[int] = None,
+        max_cost_dollars: Optional[float] = None,
+        poll_schedule: Optional[PollSchedule] = None,
+        progress: ProgressOption = "logging",
+    ) -> AsyncJobHandle:
+        """
+        Submit a transform job without waiting for it to finish.
+
+        See TransformsClient.submit for the `progress` option.
+
+        Returns:
+            AsyncJobHandle that polls the job in the background on the running event loop
+        """
+        reporter = resolve_progress(progress)
+        with reporting_api_errors(reporter):
+            job = await self._create_job(config, input_dataset, max_questions, max_cost_dollars, reporter)
+        handle = AsyncJobHandle(job, self, poll_schedule, reporter)
+        if not handle.done():
+            handle._start_polling()
+        return handle
+
+    async def stream(
+        self,
+        config: TransformConfig,
+        input_dataset: Optional[Union[AsyncDataset, Dataset, str]] = None,
+        max_questions: Optional[int] = None,
+        max_cost_dollars: Optional[float] = None,
+        poll_schedule: Optional[PollSchedule] = None,
+    ) -> AsyncIterator[Sample]:
+        """
+        Submit a transform job and yield its output samples as they are produced.
+
+        Example:
+            >>> async for sample in lr.transforms.stream(config):
+            ...     print(sample.question.question_text)
+        """
+        handle = await self.submit(config, input_dataset, max_questions, max_cost_dollars, poll_schedule)
+        async for sample in handle.iter_output(poll_schedule):
+            yield sample
+
+    async def wait_all(self, handles: Iterable[AsyncJobHandle], timeout: Optional[float] = None) -> List[TransformJob]:
+        """
+        Wait concurrently for all submitted jobs to finish.
+
+        Failed jobs do not raise here; check each job's status or call `await handle.result()`.
+
+        Raises:
+            TimeoutError: If any job is still running after `timeout` seconds
+        """
+        return await wait_all_async(handles, timeout)
+
+    async def estimate_cost(self, config: TransformConfig, max_questions: Optional[int] = None) -> float:
+        return (await self.estimate_cost_detailed(config, max_questions)).total_cost_dollars
+
+    async def estimate_cost_detailed(self, config: TransformConfig, max_questions: Optional[int] = None) -> EstimateCostResponse:
+        """Estimate the cost of a transform job, including the per-step breakdown."""
+        response = await cost_estimation_transform_jobs_cost_estimation_post.asyncio_detailed(
+            client=self._client,
+            body=EstimateCostRequest(
+                config=config,
+                max_questions=max_questions,
+            ),
+        )
+        parsed: EstimateCostResponse = handle_response_error(response, "estimate cost")
+        return parsed
+
+    async def estimate_cost_many(
+        self,
+        configs: Iterable[TransformConfig],
+        max_questions: Optional[int] = None,
+        max_concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Estimate the cost of many configs concurrently and return a per-step cost table.
+
+        See TransformsClient.estimate_cost_many.
+
+        Example:
+            >>> lr = AsyncLightningRod(api_key="your-api-key")
+            >>> rows = await lr.transforms.estimate_cost_many(sweep_configs)
+        """
+        configs = list(configs)
+        unique: Dict[str, TransformConfig] = {}
+        keys = [config_fingerprint(config, max_questions=max_questions) for config in configs]
+        for key, config in zip(keys, configs):
+            unique.setdefault(key, config)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def estimate(config: TransformConfig) -> EstimateCostResponse:
+            async with semaphore:
+                return await self.estimate_cost_detailed(config, max_questions)
+
+        estimates, missing = _split_cached_estimates(self._estimates, unique)
+
+        results = await asyncio.gather(*(estimate(config) for config in missing.values()))
+        for key, result in zip(missing.keys(), results):
+            estimates[key] = result
+            self._estimates.put(key, result)
+
+        rows: List[Dict[str, Any]] = []
+        for index, key in enumerate(keys):
+            rows.extend(_cost_breakdown_rows(index, estimates[key]))
+        return rows
+
+    async def _create_job(
+        self,
+        config: TransformConfig,
+        input_dataset: Optional[Union[AsyncDataset, Dataset, str]],
+        max_questions: Optional[int],
+        max_cost_dollars: Optional[float],
+        reporter: Optional[ProgressReporter] = None,
+    ) -> TransformJob:
+        request: CreateTransformJobRequest = CreateTransformJobRequest(
+            config=config,
+            input_dataset_id=_input_dataset_id(input_dataset),
+            max_questions=max_questions,
+            max_cost_dollars=max_cost_dollars,
+        )
+
+        response = await create_transform_job_transform_jobs_post.asyncio_detailed(
+            client=self._client,
+            body=request,
+        )
+
+        job: TransformJob = handle_response_error(response, "submit transform job")
+
+        reporter = reporter or LoggingProgressReporter()
+        if not isinstance(job.error_message, Unset) and job.error_message is not None:
+            reporter(JobMessageEvent(job_id=job.id, level="error", title="Error", message=job.error_message, job=job))
+            raise Exception(f"Transform job {job.id} error: {job.error_message}")
+        if not isinstance(job.warning_message, Unset) and job.warning_message is not None:
+            reporter(JobMessageEvent(job_id=job.id, level="warning", title="Warning", message=job.warning_message, job=job))
+
+        return job
+
+    async def _get_output_dataset(self, job: TransformJob) -> AsyncDataset:
+        if job.output_dataset_id is None:
+            raise Exception(f"Transform job {job.id} completed but has no output dataset")
+        return await self._get_dataset(job.output_dataset_id)
+
+    async def _get_dataset(self, dataset_id: str) -> AsyncDataset:
+        dataset_response = await get_dataset_datasets_dataset_id_get.asyncio_detailed(
+            dataset_id=dataset_id,
+            client=self._client,
+        )
+        dataset_result = handle_response_error(dataset_response, "get dataset")
+
+        return AsyncDataset(
+            id=dataset_result.id,
+            num_rows=dataset_result.num_rows,
+            datasets_client=self._dataset_samples_client
+        )
@@ -0,0 +1,553 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional
+
+from lightningrod._generated.models import PaginatedSamplesResponse, PipelineMetricsResponse, Sample, TransformJob, TransformJobStatus
+from lightningrod._errors import is_transient_error
+from lightningrod._generated.types import Unset
+from lightningrod._instrumentation import span_context
+from lightningrod.datasets.dataset import AsyncDataset, Dataset
+from lightningrod.transforms.metrics import JobThroughput, MetricsHistory
+from lightningrod.transforms.polling import DEFAULT_POLL_SCHEDULE, PollSchedule
+from lightningrod.transforms.progress import JobMessageEvent, LoggingProgressReporter, ProgressEvent, ProgressReporter, snapshot_events
+
+# avoid circular import
+if TYPE_CHECKING:
+    from lightningrod.transforms.client import AsyncTransformsClient, TransformJobsClient, TransformsClient
+
+logger = logging.getLogger(__name__)
+
+
+class JobHandle:
+    """
+    A handle to a submitted transform job that can be waited on without blocking a thread per job.
+
+    Handles returned by `lr.transforms.submit` are tracked by a single background poller
+    shared by all jobs of the same client, so `done()` reflects the latest known status and
+    done-callbacks fire as soon as the job finishes. Attributes of the underlying
+    TransformJob (`id`, `status`, `output_dataset_id`, ...) are available directly on the handle.
+
+    Note: JobHandles should only be created through LightningRod methods,
+    not instantiated directly.
+
+    Example:
+        >>> lr = LightningRod(api_key="your-api-key")
+        >>> handles = [lr.transforms.submit(config) for config in configs]
+        >>> lr.transforms.wait_all(handles)
+        >>> datasets = [handle.result() for handle in handles]
+    """
+
+    def __init__(self, job: TransformJob, transforms_client: "TransformsClient", reporter: Optional[ProgressReporter] = None):
+        self._job: TransformJob = job
+        self._transforms_client: "TransformsClient" = transforms_client
+        # Receives the failure message from result(); logging when None
+        self._reporter: Optional[ProgressReporter] = reporter
+        self._lock = threading.Lock()
+        self._done_event = threading.Event()
+        self._callbacks: List[Callable[["JobHandle"], Any]] = []
+        self._dataset: Optional[Dataset] = None
+        # Set when polling hit an error that retrying won't fix; raised from wait()
+        self._error: Optional[BaseException] = None
+        self.metrics_history: MetricsHistory = MetricsHistory()
+        if job.status != TransformJobStatus.RUNNING:
+            self._done_event.set()
+
+    @property
+    def job(self) -> TransformJob:
+        """The most recently fetched TransformJob."""
+        return self._job
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate to the TransformJob so handles stay drop-in for code expecting a job
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._job, name)
+
+    def __repr__(self) -> str:
+        return f"JobHandle(id={self._job.id!r}, status={self._job.status.value!r})"
+
+    def done(self) -> bool:
+        """Return True if the job is no longer running, or polling it failed."""
+        return self._done_event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> TransformJob:
+        """
+        Block until the job finishes.
+
+        Args:
+            timeout: Maximum seconds to wait (waits forever if None)
+
+        Returns:
+            The final TransformJob
+
+        Raises:
+            TimeoutError: If the job is still running after `timeout` seconds
+            Exception: If polling the job failed with a non-transient error (e.g. HTTP 401 or 404)
+        """
+        if not self._done_event.wait(timeout):
+            raise TimeoutError(f"Transform job {self._job.id} still running after {timeout}s")
+        if self._error is not None:
+            raise self._error
+        return self._job
+
+    def result(self, timeout: Optional[float] = None) -> Dataset:
+        """
+        Wait for the job to finish and return its output dataset.
+
+        Args:
+            timeout: Maximum seconds to wait (waits forever if None)
+
+        Returns:
+            Dataset produced by the job
+
+        Raises:
+            TimeoutError: If the job is still running after `timeout` seconds
+            Exception: If the job failed, finished without an output dataset, or could not be polled
+        """
+        job = self.wait(timeout)
+        _raise_for_job_status(job, self._reporter)
+
+        with self._lock:
+            if self._dataset is None:
+                with span_context(job_id=job.id):
+                    self._dataset = self._transforms_client._get_output_dataset(job)
+            return self._dataset
+
+    def add_done_callback(self, fn: Callable[["JobHandle"], Any]) -> None:
+        """
+        Call `fn(handle)` once the job finishes.
+
+        The callback runs on the poller thread, or immediately if the job is already done.
+        """
+        with self._lock:
+            if not self._done_event.is_set():
+                self._callbacks.append(fn)
+                return
+        self._invoke_callback(fn)
+
+    def throughput(self) -> Optional[JobThroughput]:
+        """
+        Per-step rows/sec, rejection rate and ETA, plus the job's ETA and projected final cost.
+
+        Computed from the metrics recorded while iterating `events()` (which `run` does);
+        returns None until metrics have been seen.
+        """
+        return self.metrics_history.throughput()
+
+    def events(self, poll_schedule: Optional[PollSchedule] = None) -> Iterator[ProgressEvent]:
+        """
+        Poll the job's status and metrics, yielding typed progress events until it finishes.
+
+        Each poll yields a StepMetricsEvent per pipeline step, a CostEvent when usage is
+        reported, and finally a JobStatusEvent.
+
+        Args:
+            poll_schedule: Optional PollSchedule controlling the time between polls
+
+        Example:
+            >>> handle = lr.transforms.submit(config)
+            >>> for event in handle.events():
+            ...     if isinstance(event, StepMetricsEvent):
+            ...         print(event.step.transform_name, event.step.progress)
+        """
+        schedule = poll_schedule or DEFAULT_POLL_SCHEDULE
+        poll_count = 0
+        while True:
+            job, metrics = self._transforms_client.jobs.snapshot(self._job.id)
+            self._update(job)
+            self.metrics_history.record(metrics, job)
+            poll_count += 1
+            yield from snapshot_events(job, metrics)
+            if self.done():
+                return
+            time.sleep(schedule.next_interval(poll_count, metrics))
+
+    def iter_output(self, poll_schedule: Optional[PollSchedule] = None) -> Iterator[Sample]:
+        """
+        Yield output samples as the job writes them, while it is still running.
+
+        The output dataset is tailed with pagination cursors: each tick reads any rows
+        appended since the last one, then waits per `poll_schedule`. Once the job has
+        finished, remaining rows are drained and the iterator ends. If the job
+        failed, the exception from `result()` is raised after the rows it wrote.
+
+        Args:
+            poll_schedule: Optional PollSchedule for re-reading the output dataset
+
+        Example:
+            >>> handle = lr.transforms.submit(config)
+            >>> for sample in handle.iter_output():
+            ...     print(sample.question.question_text)
+        """
+        self._transforms_client._poller.watch(self)
+        schedule = poll_schedule or DEFAULT_POLL_SCHEDULE
+        samples_client = self._transforms_client._dataset_samples_client
+        tail = _OutputTail()
+        poll_count = 0
+
+        while True:
+            # Read the status before fetching so the last pass sees every row
+            finished = self.done()
+            dataset_id = self._job.output_dataset_id
+            if dataset_id:
+                while True:
+                    with span_context(job_id=self._job.id):
+                        page = samples_client.fetch_page(dataset_id, tail.cursor)
+                    yield from tail.new_samples(page)
+                    if not tail.advance(page):
+                        break
+            if finished:
+                break
+            poll_count += 1
+            time.sleep(schedule.next_interval(poll_count))
+
+        _raise_for_job_status(self.wait(0), self._reporter)
+
+    def _update(self, job: TransformJob) -> None:
+        with self._lock:
+            self._job = job
+            if job.status == TransformJobStatus.RUNNING or self._done_event.is_set():
+                return
+        self._finish()
+
+    def _fail(self, error: BaseException) -> None:
+        with self._lock:
+            if self._done_event.is_set():
+                return
+            self._error = error
+        self._finish()
+
+    def _finish(self) -> None:
+        with self._lock:
+            if self._done_event.is_set():
+                return
+            self._done_event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            self._invoke_callback(fn)
+
+    def _invoke_callback(self, fn: Callable[["JobHandle"], Any]) -> None:
+        try:
+            fn(self)
+        except Exception:
+            logger.exception("Done callback for transform job %s raised", self._job.id)
+
+
+class _OutputTail:
+    """Cursor state for tailing an append-only dataset page by page."""
+
+    def __init__(self) -> None:
+        # Cursor of the page currently being read, and how many of its rows were yielded
+        self.cursor: Optional[str] = None
+        self.seen_in_page: int = 0
+
+    def new_samples(self, page: PaginatedSamplesResponse) -> List[Sample]:
+        samples = page.samples[self.seen_in_page:]
+        self.seen_in_page = max(self.seen_in_page, len(page.samples))
+        return samples
+
+    def advance(self, page: PaginatedSamplesResponse) -> bool:
+        """Move to the next page if there is one; returns False when caught up."""
+        if not page.has_more or isinstance(page.next_cursor, Unset) or page.next_cursor is None:
+            return False
+        self.cursor = str(page.next_cursor)
+        self.seen_in_page = 0
+        return True
+
+
+def _raise_for_job_status(job: TransformJob, reporter: Optional[ProgressReporter] = None) -> None:
+    if job.status == TransformJobStatus.FAILED:
+        error_msg = job.error_message if (not isinstance(job.error_message, Unset) and job.error_message) else "Unknown error"
+        (reporter or LoggingProgressReporter())(JobMessageEvent(job_id=job.id, level="error", title="Job Failed", message=error_msg, job=job))
+        raise Exception(f"Transform job {job.id} failed: {error_msg}")
+
+    if job.status != TransformJobStatus.COMPLETED:
+        raise Exception(f"Unexpected job status: {job.status}")
+
+
+class _WatchEntry:
+    def __init__(self, handle: JobHandle, poll_schedule: PollSchedule):
+        self.handle: JobHandle = handle
+        self.poll_schedule: PollSchedule = poll_schedule
+        self.poll_count: int = 0
+        self.metrics: Optional[PipelineMetricsResponse] = None
+        self.next_poll_at: float = time.monotonic() + poll_schedule.next_interval(0)
+
+
+class JobPoller:
+    """Single background thread that polls the status of every watched job on its own schedule."""
+
+    def __init__(self, jobs_client: "TransformJobsClient"):
+        self._jobs_client: "TransformJobsClient" = jobs_client
+        self._condition = threading.Condition()
+        self._entries: Dict[str, _WatchEntry] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, handle: JobHandle, poll_schedule: Optional[PollSchedule] = None) -> None:
+        if handle.done():
+            return
+        with self._condition:
+            if handle.id in self._entries:
+                return
+            self._entries[handle.id] = _WatchEntry(handle, poll_schedule or DEFAULT_POLL_SCHEDULE)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="lightningrod-job-poller", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._entries:
+                    # Exit when idle; the next watch() starts a new thread
+                    self._thread = None
+                    return
+                now = time.monotonic()
+                next_due = min(entry.next_poll_at for entry in self._entries.values())
+                if next_due > now:
+                    self._condition.wait(next_due - now)
+                    continue
+                due = [entry for entry in self._entries.values() if entry.next_poll_at <= now]
+
+            for entry in due:
+                self._poll(entry)
+
+    def _poll(self, entry: _WatchEntry) -> None:
+        entry.poll_count += 1
+        try:
+            if entry.poll_schedule.uses_metrics:
+                job, entry.metrics = self._jobs_client.snapshot(entry.handle.id)
+            else:
+                job = self._jobs_client.get(entry.handle.id)
+            entry.handle._update(job)
+        except Exception as e:
+            if is_transient_error(e):
+                logger.warning("Failed to poll transform job %s; will retry", entry.handle.id, exc_info=True)
+            else:
+                entry.handle._fail(e)
+
+        with self._condition:
+            if entry.handle.done():
+                self._entries.pop(entry.handle.id, None)
+            else:
+                entry.next_poll_at = time.monotonic() + entry.poll_schedule.next_interval(entry.poll_count, entry.metrics)
+
+
+def wait_all(handles: Iterable[JobHandle], timeout: Optional[float] = None) -> List[TransformJob]:
+    """Wait for every handle to finish; see TransformsClient.wait_all."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    jobs: List[TransformJob] = []
+    for handle in handles:
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        jobs.append(handle.wait(remaining))
+    return jobs
+
+
+class AsyncJobHandle:
+    """
+    Async counterpart of JobHandle.
+
+    Each handle returned by `await lr.transforms.submit(...)` polls its job from a
+    lightweight asyncio task on its PollSchedule, so any number of jobs can be
+    awaited concurrently on one event loop.
+
+    Note: AsyncJobHandles should only be created through AsyncLightningRod methods,
+    not instantiated directly.
+
+    Example:
+        >>> lr = AsyncLightningRod(api_key="your-api-key")
+        >>> handles = [await lr.transforms.submit(config) for config in configs]
+        >>> await lr.transforms.wait_all(handles)
+        >>> datasets = [await handle.result() for handle in handles]
+    """
+
+    def __init__(
+        self,
+        job: TransformJob,
+        transforms_client: "AsyncTransformsClient",
+        poll_schedule: Optional[PollSchedule] = None,
+        reporter: Optional[ProgressReporter] = None,
+    ):
+        self._job: TransformJob = job
+        self._transforms_client: "AsyncTransformsClient" = transforms_client
+        self._reporter: Optional[ProgressReporter] = reporter
+        self._poll_schedule: PollSchedule = poll_schedule or DEFAULT_POLL_SCHEDULE
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._dataset: Optional[AsyncDataset] = None
+        # Set when polling hit an error that retrying won't fix; raised from wait()
+        self._error: Optional[BaseException] = None
+        self.metrics_history: MetricsHistory = MetricsHistory()
+
+    @property
+    def job(self) -> TransformJob:
+        """The most recently fetched TransformJob."""
+        return self._job
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate to the TransformJob so handles stay drop-in for code expecting a job
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._job, name)
+
+    def __repr__(self) -> str:
+        return f"AsyncJobHandle(id={self._job.id!r}, status={self._job.status.value!r})"
+
+    def done(self) -> bool:
+        """Return True if the job is no longer running, or polling it failed."""
+        return self._error is not None or self._job.status != TransformJobStatus.RUNNING
+
+    async def wait(self, timeout: Optional[float] = None) -> TransformJob:
+        """
+        Wait until the job finishes.
+
+        Args:
+            timeout: Maximum seconds to wait (waits forever if None)
+
+        Returns:
+            The final TransformJob
+
+        Raises:
+            TimeoutError: If the job is still running after `timeout` seconds
+            Exception: If polling the job failed with a non-transient error (e.g. HTTP 401 or 404)
+        """
+        if not self.done():
+            task = self._start_polling()
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Transform job {self._job.id} still running after {timeout}s") from None
+        if self._error is not None:
+            raise self._error
+        return self._job
+
+    async def result(self, timeout: Optional[float] = None) -> AsyncDataset:
+        """
+        Wait for the job to finish and return its output dataset.
+
+        Args:
+            timeout: Maximum seconds to wait (waits forever if None)
+
+        Returns:
+            AsyncDataset produced by the job
+
+        Raises:
+            TimeoutError: If the job is still running after `timeout` seconds
+            Exception: If the job failed, finished without an output dataset, or could not be polled
+        """
+        job = await self.wait(timeout)
+        _raise_for_job_status(job, self._reporter)
+
+        if self._dataset is None:
+            with span_context(job_id=job.id):
+                self._dataset = await self._transforms_client._get_output_dataset(job)
+        return self._dataset
+
+    def add_done_callback(self, fn: Callable[["AsyncJobHandle"], Any]) -> None:
+        """
+        Call `fn(handle)` once the job finishes.
+
+        The callback runs on the event loop, or immediately if the job is already done.
+        """
+        if self.done():
+            fn(self)
+            return
+        self._start_polling().add_done_callback(lambda _: fn(self))
+
+    def throughput(self) -> Optional[JobThroughput]:
+        """Throughput and ETA from the metrics recorded by `events()`; see JobHandle.throughput."""
+        return self.metrics_history.throughput()
+
+    async def events(self, poll_schedule: Optional[PollSchedule] = None) -> AsyncIterator[ProgressEvent]:
+        """
+        Poll the job's status and metrics, yielding typed progress events until it finishes.
+
+        See JobHandle.events.
+        """
+        schedule = poll_schedule or DEFAULT_POLL_SCHEDULE
+        poll_count = 0
+        while True:
+            job, metrics = await self._transforms_client.jobs.snapshot(self._job.id)
+            self._update(job)
+            self.metrics_history.record(metrics, job)
+            poll_count += 1
+            for event in snapshot_events(job, metrics):
+                yield event
+            if self.done():
+                return
+            await asyncio.sleep(schedule.next_interval(poll_count, metrics))
+
+    async def iter_output(self, poll_schedule: Optional[PollSchedule] = None) -> AsyncIterator[Sample]:
+        """
+        Yield output samples as the job writes them, while it is still running.
+
+        See JobHandle.iter_output.
+
+        Example:
+            >>> handle = await lr.transforms.submit(config)
+            >>> async for sample in handle.iter_output():
+            ...     print(sample.question.question_text)
+        """
+        if not self.done():
+            self._start_polling()
+        schedule = poll_schedule or DEFAULT_POLL_SCHEDULE
+        samples_client = self._transforms_client._dataset_samples_client
+        tail = _OutputTail()
+        poll_count = 0
+
+        while True:
+            # Read the status before fetching so the last pass sees every row
+            finished = self.done()
+            dataset_id = self._job.output_dataset_id
+            if dataset_id:
+                while True:
+                    with span_context(job_id=self._job.id):
+                        page = await samples_client.fetch_page(dataset_id, tail.cursor)
+                    for sample in tail.new_samples(page):
+                        yield sample
+                    if not tail.advance(page):
+                        break
+            if finished:
+                break
+            poll_count += 1
+            await asyncio.sleep(schedule.next_interval(poll_count))
+
+        _raise_for_job_status(await self.wait(0), self._reporter)
+
+    def _update(self, job: TransformJob) -> None:
+        self._job = job
+
+    def _start_polling(self) -> "asyncio.Task[None]":
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._poll())
+        return self._task
+
+    async def _poll(self) -> None:
+        jobs = self._transforms_client.jobs
+        poll_count = 0
+        metrics: Optional[PipelineMetricsResponse] = None
+        while not self.done():
+            await asyncio.sleep(self._poll_schedule.next_interval(poll_count, metrics))
+            poll_count += 1
+            try:
+                if self._poll_schedule.uses_metrics:
+                    job, metrics = await jobs.snapshot(self._job.id)
+                else:
+                    job = await jobs.get(self._job.id)
+                self._update(job)
+            except Exception as e:
+                if not is_transient_error(e):
+                    self._error = e
+                    return
+                logger.warning("Failed to poll transform job %s; will retry", self._job.id, exc_info=True)
+
+
+async def wait_all_async(handles: Iterable[AsyncJobHandle], timeout: Optional[float] = None) -> List[TransformJob]:
+    """Wait concurrently for every async handle to finish; see AsyncTransformsClient.wait_all."""
+    handles = list(handles)
+    try:
+        await asyncio.wait_for(asyncio.gather(*(handle.wait() for handle in handles)), timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"Transform jobs still running after {timeout}s") from None
+    return [handle.job for handle in handles]
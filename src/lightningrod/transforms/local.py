@@ -0,0 +1,342 @@
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from attrs import evolve
+
+from lightningrod._generated.models import (
+    JobUsage,
+    Question,
+    QuestionPipeline,
+    SampleMeta,
+    Seed,
+    TransformJob,
+    TransformJobStatus,
+)
+from lightningrod._generated.models.mock_transform_config import MockTransformConfig
+from lightningrod._generated.models.pipeline_metrics_response import PipelineMetricsResponse
+from lightningrod._generated.models.sample import Sample
+from lightningrod._generated.models.transform_step_metrics_response import TransformStepMetricsResponse
+from lightningrod._generated.types import Unset
+from lightningrod.datasets.dataset import Dataset
+from lightningrod.datasets.memory import InMemoryDatasetSamplesClient
+from lightningrod.transforms.progress import ProgressOption, ProgressReporter, resolve_progress, snapshot_events
+
+LocalConfig = Union[MockTransformConfig, QuestionPipeline]
+
+
+def _value(value: Any, default: Any) -> Any:
+    return default if isinstance(value, Unset) or value is None else value
+
+
+def _index_formatter(template: str) -> Callable[[int], str]:
+    """Return a function rendering `template` with `{index}`, avoiding str.format for the common single-placeholder case."""
+    prefix, placeholder, suffix = template.partition("{index}")
+    if placeholder and not any(c in prefix + suffix for c in "{}"):
+        return lambda index: f"{prefix}{index}{suffix}"
+    return lambda index: template.format(index=index)
+
+
+class _MockStep:
+    """Executes one MockTransformConfig over a stream of samples, tracking its metrics."""
+
+    def __init__(self, index: int, name: str, config: MockTransformConfig, expected_inputs: float, simulate_delay: bool):
+        self.config = config
+        self.simulate_delay = simulate_delay
+        self.expected_inputs = expected_inputs
+        self.rng = random.Random(_value(config.random_seed, index))
+        self.cost_dollars = 0.0
+        self.metrics = TransformStepMetricsResponse(
+            step_index=index,
+            transform_name=name,
+            input_rows=0,
+            output_rows=0,
+            rejected_count=0,
+            error_count=0,
+            duration_seconds=0.0,
+            progress=0.0,
+            summary=None,
+        )
+        self._delay = float(_value(config.delay_seconds, 0.1))
+        self._delay_variance = float(_value(config.delay_variance, 0.05))
+        self._error_rate = float(_value(config.error_rate, 0.01))
+        self._filter_rate = float(_value(config.filter_rate, 0.0))
+        self._expansion = int(_value(config.expansion_factor, 1))
+        self._cost_per_call = float(_value(config.simulated_cost_per_call, 0.0))
+        self._question_text: Optional[Callable[[int], str]] = (
+            _index_formatter(_value(config.question_template, "Mock question {index}?")) if _value(config.add_question, False) else None
+        )
+        self._meta_additions: Dict[str, Any] = (
+            {} if isinstance(config.metadata_additions, Unset) else dict(config.metadata_additions.additional_properties)
+        )
+        self._questions = 0
+        self.finished = False
+
+    @property
+    def expected_outputs(self) -> float:
+        return self.expected_inputs * (1 - self._error_rate) * self._expansion
+
+    def seeds(self) -> Iterator[Sample]:
+        seed_text = _index_formatter(_value(self.config.seed_text_template, "Mock seed content {index}"))
+        for i in range(int(_value(self.config.num_seeds, 0))):
+            yield Sample(seed=Seed(seed_text=seed_text(i)))
+
+    def process(self, samples: Iterable[Sample]) -> Iterator[Sample]:
+        metrics = self.metrics
+        random_value = self.rng.random
+        delay, delay_variance = self._delay, self._delay_variance
+        error_rate, filter_rate = self._error_rate, self._filter_rate
+        for sample in samples:
+            # Samples rejected upstream pass through untouched
+            if sample.is_valid is False:
+                yield sample
+                continue
+
+            metrics.input_rows += 1
+            self.cost_dollars += self._cost_per_call
+            item_delay = max(0.0, delay + (2 * random_value() - 1) * delay_variance)
+            metrics.duration_seconds += item_delay
+            if self.simulate_delay:
+                time.sleep(item_delay)
+
+            if random_value() < error_rate:
+                metrics.error_count += 1
+                continue
+
+            # Copy before mutating so the input dataset is never changed and every
+            # output starts from the same input sample
+            outputs = [_copy_sample(sample) for _ in range(self._expansion)]
+            for output in outputs:
+                if self._question_text is not None:
+                    output.question = Question(question_text=self._question_text(self._questions))
+                    self._questions += 1
+                if self._meta_additions:
+                    meta = SampleMeta()
+                    if not isinstance(output.meta, Unset):
+                        meta.additional_properties.update(output.meta.additional_properties)
+                    meta.additional_properties.update(self._meta_additions)
+                    output.meta = meta
+                if filter_rate and random_value() < filter_rate:
+                    output.is_valid = False
+                    metrics.rejected_count += 1
+                else:
+                    metrics.output_rows += 1
+                yield output
+
+        self.finished = True
+
+    def update_progress(self) -> None:
+        if self.finished:
+            self.metrics.progress = 1.0
+        elif self.expected_inputs:
+            self.metrics.progress = min(self.metrics.input_rows / self.expected_inputs, 0.99)
+
+
+def _copy_sample(sample: Sample) -> Sample:
+    # Cheaper than attrs.evolve, which matters at millions of rows
+    copy = Sample(
+        seed=sample.seed,
+        question=sample.question,
+        label=sample.label,
+        prompt=sample.prompt,
+        context=sample.context,
+        rollouts=sample.rollouts,
+        meta=sample.meta,
+        is_valid=sample.is_valid,
+    )
+    copy.additional_properties = dict(sample.additional_properties)
+    return copy
+
+
+def _pipeline_steps(config: LocalConfig) -> List[Tuple[str, MockTransformConfig]]:
+    if isinstance(config, MockTransformConfig):
+        return [("mock", config)]
+    if not isinstance(config, QuestionPipeline):
+        raise ValueError(f"{type(config).__name__} can't run locally; use MockTransformConfig or a QuestionPipeline of them")
+
+    steps: List[Tuple[str, Any]] = [
+        ("seed_generator", config.seed_generator),
+        ("question_generator", config.question_generator),
+        ("labeler", config.labeler),
+    ]
+    for i, context_generator in enumerate(_value(config.context_generators, [])):
+        steps.append((f"context_generator_{i}", context_generator))
+    steps.append(("renderer", config.renderer))
+    steps.append(("rollout_generator", config.rollout_generator))
+
+    present = [(name, step) for name, step in steps if not isinstance(step, Unset) and step is not None]
+    for name, step in present:
+        if not isinstance(step, MockTransformConfig):
+            raise ValueError(f"Pipeline step {name} is a {type(step).__name__}; only MockTransformConfig steps can run locally")
+    return present
+
+
+class LocalTransformJobsClient:
+    """Job and metrics lookups for jobs run by LocalTransformsClient, mirroring TransformJobsClient."""
+
+    def __init__(self) -> None:
+        self._jobs: Dict[str, TransformJob] = {}
+        self._metrics: Dict[str, PipelineMetricsResponse] = {}
+
+    def get(self, job_id: str) -> TransformJob:
+        try:
+            return self._jobs[job_id]
+        except KeyError:
+            raise Exception(f"Transform job {job_id} not found") from None
+
+    def get_metrics(self, job_id: str) -> Optional[PipelineMetricsResponse]:
+        return self._metrics.get(job_id)
+
+
+class LocalTransformsClient:
+    """
+    Runs pipelines made of MockTransformConfig steps in-process, without network or spend.
+
+    Each step applies its config's `error_rate`, `expansion_factor`, `filter_rate`,
+    `add_question`, `metadata_additions` and `simulated_cost_per_call` with a RNG seeded
+    from `random_seed`, so runs are reproducible. Delays are added to the step's
+    `duration_seconds` but not slept unless `simulate_delay=True`. Output is a regular
+    Dataset backed by an in-memory samples client that pages like the API, which makes
+    this suitable for load-testing downstream consumers at millions of rows.
+
+    Args:
+        dataset_samples_client: Where datasets are stored (a new in-memory store if None)
+        simulate_delay: Sleep for each item's simulated delay
+        progress_interval: Emit progress events every this many processed output rows
+
+    Example:
+        >>> local = LocalTransformsClient()
+        >>> pipeline = QuestionPipeline(
+        ...     seed_generator=MockTransformConfig(num_seeds=1_000_000, random_seed=1),
+        ...     question_generator=MockTransformConfig(add_question=True, filter_rate=0.1),
+        ... )
+        >>> dataset = local.run(pipeline)
+        >>> rows = dataset.flattened()
+        >>> metrics = local.jobs.get_metrics(local.last_job_id)
+    """
+
+    def __init__(
+        self,
+        dataset_samples_client: Optional[InMemoryDatasetSamplesClient] = None,
+        simulate_delay: bool = False,
+        progress_interval: int = 10_000,
+    ):
+        self.datasets: InMemoryDatasetSamplesClient = dataset_samples_client or InMemoryDatasetSamplesClient()
+        self.jobs = LocalTransformJobsClient()
+        self.simulate_delay: bool = simulate_delay
+        self.progress_interval: int = progress_interval
+        self.last_job_id: Optional[str] = None
+
+    def run(
+        self,
+        config: LocalConfig,
+        input_dataset: Optional[Union[Dataset, str]] = None,
+        max_questions: Optional[int] = None,
+        max_cost_dollars: Optional[float] = None,
+        progress: ProgressOption = None,
+    ) -> Dataset:
+        """
+        Execute the pipeline locally and return its output dataset.
+
+        Args:
+            config: MockTransformConfig or QuestionPipeline whose steps are all MockTransformConfig
+            input_dataset: Input Dataset or dataset ID from this client's store; required
+                unless the first step is a seed generator (`num_seeds` > 0)
+            max_questions: Stop once this many valid output rows have been produced
+            max_cost_dollars: Stop once the simulated cost reaches this budget
+            progress: Progress option, as for `lr.transforms.run` (silent by default)
+
+        Returns:
+            Dataset with the pipeline's output samples
+        """
+        step_configs = _pipeline_steps(config)
+        input_dataset_id = input_dataset.id if isinstance(input_dataset, Dataset) else input_dataset
+
+        first = step_configs[0][1]
+        source: Iterable[Sample]
+        expected: float
+        if input_dataset_id is not None:
+            source = self.datasets.list(input_dataset_id)
+            expected = len(source)
+        elif _value(first.num_seeds, 0) > 0:
+            source = []
+            expected = first.num_seeds
+        else:
+            raise ValueError("The first step must be a seed generator (num_seeds > 0) when no input_dataset is given")
+
+        steps: List[_MockStep] = []
+        for index, (name, step_config) in enumerate(step_configs):
+            step = _MockStep(index, name, step_config, expected, self.simulate_delay)
+            if index == 0 and input_dataset_id is None:
+                source = step.seeds()
+            source = step.process(source)
+            expected = step.expected_outputs
+            steps.append(step)
+
+        job = self._new_job(config, input_dataset_id)
+        output: List[Sample] = []
+        valid_rows = 0
+        with resolve_progress(progress) as reporter:
+            for sample in source:
+                output.append(sample)
+                if sample.is_valid is not False:
+                    valid_rows += 1
+                    if max_questions is not None and valid_rows >= max_questions:
+                        break
+                if max_cost_dollars is not None and sum(step.cost_dollars for step in steps) >= max_cost_dollars:
+                    break
+                if len(output) % self.progress_interval == 0:
+                    self._report(reporter, job, steps, TransformJobStatus.RUNNING, max_cost_dollars)
+
+            for step in steps:
+                step.finished = True
+            dataset = self.datasets.create(output)
+            job.output_dataset_id = dataset.id
+            self._report(reporter, job, steps, TransformJobStatus.COMPLETED, max_cost_dollars)
+
+        return dataset
+
+    def _new_job(self, config: LocalConfig, input_dataset_id: Optional[str]) -> TransformJob:
+        now = datetime.now(timezone.utc)
+        job = TransformJob(
+            id=f"local-job-{uuid.uuid4().hex[:12]}",
+            organization_id="local",
+            status=TransformJobStatus.RUNNING,
+            modal_function_call_id="local",
+            modal_app_id="local",
+            transform_config=json.dumps(config.to_dict()),
+            input_dataset_id=input_dataset_id,
+            output_dataset_id=None,
+            created_at=now,
+            updated_at=now,
+        )
+        self.jobs._jobs[job.id] = job
+        self.last_job_id = job.id
+        return job
+
+    def _report(
+        self,
+        reporter: ProgressReporter,
+        job: TransformJob,
+        steps: List[_MockStep],
+        status: TransformJobStatus,
+        max_cost_dollars: Optional[float],
+    ) -> None:
+        job.status = status
+        job.updated_at = datetime.now(timezone.utc)
+        job.usage = JobUsage(current_cost_dollars=sum(step.cost_dollars for step in steps), max_cost_dollars=max_cost_dollars)
+        for step in steps:
+            step.update_progress()
+        step_metrics = [evolve(step.metrics) for step in steps]
+        metrics = PipelineMetricsResponse(
+            total_input_rows=step_metrics[0].input_rows,
+            total_output_rows=step_metrics[-1].output_rows,
+            total_duration_seconds=sum(step.duration_seconds for step in step_metrics),
+            steps=step_metrics,
+        )
+        self.jobs._metrics[job.id] = metrics
+        for event in snapshot_events(job, metrics):
+            reporter(event)
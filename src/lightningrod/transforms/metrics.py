@@ -0,0 +1,161 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, NamedTuple, Optional
+
+from lightningrod._generated.models import TransformJob
+from lightningrod._generated.models.pipeline_metrics_response import PipelineMetricsResponse
+from lightningrod._generated.types import Unset
+from lightningrod.transforms.polling import pipeline_progress
+
+
+@dataclass(frozen=True)
+class StepThroughput:
+    """Rates for one pipeline step, computed over the history window."""
+    step_index: int
+    transform_name: str
+    progress: float
+    rows_per_second: Optional[float]
+    output_rows_per_second: Optional[float]
+    rejection_rate: Optional[float]
+    eta_seconds: Optional[float]
+
+
+@dataclass(frozen=True)
+class JobThroughput:
+    """Per-step rates plus whole-job ETA and projected final cost."""
+    job_id: Optional[str]
+    steps: List[StepThroughput]
+    eta_seconds: Optional[float]
+    current_cost_dollars: Optional[float]
+    projected_cost_dollars: Optional[float]
+
+
+class _MetricsSample(NamedTuple):
+    timestamp: float
+    metrics: PipelineMetricsResponse
+    current_cost_dollars: Optional[float]
+    max_cost_dollars: Optional[float]
+
+
+class MetricsHistory:
+    """
+    Rolling time series of a job's pipeline metrics, used to compute throughput and ETAs.
+
+    Rates are measured between the oldest and newest samples within `window_seconds`,
+    so they follow recent behavior rather than the average since the job started.
+    Job handles and the rich display keep one automatically.
+
+    Args:
+        window_seconds: Age of the oldest sample used for rate calculations
+        max_samples: Upper bound on samples kept in memory
+
+    Example:
+        >>> handle = lr.transforms.submit(config)
+        >>> for event in handle.events():
+        ...     pass
+        >>> throughput = handle.throughput()
+        >>> print(throughput.eta_seconds, throughput.projected_cost_dollars)
+    """
+
+    def __init__(self, window_seconds: float = 300.0, max_samples: int = 1000):
+        self.window_seconds: float = window_seconds
+        self._samples: Deque[_MetricsSample] = deque(maxlen=max_samples)
+        self._job_id: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(
+        self,
+        metrics: Optional[PipelineMetricsResponse],
+        job: Optional[TransformJob] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Add one polled snapshot. Snapshots without metrics are ignored."""
+        if metrics is None:
+            return
+        current_cost: Optional[float] = None
+        max_cost: Optional[float] = None
+        if job is not None:
+            self._job_id = job.id
+            if not isinstance(job.usage, Unset) and job.usage is not None:
+                current_cost = _optional(job.usage.current_cost_dollars)
+                max_cost = _optional(job.usage.max_cost_dollars)
+        self._samples.append(_MetricsSample(
+            timestamp=time.time() if timestamp is None else timestamp,
+            metrics=metrics,
+            current_cost_dollars=current_cost,
+            max_cost_dollars=max_cost,
+        ))
+
+    def throughput(self) -> Optional[JobThroughput]:
+        """Compute rates, ETAs and projected cost from the recorded samples, or None if there are none."""
+        if not self._samples:
+            return None
+        latest = self._samples[-1]
+        oldest = self._window_start(latest.timestamp)
+        elapsed = latest.timestamp - oldest.timestamp
+
+        previous_steps: Dict[int, Any] = {step.step_index: step for step in oldest.metrics.steps}
+        steps: List[StepThroughput] = []
+        for step in sorted(latest.metrics.steps, key=lambda s: s.step_index):
+            before = previous_steps.get(step.step_index)
+            rows_per_second = output_rows_per_second = progress_rate = None
+            if before is not None and elapsed > 0:
+                rows_per_second = (step.input_rows - before.input_rows) / elapsed
+                output_rows_per_second = (step.output_rows - before.output_rows) / elapsed
+                progress_rate = (step.progress - before.progress) / elapsed
+            steps.append(StepThroughput(
+                step_index=step.step_index,
+                transform_name=step.transform_name,
+                progress=step.progress,
+                rows_per_second=rows_per_second,
+                output_rows_per_second=output_rows_per_second,
+                rejection_rate=step.rejected_count / step.input_rows if step.input_rows > 0 else None,
+                eta_seconds=_eta(step.progress, progress_rate),
+            ))
+
+        progress = pipeline_progress(latest.metrics)
+        previous_progress = pipeline_progress(oldest.metrics)
+        job_progress_rate = None
+        if progress is not None and previous_progress is not None and elapsed > 0:
+            job_progress_rate = (progress - previous_progress) / elapsed
+
+        return JobThroughput(
+            job_id=self._job_id,
+            steps=steps,
+            eta_seconds=_eta(progress, job_progress_rate),
+            current_cost_dollars=latest.current_cost_dollars,
+            projected_cost_dollars=_projected_cost(latest, progress),
+        )
+
+    def _window_start(self, now: float) -> _MetricsSample:
+        for sample in self._samples:
+            if now - sample.timestamp <= self.window_seconds:
+                return sample
+        return self._samples[-1]
+
+
+def _eta(progress: Optional[float], progress_rate: Optional[float]) -> Optional[float]:
+    if progress is None:
+        return None
+    if progress >= 1.0:
+        return 0.0
+    if progress_rate is None or progress_rate <= 0:
+        return None
+    return (1.0 - progress) / progress_rate
+
+
+def _projected_cost(sample: _MetricsSample, progress: Optional[float]) -> Optional[float]:
+    if sample.current_cost_dollars is None or not progress:
+        return None
+    projected = sample.current_cost_dollars / min(progress, 1.0)
+    if sample.max_cost_dollars is not None:
+        # The job stops once it reaches its budget
+        projected = min(projected, sample.max_cost_dollars)
+    return projected
+
+
+def _optional(value: Any) -> Any:
+    return None if isinstance(value, Unset) else value
@@ -0,0 +1,88 @@
+import random
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class PollSchedule:
+    """
+    Controls how often a running transform job is polled for status and metrics.
+
+    The first few polls happen quickly so short jobs return almost immediately,
+    then the interval grows exponentially (with jitter) up to `max_interval`.
+    Once the pipeline's average step progress reaches `near_completion_threshold`,
+    the interval is capped at `near_completion_interval` so completion is
+    noticed promptly.
+
+    Attributes:
+        initial_interval: Seconds between the first `fast_polls` polls
+        max_interval: Upper bound on the interval between polls
+        backoff_factor: Multiplier applied to the interval after the fast polls
+        jitter: Fractional random jitter (+/-) applied to each interval
+        fast_polls: Number of polls made at `initial_interval` before backing off
+        near_completion_threshold: Average step progress (0.0-1.0) at which polling tightens
+        near_completion_interval: Maximum interval once the threshold is reached
+
+    Example:
+        >>> lr = LightningRod(api_key="your-api-key")
+        >>> schedule = PollSchedule(initial_interval=0.5, max_interval=60)
+        >>> dataset = lr.transforms.run(config, poll_schedule=schedule)
+    """
+
+    initial_interval: float = 1.0
+    max_interval: float = 30.0
+    backoff_factor: float = 1.5
+    jitter: float = 0.1
+    fast_polls: int = 3
+    near_completion_threshold: float = 0.9
+    near_completion_interval: float = 3.0
+
+    @classmethod
+    def fixed(cls, interval: float) -> "PollSchedule":
+        """Create a schedule that always waits `interval` seconds, with no backoff or jitter."""
+        return cls(
+            initial_interval=interval,
+            max_interval=interval,
+            backoff_factor=1.0,
+            jitter=0.0,
+            fast_polls=0,
+            near_completion_interval=interval,
+        )
+
+    @property
+    def uses_metrics(self) -> bool:
+        """True if pipeline metrics can shorten the interval, so pollers should fetch them."""
+        return self.near_completion_interval < self.max_interval
+
+    def next_interval(self, poll_count: int, metrics: Any = None) -> float:
+        """
+        Compute the number of seconds to wait before the next poll.
+
+        Args:
+            poll_count: Number of polls made so far (starting at 1 after the first poll)
+            metrics: The most recent PipelineMetricsResponse, if any
+
+        Returns:
+            Seconds to sleep before polling again
+        """
+        # Capped so very long jobs can't overflow the exponent
+        backoff_steps = min(max(0, poll_count - self.fast_polls), 64)
+        interval = min(self.initial_interval * (self.backoff_factor ** backoff_steps), self.max_interval)
+
+        progress = pipeline_progress(metrics)
+        if progress is not None and progress >= self.near_completion_threshold:
+            interval = min(interval, self.near_completion_interval)
+
+        if self.jitter > 0:
+            interval *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, interval)
+
+
+def pipeline_progress(metrics: Any) -> Optional[float]:
+    """Average step progress (0.0-1.0) from a PipelineMetricsResponse, or None if unavailable."""
+    if metrics is None or not metrics.steps:
+        return None
+    return sum(min(max(step.progress, 0.0), 1.0) for step in metrics.steps) / len(metrics.steps)
+
+
+DEFAULT_POLL_SCHEDULE = PollSchedule()
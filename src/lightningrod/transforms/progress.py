@@ -0,0 +1,234 @@
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Union
+
+from lightningrod._errors import APIError
+from lightningrod._generated.models import TransformJob, TransformJobStatus
+from lightningrod._generated.models.pipeline_metrics_response import PipelineMetricsResponse
+from lightningrod._generated.models.transform_step_metrics_response import TransformStepMetricsResponse
+from lightningrod._generated.types import Unset
+from lightningrod.transforms.metrics import MetricsHistory
+
+if TYPE_CHECKING:
+    from lightningrod._display import LiveDisplay
+
+
+@dataclass(frozen=True)
+class StepMetricsEvent:
+    """Metrics for one pipeline step at a poll tick."""
+    job_id: str
+    step: TransformStepMetricsResponse
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass(frozen=True)
+class CostEvent:
+    """Cost accrued by a job so far, as reported in `TransformJob.usage`."""
+    job_id: str
+    current_cost_dollars: Optional[float]
+    max_cost_dollars: Optional[float]
+    estimated_cost_dollars: Optional[float]
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass(frozen=True)
+class JobStatusEvent:
+    """Job status at a poll tick. Emitted last in each tick, after the step and cost events."""
+    job_id: str
+    status: TransformJobStatus
+    job: TransformJob
+    metrics: Optional[PipelineMetricsResponse]
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass(frozen=True)
+class JobMessageEvent:
+    """
+    A warning or error reported for a job (e.g. a submission warning or a failure).
+
+    `job_id` and `job` are None for an API error raised before the job was fetched.
+    """
+    job_id: Optional[str]
+    level: str
+    title: str
+    message: str
+    job: Optional[TransformJob]
+    timestamp: float = field(default_factory=time.time)
+
+
+ProgressEvent = Union[StepMetricsEvent, CostEvent, JobStatusEvent, JobMessageEvent]
+
+
+def snapshot_events(job: TransformJob, metrics: Optional[PipelineMetricsResponse]) -> List[ProgressEvent]:
+    """Convert one polled job/metrics snapshot into typed progress events."""
+    timestamp = time.time()
+    events: List[ProgressEvent] = []
+    if metrics is not None:
+        for step in sorted(metrics.steps, key=lambda s: s.step_index):
+            events.append(StepMetricsEvent(job_id=job.id, step=step, timestamp=timestamp))
+    if not isinstance(job.usage, Unset) and job.usage is not None:
+        events.append(CostEvent(
+            job_id=job.id,
+            current_cost_dollars=_optional(job.usage.current_cost_dollars),
+            max_cost_dollars=_optional(job.usage.max_cost_dollars),
+            estimated_cost_dollars=_optional(job.usage.estimated_cost_dollars),
+            timestamp=timestamp,
+        ))
+    events.append(JobStatusEvent(job_id=job.id, status=job.status, job=job, metrics=metrics, timestamp=timestamp))
+    return events
+
+
+def _optional(value: Any) -> Any:
+    return None if isinstance(value, Unset) else value
+
+
+@contextmanager
+def reporting_api_errors(reporter: "ProgressReporter", job_id: Optional[str] = None) -> Iterator[None]:
+    """Pass an APIError raised inside the block to `reporter` as an error JobMessageEvent, then re-raise it."""
+    try:
+        yield
+    except APIError as e:
+        reporter(JobMessageEvent(job_id=job_id, level="error", title="API Error", message=str(e), job=None))
+        raise
+
+
+class ProgressReporter:
+    """
+    Consumer of progress events emitted while a transform job runs.
+
+    Subclass and override `__call__` to handle events. Reporters are used as context
+    managers around a run, so they can set up and tear down any output they own.
+    The base class ignores every event, which makes a fully headless run.
+    """
+
+    def __enter__(self) -> "ProgressReporter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def __call__(self, event: ProgressEvent) -> None:
+        pass
+
+
+class RichProgressReporter(ProgressReporter):
+    """Renders progress with rich: a live-updating panel plus warning and error panels."""
+
+    def __init__(self) -> None:
+        self._warning_message: Optional[str] = None
+        self._display: Optional["LiveDisplay"] = None
+        self._history: MetricsHistory = MetricsHistory()
+
+    def __exit__(self, *args: Any) -> None:
+        if self._display is not None:
+            self._display.__exit__(*args)
+            self._display = None
+
+    def __call__(self, event: ProgressEvent) -> None:
+        # Deferred so that rich is not imported until something is rendered
+        from lightningrod._display import LiveDisplay, display_error, display_warning
+
+        if isinstance(event, JobMessageEvent):
+            if event.level == "warning":
+                # Persisted above the live display in notebooks
+                self._warning_message = event.message
+                display_warning(event.message, title=event.title)
+            else:
+                display_error(event.message, title=event.title, job=event.job)
+        elif isinstance(event, JobStatusEvent):
+            self._history.record(event.metrics, event.job, event.timestamp)
+            if self._display is None:
+                self._display = LiveDisplay(self._warning_message).__enter__()
+            self._display.update(event.metrics, event.job, self._history.throughput())
+
+
+class CallbackProgressReporter(ProgressReporter):
+    """Passes every event to a callable."""
+
+    def __init__(self, callback: Callable[[ProgressEvent], Any]):
+        self._callback: Callable[[ProgressEvent], Any] = callback
+
+    def __call__(self, event: ProgressEvent) -> None:
+        self._callback(event)
+
+
+class LoggingProgressReporter(ProgressReporter):
+    """Writes events as log records; warnings and errors use the matching log level."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self._logger: logging.Logger = logger or logging.getLogger("lightningrod.progress")
+        self._level: int = level
+
+    def __call__(self, event: ProgressEvent) -> None:
+        if isinstance(event, StepMetricsEvent):
+            step = event.step
+            self._logger.log(
+                self._level,
+                "job=%s step=%d name=%s progress=%.2f input_rows=%d output_rows=%d rejected=%d errors=%d duration=%.1fs",
+                event.job_id, step.step_index, step.transform_name, step.progress, step.input_rows,
+                step.output_rows, step.rejected_count, step.error_count, step.duration_seconds,
+            )
+        elif isinstance(event, CostEvent):
+            self._logger.log(
+                self._level,
+                "job=%s cost=%s budget=%s estimated=%s",
+                event.job_id, event.current_cost_dollars, event.max_cost_dollars, event.estimated_cost_dollars,
+            )
+        elif isinstance(event, JobStatusEvent):
+            self._logger.log(self._level, "job=%s status=%s", event.job_id, event.status.value)
+        elif isinstance(event, JobMessageEvent):
+            level = logging.WARNING if event.level == "warning" else logging.ERROR
+            self._logger.log(level, "job=%s %s: %s", event.job_id, event.title, event.message)
+
+
+class _FanoutProgressReporter(ProgressReporter):
+    """Passes every event to several reporters."""
+
+    def __init__(self, reporters: List[ProgressReporter]):
+        self._reporters: List[ProgressReporter] = reporters
+
+    def __enter__(self) -> "ProgressReporter":
+        for reporter in self._reporters:
+            reporter.__enter__()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        for reporter in self._reporters:
+            reporter.__exit__(*args)
+
+    def __call__(self, event: ProgressEvent) -> None:
+        for reporter in self._reporters:
+            reporter(event)
+
+
+ProgressOption = Union[str, ProgressReporter, logging.Logger, Callable[[ProgressEvent], Any], List[Any], None]
+
+
+def resolve_progress(progress: ProgressOption) -> ProgressReporter:
+    """
+    Build a ProgressReporter from the `progress` argument accepted by `run`.
+
+    - "rich": live rich rendering (the default)
+    - "logging" or a logging.Logger: log records
+    - None: headless, no output
+    - a ProgressReporter: used as-is
+    - any other callable: called with each event
+    - a list of any of the above: every event goes to each of them
+    """
+    if isinstance(progress, ProgressReporter):
+        return progress
+    if isinstance(progress, (list, tuple)):
+        return _FanoutProgressReporter([resolve_progress(option) for option in progress])
+    if progress is None:
+        return ProgressReporter()
+    if progress == "rich":
+        return RichProgressReporter()
+    if progress == "logging":
+        return LoggingProgressReporter()
+    if isinstance(progress, logging.Logger):
+        return LoggingProgressReporter(progress)
+    if callable(progress):
+        return CallbackProgressReporter(progress)
+    raise ValueError(f"Unsupported progress option: {progress!r}")
@@ -0,0 +1,244 @@
+import json
+import math
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from lightningrod.transforms.progress import CostEvent, JobStatusEvent, ProgressEvent, ProgressReporter
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+_STEP_FIELDS = ("input_rows", "output_rows", "rejected_count", "error_count", "duration_seconds", "progress")
+_COST_FIELDS = ("current_cost_dollars", "max_cost_dollars", "estimated_cost_dollars")
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_metrics (
+    job_id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    status TEXT NOT NULL,
+    current_cost_dollars REAL,
+    max_cost_dollars REAL,
+    estimated_cost_dollars REAL,
+    PRIMARY KEY (job_id, timestamp)
+);
+CREATE TABLE IF NOT EXISTS step_metrics (
+    job_id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    step_index INTEGER NOT NULL,
+    transform_name TEXT NOT NULL,
+    input_rows INTEGER NOT NULL,
+    output_rows INTEGER NOT NULL,
+    rejected_count INTEGER NOT NULL,
+    error_count INTEGER NOT NULL,
+    duration_seconds REAL NOT NULL,
+    progress REAL NOT NULL,
+    PRIMARY KEY (job_id, timestamp, step_index)
+);
+"""
+
+
+class MetricsRecorder(ProgressReporter):
+    """
+    Appends every polled job snapshot to a local JSONL or SQLite file for later graphing.
+
+    Each record is keyed by job ID and poll timestamp and holds the job status, cost
+    from `TransformJob.usage` and every step's rows, rejections, errors, duration and
+    progress. Use it as (or alongside) the `progress` option of `run`.
+
+    Args:
+        path: File to append to; `.db`, `.sqlite` and `.sqlite3` files use SQLite, anything else JSONL
+        format: "jsonl" or "sqlite" to override the choice made from the file suffix
+
+    Example:
+        >>> recorder = MetricsRecorder("metrics.jsonl")
+        >>> dataset = lr.transforms.run(config, progress=["rich", recorder])
+        >>> print(recorder.openmetrics())
+    """
+
+    def __init__(self, path: str | Path, format: Optional[str] = None):
+        self.path: Path = Path(path)
+        if format is None:
+            format = "sqlite" if self.path.suffix in SQLITE_SUFFIXES else "jsonl"
+        if format not in ("jsonl", "sqlite"):
+            raise ValueError(f"format must be 'jsonl' or 'sqlite', got {format!r}")
+        self.format: str = format
+        self._lock = threading.Lock()
+        self._costs: Dict[str, CostEvent] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection for the recorder's lifetime, shared across polling threads under the lock
+        self._conn: Optional[sqlite3.Connection] = None
+        if format == "sqlite":
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.executescript(_SQLITE_SCHEMA)
+
+    def __call__(self, event: ProgressEvent) -> None:
+        # Cost arrives just before the status event of the same tick
+        if isinstance(event, CostEvent):
+            self._costs[event.job_id] = event
+        elif isinstance(event, JobStatusEvent):
+            self.write(_snapshot_record(event, self._costs.pop(event.job_id, None)))
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Append one snapshot record (as produced by `read`)."""
+        with self._lock:
+            if self.format == "jsonl":
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record) + "\n")
+            else:
+                self._write_sqlite(record)
+
+    def read(self, job_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Read recorded snapshots in timestamp order.
+
+        Args:
+            job_id: Only return snapshots of this job
+
+        Returns:
+            List of records with `job_id`, `timestamp`, `status`, cost fields and a `steps` list
+        """
+        with self._lock:
+            if not self.path.exists():
+                return []
+            if self.format == "jsonl":
+                with open(self.path, "r", encoding="utf-8") as f:
+                    records = [json.loads(line) for line in f if line.strip()]
+            else:
+                records = self._read_sqlite()
+        if job_id is not None:
+            records = [record for record in records if record["job_id"] == job_id]
+        return sorted(records, key=lambda record: record["timestamp"])
+
+    def openmetrics(self, job_id: Optional[str] = None) -> str:
+        """Serialize the latest recorded snapshot of each job in OpenMetrics text format."""
+        return to_openmetrics(self.read(job_id))
+
+    def close(self) -> None:
+        """Close the SQLite connection. Recording or reading afterwards raises."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+
+    def _write_sqlite(self, record: Dict[str, Any]) -> None:
+        with self._conn as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO job_metrics VALUES (?, ?, ?, ?, ?, ?)",
+                (record["job_id"], record["timestamp"], record["status"], *(record[f] for f in _COST_FIELDS)),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO step_metrics VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (record["job_id"], record["timestamp"], step["step_index"], step["transform_name"], *(step[f] for f in _STEP_FIELDS))
+                    for step in record["steps"]
+                ],
+            )
+
+    def _read_sqlite(self) -> List[Dict[str, Any]]:
+        records: Dict[tuple, Dict[str, Any]] = {}
+        for row in self._conn.execute("SELECT * FROM job_metrics"):
+            records[(row["job_id"], row["timestamp"])] = {**dict(row), "steps": []}
+        for row in self._conn.execute("SELECT * FROM step_metrics ORDER BY step_index"):
+            step = dict(row)
+            key = (step.pop("job_id"), step.pop("timestamp"))
+            if key in records:
+                records[key]["steps"].append(step)
+        return list(records.values())
+
+
+def _snapshot_record(event: JobStatusEvent, cost: Optional[CostEvent]) -> Dict[str, Any]:
+    steps: List[Dict[str, Any]] = []
+    if event.metrics is not None:
+        for step in sorted(event.metrics.steps, key=lambda s: s.step_index):
+            steps.append({
+                "step_index": step.step_index,
+                "transform_name": step.transform_name,
+                **{name: getattr(step, name) for name in _STEP_FIELDS},
+            })
+    return {
+        "job_id": event.job_id,
+        "timestamp": event.timestamp,
+        "status": event.status.value,
+        **{name: getattr(cost, name) if cost is not None else None for name in _COST_FIELDS},
+        "steps": steps,
+    }
+
+
+_STEP_METRICS = (
+    ("lightningrod_step_input_rows", "input_rows", "Rows read by the step"),
+    ("lightningrod_step_output_rows", "output_rows", "Rows written by the step"),
+    ("lightningrod_step_rejected", "rejected_count", "Rows rejected by the step"),
+    ("lightningrod_step_errors", "error_count", "Rows that errored in the step"),
+    ("lightningrod_step_duration_seconds", "duration_seconds", "Time spent in the step"),
+    ("lightningrod_step_progress", "progress", "Step progress from 0 to 1"),
+)
+
+_JOB_METRICS = (
+    ("lightningrod_job_cost_dollars", "current_cost_dollars", "Cost accrued by the job"),
+    ("lightningrod_job_max_cost_dollars", "max_cost_dollars", "Cost budget of the job"),
+    ("lightningrod_job_estimated_cost_dollars", "estimated_cost_dollars", "Estimated total cost of the job"),
+)
+
+
+def to_openmetrics(records: Iterable[Dict[str, Any]]) -> str:
+    """
+    Serialize snapshot records as OpenMetrics text, using the latest record of each job.
+
+    Every sample carries the snapshot's timestamp, so a scraper can detect stalled
+    steps from rows that stop changing.
+    """
+    latest: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        current = latest.get(record["job_id"])
+        if current is None or record["timestamp"] >= current["timestamp"]:
+            latest[record["job_id"]] = record
+
+    lines: List[str] = []
+    for name, field, help_text in _STEP_METRICS:
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"# HELP {name} {help_text}.")
+        for record in latest.values():
+            for step in record["steps"]:
+                labels = _labels(job_id=record["job_id"], step=str(step["step_index"]), transform=step["transform_name"])
+                lines.append(f"{name}{{{labels}}} {_number(step[field])} {_number(record['timestamp'])}")
+
+    lines.append("# TYPE lightningrod_job_running gauge")
+    lines.append("# HELP lightningrod_job_running 1 while the job is running, 0 once it has finished.")
+    for record in latest.values():
+        running = 1 if record["status"] == "RUNNING" else 0
+        labels = _labels(job_id=record["job_id"], status=record["status"])
+        lines.append(f"lightningrod_job_running{{{labels}}} {running} {_number(record['timestamp'])}")
+
+    for name, field, help_text in _JOB_METRICS:
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"# HELP {name} {help_text}.")
+        for record in latest.values():
+            if record.get(field) is not None:
+                labels = _labels(job_id=record["job_id"])
+                lines.append(f"{name}{{{labels}}} {_number(record[field])} {_number(record['timestamp'])}")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    value = float(value)
+    # OpenMetrics spells non-finite values +Inf, -Inf and NaN, unlike Python's repr
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
@@ -0,0 +1,89 @@
+import math
+from datetime import timedelta
+from typing import Any, List, Optional, Tuple
+
+from attrs import evolve
+
+from lightningrod._generated.models import GdeltSeedGenerator, NewsSeedGenerator, QuestionPipeline
+from lightningrod._generated.types import Unset
+
+SHARD_BY_OPTIONS = ("auto", "date", "query")
+
+
+def shard_config(config: Any, shards: int, by: str = "auto") -> List[Any]:
+    """
+    Split a seed-generator config (or a QuestionPipeline built on one) into independent sub-configs.
+
+    Date sharding splits `start_date`-`end_date` into contiguous ranges aligned to
+    `interval_duration_days`, so every search interval lands in exactly one shard.
+    Query sharding spreads a NewsSeedGenerator's `search_query` list across shards.
+    With `by="auto"`, queries are used when there are at least `shards` of them,
+    otherwise dates.
+
+    Args:
+        config: NewsSeedGenerator, GdeltSeedGenerator, or QuestionPipeline using one
+        shards: Desired number of shards; fewer are returned if the work can't be split that far
+        by: "auto", "date" or "query"
+
+    Returns:
+        List of configs of the same type as `config`
+
+    Raises:
+        ValueError: If the config can't be sharded the requested way
+    """
+    if shards < 1:
+        raise ValueError(f"shards must be at least 1, got {shards}")
+    if by not in SHARD_BY_OPTIONS:
+        raise ValueError(f"by must be one of {SHARD_BY_OPTIONS}, got {by!r}")
+
+    if isinstance(config, QuestionPipeline):
+        return [evolve(config, seed_generator=seed) for seed in shard_config(config.seed_generator, shards, by)]
+
+    if not isinstance(config, (NewsSeedGenerator, GdeltSeedGenerator)):
+        raise ValueError(f"{type(config).__name__} cannot be sharded; use a NewsSeedGenerator or GdeltSeedGenerator")
+
+    queries = _search_queries(config)
+    if by == "auto":
+        by = "query" if len(queries) >= shards else "date"
+
+    if by == "query":
+        if not isinstance(config, NewsSeedGenerator):
+            raise ValueError("Only NewsSeedGenerator configs can be sharded by query")
+        count = min(shards, len(queries))
+        return [evolve(config, search_query=queries[i::count]) for i in range(count)]
+
+    return [evolve(config, start_date=start, end_date=end) for start, end in _date_ranges(config, shards)]
+
+
+def split_budget(max_questions: Optional[int], max_cost_dollars: Optional[float], shards: int) -> List[Tuple[Optional[int], Optional[float]]]:
+    """Divide question and cost limits across shards; earlier shards get any leftover questions."""
+    budgets: List[Tuple[Optional[int], Optional[float]]] = []
+    for i in range(shards):
+        questions = None if max_questions is None else max_questions // shards + (1 if i < max_questions % shards else 0)
+        cost = None if max_cost_dollars is None else max_cost_dollars / shards
+        budgets.append((questions, cost))
+    return budgets
+
+
+def _search_queries(config: Any) -> List[str]:
+    if not isinstance(config, NewsSeedGenerator):
+        return []
+    if isinstance(config.search_query, list):
+        return list(config.search_query)
+    return [config.search_query]
+
+
+def _date_ranges(config: Any, shards: int) -> List[Tuple[Any, Any]]:
+    interval_days = 7 if isinstance(config.interval_duration_days, Unset) else config.interval_duration_days
+    interval = timedelta(days=interval_days)
+    num_intervals = max(1, math.ceil((config.end_date - config.start_date) / interval))
+    count = min(shards, num_intervals)
+
+    ranges: List[Tuple[Any, Any]] = []
+    start = config.start_date
+    for i in range(count):
+        intervals_in_shard = num_intervals // count + (1 if i < num_intervals % count else 0)
+        end = min(start + interval * intervals_in_shard, config.end_date)
+        ranges.append((start, end))
+        start = end
+    return ranges
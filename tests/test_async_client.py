@@ -0,0 +1,142 @@
+"""Tests for AsyncLightningRod against a mocked HTTP transport."""
+
+import asyncio
+from collections import Counter
+from typing import Any, Dict, List
+
+import httpx
+
+from lightningrod import AsyncLightningRod
+from lightningrod._generated.models import QuestionPipeline, TransformJobStatus
+from lightningrod._generated.models.mock_transform_config import MockTransformConfig
+from lightningrod.transforms.polling import PollSchedule
+
+BASE_URL = "https://test.invalid"
+FAST_POLLING = PollSchedule.fixed(0.01)
+
+
+def _job_payload(job_id: str, status: str, output_dataset_id: Any = None) -> Dict[str, Any]:
+    return {
+        "id": job_id,
+        "organization_id": "org-1",
+        "status": status,
+        "modal_function_call_id": "fc-1",
+        "modal_app_id": "app-1",
+        "transform_config": "{}",
+        "input_dataset_id": None,
+        "output_dataset_id": output_dataset_id,
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:00:00",
+    }
+
+
+class _Server:
+    """Jobs complete on the second status poll; dataset samples come back in two pages."""
+
+    def __init__(self) -> None:
+        self.polls: Counter = Counter()
+        self.pages_served = 0
+        self.jobs_created = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path == "/transform-jobs":
+            self.jobs_created += 1
+            return httpx.Response(201, json=_job_payload(f"job-{self.jobs_created}", "RUNNING"))
+        if path.endswith("/metrics"):
+            return httpx.Response(404, json={"detail": "Not found"})
+        if path.startswith("/transform-jobs/"):
+            job_id = path.split("/")[2]
+            self.polls[job_id] += 1
+            if self.polls[job_id] < 2:
+                return httpx.Response(200, json=_job_payload(job_id, "RUNNING"))
+            return httpx.Response(200, json=_job_payload(job_id, "COMPLETED", output_dataset_id="out-1"))
+        if path == "/datasets/out-1/samples":
+            self.pages_served += 1
+            if request.url.params.get("cursor") is None:
+                return httpx.Response(200, json={"samples": [{"prompt": "a"}, {"prompt": "b"}], "has_more": True, "total": 3, "next_cursor": "c1"})
+            return httpx.Response(200, json={"samples": [{"prompt": "c"}], "has_more": False, "total": 3, "next_cursor": None})
+        if path == "/datasets/out-1":
+            return httpx.Response(200, json={"id": "out-1", "num_rows": 3})
+        if path == "/datasets/empty/samples":
+            self.pages_served += 1
+            return httpx.Response(200, json={"samples": [], "has_more": False, "total": 0, "next_cursor": None})
+        if path == "/datasets/empty":
+            return httpx.Response(200, json={"id": "empty", "num_rows": 0})
+        return httpx.Response(404)
+
+
+def _client(server: _Server) -> AsyncLightningRod:
+    lr = AsyncLightningRod(api_key="token", base_url=BASE_URL)
+    lr._generated_client.set_async_httpx_client(
+        httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(server))
+    )
+    return lr
+
+
+def _pipeline() -> QuestionPipeline:
+    return QuestionPipeline(seed_generator=MockTransformConfig(num_seeds=1), question_generator=MockTransformConfig())
+
+
+class TestAsyncLightningRod:
+    """Test async runs, handles and sample iteration."""
+
+    def test_run_and_iterate_samples(self) -> None:
+        server = _Server()
+
+        async def scenario() -> List[str]:
+            async with _client(server) as lr:
+                dataset = await lr.transforms.run(_pipeline(), poll_schedule=FAST_POLLING)
+                assert dataset.num_rows == 3
+                return [sample.prompt async for sample in dataset]
+
+        assert asyncio.run(scenario()) == ["a", "b", "c"]
+        assert server.pages_served == 2
+
+    def test_empty_dataset_is_downloaded_once(self) -> None:
+        server = _Server()
+
+        async def scenario() -> None:
+            async with _client(server) as lr:
+                dataset = await lr.datasets.get("empty")
+                assert await dataset.samples() == []
+                assert await dataset.samples() == []
+
+        asyncio.run(scenario())
+        assert server.pages_served == 1
+
+    def test_submit_and_wait_all(self) -> None:
+        server = _Server()
+
+        async def scenario() -> None:
+            async with _client(server) as lr:
+                handles = [await lr.transforms.submit(_pipeline(), poll_schedule=FAST_POLLING) for _ in range(3)]
+                jobs = await lr.transforms.wait_all(handles, timeout=10)
+                assert [job.status for job in jobs] == [TransformJobStatus.COMPLETED] * 3
+                assert set(server.polls) == {"job-1", "job-2", "job-3"}
+                samples = await (await handles[0].result()).to_samples()
+                assert len(samples) == 3
+
+        asyncio.run(scenario())
+
+    def test_wait_raises_when_job_cannot_be_polled(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(201, json=_job_payload("job-1", "RUNNING"))
+            return httpx.Response(401, json={"detail": "Invalid API key"})
+
+        async def scenario() -> None:
+            lr = AsyncLightningRod(api_key="token", base_url=BASE_URL)
+            lr._generated_client.set_async_httpx_client(
+                httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler))
+            )
+            async with lr:
+                handle = await lr.transforms.submit(_pipeline(), poll_schedule=FAST_POLLING)
+                try:
+                    await handle.wait(10)
+                    assert False, "Should have raised"
+                except Exception as e:
+                    assert "Invalid API key" in str(e)
+                assert handle.done()
+
+        asyncio.run(scenario())
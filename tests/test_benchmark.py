@@ -0,0 +1,47 @@
+"""Smoke test for scripts/benchmark.py at a tiny scale."""
+
+import importlib.util
+import json
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).parent.parent
+
+
+def _load_benchmark_script() -> Any:
+    spec = importlib.util.spec_from_file_location("benchmark", ROOT / "scripts" / "benchmark.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestBenchmarkScript:
+    """Test that the benchmark suite runs and its report can be compared."""
+
+    def test_report_and_compare(self, tmp_path: Path) -> None:
+        benchmark = _load_benchmark_script()
+        output = tmp_path / "bench.json"
+
+        assert benchmark.main(["--sizes", "30", "--repeat", "1", "--output", str(output)]) == 0
+
+        report = json.loads(output.read_text())
+        assert report["schema_version"] == benchmark.SCHEMA_VERSION
+        assert {r["name"] for r in report["results"]} >= {
+            "import_lightningrod",
+            "sample_from_dict",
+            "sample_to_dict",
+            "paginated_response_parse",
+            "pagination_download",
+            "dataset_flattened",
+            "create_from_samples",
+            "download_peak_memory",
+        }
+        download = next(r for r in report["results"] if r["name"] == "pagination_download")
+        assert (download["size"], download["requests"]) == (30, 1)
+        assert download["items_per_second"] > 0
+
+        slower = json.loads(output.read_text())
+        for result in slower["results"]:
+            result["seconds" if "seconds" in result else "peak_bytes"] *= 2
+        assert benchmark.compare(report, report, threshold=1.25) == []
+        assert len(benchmark.compare(slower, report, threshold=1.25)) == len(report["results"])
@@ -0,0 +1,154 @@
+"""Tests for concurrent, memoized cost estimation."""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+from lightningrod._generated.client import AuthenticatedClient
+from lightningrod._generated.models.mock_transform_config import MockTransformConfig
+from lightningrod.datasets.client import AsyncDatasetSamplesClient, DatasetSamplesClient
+from lightningrod.transforms.cache import _BoundedMemo
+from lightningrod.transforms.client import AsyncTransformsClient, TransformsClient
+
+
+def _estimate_payload(num_seeds: int) -> Dict[str, Any]:
+    step = {
+        "step_name": "seed",
+        "step_type": "MOCK",
+        "total_cost_dollars": 0.5 * num_seeds,
+        "usage": {},
+        "output_count": num_seeds,
+        "cost_per_output": 0.5,
+    }
+    return {
+        "total_cost_dollars": 1.0 * num_seeds,
+        "llm_cost_dollars": 1.0 * num_seeds,
+        "web_search_cost_dollars": 0.0,
+        "url_download_cost_dollars": 0.0,
+        "usage": {},
+        "steps": [step, {**step, "step_name": "label"}],
+    }
+
+
+class _EstimateServer:
+    """Answers cost estimates slowly and tracks how many are in flight at once."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.requests: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        num_seeds = json.loads(request.content)["config"]["num_seeds"]
+        with self._lock:
+            self.requests.append(num_seeds)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return httpx.Response(200, json=_estimate_payload(num_seeds))
+
+
+def _configs() -> List[MockTransformConfig]:
+    return [MockTransformConfig(num_seeds=n) for n in (1, 2, 3, 2)]
+
+
+class TestEstimateCostMany:
+    """Test sweeping cost estimates over many configs."""
+
+    def test_estimates_run_concurrently_and_dedupe(self) -> None:
+        server = _EstimateServer()
+        client = AuthenticatedClient(base_url="https://test.invalid", token="token")
+        client.set_httpx_client(httpx.Client(base_url="https://test.invalid", transport=httpx.MockTransport(server)))
+        transforms = TransformsClient(client, DatasetSamplesClient(client))
+
+        rows = transforms.estimate_cost_many(_configs())
+
+        assert sorted(server.requests) == [1, 2, 3]
+        assert server.max_in_flight > 1
+        assert len(rows) == 8
+        assert [row["config_index"] for row in rows] == [0, 0, 1, 1, 2, 2, 3, 3]
+        assert rows[2] == {
+            "config_index": 1,
+            "step_name": "seed",
+            "step_type": "MOCK",
+            "output_count": 2,
+            "cost_per_output": 0.5,
+            "step_cost_dollars": 1.0,
+            "total_cost_dollars": 2.0,
+            "llm_cost_dollars": 2.0,
+            "web_search_cost_dollars": 0.0,
+            "url_download_cost_dollars": 0.0,
+        }
+
+    def test_sweeps_are_memoized(self) -> None:
+        server = _EstimateServer(delay=0)
+        client = AuthenticatedClient(base_url="https://test.invalid", token="token")
+        client.set_httpx_client(httpx.Client(base_url="https://test.invalid", transport=httpx.MockTransport(server)))
+        transforms = TransformsClient(client, DatasetSamplesClient(client))
+
+        first = transforms.estimate_cost_many(_configs())
+        assert transforms.estimate_cost_many(_configs()) == first
+        transforms.estimate_cost_many([MockTransformConfig(num_seeds=3)], max_questions=10)
+        assert transforms.estimate_cost(MockTransformConfig(num_seeds=3)) == 3.0
+
+        assert sorted(server.requests) == [1, 2, 3, 3, 3]
+
+    def test_memo_is_bounded_and_expires(self) -> None:
+        memo = _BoundedMemo(max_entries=2, ttl_seconds=60)
+        for key in "abc":
+            memo.put(key, key)
+        assert (len(memo), memo.get("a"), memo.get("c")) == (2, None, "c")
+
+        memo.ttl_seconds = 0
+        assert memo.get("c") is None
+        assert len(memo) == 1
+
+    def test_config_without_steps_gets_a_totals_row(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            num_seeds = json.loads(request.content)["config"]["num_seeds"]
+            return httpx.Response(200, json={**_estimate_payload(num_seeds), "steps": []})
+
+        client = AuthenticatedClient(base_url="https://test.invalid", token="token")
+        client.set_httpx_client(httpx.Client(base_url="https://test.invalid", transport=httpx.MockTransport(handler)))
+        transforms = TransformsClient(client, DatasetSamplesClient(client))
+
+        rows = transforms.estimate_cost_many([MockTransformConfig(num_seeds=2)])
+
+        assert rows == [{
+            "config_index": 0,
+            "step_name": None,
+            "step_type": None,
+            "output_count": None,
+            "cost_per_output": None,
+            "step_cost_dollars": None,
+            "total_cost_dollars": 2.0,
+            "llm_cost_dollars": 2.0,
+            "web_search_cost_dollars": 0.0,
+            "url_download_cost_dollars": 0.0,
+        }]
+
+    def test_async_estimate_cost_many(self) -> None:
+        server = _EstimateServer(delay=0)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return server(request)
+
+        async def main() -> List[Dict[str, Any]]:
+            client = AuthenticatedClient(base_url="https://test.invalid", token="token")
+            client.set_async_httpx_client(httpx.AsyncClient(base_url="https://test.invalid", transport=httpx.MockTransport(handler)))
+            transforms = AsyncTransformsClient(client, AsyncDatasetSamplesClient(client))
+            return await transforms.estimate_cost_many(_configs())
+
+        rows = asyncio.run(main())
+
+        assert sorted(server.requests) == [1, 2, 3]
+        assert [row["total_cost_dollars"] for row in rows[::2]] == [1.0, 2.0, 3.0, 2.0]
@@ -0,0 +1,96 @@
+"""Tests for Dataset.save() / Dataset.load()."""
+
+import json
+import pickle
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from lightningrod import Dataset, LazySample
+from lightningrod._generated.models import QuestionPipeline, Sample, Seed
+from lightningrod._generated.models.mock_transform_config import MockTransformConfig
+from lightningrod.datasets.memory import InMemoryDatasetSamplesClient
+from lightningrod.datasets.storage import BATCH_ROWS, MappedSamples
+from lightningrod.testing import FakeLightningRodServer, FakeServerConfig
+
+
+def _dataset(rows: int) -> Dataset:
+    server = FakeLightningRodServer(FakeServerConfig(rows_per_job=rows, seed_text_bytes=20))
+    config = QuestionPipeline(seed_generator=MockTransformConfig(), question_generator=MockTransformConfig())
+    return server.client().transforms.run(config, progress=None)
+
+
+class TestDatasetStorage:
+    """Test saving datasets to Arrow IPC files and memory-mapping them back."""
+
+    def test_save_and_load_roundtrip(self, tmp_path: Path) -> None:
+        dataset = _dataset(BATCH_ROWS + 5)
+        path = tmp_path / "out" / "dataset.arrow"
+
+        dataset.save(path)
+        loaded = Dataset.load(path)
+
+        assert (loaded.id, loaded.num_rows) == (dataset.id, dataset.num_rows)
+        samples = loaded.samples()
+        assert len(samples) == BATCH_ROWS + 5
+        assert isinstance(samples[0], LazySample)
+        assert samples[BATCH_ROWS + 1] == dataset.samples()[BATCH_ROWS + 1]
+        assert samples[-1] == dataset.samples()[-1]
+        assert samples[2:4] == dataset.samples()[2:4]
+        assert list(samples) == dataset.samples()
+        eager = loaded.download()
+        assert not any(isinstance(sample, LazySample) for sample in eager)
+        assert list(eager) == dataset.samples()
+        assert isinstance(loaded.download(lazy=True)[0], LazySample)
+        assert loaded.flattened() == dataset.flattened()
+        assert list(tmp_path.joinpath("out").iterdir()) == [path]
+
+    def test_file_is_feather_v2(self, tmp_path: Path) -> None:
+        path = tmp_path / "dataset.feather"
+        InMemoryDatasetSamplesClient().create([Sample(seed=Seed(seed_text="a"))]).save(path)
+
+        table = feather.read_table(path)
+
+        assert table.column_names == ["sample"]
+        assert json.loads(table["sample"][0].as_py())["seed"]["seed_text"] == "a"
+
+    def test_load_is_memory_mapped(self, tmp_path: Path) -> None:
+        path = tmp_path / "dataset.arrow"
+        _dataset(2000).save(path)
+
+        before = pa.total_allocated_bytes()
+        samples = Dataset.load(path).samples()
+
+        assert pa.total_allocated_bytes() - before < path.stat().st_size // 10
+        assert samples[1999].seed.seed_text
+
+    def test_pickles_by_path(self, tmp_path: Path) -> None:
+        path = tmp_path / "dataset.arrow"
+        _dataset(500).save(path)
+        samples = MappedSamples(path, lazy=False)
+
+        data = pickle.dumps(samples)
+        restored = pickle.loads(data)
+
+        assert len(data) < 500
+        assert (len(restored), restored.lazy) == (500, False)
+        assert restored[10] == samples[10]
+
+    def test_empty_and_invalid_files(self, tmp_path: Path) -> None:
+        empty = tmp_path / "empty.arrow"
+        InMemoryDatasetSamplesClient().create([]).save(empty)
+        other = tmp_path / "other.arrow"
+        feather.write_feather(pa.table({"x": [1]}), str(other), compression="uncompressed")
+
+        assert Dataset.load(empty).samples()[:] == []
+        try:
+            Dataset.load(empty).samples()[0]
+            assert False, "expected IndexError"
+        except IndexError:
+            pass
+        try:
+            Dataset.load(other)
+            assert False, "expected ValueError"
+        except ValueError as e:
+            assert "not a Lightning Rod dataset file" in str(e)
@@ -0,0 +1,127 @@
+"""Tests for the stand-in API server in lightningrod.testing."""
+
+import asyncio
+from pathlib import Path
+from typing import List
+
+import httpx
+
+from lightningrod import RetryPolicy
+from lightningrod._generated.models import QuestionPipeline, Sample, Seed
+from lightningrod._generated.models.mock_transform_config import MockTransformConfig
+from lightningrod.files.client import FilesClient
+from lightningrod.filesets.client import FileSetsClient
+from lightningrod.testing import FakeLightningRodServer, FakeServerConfig
+from lightningrod.transforms.polling import PollSchedule
+
+FAST_POLLING = PollSchedule.fixed(0.01)
+
+
+def _pipeline() -> QuestionPipeline:
+    return QuestionPipeline(seed_generator=MockTransformConfig(num_seeds=1), question_generator=MockTransformConfig())
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFakeServer:
+    """Test the SDK end to end against the fake server."""
+
+    def test_run_transform_and_download(self) -> None:
+        server = FakeLightningRodServer(FakeServerConfig(rows_per_job=250, seed_text_bytes=50))
+        lr = server.client()
+
+        dataset = lr.transforms.run(_pipeline(), poll_schedule=FAST_POLLING, progress=None)
+        samples = dataset.download()
+
+        assert dataset.num_rows == 250
+        assert len(samples) == 250
+        assert samples[0].seed.seed_text.startswith("[")
+        assert samples[0].question.question_text
+        assert server.requests["GET /datasets/{dataset_id}/samples"] == 3
+        assert lr.transforms.estimate_cost(_pipeline(), max_questions=10) == 0.1
+
+    def test_job_progresses_with_clock(self) -> None:
+        clock = _Clock()
+        server = FakeLightningRodServer(FakeServerConfig(rows_per_job=10, job_duration_seconds=60), clock=clock)
+        lr = server.client()
+        handle = lr.transforms.submit(_pipeline(), max_questions=4)
+
+        job, metrics = lr.transforms.jobs.snapshot(handle.id)
+        assert (job.status.value, job.output_dataset_id) == ("RUNNING", None)
+        clock.now = 30.0
+        assert lr.transforms.jobs.snapshot(handle.id)[1].steps[0].progress == 0.5
+        clock.now = 60.0
+        job = lr.transforms.jobs.get(handle.id)
+
+        assert job.status.value == "COMPLETED"
+        assert lr.datasets.get(job.output_dataset_id).num_rows == 4
+
+    def test_repeated_uploads_are_stored_unless_replay_is_enabled(self) -> None:
+        for replay, expected in ((False, ["0", "1", "x", "x"]), (True, ["0", "1", "x"])):
+            server = FakeLightningRodServer(FakeServerConfig(replay_idempotency_keys=replay))
+            lr = server.client()
+            dataset = lr.datasets.create_from_samples([Sample(seed=Seed(seed_text=str(i))) for i in range(2)])
+
+            lr._dataset_samples.upload(dataset.id, [Sample(seed=Seed(seed_text="x"))], idempotency_key="k")
+            lr._dataset_samples.upload(dataset.id, [Sample(seed=Seed(seed_text="x"))], idempotency_key="k")
+
+            assert [s.seed.seed_text for s in lr._dataset_samples.list(dataset.id)] == expected
+
+    def test_files_and_filesets(self, tmp_path: Path) -> None:
+        server = FakeLightningRodServer()
+        lr = server.client()
+        filesets = FileSetsClient(lr._generated_client, FilesClient(lr._generated_client, lr._http))
+        path = tmp_path / "notes.txt"
+        path.write_text("hello world")
+
+        file_set = filesets.create("docs", description="notes")
+        added = filesets.files.upload(file_set.id, path, metadata={"source": "test"})
+
+        assert added.size_bytes == 11
+        assert [f.name for f in filesets.list()] == ["docs"]
+        assert filesets.get(file_set.id).file_count == 1
+        assert [f.original_file_name for f in filesets.files.list(file_set.id).files] == ["notes.txt"]
+
+    def test_errors_and_failure_injection(self) -> None:
+        server = FakeLightningRodServer(FakeServerConfig(failure_rate=0.5, seed=1))
+        lr = server.client(retry=RetryPolicy(max_attempts=20, backoff_base=0.0, jitter=0.0))
+
+        balances = [lr.organization.get_balance() for _ in range(10)]
+
+        assert balances == [100.0] * 10
+        assert server.requests["GET /organizations/balance"] > 10
+        try:
+            server.client(retry=RetryPolicy.disabled()).datasets.get("missing")
+            assert False, "expected an error"
+        except Exception as e:
+            assert "not found" in str(e)
+
+    def test_async_client_with_latency(self) -> None:
+        server = FakeLightningRodServer(FakeServerConfig(rows_per_job=20, latency_seconds=0.01))
+
+        async def scenario() -> List[str]:
+            async with server.async_client() as lr:
+                dataset = await lr.transforms.run(_pipeline(), poll_schedule=FAST_POLLING, progress=None)
+                return [sample.seed.seed_text async for sample in dataset]
+
+        assert len(asyncio.run(scenario())) == 20
+
+    def test_asgi_app(self) -> None:
+        server = FakeLightningRodServer(FakeServerConfig(rows_per_job=3))
+
+        async def scenario() -> httpx.Response:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=server), base_url="http://local") as client:
+                job = (await client.post("/api/public/v1/transform-jobs", json={"config": {}})).json()
+                return await client.get(f"/api/public/v1/datasets/{job['output_dataset_id']}/samples", params={"limit": 2})
+
+        response = asyncio.run(scenario())
+
+        assert response.status_code == 200
+        page = response.json()
+        assert (len(page["samples"]), page["has_more"], page["total"]) == (2, True, 3)
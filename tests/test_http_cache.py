@@ -0,0 +1,218 @@
+"""Tests for the disk-backed HTTP response cache."""
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+from lightningrod import AsyncLightningRod, HttpCache, LightningRod, RetryPolicy
+
+BASE_URL = "https://api.test/api/public/v1"
+
+
+def _job(status: str) -> Dict[str, Any]:
+    return {
+        "id": "job-1",
+        "organization_id": "org",
+        "status": status,
+        "modal_function_call_id": "fc",
+        "modal_app_id": "app",
+        "transform_config": "{}",
+        "input_dataset_id": None,
+        "output_dataset_id": "out-1",
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+    }
+
+
+class _Server:
+    """MockTransport handler serving one job, its output dataset and the balance endpoint."""
+
+    def __init__(self) -> None:
+        self.job_status = "COMPLETED"
+        self.balance = 1.0
+        self.etag = '"b1"'
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path.endswith("/transform-jobs/job-1"):
+            return httpx.Response(200, json=_job(self.job_status))
+        if path.endswith("/organizations/balance"):
+            if request.headers.get("If-None-Match") == self.etag:
+                return httpx.Response(304)
+            return httpx.Response(200, json={"balance_dollars": self.balance}, headers={"ETag": self.etag})
+        cursor = int(request.url.params.get("cursor", 0))
+        return httpx.Response(200, json={
+            "samples": [{"seed": {"seed_text": f"s{cursor}"}}],
+            "has_more": cursor < 1,
+            "total": 2,
+            "next_cursor": str(cursor + 1) if cursor < 1 else None,
+        })
+
+    def count(self, suffix: str) -> int:
+        return sum(1 for r in self.requests if r.url.path.endswith(suffix))
+
+
+def _client(server: _Server, cache: HttpCache, api_key: str = "key") -> LightningRod:
+    return LightningRod(
+        api_key=api_key,
+        base_url=BASE_URL,
+        transport=httpx.MockTransport(server),
+        retry=RetryPolicy.disabled(),
+        http_cache=cache,
+    )
+
+
+class TestHttpCache:
+    """Test which responses are cached and how they are served."""
+
+    def test_finished_job_is_served_from_disk(self, tmp_path: Path) -> None:
+        server = _Server()
+        cache = HttpCache(tmp_path)
+        lr = _client(server, cache)
+
+        first = lr.transforms.jobs.get("job-1")
+        second = lr.transforms.jobs.get("job-1")
+
+        assert server.count("/transform-jobs/job-1") == 1
+        assert first.to_dict() == second.to_dict()
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+        assert stats.size_bytes > 0
+        assert stats.hit_rate == 0.5
+
+    def test_running_job_is_not_cached(self, tmp_path: Path) -> None:
+        server = _Server()
+        server.job_status = "RUNNING"
+        cache = HttpCache(tmp_path)
+        lr = _client(server, cache)
+
+        for _ in range(3):
+            lr.transforms.jobs.get("job-1")
+        server.job_status = "COMPLETED"
+        lr.transforms.jobs.get("job-1")
+        lr.transforms.jobs.get("job-1")
+
+        assert server.count("/transform-jobs/job-1") == 4
+        # Polls of the running job could never be stored, so they aren't misses
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+
+    def test_output_dataset_pages_are_shared_across_clients(self, tmp_path: Path) -> None:
+        server = _Server()
+        lr = _client(server, HttpCache(tmp_path))
+        lr.transforms.jobs.get("job-1")
+
+        assert [s.seed.seed_text for s in lr._dataset_samples.list("out-1")] == ["s0", "s1"]
+        # A fresh cache object over the same directory stands in for another process
+        other_cache = HttpCache(tmp_path)
+        other = _client(server, other_cache)
+        assert [s.seed.seed_text for s in other._dataset_samples.list("out-1")] == ["s0", "s1"]
+        assert [s.seed.seed_text for s in other._dataset_samples.list("other")] == ["s0", "s1"]
+
+        assert server.count("/datasets/out-1/samples") == 2
+        assert server.count("/datasets/other/samples") == 2
+        assert other_cache.stats().hits == 2
+
+    def test_etag_revalidation(self, tmp_path: Path) -> None:
+        server = _Server()
+        cache = HttpCache(tmp_path)
+        lr = _client(server, cache)
+
+        assert lr.organization.get_balance() == 1.0
+        assert lr.organization.get_balance() == 1.0
+        server.balance, server.etag = 2.0, '"b2"'
+        assert lr.organization.get_balance() == 2.0
+        assert lr.organization.get_balance() == 2.0
+
+        assert [r.headers.get("If-None-Match") for r in server.requests] == [None, '"b1"', '"b1"', '"b2"']
+        stats = cache.stats()
+        assert (stats.hits, stats.revalidated, stats.misses) == (0, 2, 2)
+
+    def test_entries_are_scoped_to_credentials(self, tmp_path: Path) -> None:
+        server = _Server()
+        cache = HttpCache(tmp_path)
+
+        _client(server, cache, api_key="a").transforms.jobs.get("job-1")
+        _client(server, cache, api_key="b").transforms.jobs.get("job-1")
+
+        assert server.count("/transform-jobs/job-1") == 2
+
+    def test_no_store_discards_entry(self, tmp_path: Path) -> None:
+        cache = HttpCache(tmp_path)
+        request = httpx.Request("GET", f"{BASE_URL}/organizations/balance")
+
+        assert cache.store(request, httpx.Response(200, content=b"{}", headers={"ETag": '"1"'}))
+        assert not cache.store(request, httpx.Response(200, content=b"{}", headers={"ETag": '"2"', "Cache-Control": "no-store"}))
+
+        assert cache.lookup(request) is None
+        assert cache.stats().size_bytes == 0
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        cache = HttpCache(tmp_path, max_bytes=1000)
+        requests = [httpx.Request("GET", f"{BASE_URL}/items/{i}") for i in range(3)]
+
+        for i, request in enumerate(requests[:2]):
+            cache.store(request, httpx.Response(200, content=b"x" * 300, headers={"ETag": f'"{i}"'}))
+            os.utime(cache._entry_path(request), (i, i))
+        # Reading an entry makes it the most recently used
+        assert cache.lookup(requests[0]) is not None
+        cache.store(requests[2], httpx.Response(200, content=b"x" * 300, headers={"ETag": '"2"'}))
+
+        assert cache.lookup(requests[1]) is None
+        assert cache.lookup(requests[0]) is not None
+        assert cache.lookup(requests[2]) is not None
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.size_bytes <= 1000
+
+    def test_clear_and_validation(self, tmp_path: Path) -> None:
+        server = _Server()
+        cache = HttpCache(tmp_path)
+        lr = _client(server, cache)
+        lr.transforms.jobs.get("job-1")
+
+        cache.clear()
+        lr.transforms.jobs.get("job-1")
+
+        assert server.count("/transform-jobs/job-1") == 2
+        try:
+            HttpCache(tmp_path, max_bytes=0)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+    def test_async_client(self, tmp_path: Path) -> None:
+        server = _Server()
+        cache = HttpCache(tmp_path)
+        cache_threads: List[int] = []
+        for name in ("lookup", "store"):
+            def record(*args: Any, _method: Any = getattr(cache, name)) -> Any:
+                cache_threads.append(threading.get_ident())
+                return _method(*args)
+            setattr(cache, name, record)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return server(request)
+
+        async def run() -> None:
+            async with AsyncLightningRod(
+                api_key="key",
+                base_url=BASE_URL,
+                transport=httpx.MockTransport(handler),
+                http_cache=cache,
+            ) as lr:
+                await lr.transforms.jobs.get("job-1")
+                await lr.transforms.jobs.get("job-1")
+
+        asyncio.run(run())
+
+        assert server.count("/transform-jobs/job-1") == 1
+        assert cache.stats().hits == 1
+        # Disk reads and writes stay off the event loop thread
+        assert len(cache_threads) == 3 and threading.get_ident() not in cache_threads
@@ -0,0 +1,146 @@
+"""Tests for the connection pool shared by API calls and signed-URL uploads."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterator, List, Tuple
+
+import httpx
+import pytest
+
+from lightningrod import AsyncLightningRod, HttpConfig, InMemoryExporter, Instrumentation, LightningRod
+from lightningrod.files.client import AsyncFilesClient, FilesClient
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: List[Tuple[int, str, str, Any]] = []
+
+    def _respond(self, status: int, body: Any = None) -> None:
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _record(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        self.requests.append((self.client_address[1], self.command, self.path, self.headers.get("Authorization")))
+
+    def do_HEAD(self) -> None:
+        self._record()
+        self._respond(404)
+
+    def do_GET(self) -> None:
+        self._record()
+        self._respond(200, {"balance_dollars": 12.5})
+
+    def do_POST(self) -> None:
+        self._record()
+        host, port = self.server.server_address
+        self._respond(201, {
+            "id": "file-1",
+            "original_file_name": "data.txt",
+            "cloud_storage_path": "bucket/data.txt",
+            "upload_url": f"http://{host}:{port}/signed-upload?sig=abc",
+            "mime_type": "text/plain",
+            "size_bytes": 5,
+            "created_at": "2024-01-01T00:00:00",
+            "expires_at": "2024-01-02T00:00:00",
+        })
+
+    def do_PUT(self) -> None:
+        self._record()
+        self._respond(200)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    _RecordingHandler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RecordingHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestSharedPool:
+    """Test that every request of one client reuses the same pooled connections."""
+
+    def test_api_calls_and_uploads_share_one_connection(self, server: ThreadingHTTPServer, tmp_path: Path) -> None:
+        host, port = server.server_address
+        lr = LightningRod(api_key="key", base_url=f"http://{host}:{port}/api", http=HttpConfig(warm_up=True))
+        files = FilesClient(lr._generated_client, lr._http)
+        path = tmp_path / "data.txt"
+        path.write_text("hello")
+
+        with lr:
+            assert lr.organization.get_balance() == 12.5
+            for _ in range(3):
+                files.upload(path)
+            lr.organization.get_balance()
+
+        methods = [(method, path.split("?")[0]) for _, method, path, _ in _RecordingHandler.requests]
+        assert methods[0] == ("HEAD", "/api/")
+        assert methods.count(("PUT", "/signed-upload")) == 3
+        assert len({port for port, _, _, _ in _RecordingHandler.requests}) == 1
+        auth = {path.split("?")[0]: header for _, _, path, header in _RecordingHandler.requests}
+        assert auth["/api/files"] == "Bearer key"
+        assert auth["/signed-upload"] is None
+
+    def test_async_upload_streams_file(self, server: ThreadingHTTPServer, tmp_path: Path) -> None:
+        host, port = server.server_address
+        path = tmp_path / "data.txt"
+        path.write_bytes(b"x" * (3 * 1024 * 1024 + 5))
+
+        async def run() -> None:
+            async with AsyncLightningRod(api_key="key", base_url=f"http://{host}:{port}/api") as lr:
+                await AsyncFilesClient(lr._generated_client, lr._http).upload(path)
+
+        asyncio.run(run())
+
+        assert [method for _, method, _, _ in _RecordingHandler.requests] == ["POST", "PUT"]
+
+    def test_pool_limits_and_timeout_are_applied(self) -> None:
+        lr = LightningRod(api_key="key", http=HttpConfig(max_connections=7, max_keepalive_connections=3, keepalive_expiry=5, timeout=12))
+
+        pool = lr._http.base_transport._pool
+        client = lr._generated_client.get_httpx_client()
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 5
+        assert client.timeout == httpx.Timeout(12)
+        assert client._transport is lr._http.transport
+        assert lr._http.upload_client()._transport is lr._http.transport
+
+    def test_injected_transport(self) -> None:
+        seen: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"balance_dollars": 3.0})
+
+        lr = LightningRod(api_key="key", transport=httpx.MockTransport(handler))
+
+        assert lr.organization.get_balance() == 3.0
+        assert seen == ["Bearer key"]
+
+    def test_instrumentation_counts_streamed_bodies(self, server: ThreadingHTTPServer) -> None:
+        host, port = server.server_address
+        exporter = InMemoryExporter()
+        lr = LightningRod(api_key="key", base_url=f"http://{host}:{port}/api", instrumentation=Instrumentation([exporter]))
+
+        lr.organization.get_balance()
+
+        http, parse = exporter.spans
+        assert (http.endpoint, http.status_code, http.response_bytes) == ("/organizations/balance", 200, len(b'{"balance_dollars": 12.5}'))
+        assert parse.request_id == http.request_id
@@ -0,0 +1,107 @@
+"""Import-time regression tests for `import lightningrod`, measured with `python -X importtime`."""
+
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, Set, Tuple
+
+import lightningrod
+
+ROOT = Path(__file__).parent.parent
+GENERATED = ROOT / "src" / "lightningrod" / "_generated"
+
+# Generous ceiling for the package's own cumulative import time; a lazy
+# `import lightningrod` takes around a millisecond, the eager one took hundreds.
+IMPORT_BUDGET_SECONDS = 0.05
+
+
+def _import(statement: str) -> Tuple[Dict[str, int], Set[str]]:
+    """
+    Run `statement` in a fresh interpreter and return the cumulative import time (µs)
+    per module reported by `-X importtime`, plus every module that ended up loaded.
+
+    importtime does not report modules loaded through `importlib.import_module`,
+    which is how lazy attributes resolve, so presence is checked via `sys.modules`.
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    # The first run writes bytecode so the measured run does not include compilation
+    for _ in range(2):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"{statement}; import sys; print(*sys.modules)"],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times, set(result.stdout.split())
+
+
+def _load_generate_script() -> Any:
+    spec = importlib.util.spec_from_file_location("generate", ROOT / "scripts" / "generate.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestImportTime:
+    """Test that heavy dependencies are only imported when they are used."""
+
+    def test_import_is_lazy(self) -> None:
+        times, modules = _import("import lightningrod")
+
+        assert times["lightningrod"] < IMPORT_BUDGET_SECONDS * 1e6
+        assert not [m for m in modules if m == "httpx" or m.startswith("rich")]
+        assert not [m for m in modules if m.startswith("lightningrod.")]
+
+    def test_client_import_skips_rich_and_unused_subclients(self) -> None:
+        _, modules = _import("from lightningrod import LightningRod")
+
+        assert "lightningrod.client" in modules
+        assert not [m for m in modules if m.startswith("rich")]
+        assert "lightningrod.transforms.client" not in modules
+        assert "lightningrod.filesets.client" not in modules
+        assert "lightningrod._generated.models.question_pipeline" not in modules
+
+    def test_transforms_client_is_built_on_first_use(self) -> None:
+        lr = lightningrod.LightningRod(api_key="key")
+
+        assert lr._transforms is None
+        assert lr.transforms is lr.transforms
+        assert lr.transforms._dataset_samples_client is lr._dataset_samples
+
+
+class TestLazyExports:
+    """Test that lazily resolved names behave like eager imports."""
+
+    def test_every_public_name_resolves(self) -> None:
+        from lightningrod import _generated
+
+        assert set(lightningrod._LAZY_IMPORTS) == set(lightningrod.__all__)
+        for name in lightningrod.__all__:
+            assert getattr(lightningrod, name) is not None, name
+        assert set(lightningrod.__all__) <= set(dir(lightningrod))
+        for name in _generated.models.__all__:
+            assert getattr(_generated.models, name).__name__ == name
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        try:
+            lightningrod.NotAThing
+            assert False, "expected AttributeError"
+        except AttributeError as e:
+            assert "NotAThing" in str(e)
+
+    def test_models_init_is_postprocessed(self) -> None:
+        generate = _load_generate_script()
+        source = (GENERATED / "models" / "__init__.py").read_text()
+
+        assert generate.LAZY_MODELS_MARKER in source
+        assert generate._patch_models_init(source) == source
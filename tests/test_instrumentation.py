@@ -0,0 +1,180 @@
+"""Tests for per-request spans, endpoint statistics and exporters."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+
+from lightningrod import AsyncLightningRod, InMemoryExporter, Instrumentation, LightningRod, RetryPolicy, Span, SpanExporter, span_context
+from lightningrod._generated.models import Sample, Seed
+from lightningrod._instrumentation import Histogram
+
+BASE_URL = "https://api.test/api/public/v1"
+_FAST = RetryPolicy(backoff_base=0.0, jitter=0.0)
+
+
+def _page(start: int, count: int, has_more: bool) -> Dict[str, Any]:
+    return {
+        "samples": [{"seed": {"seed_text": f"s{i}"}} for i in range(start, start + count)],
+        "has_more": has_more,
+        "total": 4,
+        "next_cursor": str(start + count) if has_more else None,
+    }
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/organizations/balance"):
+        return httpx.Response(200, json={"balance_dollars": 2.0})
+    if request.method == "POST":
+        return httpx.Response(200, json={"count": 1, "total": 1})
+    if request.url.params.get("cursor") is None:
+        return httpx.Response(200, json=_page(0, 2, True))
+    return httpx.Response(200, json=_page(2, 2, False))
+
+
+def _client(exporter: InMemoryExporter, handler: Any = _handler, **kwargs: Any) -> LightningRod:
+    return LightningRod(
+        api_key="key",
+        base_url=BASE_URL,
+        transport=httpx.MockTransport(handler),
+        retry=_FAST,
+        instrumentation=Instrumentation([exporter], **kwargs),
+    )
+
+
+class TestInstrumentation:
+    """Test spans recorded for API requests."""
+
+    def test_http_and_parse_spans(self) -> None:
+        exporter = InMemoryExporter()
+        lr = _client(exporter)
+
+        lr.organization.get_balance()
+
+        http, parse = exporter.spans
+        assert (http.name, http.method, http.endpoint, http.status_code) == ("http", "GET", "/organizations/balance", 200)
+        assert http.response_bytes == len(b'{"balance_dollars":2.0}')
+        assert http.duration_seconds > 0
+        assert (parse.name, parse.request_id, parse.endpoint) == ("parse", http.request_id, http.endpoint)
+        stats = lr.instrumentation.stats()["GET /organizations/balance"]
+        assert (stats.requests, stats.errors, stats.latency.count, stats.parse.count) == (1, 0, 1, 1)
+
+    def test_pagination_is_correlated_by_dataset(self) -> None:
+        exporter = InMemoryExporter()
+        lr = _client(exporter)
+
+        lr._dataset_samples.list("d-42")
+
+        http = [s for s in exporter.spans if s.name == "http"]
+        assert len(http) == 2
+        assert {s.endpoint for s in exporter.spans} == {"/datasets/{dataset_id}/samples"}
+        assert {s.dataset_id for s in exporter.spans} == {"d-42"}
+        stats = lr.instrumentation.stats()["GET /datasets/{dataset_id}/samples"]
+        assert stats.requests == stats.parse.count == 2
+        assert stats.response_bytes == sum(s.response_bytes for s in http) > 0
+
+    def test_upload_bytes_and_job_context(self) -> None:
+        exporter = InMemoryExporter()
+        lr = _client(exporter)
+
+        with span_context(job_id="job-7"):
+            lr._dataset_samples.upload("d1", [Sample(seed=Seed(seed_text="x" * 500))])
+        lr.organization.get_balance()
+
+        upload, balance = [s for s in exporter.spans if s.name == "http"]
+        assert upload.request_bytes > 500
+        assert (upload.job_id, upload.dataset_id) == ("job-7", "d1")
+        assert balance.job_id is None
+
+    def test_retries_and_errors(self) -> None:
+        exporter = InMemoryExporter()
+        calls: List[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            raise httpx.ConnectError("down")
+
+        lr = LightningRod(
+            api_key="key",
+            base_url=BASE_URL,
+            transport=httpx.MockTransport(handler),
+            retry=RetryPolicy(max_attempts=3, backoff_base=0.0, jitter=0.0),
+            instrumentation=Instrumentation([exporter]),
+        )
+
+        try:
+            lr.organization.get_balance()
+            assert False, "expected ConnectError"
+        except httpx.ConnectError:
+            pass
+
+        (span,) = exporter.spans
+        assert (span.retries, span.error, span.status_code) == (2, "ConnectError", None)
+        stats = lr.instrumentation.stats()["GET /organizations/balance"]
+        assert (stats.retries, stats.errors) == (2, 1)
+
+    def test_hooks_and_exporters(self) -> None:
+        seen: List[str] = []
+        spans: List[Span] = []
+
+        def broken(span: Span) -> None:
+            raise RuntimeError("exporter down")
+
+        lr = LightningRod(
+            api_key="key",
+            base_url=BASE_URL,
+            transport=httpx.MockTransport(_handler),
+            instrumentation=Instrumentation(
+                [broken, spans.append],
+                on_request=[lambda request: seen.append(f"request {request.url.path}")],
+                on_response=[lambda request, response: seen.append(f"response {response.status_code}")],
+            ),
+        )
+
+        assert lr.organization.get_balance() == 2.0
+        assert seen == ["request /api/public/v1/organizations/balance", "response 200"]
+        assert [s.name for s in spans] == ["http", "parse"]
+        # The base exporter ignores spans rather than raising
+        assert SpanExporter().export(spans[0]) is None
+
+    def test_signed_uploads_are_grouped(self) -> None:
+        exporter = InMemoryExporter()
+        lr = _client(exporter, handler=lambda request: httpx.Response(200))
+
+        lr._http.upload_client().put("https://storage.test/bucket/f-1?sig=abc", content=b"hello")
+
+        (span,) = exporter.spans
+        assert (span.endpoint, span.request_bytes) == ("signed-upload", 5)
+
+    def test_async_client(self) -> None:
+        exporter = InMemoryExporter()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return _handler(request)
+
+        async def run() -> None:
+            async with AsyncLightningRod(
+                api_key="key",
+                base_url=BASE_URL,
+                transport=httpx.MockTransport(handler),
+                instrumentation=Instrumentation([exporter]),
+            ) as lr:
+                await asyncio.gather(lr.organization.get_balance(), lr.organization.get_balance())
+
+        asyncio.run(run())
+
+        assert sorted(s.name for s in exporter.spans) == ["http", "http", "parse", "parse"]
+        assert all(s.response_bytes > 0 for s in exporter.spans if s.name == "http")
+
+    def test_histogram_quantiles(self) -> None:
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.75) == 1.0
+        assert histogram.quantile(1.0) == float("inf")
+        assert histogram.mean == 5.6 / 4
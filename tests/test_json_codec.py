@@ -0,0 +1,97 @@
+"""Tests for the pluggable JSON codec used by the generated endpoints."""
+
+import importlib.util
+import json
+from pathlib import Path
+from typing import Any, List
+
+import httpx
+import pytest
+
+from lightningrod import HttpConfig, LightningRod
+from lightningrod._generated.models import Sample, Seed
+from lightningrod._json import JsonCodec, available_codecs, get_codec
+
+ROOT = Path(__file__).parent.parent
+
+
+def _load_generate_script() -> Any:
+    spec = importlib.util.spec_from_file_location("generate", ROOT / "scripts" / "generate.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestCodecs:
+    """Test codec selection and encoding parity."""
+
+    def test_selection(self) -> None:
+        assert get_codec().name == available_codecs()[0]
+        assert get_codec("json").name == "json"
+        assert "json" in available_codecs()
+        try:
+            get_codec("yaml")
+            assert False, "expected ValueError"
+        except ValueError as e:
+            assert "orjson" in str(e)
+
+    @pytest.mark.parametrize("name", available_codecs())
+    def test_round_trip_parity(self, name: str) -> None:
+        codec = get_codec(name)
+        payload = {"text": "naïve ✓ \"quoted\"", "n": [1, 2.5, None, True], "nested": {"k": "v" * 1000}}
+
+        encoded = codec.dumps(payload)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == payload
+        assert codec.loads(encoded) == payload
+        assert codec.loads(get_codec("json").dumps(payload)) == payload
+
+    def test_encode_replaces_json_kwarg(self) -> None:
+        codec = get_codec("json")
+
+        kwargs = codec.encode({"method": "post", "url": "/x", "json": {"a": 1}, "headers": {"Content-Type": "application/json"}})
+
+        assert "json" not in kwargs
+        assert kwargs["content"] == b'{"a":1}'
+        assert codec.encode({"method": "get", "url": "/x"}) == {"method": "get", "url": "/x"}
+
+
+class TestClientCodec:
+    """Test that generated endpoints go through the client's codec."""
+
+    def test_configured_codec_is_used_for_requests_and_responses(self) -> None:
+        calls: List[str] = []
+        stdlib = get_codec("json")
+        codec = JsonCodec(
+            name="counting",
+            loads=lambda data: calls.append("loads") or stdlib.loads(data),
+            dumps=lambda obj: calls.append("dumps") or stdlib.dumps(obj),
+        )
+        bodies: List[Any] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append((request.headers["Content-Type"], json.loads(request.content)))
+            return httpx.Response(200, json={"count": 1, "total": 1})
+
+        lr = LightningRod(api_key="key", transport=httpx.MockTransport(handler), http=HttpConfig(json_codec="json"))
+        assert lr._generated_client.json_codec.name == "json"
+        lr._generated_client.json_codec = codec
+
+        lr._dataset_samples.upload("d1", [Sample(seed=Seed(seed_text="a"))])
+
+        assert calls == ["dumps", "loads"]
+        assert bodies[0][0] == "application/json"
+        assert bodies[0][1]["samples"][0]["seed"]["seed_text"] == "a"
+
+    def test_generated_code_is_postprocessed(self) -> None:
+        generated = ROOT / "src" / "lightningrod" / "_generated"
+        generate = _load_generate_script()
+
+        for path in (generated / "api").rglob("*.py"):
+            source = path.read_text()
+            assert "response.json()" not in source, path
+            assert generate._patch_endpoint_module(source) == source
+        client_source = (generated / "client.py").read_text()
+        assert generate._patch_client_module(client_source) == client_source
+        assert client_source.count(generate.CODEC_FIELD) == 2
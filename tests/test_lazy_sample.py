@@ -0,0 +1,139 @@
+"""Tests for LazySample and lazy pagination."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+
+from lightningrod import LazySample, RetryPolicy
+from lightningrod._generated.client import AuthenticatedClient
+from lightningrod._generated.models import QuestionPipeline, Sample
+from lightningrod._generated.models.forward_looking_question import ForwardLookingQuestion
+from lightningrod._generated.models.mock_transform_config import MockTransformConfig
+from lightningrod._generated.models.rag_context import RAGContext
+from lightningrod.datasets.client import DatasetSamplesClient
+from lightningrod.datasets.dataset import _sample_to_dict
+from lightningrod.testing import FakeLightningRodServer, FakeServerConfig, synthetic_samples
+
+PAYLOADS: List[Dict[str, Any]] = synthetic_samples(3) + [
+    {"question": {"question_type": "QUESTION", "question_text": "Plain?"}, "prompt": "p", "extra": [1, 2]},
+    {
+        "seed": "not an object",
+        "context": [
+            {"rendered_context": "news", "search_query": "q", "context_type": "NEWS_CONTEXT"},
+            {"rendered_context": "doc", "document_id": "d1", "context_type": "RAG_CONTEXT"},
+        ],
+        "rollouts": [{"model_name": "m", "content": "c", "parsed_output": {"answer": "Yes"}}],
+        "is_valid": False,
+    },
+    {"context": None, "rollouts": None, "meta": {}},
+    {},
+]
+
+
+def _is_decoded(sample: LazySample, name: str) -> bool:
+    # LazySample caches decoded fields in Sample's slots
+    try:
+        Sample.__dict__[name].__get__(sample, LazySample)
+        return True
+    except AttributeError:
+        return False
+
+
+def _dataset_id(server: FakeLightningRodServer) -> str:
+    config = QuestionPipeline(seed_generator=MockTransformConfig(), question_generator=MockTransformConfig())
+    return server.client().transforms.run(config, progress=None).id
+
+
+class TestLazySample:
+    """Test that LazySample reads exactly like an eagerly decoded Sample."""
+
+    def test_matches_eager_decoding(self) -> None:
+        for payload in PAYLOADS:
+            lazy = LazySample.from_dict(payload)
+            eager = Sample.from_dict(payload)
+
+            assert isinstance(lazy, Sample)
+            assert lazy == eager and eager == lazy
+            assert lazy.to_dict() == eager.to_dict()
+            if not isinstance(eager.seed, str):
+                assert _sample_to_dict(LazySample.from_dict(payload)) == _sample_to_dict(eager)
+
+    def test_fields_decode_on_first_access(self) -> None:
+        sample = LazySample.from_dict(PAYLOADS[0])
+
+        question = sample.question
+
+        assert isinstance(question, ForwardLookingQuestion)
+        assert sample.question is question
+        assert _is_decoded(sample, "question")
+        assert not any(_is_decoded(sample, name) for name in ("seed", "label", "context", "meta"))
+
+    def test_union_members_and_assignment(self) -> None:
+        sample = LazySample.from_dict(PAYLOADS[4])
+
+        assert sample.seed == "not an object"
+        assert isinstance(sample.context[1], RAGContext)
+        assert sample.rollouts[0].parsed_output.additional_properties == {"answer": "Yes"}
+        assert LazySample.from_dict({"rollouts": ["not a rollout"]}).rollouts == ["not a rollout"]
+        sample.prompt = "edited"
+        sample.is_valid = True
+        assert (sample.to_dict()["prompt"], sample.to_dict()["is_valid"]) == ("edited", True)
+        assert LazySample.from_dict(PAYLOADS[3])["extra"] == [1, 2]
+
+
+class TestLazyPagination:
+    """Test that pages can be returned as LazySample objects."""
+
+    def test_download_lazy(self) -> None:
+        server = FakeLightningRodServer(FakeServerConfig(rows_per_job=150, seed_text_bytes=20))
+        lr = server.client()
+        dataset = lr.datasets.get(_dataset_id(server))
+
+        lazy = dataset.download(lazy=True)
+        eager = lr.datasets.get(dataset.id).download()
+
+        assert len(lazy) == 150
+        assert all(type(sample) is LazySample for sample in lazy)
+        assert all(type(sample) is Sample for sample in eager)
+        assert lazy == eager
+        assert dataset.flattened() == lr.datasets.get(dataset.id).flattened()
+
+    def test_lazy_page_errors(self) -> None:
+        lr = FakeLightningRodServer().client(retry=RetryPolicy.disabled())
+        try:
+            lr._dataset_samples.fetch_page("missing", lazy=True)
+            assert False, "expected an error"
+        except Exception as e:
+            assert "not found" in str(e)
+
+    def test_malformed_page_fails_like_eager_parsing(self) -> None:
+        for body in ({"has_more": False, "total": 0}, {"samples": ["x"], "has_more": False, "total": 1}, ["x"]):
+            client = AuthenticatedClient(base_url="https://test.invalid", token="token")
+            client.set_httpx_client(httpx.Client(
+                base_url="https://test.invalid", transport=httpx.MockTransport(lambda request: httpx.Response(200, json=body)),
+            ))
+            samples_client = DatasetSamplesClient(client)
+
+            errors = []
+            for lazy in (False, True):
+                try:
+                    samples_client.fetch_page("dataset-1", lazy=lazy)
+                    assert False, "expected an error"
+                except Exception as e:
+                    errors.append((type(e), str(e)))
+            assert errors[0] == errors[1], body
+
+    def test_async_iter_lazy(self) -> None:
+        server = FakeLightningRodServer(FakeServerConfig(rows_per_job=30, seed_text_bytes=20))
+        dataset_id = _dataset_id(server)
+
+        async def scenario() -> List[Sample]:
+            async with server.async_client() as lr:
+                return [sample async for sample in lr._dataset_samples.iter(dataset_id, lazy=True)]
+
+        samples = asyncio.run(scenario())
+
+        assert len(samples) == 30
+        assert all(isinstance(sample, LazySample) for sample in samples)
+        assert samples[0].seed.seed_text.startswith("[")
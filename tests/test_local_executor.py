@@ -0,0 +1,100 @@
+"""Tests for running MockTransformConfig pipelines in-process."""
+
+import json
+from typing import Any, List
+
+from lightningrod._generated.models import QuestionPipeline, Sample, Seed, TransformJobStatus
+from lightningrod._generated.models.mock_transform_config import MockTransformConfig
+from lightningrod._generated.models.mock_transform_config_metadata_additions import MockTransformConfigMetadataAdditions
+from lightningrod._generated.models.news_seed_generator import NewsSeedGenerator
+from lightningrod.transforms.local import LocalTransformsClient
+from lightningrod.transforms.progress import JobStatusEvent
+
+
+def _pipeline(num_seeds: int = 500, **question_options: Any) -> QuestionPipeline:
+    return QuestionPipeline(
+        seed_generator=MockTransformConfig(num_seeds=num_seeds, error_rate=0.0, random_seed=1),
+        question_generator=MockTransformConfig(add_question=True, random_seed=2, **question_options),
+    )
+
+
+class TestLocalTransformsClient:
+    """Test the local mock pipeline engine."""
+
+    def test_run_produces_dataset_and_metrics(self) -> None:
+        local = LocalTransformsClient()
+
+        dataset = local.run(_pipeline(error_rate=0.1, expansion_factor=3, filter_rate=0.2))
+        samples = dataset.download()
+        metrics = local.jobs.get_metrics(local.last_job_id)
+        seeds, questions = metrics.steps
+
+        assert local.jobs.get(local.last_job_id).status == TransformJobStatus.COMPLETED
+        assert local.jobs.get(local.last_job_id).output_dataset_id == dataset.id
+        assert seeds.input_rows == seeds.output_rows == 500
+        assert questions.input_rows == 500
+        assert questions.output_rows + questions.rejected_count == 3 * (500 - questions.error_count)
+        assert 0 < questions.error_count < 100
+        assert len(samples) == dataset.num_rows == questions.output_rows + questions.rejected_count
+        assert sum(1 for s in samples if s.is_valid is False) == questions.rejected_count
+        assert all(step.progress == 1.0 for step in metrics.steps)
+        assert samples[0].question.question_text == "Mock question 0?"
+
+    def test_runs_are_reproducible(self) -> None:
+        local = LocalTransformsClient()
+        config = _pipeline(error_rate=0.3, filter_rate=0.3)
+
+        first = [s.to_dict() for s in local.run(config).download()]
+        second = [s.to_dict() for s in local.run(config).download()]
+
+        assert first == second
+
+    def test_flattened_and_metadata(self) -> None:
+        additions = MockTransformConfigMetadataAdditions.from_dict({"source": "mock"})
+        local = LocalTransformsClient()
+
+        rows = local.run(_pipeline(num_seeds=3, error_rate=0.0, metadata_additions=additions)).flattened()
+
+        assert rows[2]["seed.seed_text"] == "Mock seed content 2"
+        assert rows[2]["meta.source"] == "mock"
+
+    def test_limits_and_progress_events(self) -> None:
+        events: List[Any] = []
+        local = LocalTransformsClient(progress_interval=100)
+
+        dataset = local.run(_pipeline(num_seeds=1000, error_rate=0.0), max_questions=250, progress=events.append)
+
+        statuses = [e for e in events if isinstance(e, JobStatusEvent)]
+        assert dataset.num_rows == 250
+        assert [e.status for e in statuses] == [TransformJobStatus.RUNNING] * 2 + [TransformJobStatus.COMPLETED]
+        assert 0 < statuses[0].metrics.steps[0].progress < 1
+
+    def test_input_dataset(self) -> None:
+        local = LocalTransformsClient()
+        source = local.datasets.create([Sample(seed=Seed(seed_text=f"s{i}")) for i in range(10)])
+
+        dataset = local.run(MockTransformConfig(error_rate=0.0, expansion_factor=2), input_dataset=source)
+
+        assert [s.seed.seed_text for s in dataset.download()][:4] == ["s0", "s0", "s1", "s1"]
+
+    def test_input_dataset_is_unchanged(self) -> None:
+        local = LocalTransformsClient()
+        source = local.datasets.create([Sample(seed=Seed(seed_text=f"s{i}")) for i in range(20)])
+        before = [s.to_dict() for s in source.download()]
+        config = MockTransformConfig(error_rate=0.0, filter_rate=0.5, add_question=True, random_seed=3)
+
+        local.run(config, input_dataset=source)
+
+        assert [s.to_dict() for s in local.datasets.get(source.id).download()] == before
+        assert json.loads(local.jobs.get(local.last_job_id).transform_config) == config.to_dict()
+
+    def test_non_mock_steps_are_rejected(self) -> None:
+        config = QuestionPipeline(
+            seed_generator=NewsSeedGenerator.from_dict({"start_date": "2024-01-01T00:00:00", "end_date": "2024-02-01T00:00:00", "search_query": "AI"}),
+            question_generator=MockTransformConfig(),
+        )
+        try:
+            LocalTransformsClient().run(config)
+            assert False, "expected ValueError"
+        except ValueError as e:
+            assert "seed_generator" in str(e)
@@ -0,0 +1,113 @@
+"""Tests for throughput, ETA and projected cost computed from pipeline metrics history."""
+
+from typing import List, Optional
+
+from rich.console import Console
+
+from lightningrod._display import build_live_display
+from lightningrod._generated.models import JobUsage, TransformJob
+from lightningrod._generated.models.pipeline_metrics_response import PipelineMetricsResponse
+from lightningrod._generated.models.transform_step_metrics_response import TransformStepMetricsResponse
+from lightningrod.transforms.metrics import MetricsHistory
+
+
+def _step(index: int, input_rows: int, output_rows: int, rejected: int, progress: float) -> TransformStepMetricsResponse:
+    return TransformStepMetricsResponse(
+        step_index=index,
+        transform_name=f"step-{index}",
+        input_rows=input_rows,
+        output_rows=output_rows,
+        rejected_count=rejected,
+        error_count=0,
+        duration_seconds=1.0,
+        progress=progress,
+        summary=None,
+    )
+
+
+def _metrics(steps: List[TransformStepMetricsResponse]) -> PipelineMetricsResponse:
+    return PipelineMetricsResponse(
+        total_input_rows=sum(s.input_rows for s in steps),
+        total_output_rows=sum(s.output_rows for s in steps),
+        total_duration_seconds=1.0,
+        steps=steps,
+    )
+
+
+def _job(current_cost: Optional[float], max_cost: Optional[float] = None) -> TransformJob:
+    return TransformJob.from_dict({
+        "id": "job-1",
+        "organization_id": "org-1",
+        "status": "RUNNING",
+        "modal_function_call_id": "fc-1",
+        "modal_app_id": "app-1",
+        "transform_config": "{}",
+        "input_dataset_id": None,
+        "output_dataset_id": None,
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:00:00",
+        "usage": JobUsage(current_cost_dollars=current_cost, max_cost_dollars=max_cost).to_dict(),
+    })
+
+
+class TestMetricsHistory:
+    """Test rates and estimates derived from recorded snapshots."""
+
+    def test_rates_eta_and_projected_cost(self) -> None:
+        history = MetricsHistory()
+        history.record(_metrics([_step(0, 100, 80, 20, 0.2), _step(1, 0, 0, 0, 0.0)]), _job(1.0), timestamp=1000.0)
+        history.record(_metrics([_step(0, 300, 240, 60, 0.6), _step(1, 100, 100, 0, 0.2)]), _job(4.0), timestamp=1010.0)
+
+        throughput = history.throughput()
+
+        assert throughput is not None
+        assert throughput.job_id == "job-1"
+        first, second = throughput.steps
+        assert first.rows_per_second == 20.0
+        assert first.output_rows_per_second == 16.0
+        assert first.rejection_rate == 0.2
+        assert abs(first.eta_seconds - 10.0) < 1e-9
+        assert second.rejection_rate == 0.0
+        # Pipeline progress goes from 0.1 to 0.4 in 10s
+        assert abs(throughput.eta_seconds - 20.0) < 1e-9
+        assert abs(throughput.projected_cost_dollars - 10.0) < 1e-9
+
+    def test_projected_cost_is_capped_at_budget(self) -> None:
+        history = MetricsHistory()
+        history.record(_metrics([_step(0, 10, 10, 0, 0.5)]), _job(3.0, max_cost=5.0), timestamp=0.0)
+
+        throughput = history.throughput()
+
+        assert throughput.projected_cost_dollars == 5.0
+        # A single sample has no rate yet
+        assert throughput.eta_seconds is None
+        assert throughput.steps[0].rows_per_second is None
+
+    def test_rates_use_only_the_window(self) -> None:
+        history = MetricsHistory(window_seconds=10)
+        history.record(_metrics([_step(0, 0, 0, 0, 0.0)]), timestamp=0.0)
+        history.record(_metrics([_step(0, 1000, 0, 0, 0.5)]), timestamp=100.0)
+        history.record(_metrics([_step(0, 1010, 0, 0, 0.6)]), timestamp=105.0)
+
+        assert history.throughput().steps[0].rows_per_second == 2.0
+
+    def test_empty_history(self) -> None:
+        history = MetricsHistory()
+        history.record(None)
+
+        assert len(history) == 0
+        assert history.throughput() is None
+
+    def test_display_renders_eta_and_projection(self) -> None:
+        history = MetricsHistory()
+        metrics = _metrics([_step(0, 100, 80, 20, 0.5)])
+        history.record(_metrics([_step(0, 0, 0, 0, 0.0)]), _job(0.0), timestamp=0.0)
+        history.record(metrics, _job(2.0), timestamp=60.0)
+
+        console = Console(record=True, width=140)
+        console.print(build_live_display(metrics=metrics, job=_job(2.0), throughput=history.throughput()))
+        output = console.export_text()
+
+        assert "ETA" in output
+        assert "1m 0s" in output
+        assert "Projected:  $4.00" in output
@@ -0,0 +1,160 @@
+"""Tests for recording job metrics snapshots and exporting them as OpenMetrics."""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from lightningrod._generated.models import JobUsage, TransformJob
+from lightningrod._generated.models.pipeline_metrics_response import PipelineMetricsResponse
+from lightningrod._generated.models.transform_step_metrics_response import TransformStepMetricsResponse
+from lightningrod.transforms.progress import resolve_progress, snapshot_events
+from lightningrod.transforms import recorder as recorder_module
+from lightningrod.transforms.recorder import MetricsRecorder, to_openmetrics
+
+
+def _job(job_id: str, status: str = "RUNNING", cost: float = 1.5) -> TransformJob:
+    return TransformJob.from_dict({
+        "id": job_id,
+        "organization_id": "org-1",
+        "status": status,
+        "modal_function_call_id": "fc-1",
+        "modal_app_id": "app-1",
+        "transform_config": "{}",
+        "input_dataset_id": None,
+        "output_dataset_id": None,
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:00:00",
+        "usage": JobUsage(current_cost_dollars=cost, max_cost_dollars=10.0).to_dict(),
+    })
+
+
+def _metrics(input_rows: int) -> PipelineMetricsResponse:
+    step = TransformStepMetricsResponse(
+        step_index=0,
+        transform_name='news "seed"',
+        input_rows=input_rows,
+        output_rows=input_rows - 1,
+        rejected_count=1,
+        error_count=0,
+        duration_seconds=2.5,
+        progress=0.5,
+        summary=None,
+    )
+    return PipelineMetricsResponse(total_input_rows=input_rows, total_output_rows=input_rows - 1, total_duration_seconds=2.5, steps=[step])
+
+
+def _record_two_polls(recorder: MetricsRecorder) -> None:
+    for event in snapshot_events(_job("job-1", cost=1.0), _metrics(5)):
+        recorder(event)
+    for event in snapshot_events(_job("job-1", status="COMPLETED", cost=2.0), _metrics(9)):
+        recorder(event)
+    for event in snapshot_events(_job("job-2"), None):
+        recorder(event)
+
+
+class TestMetricsRecorder:
+    """Test persisting snapshots to JSONL and SQLite."""
+
+    def test_jsonl_roundtrip(self, tmp_path: Path) -> None:
+        recorder = MetricsRecorder(tmp_path / "metrics.jsonl")
+        _record_two_polls(recorder)
+
+        records = recorder.read("job-1")
+
+        assert recorder.format == "jsonl"
+        assert [r["status"] for r in records] == ["RUNNING", "COMPLETED"]
+        assert [r["current_cost_dollars"] for r in records] == [1.0, 2.0]
+        assert records[1]["steps"][0]["input_rows"] == 9
+        assert len(recorder.read()) == 3
+
+    def test_sqlite_roundtrip(self, tmp_path: Path) -> None:
+        recorder = MetricsRecorder(tmp_path / "metrics.db")
+        _record_two_polls(recorder)
+
+        records = recorder.read()
+
+        assert recorder.format == "sqlite"
+        assert [(r["job_id"], r["status"]) for r in records] == [("job-1", "RUNNING"), ("job-1", "COMPLETED"), ("job-2", "RUNNING")]
+        assert records[0]["steps"] == [{
+            "step_index": 0,
+            "transform_name": 'news "seed"',
+            "input_rows": 5,
+            "output_rows": 4,
+            "rejected_count": 1,
+            "error_count": 0,
+            "duration_seconds": 2.5,
+            "progress": 0.5,
+        }]
+        assert records[2]["steps"] == []
+
+    def test_sqlite_reuses_one_connection(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        connects: List[Any] = []
+        real_connect = sqlite3.connect
+
+        def connect(*args: Any, **kwargs: Any) -> sqlite3.Connection:
+            connects.append(args)
+            return real_connect(*args, **kwargs)
+
+        monkeypatch.setattr(recorder_module.sqlite3, "connect", connect)
+        recorder = MetricsRecorder(tmp_path / "metrics.db")
+        _record_two_polls(recorder)
+        # Reporters are called from the poller's thread
+        thread = threading.Thread(target=lambda: [recorder(event) for event in snapshot_events(_job("job-3"), None)])
+        thread.start()
+        thread.join()
+
+        assert len(recorder.read()) == 4
+        assert len(connects) == 1
+        recorder.close()
+
+    def test_recorder_alongside_other_progress(self, tmp_path: Path) -> None:
+        recorder = MetricsRecorder(tmp_path / "metrics.jsonl")
+        seen: List[Any] = []
+
+        with resolve_progress([seen.append, recorder]) as reporter:
+            for event in snapshot_events(_job("job-1"), _metrics(3)):
+                reporter(event)
+
+        assert len(seen) == 3
+        assert len(recorder.read()) == 1
+
+
+class TestOpenMetrics:
+    """Test the OpenMetrics text serializer."""
+
+    def test_latest_snapshot_per_job(self, tmp_path: Path) -> None:
+        recorder = MetricsRecorder(tmp_path / "metrics.jsonl")
+        _record_two_polls(recorder)
+        records = recorder.read()
+        timestamp = repr(float(records[1]["timestamp"]))
+
+        text = recorder.openmetrics()
+
+        assert text == to_openmetrics(records)
+        assert text.endswith("# EOF\n")
+        assert "# TYPE lightningrod_step_input_rows gauge" in text
+        assert f'lightningrod_step_input_rows{{job_id="job-1",step="0",transform="news \\"seed\\""}} 9 {timestamp}' in text
+        assert f'lightningrod_job_cost_dollars{{job_id="job-1"}} 2.0 {timestamp}' in text
+        assert 'lightningrod_job_running{job_id="job-1",status="COMPLETED"} 0' in text
+        assert 'lightningrod_job_running{job_id="job-2",status="RUNNING"} 1' in text
+        assert "input_rows{job_id=\"job-1\",step=\"0\",transform=\"news \\\"seed\\\"\"} 5" not in text
+
+    def test_non_finite_values(self) -> None:
+        record = {
+            "job_id": "job-1",
+            "timestamp": 1.0,
+            "status": "RUNNING",
+            "current_cost_dollars": float("nan"),
+            "max_cost_dollars": float("inf"),
+            "estimated_cost_dollars": float("-inf"),
+            "steps": [],
+        }
+
+        text = to_openmetrics([record])
+
+        assert 'lightningrod_job_cost_dollars{job_id="job-1"} NaN 1.0' in text
+        assert 'lightningrod_job_max_cost_dollars{job_id="job-1"} +Inf 1.0' in text
+        assert 'lightningrod_job_estimated_cost_dollars{job_id="job-1"} -Inf 1.0' in text
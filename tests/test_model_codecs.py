@@ -0,0 +1,223 @@
+"""Parity tests for the post-processed (hoisted-import, fast-datetime) model codecs."""
+
+import importlib.util
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from dateutil.parser import isoparse
+
+import lightningrod._generated.models as models
+from lightningrod._datetime import parse_datetime
+
+ROOT = Path(__file__).parent.parent
+MODELS_DIR = ROOT / "src" / "lightningrod" / "_generated" / "models"
+
+DATES = [
+    "2026-01-01T00:00:00Z",
+    "2026-01-01T12:30:45.123456+02:00",
+    "2026-01-01T12:30:45",
+    "2026-03-04",
+    "2026-01-01T00:00:00.5-05:30",
+]
+
+# Each payload with the to_dict() output the models produced with dateutil's
+# isoparse and per-call imports, before post-processing.
+CASES: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = [
+    (
+        "Sample",
+        {
+            "seed": {"seed_text": "s", "seed_creation_date": DATES[0], "search_query": "q"},
+            "question": {
+                "question_type": "FORWARD_LOOKING_QUESTION",
+                "question_text": "Will it?",
+                "date_close": DATES[1],
+                "event_date": DATES[2],
+                "resolution_criteria": "r",
+                "prediction_date": DATES[4],
+            },
+            "label": {"label": "Yes", "label_confidence": 0.9, "resolution_date": DATES[3]},
+            "meta": {"k": 1},
+            "is_valid": True,
+        },
+        {
+            "seed": {"seed_text": "s", "seed_creation_date": "2026-01-01T00:00:00+00:00", "search_query": "q"},
+            "question": {
+                "question_text": "Will it?",
+                "date_close": "2026-01-01T12:30:45.123456+02:00",
+                "event_date": "2026-01-01T12:30:45",
+                "resolution_criteria": "r",
+                "question_type": "FORWARD_LOOKING_QUESTION",
+                "prediction_date": "2026-01-01T00:00:00.500000-05:30",
+            },
+            "label": {"label": "Yes", "label_confidence": 0.9, "resolution_date": "2026-03-04T00:00:00"},
+            "meta": {"k": 1},
+            "is_valid": True,
+        },
+    ),
+    (
+        "Sample",
+        {"seed": {"seed_text": "s", "seed_creation_date": "not a date"}, "question": {"question_text": "Plain?"}},
+        {"seed": {"seed_text": "s", "seed_creation_date": "not a date"}, "question": {"question_text": "Plain?"}},
+    ),
+    (
+        "TransformJob",
+        {
+            "id": "job", "organization_id": "org", "status": "COMPLETED", "modal_function_call_id": "fc",
+            "modal_app_id": "app", "transform_config": "{}", "input_dataset_id": None, "output_dataset_id": "out",
+            "created_at": DATES[0], "updated_at": DATES[1], "usage": None, "extra": "kept",
+        },
+        {
+            "extra": "kept", "id": "job", "organization_id": "org", "status": "COMPLETED",
+            "modal_function_call_id": "fc", "modal_app_id": "app", "transform_config": "{}",
+            "input_dataset_id": None, "output_dataset_id": "out", "created_at": "2026-01-01T00:00:00+00:00",
+            "updated_at": "2026-01-01T12:30:45.123456+02:00", "usage": None,
+        },
+    ),
+    (
+        "FileSet",
+        {
+            "id": "fs", "name": "docs", "description": None, "file_count": 1, "indexed_file_count": 0,
+            "created_at": DATES[2], "updated_at": DATES[4],
+        },
+        {
+            "id": "fs", "name": "docs", "description": None, "file_count": 1, "indexed_file_count": 0,
+            "created_at": "2026-01-01T12:30:45", "updated_at": "2026-01-01T00:00:00.500000-05:30",
+        },
+    ),
+    (
+        "FileSetFile",
+        {
+            "id": "f", "original_file_name": "a.txt", "cloud_storage_path": "p", "mime_type": None, "size_bytes": 1,
+            "character_count": None, "metadata": {"a": "b"}, "gemini_file_id": None, "file_created_date": DATES[3],
+            "created_at": DATES[0], "updated_at": DATES[1],
+        },
+        {
+            "id": "f", "original_file_name": "a.txt", "cloud_storage_path": "p", "mime_type": None, "size_bytes": 1,
+            "character_count": None, "metadata": {"a": "b"}, "gemini_file_id": None,
+            "file_created_date": "2026-03-04T00:00:00", "created_at": "2026-01-01T00:00:00+00:00",
+            "updated_at": "2026-01-01T12:30:45.123456+02:00",
+        },
+    ),
+    (
+        "CreateFileUploadResponse",
+        {
+            "id": "f", "original_file_name": "a.txt", "cloud_storage_path": "p", "upload_url": "u",
+            "mime_type": "text/plain", "size_bytes": 1, "created_at": DATES[1], "expires_at": DATES[4],
+        },
+        {
+            "id": "f", "original_file_name": "a.txt", "cloud_storage_path": "p", "upload_url": "u",
+            "mime_type": "text/plain", "size_bytes": 1, "created_at": "2026-01-01T12:30:45.123456+02:00",
+            "expires_at": "2026-01-01T00:00:00.500000-05:30",
+        },
+    ),
+    (
+        "GdeltSeedGenerator",
+        {"start_date": DATES[0], "end_date": DATES[3]},
+        {"start_date": "2026-01-01T00:00:00+00:00", "end_date": "2026-03-04T00:00:00"},
+    ),
+    (
+        "NewsSeedGenerator",
+        {"start_date": DATES[2], "end_date": DATES[1], "search_query": ["a", "b"]},
+        {"start_date": "2026-01-01T12:30:45", "end_date": "2026-01-01T12:30:45.123456+02:00", "search_query": ["a", "b"]},
+    ),
+]
+
+
+NEWS = {"rendered_context": "news", "search_query": "q", "context_type": "NEWS_CONTEXT"}
+RAG = {"rendered_context": "doc", "document_id": "d1", "context_type": "RAG_CONTEXT"}
+FORWARD_FIELDS = {"date_close": DATES[0], "event_date": DATES[1], "resolution_criteria": "r"}
+
+# Each Sample payload with the types its question and context items decoded to
+# with the generator's try-each-member union decoders, before post-processing.
+UNION_CASES: List[Tuple[Dict[str, Any], Tuple[Any, Any]]] = [
+    (
+        {"question": {"question_type": "QUESTION", "question_text": "Plain?"}, "context": [NEWS, RAG, {"rendered_context": "r", "document_id": "d2"}]},
+        ("Question", ["NewsContext", "RAGContext", "RAGContext"]),
+    ),
+    (
+        {"question": {"question_type": "OTHER", "question_text": "?"}, "context": [{"rendered_context": "n", "search_query": "q"}, {**RAG, "context_type": "OTHER"}]},
+        ("dict", ["dict", "dict"]),
+    ),
+    (
+        {"question": {"question_type": "FORWARD_LOOKING_QUESTION", "question_text": "Will?"}, "context": [{"rendered_context": "n", "context_type": "NEWS_CONTEXT"}]},
+        ("dict", ["dict"]),
+    ),
+    (
+        {"question": {"question_type": "QUESTION", "question_text": "Q", **FORWARD_FIELDS}, "context": [{**NEWS, **RAG}]},
+        ("Question", ["RAGContext"]),
+    ),
+    (
+        {"question": {"question_text": "Q", **FORWARD_FIELDS}, "context": [{**NEWS, "document_id": "d", "context_type": None}]},
+        ("ForwardLookingQuestion", ["dict"]),
+    ),
+    ({"question": "text", "context": ["x"]}, ("str", ["str"])),
+]
+
+
+def _type_names(value: Any) -> Any:
+    return [_type_names(item) for item in value] if isinstance(value, list) else type(value).__name__
+
+
+def _load_generate_script() -> Any:
+    spec = importlib.util.spec_from_file_location("generate", ROOT / "scripts" / "generate.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestModelCodecs:
+    """Test that post-processed models encode and decode exactly as before."""
+
+    def test_roundtrip_matches_previous_output(self) -> None:
+        for name, payload, expected in CASES:
+            assert getattr(models, name).from_dict(payload).to_dict() == expected, name
+
+    def test_union_dispatch_matches_previous_decoding(self) -> None:
+        for payload, expected in UNION_CASES:
+            sample = models.Sample.from_dict(payload)
+            assert (_type_names(sample.question), _type_names(sample.context)) == expected, payload
+
+    def test_parse_datetime_matches_isoparse(self) -> None:
+        values = DATES + [
+            "2026-01-01T00:00:00.123Z",
+            "2026-01-01T00:00:00+0000",
+            "2026-01-01T24:00:00",
+            "20260101T103000",
+            "2026-01-01T10:30",
+        ]
+        for value in values:
+            assert parse_datetime(value) == isoparse(value), value
+            assert parse_datetime(value).utcoffset() == isoparse(value).utcoffset(), value
+
+    def test_parse_datetime_rejects_what_isoparse_rejects(self) -> None:
+        for value in ("not a date", "", "2026-13-01"):
+            try:
+                parse_datetime(value)
+                assert False, f"expected ValueError for {value!r}"
+            except ValueError:
+                pass
+
+    def test_parse_datetime_is_faster_than_isoparse(self) -> None:
+        values = [f"2026-01-01T{h:02d}:00:00.123456Z" for h in range(24)] * 200
+
+        def best(fn: Any) -> float:
+            times = []
+            for _ in range(3):
+                start = time.perf_counter()
+                for value in values:
+                    fn(value)
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        # Typically around 30x; the bound only guards against losing the fast path
+        assert best(isoparse) > 3 * best(parse_datetime)
+
+    def test_models_are_postprocessed(self) -> None:
+        generate = _load_generate_script()
+        for path in MODELS_DIR.glob("*.py"):
+            if path.name == "__init__.py":
+                continue
+            source = path.read_text()
+            assert generate._patch_model_module(source) == source, path.name
+            assert "isoparse" not in source, path.name
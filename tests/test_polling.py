@@ -0,0 +1,56 @@
+"""Tests for the adaptive job poll schedule."""
+
+from lightningrod._generated.models.pipeline_metrics_response import PipelineMetricsResponse
+from lightningrod._generated.models.transform_step_metrics_response import TransformStepMetricsResponse
+from lightningrod.transforms.polling import PollSchedule, pipeline_progress
+
+
+def _metrics(*progress: float) -> PipelineMetricsResponse:
+    steps = [
+        TransformStepMetricsResponse(
+            step_index=i,
+            transform_name=f"step-{i}",
+            input_rows=10,
+            output_rows=10,
+            rejected_count=0,
+            error_count=0,
+            duration_seconds=1.0,
+            progress=p,
+            summary=None,
+        )
+        for i, p in enumerate(progress)
+    ]
+    return PipelineMetricsResponse(total_input_rows=10, total_output_rows=10, total_duration_seconds=1.0, steps=steps)
+
+
+class TestPollSchedule:
+    """Test the backoff and progress-aware tightening of PollSchedule."""
+
+    def test_fast_polls_then_backoff(self) -> None:
+        schedule = PollSchedule(initial_interval=1.0, backoff_factor=2.0, jitter=0.0, fast_polls=2, max_interval=100)
+        intervals = [schedule.next_interval(n) for n in range(1, 6)]
+        assert intervals == [1.0, 1.0, 2.0, 4.0, 8.0]
+
+    def test_interval_capped_at_max(self) -> None:
+        schedule = PollSchedule(initial_interval=1.0, backoff_factor=2.0, jitter=0.0, fast_polls=0, max_interval=10)
+        assert schedule.next_interval(50) == 10
+        assert schedule.next_interval(10_000) == 10
+
+    def test_jitter_stays_within_bounds(self) -> None:
+        schedule = PollSchedule(initial_interval=10.0, jitter=0.2, fast_polls=5)
+        for _ in range(100):
+            assert 8.0 <= schedule.next_interval(1) <= 12.0
+
+    def test_tightens_near_completion(self) -> None:
+        schedule = PollSchedule(jitter=0.0, fast_polls=0, max_interval=60, near_completion_threshold=0.9, near_completion_interval=2.0)
+        assert schedule.next_interval(20, _metrics(1.0, 0.5)) == 60
+        assert schedule.next_interval(20, _metrics(1.0, 0.95)) == 2.0
+
+    def test_fixed_schedule(self) -> None:
+        schedule = PollSchedule.fixed(15)
+        assert schedule.next_interval(1) == 15
+        assert schedule.next_interval(100, _metrics(0.99)) == 15
+
+    def test_pipeline_progress_without_metrics(self) -> None:
+        assert pipeline_progress(None) is None
+        assert pipeline_progress(_metrics(0.0, 1.0)) == 0.5
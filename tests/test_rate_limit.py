@@ -0,0 +1,141 @@
+"""Tests for the client-side token-bucket rate limiter."""
+
+import asyncio
+import threading
+import time
+from typing import List
+
+import httpx
+
+from lightningrod import AsyncLightningRod, LightningRod, RateLimit, RateLimiter, RetryPolicy
+
+
+def _request(path: str) -> httpx.Request:
+    return httpx.Request("GET", f"https://api.test/api/public/v1{path}")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimiter:
+    """Test bucket accounting with a controlled clock."""
+
+    def test_burst_then_queued_at_rate(self) -> None:
+        clock = _Clock()
+        limiter = RateLimiter({"datasets": RateLimit(rate=2, burst=3)}, clock=clock)
+        request = _request("/datasets/d1/samples")
+
+        waits = [limiter.reserve(request) for _ in range(6)]
+
+        assert waits == [0.0, 0.0, 0.0, 0.5, 1.0, 1.5]
+        clock.now = 10.0
+        assert limiter.reserve(request) == 0.0
+
+    def test_groups_have_separate_budgets(self) -> None:
+        limiter = RateLimiter({"transform-jobs": RateLimit(rate=1)}, clock=_Clock())
+
+        assert limiter.group(_request("/transform-jobs/j1/metrics")) == "transform-jobs"
+        assert limiter.group(_request("/filesets/f1/files")) == "files"
+        assert limiter.group(httpx.Request("PUT", "https://storage.test/bucket/x")) == "default"
+        assert limiter.reserve(_request("/transform-jobs/j1")) == 0.0
+        assert limiter.reserve(_request("/transform-jobs/j1")) == 1.0
+        assert limiter.reserve(_request("/datasets/d1")) == 0.0
+        assert set(limiter.stats()) == {"transform-jobs"}
+
+    def test_stats_record_waits(self) -> None:
+        limiter = RateLimiter(default=RateLimit(rate=4, burst=1), clock=_Clock())
+        for _ in range(3):
+            limiter.reserve(_request("/samples/validate"))
+
+        stats = limiter.stats()["default"]
+
+        assert (stats.requests, stats.delayed) == (3, 2)
+        assert stats.total_wait_seconds == 0.75
+        assert stats.max_wait_seconds == 0.5
+        assert stats.mean_wait_seconds == 0.25
+
+    def test_pause_holds_group(self) -> None:
+        limiter = RateLimiter({"datasets": RateLimit(rate=10, burst=10)}, clock=_Clock())
+
+        limiter.pause(_request("/datasets"), 2.0)
+
+        assert limiter.reserve(_request("/datasets/d1")) == 2.0
+
+    def test_invalid_configuration(self) -> None:
+        for make in (lambda: RateLimiter({"jobs": RateLimit(rate=1)}), lambda: RateLimit(rate=0)):
+            try:
+                make()
+                assert False, "expected ValueError"
+            except ValueError:
+                pass
+
+
+class TestRateLimitedClients:
+    """Test that clients sharing a limiter stay within its budget."""
+
+    def test_threads_share_budget(self) -> None:
+        sent: List[float] = []
+        lock = threading.Lock()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            with lock:
+                sent.append(time.monotonic())
+            return httpx.Response(200, json={"balance_dollars": 1.0})
+
+        limiter = RateLimiter({"organizations": RateLimit(rate=50, burst=5)})
+        clients = [LightningRod(api_key="key", transport=httpx.MockTransport(handler), rate_limit=limiter) for _ in range(2)]
+        threads = [threading.Thread(target=lambda c=c: [c.organization.get_balance() for _ in range(10)]) for c in clients * 2]
+
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = limiter.stats()["organizations"]
+        assert len(sent) == stats.requests == 40
+        assert max(sent) - start >= (40 - 5) / 50 * 0.9
+        assert stats.delayed >= 30
+
+    def test_async_tasks_share_budget(self) -> None:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"balance_dollars": 1.0})
+
+        limiter = RateLimiter({"organizations": RateLimit(rate=100, burst=2)})
+
+        async def run() -> float:
+            async with AsyncLightningRod(api_key="key", transport=httpx.MockTransport(handler), rate_limit=limiter) as lr:
+                start = time.monotonic()
+                await asyncio.gather(*(lr.organization.get_balance() for _ in range(20)))
+                return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 18 / 100 * 0.9
+        assert limiter.stats()["organizations"].delayed >= 15
+
+    def test_429_pauses_group_and_retry_is_throttled(self) -> None:
+        calls: List[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0.2"})
+            return httpx.Response(200, json={"balance_dollars": 1.0})
+
+        limiter = RateLimiter({"organizations": RateLimit(rate=1000)})
+        lr = LightningRod(
+            api_key="key",
+            transport=httpx.MockTransport(handler),
+            retry=RetryPolicy(retry_after_max=0.0),
+            rate_limit=limiter,
+        )
+
+        start = time.monotonic()
+        lr.organization.get_balance()
+
+        assert time.monotonic() - start >= 0.15
+        assert limiter.stats()["organizations"].delayed == 1
@@ -0,0 +1,263 @@
+"""Tests for retrying transient failures at the transport layer."""
+
+import asyncio
+import email.utils
+import json
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+from lightningrod import AsyncLightningRod, LightningRod, RetryPolicy
+from lightningrod._generated.models import Sample, Seed
+from lightningrod._retry import AsyncRetryTransport, RetryTransport, idempotency_scope
+
+_FAST = RetryPolicy(backoff_base=0.0, jitter=0.0)
+
+
+def _samples_page(start: int, count: int, has_more: bool) -> Dict[str, Any]:
+    return {
+        "samples": [{"seed": {"seed_text": f"s{i}"}} for i in range(start, start + count)],
+        "has_more": has_more,
+        "total": 4,
+        "next_cursor": str(start + count) if has_more else None,
+    }
+
+
+class TestRetryPolicy:
+    """Test backoff and idempotency decisions."""
+
+    def test_backoff_grows_and_is_capped(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=0.0)
+
+        assert [policy.backoff(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_jitter_stays_in_bounds(self) -> None:
+        policy = RetryPolicy(backoff_base=2.0, jitter=0.5)
+
+        delays = [policy.backoff(1) for _ in range(200)]
+
+        assert all(1.0 <= d <= 3.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_after_seconds_and_date(self) -> None:
+        policy = RetryPolicy(retry_after_max=60.0)
+        date = email.utils.formatdate(time.time() + 30, usegmt=True)
+
+        assert policy.backoff(1, httpx.Response(429, headers={"Retry-After": "7"})) == 7.0
+        assert policy.backoff(1, httpx.Response(503, headers={"Retry-After": "3600"})) == 60.0
+        assert 25 <= policy.backoff(1, httpx.Response(503, headers={"Retry-After": date})) <= 30
+
+    def test_idempotency_rules(self) -> None:
+        policy = RetryPolicy()
+
+        def request(method: str, path: str, **headers: str) -> httpx.Request:
+            return httpx.Request(method, f"https://api.test/api/public/v1{path}", headers=headers)
+
+        assert policy.is_idempotent(request("GET", "/datasets/d1/samples"))
+        assert policy.is_idempotent(request("PUT", "/signed-upload"))
+        assert policy.is_idempotent(request("POST", "/transform-jobs/cost-estimation"))
+        assert not policy.is_idempotent(request("POST", "/datasets/d1/samples", **{"Idempotency-Key": "k"}))
+        assert RetryPolicy(honor_idempotency_keys=True).is_idempotent(
+            request("POST", "/datasets/d1/samples", **{"Idempotency-Key": "k"})
+        )
+        assert not policy.is_idempotent(request("POST", "/datasets/d1/samples"))
+        assert not policy.is_idempotent(request("POST", "/transform-jobs"))
+
+
+class TestRetryTransport:
+    """Test retries of real requests through the client."""
+
+    def test_get_retries_with_retry_after(self) -> None:
+        calls: List[int] = []
+        waits: List[float] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            if len(calls) < 3:
+                return httpx.Response(503, headers={"Retry-After": "2"})
+            return httpx.Response(200, json={"balance_dollars": 4.0})
+
+        transport = RetryTransport(httpx.MockTransport(handler), RetryPolicy(), sleep=waits.append)
+        lr = LightningRod(api_key="key", transport=transport, retry=RetryPolicy.disabled())
+
+        assert lr.organization.get_balance() == 4.0
+        assert waits == [2.0, 2.0]
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        calls: List[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            return httpx.Response(502)
+
+        lr = LightningRod(api_key="key", transport=httpx.MockTransport(handler), retry=RetryPolicy(max_attempts=3, backoff_base=0.0))
+
+        try:
+            lr.organization.get_balance()
+            assert False, "expected Exception"
+        except Exception:
+            pass
+        assert len(calls) == 3
+
+    def test_pagination_survives_transient_failure(self) -> None:
+        failed: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            cursor = request.url.params.get("cursor")
+            if cursor == "2" and not failed:
+                failed.append(cursor)
+                raise httpx.ReadError("connection reset")
+            if cursor is None:
+                return httpx.Response(200, json=_samples_page(0, 2, True))
+            return httpx.Response(200, json=_samples_page(2, 2, False))
+
+        lr = LightningRod(api_key="key", transport=httpx.MockTransport(handler), retry=_FAST)
+
+        samples = lr._dataset_samples.list("d1")
+
+        assert [s.seed.seed_text for s in samples] == ["s0", "s1", "s2", "s3"]
+        assert failed == ["2"]
+
+    def test_post_without_key_is_not_retried_on_server_error(self) -> None:
+        calls: List[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            return httpx.Response(500)
+
+        lr = LightningRod(api_key="key", transport=httpx.MockTransport(handler), retry=_FAST)
+
+        try:
+            lr._dataset_samples.upload("d1", [Sample(seed=Seed(seed_text="a"))])
+            assert False, "expected Exception"
+        except Exception:
+            pass
+        assert len(calls) == 1
+
+    def test_post_is_retried_on_429(self) -> None:
+        calls: List[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"id": "job-1"})
+
+        transport = RetryTransport(httpx.MockTransport(handler), _FAST)
+        response = httpx.Client(transport=transport).post("https://api.test/transform-jobs", json={})
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+
+    def test_upload_is_not_retried_after_it_may_have_been_stored(self) -> None:
+        received: List[Any] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received.append(request.headers.get("Idempotency-Key"))
+            if len(received) == 1:
+                raise httpx.ReadTimeout("response lost")
+            return httpx.Response(200, json={"count": 1, "total": 1})
+
+        lr = LightningRod(api_key="key", transport=httpx.MockTransport(handler), retry=_FAST)
+
+        try:
+            lr._dataset_samples.upload("d1", [Sample(seed=Seed(seed_text="a"))], idempotency_key="d1:0")
+            assert False, "expected ReadTimeout"
+        except httpx.ReadTimeout:
+            pass
+        assert received == ["d1:0"]
+
+    def test_upload_is_retried_when_turned_away_or_keys_are_honored(self) -> None:
+        received: List[Any] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received.append((request.headers.get("Idempotency-Key"), json.loads(request.content)))
+            if len(received) == 1:
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            if len(received) == 3:
+                return httpx.Response(500)
+            return httpx.Response(200, json={"count": 1, "total": 1})
+
+        policy = RetryPolicy(max_attempts=3, backoff_base=0.0, jitter=0.0, honor_idempotency_keys=True)
+        lr = LightningRod(api_key="key", transport=httpx.MockTransport(handler), retry=policy)
+
+        lr._dataset_samples.upload("d1", [Sample(seed=Seed(seed_text="a"))], idempotency_key="d1:0")
+        lr._dataset_samples.upload("d1", [Sample(seed=Seed(seed_text="a"))], idempotency_key="d1:1")
+
+        assert [key for key, _ in received] == ["d1:0", "d1:0", "d1:1", "d1:1"]
+        assert received[0][1] == received[1][1]
+
+    def test_streamed_body_is_not_retried(self) -> None:
+        calls: List[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            request.read()
+            calls.append(1)
+            return httpx.Response(503)
+
+        transport = RetryTransport(httpx.MockTransport(handler), _FAST)
+        response = httpx.Client(transport=transport).put("https://upload.test/signed", content=iter([b"chunk"]))
+
+        assert response.status_code == 503
+        assert len(calls) == 1
+
+    def test_connect_errors_are_retried_for_any_method(self) -> None:
+        calls: List[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            if len(calls) < 3:
+                raise httpx.ConnectError("refused")
+            return httpx.Response(201, json={})
+
+        transport = RetryTransport(httpx.MockTransport(handler), _FAST)
+        response = httpx.Client(transport=transport).post("https://api.test/transform-jobs", json={})
+
+        assert response.status_code == 201
+        assert len(calls) == 3
+
+    def test_idempotency_scope_is_cleared(self) -> None:
+        keys: List[Any] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            keys.append(request.headers.get("Idempotency-Key"))
+            return httpx.Response(200)
+
+        client = httpx.Client(transport=RetryTransport(httpx.MockTransport(handler), _FAST))
+        with idempotency_scope("k1"):
+            client.post("https://api.test/x")
+        client.post("https://api.test/x")
+
+        assert keys == ["k1", None]
+
+    def test_async_get_is_retried(self) -> None:
+        calls: List[int] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            if len(calls) == 1:
+                raise httpx.ReadTimeout("slow")
+            return httpx.Response(200, json={"balance_dollars": 9.0})
+
+        async def run() -> float:
+            async with AsyncLightningRod(api_key="key", transport=httpx.MockTransport(handler), retry=_FAST) as lr:
+                return await lr.organization.get_balance()
+
+        assert asyncio.run(run()) == 9.0
+        assert len(calls) == 2
+
+    def test_async_transport_disabled_policy(self) -> None:
+        calls: List[int] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            return httpx.Response(503)
+
+        async def run() -> int:
+            transport = AsyncRetryTransport(httpx.MockTransport(handler), RetryPolicy.disabled())
+            async with httpx.AsyncClient(transport=transport) as client:
+                return (await client.get("https://api.test/x")).status_code
+
+        assert asyncio.run(run()) == 503
+        assert len(calls) == 1
@@ -0,0 +1,73 @@
+"""Tests for config fingerprinting and the local transform run cache."""
+
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+
+from lightningrod._generated.models import NewsSeedGenerator, QuestionPipeline
+from lightningrod._generated.models.mock_transform_config import MockTransformConfig
+from lightningrod.transforms.cache import RunCache, config_fingerprint
+
+
+def _config(query: str = "ai") -> NewsSeedGenerator:
+    return NewsSeedGenerator(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 2, 1), search_query=[query])
+
+
+class TestConfigFingerprint:
+    """Test that fingerprints identify identical runs."""
+
+    def test_equal_configs_match(self) -> None:
+        assert config_fingerprint(_config()) == config_fingerprint(_config())
+
+    def test_differences_change_fingerprint(self) -> None:
+        base = config_fingerprint(_config(), max_questions=10)
+        assert config_fingerprint(_config("chips"), max_questions=10) != base
+        assert config_fingerprint(_config(), max_questions=20) != base
+
+    def test_nested_pipeline(self) -> None:
+        pipeline = QuestionPipeline(seed_generator=_config(), question_generator=MockTransformConfig())
+        assert len(config_fingerprint(pipeline)) == 64
+
+
+class TestRunCache:
+    """Test storing, expiring and invalidating cached runs."""
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        cache = RunCache(tmp_path / "runs.json")
+        key = cache.key(_config(), input_dataset_id="in-1")
+        assert cache.get(key) is None
+
+        cache.put(key, "out-1", job_id="job-1")
+
+        assert RunCache(tmp_path / "runs.json").get(key) == "out-1"
+
+    def test_ttl_expiry(self, tmp_path: Path) -> None:
+        path = tmp_path / "runs.json"
+        cache = RunCache(path, ttl_seconds=60)
+        key = cache.key(_config())
+        cache.put(key, "out-1")
+
+        entries = json.loads(path.read_text())
+        entries[key]["created_at"] = time.time() - 120
+        path.write_text(json.dumps(entries))
+
+        assert cache.get(key) is None
+        assert RunCache(path).get(key) == "out-1"
+
+    def test_invalidate_and_clear(self, tmp_path: Path) -> None:
+        cache = RunCache(tmp_path / "runs.json")
+        cache.put(cache.key(_config("a")), "out-a")
+        cache.put(cache.key(_config("b")), "out-b")
+
+        assert cache.invalidate(_config("a")) is True
+        assert cache.invalidate(_config("a")) is False
+        assert cache.get(cache.key(_config("b"))) == "out-b"
+
+        cache.clear()
+        assert cache.get(cache.key(_config("b"))) is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "runs.json"
+        path.write_text("{not json")
+        assert RunCache(path).get("anything") is None
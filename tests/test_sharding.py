@@ -0,0 +1,144 @@
+"""Tests for splitting seed-generator jobs into shards and merging their outputs."""
+
+import json
+import threading
+from datetime import datetime
+from typing import Any, Dict, List
+
+import httpx
+
+from lightningrod._generated.client import AuthenticatedClient
+from lightningrod._generated.models import GdeltSeedGenerator, NewsSeedGenerator, QuestionPipeline
+from lightningrod._generated.models.mock_transform_config import MockTransformConfig
+from lightningrod.datasets.client import DatasetSamplesClient
+from lightningrod.transforms.client import TransformsClient
+from lightningrod.transforms.polling import PollSchedule
+from lightningrod.transforms.sharding import shard_config, split_budget
+
+
+def _news(search_query: Any = "AI", days: int = 28) -> NewsSeedGenerator:
+    return NewsSeedGenerator(
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 1, 1 + days),
+        search_query=search_query,
+    )
+
+
+class TestShardConfig:
+    """Test splitting configs by date range and by query list."""
+
+    def test_date_ranges_are_contiguous_and_interval_aligned(self) -> None:
+        shards = shard_config(GdeltSeedGenerator(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 29)), 3)
+
+        assert [(s.start_date.day, s.end_date.day) for s in shards] == [(1, 15), (15, 22), (22, 29)]
+
+    def test_never_more_shards_than_intervals(self) -> None:
+        shards = shard_config(_news(days=10), 5, by="date")
+
+        assert len(shards) == 2
+        assert shards[-1].end_date == datetime(2024, 1, 11)
+
+    def test_auto_prefers_queries_when_there_are_enough(self) -> None:
+        shards = shard_config(_news(["a", "b", "c", "d", "e"]), 2)
+
+        assert [s.search_query for s in shards] == [["a", "c", "e"], ["b", "d"]]
+        assert all(s.start_date == datetime(2024, 1, 1) for s in shards)
+
+    def test_pipeline_shards_its_seed_generator(self) -> None:
+        pipeline = QuestionPipeline(seed_generator=_news(), question_generator=MockTransformConfig())
+
+        shards = shard_config(pipeline, 4)
+
+        assert len(shards) == 4
+        assert all(isinstance(s, QuestionPipeline) for s in shards)
+        assert shards[1].seed_generator.start_date == datetime(2024, 1, 8)
+
+    def test_unshardable_config_raises(self) -> None:
+        try:
+            shard_config(MockTransformConfig(), 2)
+            assert False, "expected ValueError"
+        except ValueError as e:
+            assert "cannot be sharded" in str(e)
+
+    def test_split_budget(self) -> None:
+        assert split_budget(10, 3.0, 3) == [(4, 1.0), (3, 1.0), (3, 1.0)]
+        assert split_budget(None, None, 2) == [(None, None), (None, None)]
+
+
+class _ShardServer:
+    """Completes each submitted job immediately with one output row, and accepts merged uploads."""
+
+    def __init__(self) -> None:
+        self.job_requests: List[Dict[str, Any]] = []
+        self.uploaded: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path == "/transform-jobs":
+            with self._lock:
+                self.job_requests.append(json.loads(request.content))
+                job_id = f"job-{len(self.job_requests)}"
+            return httpx.Response(201, json=_job(job_id, "RUNNING"))
+        if path.startswith("/transform-jobs/"):
+            return httpx.Response(200, json=_job(path.split("/")[2], "COMPLETED"))
+        if request.method == "POST" and path == "/datasets":
+            return httpx.Response(201, json={"id": "merged"})
+        if request.method == "POST" and path == "/datasets/merged/samples":
+            self.uploaded.extend(json.loads(request.content)["samples"])
+            return httpx.Response(200, json={"count": len(self.uploaded), "total": len(self.uploaded)})
+        if path.endswith("/samples"):
+            return httpx.Response(200, json={
+                "samples": [{"prompt": path.split("/")[2]}], "has_more": False, "total": 1, "next_cursor": None,
+            })
+        return httpx.Response(200, json={"id": path.split("/")[2], "num_rows": len(self.uploaded) or 1})
+
+
+def _job(job_id: str, status: str) -> Dict[str, Any]:
+    return {
+        "id": job_id,
+        "organization_id": "org-1",
+        "status": status,
+        "modal_function_call_id": "fc-1",
+        "modal_app_id": "app-1",
+        "transform_config": "{}",
+        "input_dataset_id": None,
+        "output_dataset_id": f"out-{job_id}",
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:00:00",
+    }
+
+
+class TestRunSharded:
+    """Test submitting shards in parallel and merging their outputs."""
+
+    def test_run_sharded_merges_outputs(self) -> None:
+        server = _ShardServer()
+        client = AuthenticatedClient(base_url="https://test.invalid", token="token")
+        client.set_httpx_client(httpx.Client(base_url="https://test.invalid", transport=httpx.MockTransport(server)))
+        transforms = TransformsClient(client, DatasetSamplesClient(client))
+
+        dataset = transforms.run_sharded(
+            _news(["a", "b", "c"]), shards=3, max_questions=10, max_cost_dollars=6.0,
+            poll_schedule=PollSchedule.fixed(0.01),
+        )
+
+        assert dataset.id == "merged"
+        assert dataset.num_rows == 3
+        assert sorted(s["prompt"] for s in server.uploaded) == ["out-job-1", "out-job-2", "out-job-3"]
+        assert sorted(r["max_questions"] for r in server.job_requests) == [3, 3, 4]
+        assert all(r["max_cost_dollars"] == 2.0 for r in server.job_requests)
+        assert sorted(r["config"]["search_query"][0] for r in server.job_requests) == ["a", "b", "c"]
+
+    def test_shards_are_capped_by_question_budget(self) -> None:
+        server = _ShardServer()
+        client = AuthenticatedClient(base_url="https://test.invalid", token="token")
+        client.set_httpx_client(httpx.Client(base_url="https://test.invalid", transport=httpx.MockTransport(server)))
+        transforms = TransformsClient(client, DatasetSamplesClient(client))
+
+        transforms.run_sharded(
+            _news(["a", "b", "c", "d"]), shards=4, max_questions=2, poll_schedule=PollSchedule.fixed(0.01),
+        )
+
+        assert [r["max_questions"] for r in server.job_requests] == [1, 1]
+        assert sorted(q for r in server.job_requests for q in r["config"]["search_query"]) == ["a", "b", "c", "d"]
@@ -0,0 +1,167 @@
+"""Stress tests for sharing one LightningRod client across threads, against a local stand-in server."""
+
+import json
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+
+import pytest
+
+from lightningrod import Dataset, HttpConfig, LightningRod
+from lightningrod._generated.models import Sample, Seed
+
+ROWS_PER_DATASET = 25
+PAGE_SIZE = 10
+
+
+class _StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    first_pages: Counter = Counter()
+    uploaded: Counter = Counter()
+    ports: set = set()
+    failures_left: Counter = Counter()
+
+    def _respond(self, status: int, body: Any) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        with self.lock:
+            self.ports.add(self.client_address[1])
+        if self.path.endswith("/organizations/balance"):
+            return self._respond(200, {"balance_dollars": 1.0})
+        match = re.search(r"/datasets/([^/]+)/samples\?(.*)$", self.path)
+        dataset_id, query = match.group(1), match.group(2)
+        cursor = re.search(r"cursor=(\d+)", query)
+        start = int(cursor.group(1)) if cursor else 0
+        if start == 0:
+            with self.lock:
+                self.first_pages[dataset_id] += 1
+                failing = self.failures_left[dataset_id] > 0
+                self.failures_left[dataset_id] -= failing
+            if failing:
+                return self._respond(400, {"detail": "dataset unavailable"})
+        # Slow pages widen the window in which concurrent callers overlap
+        time.sleep(0.01)
+        end = min(start + PAGE_SIZE, ROWS_PER_DATASET)
+        self._respond(200, {
+            "samples": [{"seed": {"seed_text": f"{dataset_id}-{i}"}} for i in range(start, end)],
+            "has_more": end < ROWS_PER_DATASET,
+            "total": ROWS_PER_DATASET,
+            "next_cursor": str(end) if end < ROWS_PER_DATASET else None,
+        })
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        dataset_id = re.search(r"/datasets/([^/]+)/samples", self.path).group(1)
+        with self.lock:
+            self.ports.add(self.client_address[1])
+            self.uploaded[dataset_id] += len(body["samples"])
+        self._respond(200, {"count": len(body["samples"]), "total": self.uploaded[dataset_id]})
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def lr() -> Iterator[LightningRod]:
+    _StandInHandler.first_pages = Counter()
+    _StandInHandler.uploaded = Counter()
+    _StandInHandler.ports = set()
+    _StandInHandler.failures_left = Counter()
+    httpd = _StandInServer(("127.0.0.1", 0), _StandInHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    host, port = httpd.server_address
+    client = LightningRod(api_key="key", base_url=f"http://{host}:{port}/api", http=HttpConfig(max_connections=8))
+    yield client
+    client.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _dataset(lr: LightningRod, dataset_id: str) -> Dataset:
+    return Dataset(id=dataset_id, num_rows=ROWS_PER_DATASET, datasets_client=lr._dataset_samples)
+
+
+class TestThreadSafety:
+    """Test concurrent use of one client from many threads."""
+
+    def test_concurrent_samples_share_one_download(self, lr: LightningRod) -> None:
+        dataset = _dataset(lr, "d1")
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            results = list(pool.map(lambda _: dataset.samples(), range(64)))
+
+        assert _StandInHandler.first_pages["d1"] == 1
+        assert all(len(r) == ROWS_PER_DATASET for r in results)
+        assert all(r is results[0] for r in results)
+
+    def test_dataset_objects_for_same_id_share_download(self, lr: LightningRod) -> None:
+        barrier = threading.Barrier(16)
+
+        def download(_: int) -> List[Sample]:
+            dataset = _dataset(lr, "shared")
+            barrier.wait()
+            return dataset.download()
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(download, range(16)))
+
+        assert _StandInHandler.first_pages["shared"] == 1
+        assert {tuple(s.seed.seed_text for s in r) for r in results} == {tuple(f"shared-{i}" for i in range(ROWS_PER_DATASET))}
+
+    def test_mixed_workload(self, lr: LightningRod) -> None:
+        httpx_client = lr._generated_client.get_httpx_client()
+        datasets = {f"d{i}": _dataset(lr, f"d{i}") for i in range(10)}
+
+        def work(n: int) -> Any:
+            kind = n % 3
+            if kind == 0:
+                return [s.seed.seed_text for s in datasets[f"d{n % 10}"].samples()]
+            if kind == 1:
+                lr._dataset_samples.upload(f"u{n % 5}", [Sample(seed=Seed(seed_text=str(n)))] * 4)
+                return None
+            return lr.organization.get_balance()
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            results = list(pool.map(work, range(300)))
+
+        assert all(_StandInHandler.first_pages[d] == 1 for d in datasets)
+        assert sum(_StandInHandler.uploaded.values()) == 100 * 4
+        assert results[2] == 1.0
+        assert results[0] == [f"d0-{i}" for i in range(ROWS_PER_DATASET)]
+        assert lr._generated_client.get_httpx_client() is httpx_client
+        assert len(_StandInHandler.ports) <= 8
+
+    def test_failed_download_is_raised_to_waiters_and_retried(self, lr: LightningRod) -> None:
+        _StandInHandler.failures_left["flaky"] = 1
+        dataset = _dataset(lr, "flaky")
+        barrier = threading.Barrier(8)
+        errors: List[Exception] = []
+
+        def download(_: int) -> None:
+            barrier.wait()
+            try:
+                dataset.download()
+            except Exception as e:
+                errors.append(e)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(download, range(8)))
+
+        assert errors and all("dataset unavailable" in str(e) for e in errors)
+        assert len(dataset.samples()) == ROWS_PER_DATASET
@@ -0,0 +1,382 @@
+"""Tests for TransformsClient job polling against a mocked HTTP transport."""
+
+from collections import Counter
+from typing import Any, Dict, List
+
+import logging
+import threading
+
+import httpx
+
+from lightningrod import APIError
+from lightningrod._generated.client import AuthenticatedClient
+from lightningrod._generated.models import TransformJobStatus
+from lightningrod.datasets.client import DatasetSamplesClient
+from lightningrod._generated.models import QuestionPipeline
+from lightningrod._generated.models.mock_transform_config import MockTransformConfig
+from lightningrod.transforms.cache import RunCache
+from lightningrod.transforms.client import TransformsClient
+from lightningrod.transforms.handle import JobHandle
+from lightningrod.transforms.polling import PollSchedule
+from lightningrod.transforms.progress import JobStatusEvent, LoggingProgressReporter, StepMetricsEvent
+
+FAST_POLLING = PollSchedule.fixed(0.01)
+
+
+def _job_payload(job_id: str, status: str = "RUNNING", output_dataset_id: Any = None) -> Dict[str, Any]:
+    return {
+        "id": job_id,
+        "organization_id": "org-1",
+        "status": status,
+        "modal_function_call_id": "fc-1",
+        "modal_app_id": "app-1",
+        "transform_config": "{}",
+        "input_dataset_id": None,
+        "output_dataset_id": output_dataset_id,
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:00:00",
+    }
+
+
+def _metrics_payload() -> Dict[str, Any]:
+    return {
+        "total_input_rows": 5,
+        "total_output_rows": 3,
+        "total_duration_seconds": 2.0,
+        "steps": [
+            {
+                "step_index": 0,
+                "transform_name": "seed",
+                "input_rows": 5,
+                "output_rows": 3,
+                "rejected_count": 2,
+                "error_count": 0,
+                "duration_seconds": 2.0,
+                "progress": 0.5,
+                "summary": None,
+            }
+        ],
+    }
+
+
+def _make_client(handler: Any) -> TransformsClient:
+    client = AuthenticatedClient(base_url="https://test.invalid", token="token")
+    client.set_httpx_client(httpx.Client(base_url="https://test.invalid", transport=httpx.MockTransport(handler)))
+    return TransformsClient(client, DatasetSamplesClient(client))
+
+
+class TestJobSnapshot:
+    """Test fetching job status and metrics together."""
+
+    def test_snapshot_returns_job_and_metrics(self) -> None:
+        paths: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.endswith("/metrics"):
+                return httpx.Response(200, json=_metrics_payload())
+            return httpx.Response(200, json=_job_payload("job-1"))
+
+        transforms = _make_client(handler)
+        job, metrics = transforms.jobs.snapshot("job-1")
+
+        assert job.id == "job-1"
+        assert job.status == TransformJobStatus.RUNNING
+        assert metrics is not None
+        assert metrics.steps[0].progress == 0.5
+        assert sorted(paths) == ["/transform-jobs/job-1", "/transform-jobs/job-1/metrics"]
+
+    def test_snapshots_reuse_the_clients_threads(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/metrics"):
+                return httpx.Response(200, json=_metrics_payload())
+            return httpx.Response(200, json=_job_payload("job-1"))
+
+        def job_threads() -> List[threading.Thread]:
+            return [t for t in threading.enumerate() if t.name.startswith("lightningrod-jobs")]
+
+        transforms = _make_client(handler)
+        transforms.jobs.snapshot("job-1")
+        first = job_threads()
+        for _ in range(5):
+            transforms.jobs.snapshot("job-1")
+
+        assert len(first) == 1
+        assert job_threads() == first
+        transforms.jobs.close()
+        assert not job_threads()
+
+    def test_snapshot_without_metrics(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/metrics"):
+                return httpx.Response(404, json={"detail": "Not found"})
+            return httpx.Response(200, json=_job_payload("job-1"))
+
+        snapshot = _make_client(handler).jobs.snapshot("job-1")
+        assert snapshot.job.id == "job-1"
+        assert snapshot.metrics is None
+
+
+class _FakeJobsServer:
+    """Serves transform jobs that complete after a fixed number of status polls."""
+
+    def __init__(self, polls_until_done: int = 2, fail_job_ids: tuple = ()):
+        self.polls_until_done = polls_until_done
+        self.fail_job_ids = fail_job_ids
+        self.poll_counts: Counter = Counter()
+        self.threads: set = set()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path == "/transform-jobs":
+            with self._lock:
+                self._next_id += 1
+                job_id = f"job-{self._next_id}"
+            return httpx.Response(201, json=_job_payload(job_id))
+        if path.startswith("/datasets/"):
+            return httpx.Response(200, json={"id": path.split("/")[2], "num_rows": 7})
+        job_id = path.split("/")[2]
+        self.threads.add(threading.current_thread().name)
+        self.poll_counts[job_id] += 1
+        if self.poll_counts[job_id] < self.polls_until_done:
+            return httpx.Response(200, json=_job_payload(job_id))
+        if job_id in self.fail_job_ids:
+            payload = _job_payload(job_id, status="FAILED")
+            payload["error_message"] = "boom"
+            return httpx.Response(200, json=payload)
+        return httpx.Response(200, json=_job_payload(job_id, status="COMPLETED", output_dataset_id=f"out-{job_id}"))
+
+
+def _pipeline() -> QuestionPipeline:
+    return QuestionPipeline(seed_generator=MockTransformConfig(num_seeds=1), question_generator=MockTransformConfig())
+
+
+class TestJobHandle:
+    """Test non-blocking submission and the shared job poller."""
+
+    def test_wait_all_and_results(self) -> None:
+        server = _FakeJobsServer(polls_until_done=3)
+        transforms = _make_client(server)
+
+        handles = [transforms.submit(_pipeline(), poll_schedule=FAST_POLLING) for _ in range(5)]
+        assert all(isinstance(handle, JobHandle) for handle in handles)
+
+        jobs = transforms.wait_all(handles, timeout=10)
+
+        assert [job.status for job in jobs] == [TransformJobStatus.COMPLETED] * 5
+        assert all(handle.done() for handle in handles)
+        datasets = [handle.result() for handle in handles]
+        assert [dataset.id for dataset in datasets] == [f"out-job-{i}" for i in range(1, 6)]
+        assert server.threads == {"lightningrod-job-poller"}
+
+    def test_done_callback_fires_once(self) -> None:
+        transforms = _make_client(_FakeJobsServer(polls_until_done=2))
+        finished = threading.Event()
+        calls: List[str] = []
+
+        def on_done(handle: JobHandle) -> None:
+            calls.append(handle.id)
+            finished.set()
+
+        handle = transforms.submit(_pipeline(), poll_schedule=FAST_POLLING)
+        handle.add_done_callback(on_done)
+        assert finished.wait(10)
+        handle.wait(10)
+        handle.add_done_callback(lambda h: calls.append("late"))
+
+        assert calls == [handle.id, "late"]
+
+    def test_failed_job_result_raises(self) -> None:
+        transforms = _make_client(_FakeJobsServer(polls_until_done=1, fail_job_ids=("job-1",)))
+        handle = transforms.submit(_pipeline(), poll_schedule=FAST_POLLING)
+
+        handle.wait(10)
+        assert handle.status == TransformJobStatus.FAILED
+        try:
+            handle.result()
+            assert False, "Should have raised"
+        except Exception as e:
+            assert "boom" in str(e)
+
+    def test_wait_timeout(self) -> None:
+        transforms = _make_client(_FakeJobsServer(polls_until_done=10_000))
+        handle = transforms.submit(_pipeline(), poll_schedule=PollSchedule.fixed(60))
+        try:
+            handle.wait(timeout=0.05)
+            assert False, "Should have raised TimeoutError"
+        except TimeoutError:
+            pass
+        assert not handle.done()
+
+    def test_poller_tightens_near_completion(self) -> None:
+        server = _MetricsJobsServer(polls_until_done=3)
+        transforms = _make_client(server)
+        # Without metrics every poll after the first would wait a minute
+        schedule = PollSchedule(
+            initial_interval=0.01, max_interval=60, backoff_factor=10_000, jitter=0, fast_polls=1,
+            near_completion_threshold=0.5, near_completion_interval=0.01,
+        )
+
+        handle = transforms.submit(_pipeline(), poll_schedule=schedule)
+
+        assert handle.wait(10).status == TransformJobStatus.COMPLETED
+
+    def test_poller_stops_on_non_transient_error(self) -> None:
+        statuses = iter([500, 404])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(201, json=_job_payload("job-1"))
+            return httpx.Response(next(statuses, 200), json={"detail": "Not found"})
+
+        handle = _make_client(handler).submit(_pipeline(), poll_schedule=FAST_POLLING)
+
+        for wait in (handle.wait, handle.result):
+            try:
+                wait(10)
+                assert False, "Should have raised"
+            except APIError as e:
+                assert e.status_code == 404
+        assert handle.done()
+
+
+class _GrowingOutputServer:
+    """A job whose output dataset gains rows on every status poll, paged by offset cursors."""
+
+    def __init__(self, rows_per_poll: int, polls_until_done: int, page_size: int):
+        self.rows: List[str] = []
+        self.rows_per_poll = rows_per_poll
+        self.polls_until_done = polls_until_done
+        self.page_size = page_size
+        self.polls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST":
+            return httpx.Response(201, json=_job_payload("job-1", output_dataset_id="out-1"))
+        if path == "/datasets/out-1/samples":
+            start = int(request.url.params.get("cursor", "0"))
+            page = self.rows[start:start + self.page_size]
+            end = start + len(page)
+            has_more = end < len(self.rows)
+            return httpx.Response(200, json={
+                "samples": [{"prompt": row} for row in page],
+                "has_more": has_more,
+                "total": len(self.rows),
+                "next_cursor": str(end) if has_more else None,
+            })
+        self.polls += 1
+        if self.polls >= self.polls_until_done:
+            return httpx.Response(200, json=_job_payload("job-1", status="COMPLETED", output_dataset_id="out-1"))
+        start = len(self.rows)
+        self.rows.extend(f"row-{start + i}" for i in range(self.rows_per_poll))
+        return httpx.Response(200, json=_job_payload("job-1", output_dataset_id="out-1"))
+
+
+class TestStreamOutput:
+    """Test tailing a job's output dataset while it runs."""
+
+    def test_stream_yields_every_row_once(self) -> None:
+        server = _GrowingOutputServer(rows_per_poll=3, polls_until_done=6, page_size=2)
+        transforms = _make_client(server)
+
+        prompts = [sample.prompt for sample in transforms.stream(_pipeline(), poll_schedule=FAST_POLLING)]
+
+        assert prompts == [f"row-{i}" for i in range(15)]
+
+
+class _MetricsJobsServer(_FakeJobsServer):
+    """_FakeJobsServer that also reports pipeline metrics."""
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/metrics"):
+            return httpx.Response(200, json=_metrics_payload())
+        return super().__call__(request)
+
+
+class TestHeadlessRun:
+    """Test running jobs with structured progress events instead of rich rendering."""
+
+    def test_run_with_event_callback(self) -> None:
+        events: List[Any] = []
+        transforms = _make_client(_MetricsJobsServer(polls_until_done=3))
+
+        dataset = transforms.run(_pipeline(), poll_schedule=FAST_POLLING, progress=events.append)
+
+        assert dataset.id == "out-job-1"
+        statuses = [event.status for event in events if isinstance(event, JobStatusEvent)]
+        assert statuses == [TransformJobStatus.RUNNING, TransformJobStatus.RUNNING, TransformJobStatus.COMPLETED]
+        step_events = [event for event in events if isinstance(event, StepMetricsEvent)]
+        assert len(step_events) == 3
+        assert step_events[0].step.transform_name == "seed"
+
+    def test_run_with_logger(self, caplog: Any) -> None:
+        transforms = _make_client(_MetricsJobsServer(polls_until_done=1, fail_job_ids=("job-1",)))
+        logger = logging.getLogger("test.pipelines")
+
+        with caplog.at_level(logging.INFO, logger="test.pipelines"):
+            try:
+                transforms.run(_pipeline(), poll_schedule=FAST_POLLING, progress=logger)
+                assert False, "Should have raised"
+            except Exception as e:
+                assert "boom" in str(e)
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("step=0 name=seed" in message for message in messages)
+        assert any(record.levelno == logging.ERROR and "boom" in record.getMessage() for record in caplog.records)
+
+    def test_headless_run_is_silent(self, capsys: Any) -> None:
+        transforms = _make_client(_MetricsJobsServer(polls_until_done=2))
+        transforms.run(_pipeline(), poll_schedule=FAST_POLLING, progress=None)
+        assert capsys.readouterr().out == ""
+
+    def test_api_errors_go_to_the_reporter(self, capsys: Any, caplog: Any) -> None:
+        transforms = _make_client(lambda request: httpx.Response(401, json={"detail": "Invalid API key"}))
+
+        with caplog.at_level(logging.INFO, logger="lightningrod.progress"):
+            try:
+                transforms.run(_pipeline(), poll_schedule=FAST_POLLING, progress="logging")
+                assert False, "Should have raised"
+            except APIError as e:
+                assert e.status_code == 401
+
+        assert capsys.readouterr().out == ""
+        assert [(record.levelno, record.getMessage()) for record in caplog.records] == [
+            (logging.ERROR, "job=None API Error: Failed to submit transform job: Invalid API key (HTTP 401)"),
+        ]
+
+    def test_submitted_job_failures_are_logged_not_printed(self, capsys: Any, caplog: Any) -> None:
+        transforms = _make_client(_FakeJobsServer(polls_until_done=1, fail_job_ids=("job-1",)))
+        events: List[Any] = []
+
+        with caplog.at_level(logging.INFO, logger="lightningrod.progress"):
+            handle = transforms.submit(_pipeline(), poll_schedule=FAST_POLLING)
+            other = transforms.submit(_pipeline(), poll_schedule=FAST_POLLING, progress=events.append)
+            transforms.wait_all([handle, other], timeout=10)
+            try:
+                handle.result()
+                assert False, "Should have raised"
+            except Exception as e:
+                assert "boom" in str(e)
+            other.result()
+
+        assert capsys.readouterr().out == ""
+        assert any(record.levelno == logging.ERROR and "boom" in record.getMessage() for record in caplog.records)
+        assert events == []
+
+
+class TestRunCacheIntegration:
+    """Test that cached runs skip job submission."""
+
+    def test_second_run_uses_cache(self, tmp_path: Any) -> None:
+        server = _MetricsJobsServer(polls_until_done=1)
+        transforms = _make_client(server)
+        cache = RunCache(tmp_path / "runs.json")
+
+        first = transforms.run(_pipeline(), poll_schedule=FAST_POLLING, progress=None, cache=cache)
+        second = transforms.run(_pipeline(), poll_schedule=FAST_POLLING, progress=None, cache=cache)
+
+        assert first.id == second.id == "out-job-1"
+        assert server._next_id == 1